@@ -0,0 +1,137 @@
+"""
+공용 테스트 픽스처
+
+실제 엑셀 파일 없이 전체 파이프라인을 검증하기 위한 소형 Mock 워크북
+(RAWSCORE / INDEX / PERCENTAGE 시트 구조를 축소 재현)
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+
+def build_mock_rawscore() -> pd.DataFrame:
+    """RAWSCORE: 영역/과목명/원점수 → 표준점수/백분위/등급/누적%"""
+    rows = []
+    subjects = [
+        ("국어", "국어(언매)", 100, 50),
+        ("국어", "국어(화작)", 100, 48),
+        ("수학", "수학(미적)", 100, 55),
+        ("수학", "수학(확통)", 100, 50),
+        ("탐구", "물리학 Ⅰ", 50, 20),
+        ("탐구", "화학 Ⅰ", 50, 21),
+        ("탐구", "생명과학 Ⅰ", 50, 19),
+        ("탐구", "생활과 윤리", 50, 22),
+        ("탐구", "사회·문화", 50, 21),
+    ]
+    for area, subject, max_raw, base in subjects:
+        for raw in range(max_raw, -1, -1):
+            standard = base + raw
+            percentile = round(raw / max_raw * 100, 1)
+            grade = min(9, max(1, 9 - int(raw / max_raw * 9)))
+            rows.append({
+                "영역": area,
+                "과목명": subject,
+                "원점수": raw,
+                "Unnamed: 3": None,
+                "Unnamed: 4": None,
+                "과목명-원점수": f"{subject}-{raw}",
+                "202511(가채점)": standard,
+                "백분위": percentile,
+                "등급": grade,
+                "누적%": round(100 - percentile, 3),
+            })
+    return pd.DataFrame(rows)
+
+
+def build_mock_index() -> pd.DataFrame:
+    """INDEX: (국어, 수학, 탐구1, 탐구2, 계열) → 백분위합/전국등수/누백"""
+    rows = []
+    for track in ["이과", "문과"]:
+        for korean in range(100, 156, 5):
+            for math in range(100, 156, 5):
+                for inq1 in range(20, 75, 5):
+                    for inq2 in range(20, 75, 5):
+                        total = korean + math + inq1 + inq2
+                        cumulative = float(np.clip((430 - total) / 2.5, 0.0, 94.0))
+                        rows.append({
+                            "INDEX": f"{korean}{math}{inq1}{inq2}{track}",
+                            "Unnamed: 1": korean,
+                            "Unnamed: 2": math,
+                            "Unnamed: 3": inq1,
+                            "Unnamed: 4": inq2,
+                            "Unnamed: 5": track,
+                            "Unnamed: 6": float(total),
+                            "Unnamed: 7": int(cumulative * 4000) + 1,
+                            "Unnamed: 8": round(cumulative, 2),
+                        })
+    return pd.DataFrame(rows)
+
+
+def build_mock_percentage() -> pd.DataFrame:
+    """PERCENTAGE: 누백(%) × 대학/전공 컬럼 (값이 클수록 하위권, 점수↓)"""
+    pct = np.round(np.arange(0.0, 94.5, 0.5), 2)
+    programs = {
+        "★백분위합 이과": (300.0, 2.0),
+        "가천의학 이과": (99.6, 0.9),
+        "가천한의 이과": (98.0, 0.8),
+        "서울대공대 이과": (99.0, 0.6),
+        "연세대의학 이과": (99.8, 0.95),
+        "건국자연 이과": (95.0, 0.5),
+        "한양대자연 이과": (96.0, 0.55),
+        "경기인문 문과": (90.0, 0.4),
+        "이화여대인문 문과": (94.0, 0.45),
+        "숙명여대인문 문과": (92.0, 0.42),
+    }
+    data = {"%": pct}
+    for name, (top, slope) in programs.items():
+        data[name] = np.round(top - slope * pct, 2)
+    df = pd.DataFrame(data)
+    # 희소 데이터 재현: 일부 구간 결측
+    df.loc[df.index[-10:], "경기인문 문과"] = np.nan
+    df.loc[df.index[40:44], "건국자연 이과"] = np.nan
+    return df
+
+
+def build_mock_restrict() -> pd.DataFrame:
+    """RESTRICT: "□ 결격사유<...>" 헤더 블록 (모집단위 + 항목 컬럼), 블록별 행 수 상이"""
+    blocks = [
+        ("□ 결격사유<수학,탐구>", [
+            ["모집단위", "수학", "탐구", "비고"],
+            ["한양대자연 이과", "미적,기하", "과탐1", None],
+            ["연세대의학 이과", "미적,기하", "과탐2", "의예 포함"],
+        ]),
+        ("□ 결격사유<영어,한국사,제2외국어>", [
+            ["서울대공대 이과", "2", "3", "불가"],
+            ["이화여대인문 문과", None, "4등급 이내", "불가"],
+            ["숙명여대인문 문과", "3등급 이내", None, "가능"],
+        ]),
+        ("□ 결격사유<과학탐구과목>", [
+            ["서울대공대 이과", "서로 다른 과목", None, None],
+            ["연세대의학 이과", "Ⅱ 1과목 필수", None, None],
+        ]),
+    ]
+    n_rows = max(len(rows) for _, rows in blocks)
+    data = {}
+    for header, rows in blocks:
+        rows = rows + [[None] * 4] * (n_rows - len(rows))
+        for j in range(4):
+            name = header if j == 0 else f"Unnamed: {len(data)}"
+            data[name] = [row[j] for row in rows]
+    return pd.DataFrame(data)
+
+
+@pytest.fixture
+def mock_excel_data():
+    """Mock 워크북 (load_workbook 결과와 동일한 {시트명: DataFrame} 형태)"""
+    return {
+        "RAWSCORE": build_mock_rawscore(),
+        "INDEX": build_mock_index(),
+        "PERCENTAGE": build_mock_percentage(),
+        "RESTRICT": build_mock_restrict(),
+    }
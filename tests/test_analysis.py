@@ -0,0 +1,508 @@
+"""
+분석 모듈 테스트 (theory_engine.analysis)
+
+Mock 워크북(conftest.py)으로 배치 결과가 compute_theory_result()와
+동일한지 확인합니다.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 추가
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from theory_engine import rules
+from theory_engine.analysis import (
+    ElectiveSearch, search_electives, ProgramSweep, sweep_programs, DEFAULT_SWEEP_LEVELS,
+    PortfolioSimulator, simulate_portfolio, IncrementalEvaluator, analyze_sensitivity,
+)
+from theory_engine.model import StudentProfile, TargetProgram, ExamScore
+from theory_engine.constants import Track, LevelTheory
+
+
+def make_profile(targets=None) -> StudentProfile:
+    return StudentProfile(
+        track=Track.SCIENCE,
+        korean=ExamScore(subject="국어(언매)", raw_total=85),
+        math=ExamScore(subject="수학(미적)", raw_total=82),
+        english_grade=2,
+        history_grade=3,
+        inquiry1=ExamScore(subject="물리학 Ⅰ", raw_total=47),
+        inquiry2=ExamScore(subject="화학 Ⅰ", raw_total=45),
+        targets=targets or [
+            TargetProgram("가천", "의학"),
+            TargetProgram("건국", "자연"),
+            TargetProgram("한양대", "자연"),
+        ],
+    )
+
+
+def make_curved_data(excel_data):
+    """5% 간격 곡선 PERCENTAGE (격자 사이 누백에서 선형과 단조 3차 보간이 다름)"""
+    percentage = excel_data["PERCENTAGE"].iloc[::10].reset_index(drop=True)
+    programs = [c for c in percentage.columns if c != "%"]
+    percentage[programs] = percentage[programs].sub(percentage["%"] ** 2 / 100, axis=0).round(2)
+    return dict(excel_data, PERCENTAGE=percentage)
+
+
+def cubic_expected(excel_data, target, cumulative_pct):
+    """lookup_percentage(MONOTONE_CUBIC) + calculate_probability (파이프라인 3~4단계)"""
+    from theory_engine.config import InterpolationPolicy
+
+    perc = rules.lookup_percentage(
+        excel_data["PERCENTAGE"], target.university, target.major, cumulative_pct or 50.0,
+        track="이과", policy=InterpolationPolicy.MONOTONE_CUBIC,
+    )
+    prob = rules.calculate_probability(
+        perc["score"] or 0, perc["cutoff_safe"], perc["cutoff_normal"], perc["cutoff_risk"],
+        percentage_df=excel_data["PERCENTAGE"], column=perc["column"],
+    )
+    return perc, prob
+
+
+class TestElectiveSearch:
+    """선택과목 조합 탐색"""
+
+    MATH_OPTIONS = [
+        ExamScore(subject="수학(미적)", raw_total=82),
+        ExamScore(subject="수학(확통)", raw_total=92),
+    ]
+    INQUIRY_OPTIONS = [
+        ExamScore(subject="물리학 Ⅰ", raw_total=47),
+        ExamScore(subject="화학 Ⅰ", raw_total=45),
+        ExamScore(subject="생명과학 Ⅰ", raw_total=49),
+    ]
+
+    def test_combos(self):
+        combos = ElectiveSearch.build_combos(
+            make_profile(), math_options=self.MATH_OPTIONS, inquiry_options=self.INQUIRY_OPTIONS
+        )
+        # 수학 2 × 탐구쌍 3
+        assert len(combos) == 6
+        assert combos[0].label() == "국어(언매)/수학(미적)/물리학 Ⅰ+화학 Ⅰ"
+
+    def test_matches_compute_theory_result(self, mock_excel_data):
+        """조합별 결과 == 해당 프로필의 compute_theory_result"""
+        profile = make_profile()
+        ranking = search_electives(
+            mock_excel_data, profile,
+            math_options=self.MATH_OPTIONS, inquiry_options=self.INQUIRY_OPTIONS,
+        )
+        assert len(ranking) == 6 * len(profile.targets)
+
+        combos = ElectiveSearch.build_combos(
+            profile, math_options=self.MATH_OPTIONS, inquiry_options=self.INQUIRY_OPTIONS
+        )
+        for combo_id, combo in enumerate(combos):
+            single = StudentProfile(
+                track=profile.track, korean=combo.korean, math=combo.math,
+                english_grade=profile.english_grade, history_grade=profile.history_grade,
+                inquiry1=combo.inquiry1, inquiry2=combo.inquiry2, targets=profile.targets,
+            )
+            expected = rules.compute_theory_result(mock_excel_data, single, use_cache=False)
+            for prog in expected.program_results:
+                row = ranking[
+                    (ranking["combo_id"] == combo_id)
+                    & (ranking["university"] == prog.target.university)
+                    & (ranking["major"] == prog.target.major)
+                ].iloc[0]
+                assert row["level"] == prog.level_theory.value
+                assert row["cumulative_pct"] == expected.raw_components["cumulative_pct"]
+                if prog.disqualification.is_disqualified:
+                    assert row["disqualification_reason"] == prog.disqualification.reason
+                if prog.p_theory is not None:
+                    assert row["probability"] == prog.p_theory
+                    assert row["score"] == prog.score_theory
+                    assert row["cutoff_normal"] == prog.cutoff_normal
+
+    def test_cubic_policy_and_batched_disqualification(self, mock_excel_data, monkeypatch):
+        """보간 정책 == lookup_percentage(policy), 결격은 학생 조건 키별 check_many 1회"""
+        from theory_engine.analysis import elective_search
+        from theory_engine.config import InterpolationPolicy
+
+        monkeypatch.setattr(elective_search, "PERCENTAGE_INTERPOLATION_POLICY", InterpolationPolicy.MONOTONE_CUBIC)
+        engine = rules.get_disqualification_engine()
+        calls = []
+        original = engine.check_many
+        monkeypatch.setattr(engine, "check_many", lambda p, *a, **kw: calls.append(p) or original(p, *a, **kw))
+        monkeypatch.setattr(rules, "check_disqualification", None)
+
+        # 누백 8/12는 5% 격자 사이 → 선형과 단조 3차가 다름
+        data = make_curved_data(mock_excel_data)
+
+        korean_options = [
+            ExamScore(subject="국어(언매)", raw_total=85),
+            ExamScore(subject="국어(화작)", raw_total=90),
+        ]
+        ranking = search_electives(
+            data, make_profile(), korean_options=korean_options,
+            math_options=self.MATH_OPTIONS, inquiry_options=self.INQUIRY_OPTIONS,
+        )
+        # 국어 2 × 수학 2 × 탐구쌍 3 = 12 조합, 학생 조건 키는 수학 × 탐구쌍 = 6
+        assert ranking["combo_id"].nunique() == 12
+        assert len(calls) == 6
+
+        scored = ranking[ranking["probability"].notna()]
+        differs = 0
+        for _, row in scored.iterrows():
+            target = TargetProgram(row["university"], row["major"])
+            perc, prob = cubic_expected(data, target, row["cumulative_pct"])
+            assert perc["interpolation_method"] == InterpolationPolicy.MONOTONE_CUBIC.value
+            assert row["score"] == perc["score"]
+            assert row["cutoff_normal"] == perc["cutoff_normal"]
+            linear = rules.lookup_percentage(
+                data["PERCENTAGE"], target.university, target.major, row["cumulative_pct"] or 50.0, track="이과"
+            )
+            differs += row["score"] != linear["score"]
+            assert row["probability"] == prob["probability"]
+            assert row["level"] == rules.level_to_theory(prob["level"]).value
+        assert differs
+
+    def test_ranking_order(self, mock_excel_data):
+        """target별 rank 1부터, 확률 내림차순, top_n 적용"""
+        ranking = search_electives(
+            mock_excel_data, make_profile(),
+            math_options=self.MATH_OPTIONS, inquiry_options=self.INQUIRY_OPTIONS, top_n=2,
+        )
+        for _, group in ranking.groupby(["university", "major"], sort=False):
+            assert list(group["rank"]) == [1, 2]
+            probs = group["probability"].tolist()
+            assert probs == sorted(probs, reverse=True)
+
+    def test_shared_lookups(self, mock_excel_data, monkeypatch):
+        """동일 (과목, 원점수) 변환은 조합 수와 무관하게 1회"""
+        calls = []
+        original = rules.convert_raw_to_standard
+        monkeypatch.setattr(
+            rules, "convert_raw_to_standard",
+            lambda *a, **kw: calls.append(a[1:3]) or original(*a, **kw),
+        )
+        search_electives(
+            mock_excel_data, make_profile(),
+            math_options=self.MATH_OPTIONS, inquiry_options=self.INQUIRY_OPTIONS,
+        )
+        # 국어 1 + 수학 2 + 탐구 3
+        assert len(calls) == 6
+
+    def test_disqualified_ranked_last(self, mock_excel_data):
+        """한양대 이과 + 확통 → 결격(MATH_SUBJ_001), 해당 target 최하위"""
+        ranking = search_electives(
+            mock_excel_data, make_profile([TargetProgram("한양대", "자연")]),
+            math_options=self.MATH_OPTIONS,
+        )
+        assert list(ranking["math_subject"]) == ["수학(미적)", "수학(확통)"]
+        last = ranking.iloc[-1]
+        assert last["disqualified"]
+        assert last["level"] == LevelTheory.DISQUALIFIED.value
+
+
+class TestProgramSweep:
+    """누백 1개 전체 프로그램 스윕"""
+
+    def test_matches_single_lookup(self, mock_excel_data):
+        """프로그램별 점수/확률/레벨 == score_for_column + calculate_probability"""
+        extractor = rules.get_cutoff_extractor(mock_excel_data["PERCENTAGE"])
+        for pct in (3.0, 12.3, 50.0, 77.77):
+            table = sweep_programs(mock_excel_data, pct, levels=None)
+            assert len(table) == len(extractor.program_columns)
+            for row in table.itertuples():
+                looked_up = extractor.score_for_column(row.column, pct)
+                score = looked_up[0] if looked_up else None
+                if score is None:
+                    assert row.level == LevelTheory.NO_DATA.value
+                    continue
+                assert row.score == score
+                prob = rules.calculate_probability(
+                    score, row.cutoff_safe, row.cutoff_normal, row.cutoff_risk
+                )
+                assert row.probability == prob["probability"]
+                assert row.level == rules.level_to_theory(prob["level"]).value
+
+    def test_cubic_policy_matches_single_lookup(self, mock_excel_data, monkeypatch):
+        """MONOTONE_CUBIC 정책: 점수/커트라인/확률 == lookup_percentage(policy) + calculate_probability"""
+        from theory_engine.analysis import program_sweep
+        from theory_engine.config import InterpolationPolicy
+        from theory_engine.cutoff.compiled_matrix import MONOTONE_CUBIC
+
+        monkeypatch.setattr(program_sweep, "PERCENTAGE_INTERPOLATION_POLICY", InterpolationPolicy.MONOTONE_CUBIC)
+        data = make_curved_data(mock_excel_data)
+        extractor = rules.get_cutoff_extractor(data["PERCENTAGE"])
+        sweep = ProgramSweep(data["PERCENTAGE"])
+        assert sweep.method == MONOTONE_CUBIC
+        linear = ProgramSweep(data["PERCENTAGE"], method="linear")
+
+        for pct in (3.0, 12.3, 24.0, 77.77):
+            table = sweep.sweep(pct, levels=None)
+            differs = (table["score"] != linear.sweep(pct, levels=None)["score"]).sum()
+            assert differs or pct == 3.0
+            for row in table.itertuples():
+                looked_up = extractor.score_for_column(row.column, pct, MONOTONE_CUBIC)
+                if looked_up is None:
+                    assert row.level == LevelTheory.NO_DATA.value
+                    continue
+                assert row.score == looked_up[0]
+                cutoffs = extractor._column_cutoffs(row.column, MONOTONE_CUBIC)
+                assert (row.cutoff_safe, row.cutoff_normal, row.cutoff_risk) == (
+                    cutoffs["cutoff_safe"], cutoffs["cutoff_normal"], cutoffs["cutoff_risk"]
+                )
+                prob = rules.calculate_probability(
+                    row.score, row.cutoff_safe, row.cutoff_normal, row.cutoff_risk
+                )
+                assert row.probability == prob["probability"]
+                assert row.level == rules.level_to_theory(prob["level"]).value
+
+        with pytest.raises(ValueError):
+            ProgramSweep(data["PERCENTAGE"], method="nearest")
+
+    def test_missing_scores_are_no_data(self, mock_excel_data):
+        """유효 데이터 2개 미만 컬럼 → 점수/확률 NaN, 알수없음 (0점으로 계산하지 않음)"""
+        percentage = mock_excel_data["PERCENTAGE"].copy()
+        percentage["경기인문 문과"] = np.nan
+        percentage.loc[0, "경기인문 문과"] = 90.0
+        table = ProgramSweep(percentage).sweep(12.3, levels=None)
+        row = table[table["column"] == "경기인문 문과"].iloc[0]
+        assert pd.isna(row["score"]) and pd.isna(row["probability"])
+        assert row["level"] == LevelTheory.NO_DATA.value
+        assert table["probability"].notna().sum() == len(table) - 1
+
+    def test_filter_and_order(self, mock_excel_data):
+        """기본 레벨 필터 + 레벨 → 확률 내림차순"""
+        table = sweep_programs(mock_excel_data, 10.0, track="이과")
+        assert set(table["level"]) <= set(DEFAULT_SWEEP_LEVELS)
+        assert set(table["track"]) <= {"이과", ""}
+        order = [DEFAULT_SWEEP_LEVELS.index(level) for level in table["level"]]
+        assert order == sorted(order)
+        for _, group in table.groupby("level", sort=False):
+            probs = group["probability"].tolist()
+            assert probs == sorted(probs, reverse=True)
+
+    def test_disqualification(self, mock_excel_data):
+        """확통 이과 → MATH_SUBJ_001 대상 대학 제외 / 포함 시 불가"""
+        profile = make_profile()
+        profile.math = ExamScore(subject="수학(확통)", raw_total=92)
+        sweep = ProgramSweep(mock_excel_data["PERCENTAGE"])
+
+        table = sweep.sweep(10.0, profile=profile, levels=None, include_disqualified=True)
+        hanyang = table[table["university"] == "한양대"]
+        assert len(hanyang) > 0
+        assert hanyang["disqualified"].all()
+        assert (hanyang["level"] == LevelTheory.DISQUALIFIED.value).all()
+
+        kept = sweep.sweep(10.0, profile=profile, levels=None)
+        assert not kept["disqualified"].any()
+        assert "한양대" not in set(kept["university"])
+
+    def test_distribution_mode_matches_single_lookup(self, mock_excel_data, monkeypatch):
+        """분포 모드: 스윕 확률 == calculate_probability(컬럼 곡선 적합)"""
+        from theory_engine.probability import DistributionProbabilityModel
+
+        monkeypatch.setattr(rules, "_probability_model", DistributionProbabilityModel())
+        percentage_df = mock_excel_data["PERCENTAGE"]
+        table = sweep_programs(mock_excel_data, 12.3, levels=None)
+        for row in table.itertuples():
+            if row.level == LevelTheory.NO_DATA.value:
+                continue
+            prob = rules.calculate_probability(
+                row.score, row.cutoff_safe, row.cutoff_normal, row.cutoff_risk,
+                percentage_df=percentage_df, column=row.column,
+            )
+            assert row.probability == prob["probability"]
+            assert row.level == rules.level_to_theory(prob["level"]).value
+
+
+class TestPortfolioSimulation:
+    """가채점 오차 몬테카를로 포트폴리오"""
+
+    def test_zero_noise_matches_pipeline(self, mock_excel_data):
+        """오차 0 → target 확률 == compute_theory_result, 포트폴리오 == 1 - Π(1 - p)"""
+        profile = make_profile()
+        expected = rules.compute_theory_result(mock_excel_data, profile)
+        zero = {name: 0.0 for name in ("korean", "math", "inquiry1", "inquiry2")}
+        result = simulate_portfolio(mock_excel_data, profile, n=50, seed=1, raw_sd=zero)
+
+        miss = 1.0
+        for row, program in zip(result.targets.itertuples(), expected.program_results):
+            assert row.mean_probability == program.p_theory
+            assert row.baseline_probability == program.p_theory
+            miss *= 1.0 - program.p_theory
+        assert result.portfolio_probability == round(1.0 - miss, 4)
+        assert result.index_miss_rate == 0.0
+
+    def test_cubic_policy_baseline(self, mock_excel_data, monkeypatch):
+        """MONOTONE_CUBIC 정책: 기준 확률 == lookup_percentage(policy) + calculate_probability"""
+        import dataclasses
+        from theory_engine.analysis import simulation
+        from theory_engine.config import InterpolationPolicy
+
+        data = make_curved_data(mock_excel_data)
+        # 누백 24 (5% 격자 사이, 커트라인 구간 안) → 선형과 확률이 다름
+        profile = dataclasses.replace(
+            make_profile(),
+            korean=ExamScore(subject="국어(언매)", raw_total=70),
+            math=ExamScore(subject="수학(미적)", raw_total=67),
+        )
+        cumulative_pct = rules.compute_theory_result(data, profile, use_cache=False).raw_components["cumulative_pct"]
+        zero = {name: 0.0 for name in ("korean", "math", "inquiry1", "inquiry2")}
+        linear = simulate_portfolio(data, profile, n=20, seed=1, raw_sd=zero)
+
+        monkeypatch.setattr(simulation, "PERCENTAGE_INTERPOLATION_POLICY", InterpolationPolicy.MONOTONE_CUBIC)
+        result = simulate_portfolio(data, profile, n=20, seed=1, raw_sd=zero)
+        for row, target in zip(result.targets.itertuples(), profile.targets):
+            _, prob = cubic_expected(data, target, cumulative_pct)
+            assert row.baseline_probability == prob["probability"]
+            assert row.mean_probability == prob["probability"]
+        assert (result.targets["baseline_probability"] != linear.targets["baseline_probability"]).any()
+
+    def test_program_calibration_matches_pipeline(self, mock_excel_data, monkeypatch):
+        """프로그램별 보정 테이블도 compute_theory_result와 같게 적용"""
+        from theory_engine.probability import AdmissionProbabilityModel, ProbabilityCalibration
+
+        profile = make_profile()
+        zero = {name: 0.0 for name in ("korean", "math", "inquiry1", "inquiry2")}
+        plain = simulate_portfolio(mock_excel_data, profile, n=20, seed=1, raw_sd=zero)
+
+        identity = ProbabilityCalibration.identity().table
+        calibration = ProbabilityCalibration(identity, {"가천의학 이과": identity[0] ** 2})
+        monkeypatch.setattr(rules, "_probability_model", AdmissionProbabilityModel(calibration=calibration))
+
+        expected = rules.compute_theory_result(mock_excel_data, profile, use_cache=False)
+        result = simulate_portfolio(mock_excel_data, profile, n=20, seed=1, raw_sd=zero)
+        for row, program in zip(result.targets.itertuples(), expected.program_results):
+            assert row.baseline_probability == program.p_theory
+        baseline = result.targets["baseline_probability"]
+        assert baseline.iloc[0] < plain.targets["baseline_probability"].iloc[0]
+        assert (baseline.iloc[1:] == plain.targets["baseline_probability"].iloc[1:]).all()
+
+    def test_seeded_and_worker_independent(self, mock_excel_data):
+        """같은 seed/청크 → 같은 결과 (프로세스 풀 포함), 군별 확률 ≤ 전체"""
+        profile = make_profile()
+        simulator = PortfolioSimulator(mock_excel_data, raw_sd={"korean": 4.0, "math": 4.0})
+        kwargs = dict(n=3000, seed=11, groups=["가", "나", "다"], chunk_size=1000)
+
+        serial = simulator.simulate(profile, **kwargs)
+        again = simulator.simulate(profile, **kwargs)
+        pooled = simulator.simulate(profile, max_workers=2, **kwargs)
+        for other in (again, pooled):
+            assert other.portfolio_probability == serial.portfolio_probability
+            assert other.group_probabilities == serial.group_probabilities
+            assert other.targets.equals(serial.targets)
+
+        assert serial.n_draws == 3000
+        assert set(serial.group_probabilities) == {"가", "나", "다"}
+        assert all(p <= serial.portfolio_probability for p in serial.group_probabilities.values())
+        assert (serial.targets["p05_probability"] <= serial.targets["p95_probability"]).all()
+
+    def test_disqualified_target_contributes_zero(self, mock_excel_data):
+        """결격 target은 모든 표본에서 확률 0"""
+        profile = make_profile()
+        profile.math = ExamScore(subject="수학(확통)", raw_total=92)
+        result = simulate_portfolio(mock_excel_data, profile, n=200, seed=3)
+        hanyang = result.targets[result.targets["university"] == "한양대"].iloc[0]
+        assert hanyang["disqualified"] and hanyang["mean_probability"] == 0.0
+
+
+class TestIncrementalEvaluator:
+    """필드 1개 변경 시 의존 단계만 재계산"""
+
+    @staticmethod
+    def _plain(result):
+        import dataclasses
+        data = dataclasses.asdict(result)
+        data.pop("computed_at")
+        for program in data["program_results"]:
+            program["explainability"]["performance_ms"] = None
+        return data
+
+    def test_matches_pipeline_and_reruns_dependent_stages(self, mock_excel_data):
+        """단계 재실행 범위 + 결과 == compute_theory_result + diff"""
+        profile = make_profile()
+        profile.targets.append(TargetProgram("서울대", "공대"))
+        evaluator = IncrementalEvaluator(mock_excel_data)
+
+        def evaluate():
+            update = evaluator.evaluate(profile)
+            expected = rules.compute_theory_result(mock_excel_data, profile, use_cache=False)
+            assert self._plain(update.result) == self._plain(expected)
+            return update
+
+        first = evaluate()
+        assert first.stages_run == {"conversion": 4, "index": 1, "disqualification": 4, "scoring": 4}
+        assert len(first.diff.added) == 4
+
+        # 영어 등급 → 결격만 (서울대 공대 RESTRICT 영어 2등급 이내)
+        profile.english_grade = 3
+        update = evaluate()
+        assert update.changed_fields == ["english_grade"]
+        assert update.stages_run == {"conversion": 0, "index": 0, "disqualification": 4, "scoring": 0}
+        assert not update.diff.components
+        [changed] = update.diff.targets
+        assert changed.target.university == "서울대"
+        assert changed.changes["disqualified"] == (False, True)
+
+        # 수학 원점수 → 변환/INDEX/점수만, 결격 판정 재사용
+        profile.math = ExamScore(subject="수학(미적)", raw_total=70)
+        update = evaluate()
+        assert update.changed_fields == ["math.raw"]
+        assert update.stages_run["conversion"] == 1 and update.stages_run["index"] == 1
+        assert update.stages_run["disqualification"] == 0
+        assert update.stages_run["scoring"] == 3      # 결격 target 제외
+        assert "math_standard" in update.diff.components
+
+        # 되돌리면 모든 단계 캐시 적중
+        profile.english_grade = 2
+        profile.math = ExamScore(subject="수학(미적)", raw_total=82)
+        update = evaluate()
+        assert sum(update.stages_run.values()) == 0
+
+        # target 추가 → 추가분만 계산
+        profile.targets.append(TargetProgram("이화여대", "인문"))
+        update = evaluate()
+        assert update.stages_run == {"conversion": 0, "index": 0, "disqualification": 1, "scoring": 1}
+        assert [t.university for t in update.diff.added] == ["이화여대"]
+
+
+
+class TestSensitivityAnalysis:
+    """다음 등급까지 필요한 최소 원점수 상승"""
+
+    def test_minimal_delta_matches_pipeline(self, mock_excel_data):
+        """raw_delta 상승 시 next_level 도달, raw_delta - 1 로는 미도달"""
+        import dataclasses
+        order = ["적정", "예상", "소신", "상향"]
+        profile = make_profile()
+        profile.korean = ExamScore(subject="국어(언매)", raw_total=75)
+        profile.math = ExamScore(subject="수학(미적)", raw_total=70)
+        profile.inquiry1 = ExamScore(subject="물리학 Ⅰ", raw_total=40)
+        profile.targets.append(TargetProgram("서울대", "공대"))
+        profile.english_grade = 3
+
+        table = analyze_sensitivity(mock_excel_data, profile)
+        base = rules.compute_theory_result(mock_excel_data, profile, use_cache=False)
+        index = {(t.university, t.major): i for i, t in enumerate(profile.targets)}
+        assert len(table) == 4 * len(profile.targets)
+
+        def level_after(row, delta):
+            exam = getattr(profile, row.subject)
+            raised = dataclasses.replace(exam, raw_total=exam.raw_total + delta)
+            result = rules.compute_theory_result(
+                mock_excel_data, dataclasses.replace(profile, **{row.subject: raised}))
+            return result.program_results[index[(row.university, row.major)]].level_theory.value
+
+        reachable = 0
+        for row in table.itertuples():
+            program = base.program_results[index[(row.university, row.major)]]
+            assert row.level == program.level_theory.value
+            if program.disqualification.is_disqualified:
+                assert pd.isna(row.next_level) and not row.reachable
+                continue
+            if not row.reachable:
+                continue
+            reachable += 1
+            delta = int(row.raw_delta)
+            assert order.index(level_after(row, delta)) <= order.index(row.next_level)
+            if delta > 1:
+                assert level_after(row, delta - 1) == row.level
+        assert reachable > 0
@@ -65,6 +65,16 @@ class TestSubjectMatcher:
             assert name == expected, f"{input_name} → {name} (expected {expected})"
             assert conf >= 90.0  # 백분율 스케일
 
+    def test_match_cache_bounded(self, monkeypatch):
+        """자유 입력 캐시는 LRU 상한 유지, 적중 결과는 캐시 미스와 동일"""
+        monkeypatch.setattr(SubjectMatcher, "MATCH_CACHE_MAX_SIZE", 8)
+        matcher = SubjectMatcher()
+        expected = matcher.match("물리1")
+        for i in range(20):
+            matcher.match(f"과목{i}")
+        assert matcher._match_cached.cache_info().currsize == 8
+        assert matcher.match("물리1") == expected
+
     def test_social_studies_subjects(self):
         """사회탐구 과목 매칭"""
         test_cases = [
@@ -81,6 +91,26 @@ class TestSubjectMatcher:
         name, conf = self.matcher.match("알수없는과목")
         assert conf < 0.5  # 낮은 신뢰도
 
+    def test_match_many_matches_scalar_path(self, monkeypatch):
+        """대량 매칭: 입력 순서/중복 유지 + 정확/부분 단계는 match()와 동일"""
+        from theory_engine.matchers import bulk
+
+        monkeypatch.setattr(bulk, "HAS_RAPIDFUZZ", False)
+        names = ["물리학I", "생윤", "물리학I", None, "알수없는과목"]
+        df = self.matcher.match_many(names)
+
+        assert list(df.columns) == ["input", "normalized", "canonical", "score", "stage"]
+        assert len(df) == len(names)
+        assert df["canonical"].tolist()[:3] == ["물리학 Ⅰ", "생활과 윤리", "물리학 Ⅰ"]
+        assert df["stage"].tolist()[:3] == ["exact", "exact", "exact"]
+        assert df.loc[4, "stage"] == "none"
+
+        for name in ["물리학I", "생윤", "알수없는과목"]:
+            canonical, score = self.matcher.match(name)
+            row = df[df["input"] == name].iloc[0]
+            assert row["canonical"] == canonical
+            assert row["score"] == score
+
 
 class TestAdmissionProbabilityModel:
     """확률 계산 모델 테스트"""
@@ -123,6 +153,123 @@ class TestAdmissionProbabilityModel:
         assert result.confidence_low <= result.probability
         assert result.probability <= result.confidence_high
 
+    def test_calculate_many_matches_scalar(self):
+        """calculate_many == 원소별 calculate (경계값/결측/0 커트라인 포함, 비트 단위)"""
+        import numpy as np
+
+        rng = np.random.default_rng(7)
+        n = 5000
+        normal = np.round(rng.uniform(50, 100, n), 2)
+        safe = np.round(normal + rng.uniform(-1, 5, n), 2)
+        risk = np.round(normal - rng.uniform(-1, 5, n), 2)
+        score = np.round(rng.uniform(40, 110, n), 2)
+        safe[::11] = np.nan
+        risk[::13] = np.nan
+        normal[::17] = np.nan
+        risk[::19] = 0.0
+        score[:300], score[300:600], score[600:900] = safe[:300], normal[300:600], risk[600:900]
+
+        def opt(v):
+            return None if np.isnan(v) else float(v)
+
+        batch = self.model.calculate_many(score, safe, normal, risk)
+        for i in range(n):
+            expected = self.model.calculate(float(score[i]), opt(safe[i]), opt(normal[i]), opt(risk[i]))
+            assert batch.result_at(i) == expected
+
+        # calculate()를 재정의한 하위 클래스는 원소별 경로
+        class Shifted(AdmissionProbabilityModel):
+            def calculate(self, student_score, *cutoffs):
+                return super().calculate(student_score + 1.0, *cutoffs)
+
+        shifted = Shifted()
+        batch = shifted.calculate_many(score[:50], safe[:50], normal[:50], risk[:50])
+        assert batch.result_at(3) == shifted.calculate(
+            float(score[3]), opt(safe[3]), opt(normal[3]), opt(risk[3])
+        )
+
+    def test_distribution_model(self, mock_excel_data):
+        """로지스틱 적합: 커트라인 3점 → 0.8/0.5/0.2 근처, 곡선 적합은 단조, 누백 대칭"""
+        import numpy as np
+        from theory_engine.probability import DistributionProbabilityModel
+
+        model = DistributionProbabilityModel()
+        levels = [model.calculate(s, 95.0, 90.0, 85.0).level for s in (98.0, 92.0, 87.0, 80.0)]
+        assert levels == ["적정", "예상", "소신", "상향"]
+        assert model.calculate(90.0, 95.0, 90.0, 85.0).probability == 0.5
+        assert model.calculate(70.0, None, None, None).level == "알수없음"
+        # 적합 불가(예상 컷만) → 기존 구간 선형 규칙
+        assert model.calculate(90.0, None, 90.0, None) == AdmissionProbabilityModel().calculate(90.0, None, 90.0, None)
+
+        compiled = CutoffExtractor(mock_excel_data["PERCENTAGE"]).compiled
+        dist = model.distributions(compiled)
+        assert dist.params.shape == (len(compiled.columns), 3) and dist.fitted.all()
+        assert model.distributions(compiled) is dist
+
+        row = compiled.row_of("가천의학 이과")
+        scores = np.linspace(20.0, 100.0, 41)
+        batch = model.calculate_rows(scores, compiled, np.full(len(scores), row))
+        assert np.all(np.diff(batch.probability) >= 0)
+        assert np.all(batch.confidence_low <= batch.probability)
+        assert np.all(batch.probability <= batch.confidence_high)
+
+        up, down = model.calculate_from_percentile(80.0), model.calculate_from_percentile(20.0)
+        assert up.probability == 0.9 and down.probability == 0.1
+
+    def test_calibration(self, tmp_path):
+        """보정 적합(isotonic/platt): 단조, Brier 개선, 저장/로드 동일, calculate == calculate_many"""
+        import numpy as np
+        import pandas as pd
+        from theory_engine.probability import DistributionProbabilityModel, ProbabilityCalibration
+
+        # 실제 합격률 = 원확률보다 낮은 곡선 (p²)
+        rng = np.random.default_rng(3)
+        n = 4000
+        normal = rng.uniform(60, 95, n)
+        outcomes = pd.DataFrame({
+            "student_score": normal + rng.uniform(-8, 8, n),
+            "cutoff_safe": normal + 3.0,
+            "cutoff_normal": normal,
+            "cutoff_risk": normal - 3.0,
+            "program": np.where(rng.random(n) < 0.5, "가천의학 이과", "기타"),
+        })
+        raw = self.model.calculate_many(*(outcomes[c].to_numpy() for c in list(outcomes.columns)[:4]))
+        outcomes["admitted"] = (rng.random(n) < raw.probability ** 2).astype(int)
+
+        for method in ("isotonic", "platt"):
+            calibration = ProbabilityCalibration.fit(outcomes, method=method, by="program", min_samples=100)
+            assert np.all(np.diff(calibration.table, axis=1) >= -1e-12)
+            assert calibration.metadata["brier_after"] < calibration.metadata["brier_before"]
+            assert calibration.program_names == ["가천의학 이과", "기타"]
+
+        loaded = ProbabilityCalibration.load(str(calibration.save(str(tmp_path / "calibration.json"))))
+        assert np.allclose(loaded.table, calibration.table, atol=1e-6)
+        assert ProbabilityCalibration.load(str(tmp_path / "missing.json")) is None
+
+        # 모델 모드: 적합한 모델을 기록, 런타임 모드가 다르면 로드하지 않음
+        assert loaded.metadata["model"] == "linear"
+        assert ProbabilityCalibration.load(str(tmp_path / "calibration.json"), mode="linear") is not None
+        assert ProbabilityCalibration.load(str(tmp_path / "calibration.json"), mode="distribution") is None
+        fitted = ProbabilityCalibration.fit(outcomes, min_samples=100, model=DistributionProbabilityModel())
+        path = str(fitted.save(str(tmp_path / "distribution.json")))
+        assert fitted.metadata["model"] == "distribution"
+        assert ProbabilityCalibration.load(path, mode="distribution") is not None
+        assert ProbabilityCalibration.load(path, mode="linear") is None
+
+        model = AdmissionProbabilityModel(calibration=loaded)
+        scores = outcomes["student_score"].to_numpy()[:300]
+        batch = model.calculate_many(scores, 93.0, 90.0, 87.0, programs="가천의학 이과")
+        for i in range(len(scores)):
+            result = model.calculate(float(scores[i]), 93.0, 90.0, 87.0, program="가천의학 이과")
+            assert batch.result_at(i) == result
+            # 레벨은 보정 전과 같음
+            assert result.level == self.model.calculate(float(scores[i]), 93.0, 90.0, 87.0).level
+        assert model.calculate(92.0, 95.0, 90.0, 85.0).probability < self.model.calculate(92.0, 95.0, 90.0, 85.0).probability
+
+        # 항등 보정은 원확률 유지
+        identity = AdmissionProbabilityModel(calibration=ProbabilityCalibration.identity())
+        assert identity.calculate(92.0, 95.0, 90.0, 85.0) == self.model.calculate(92.0, 95.0, 90.0, 85.0)
+
 
 class TestDisqualificationEngine:
     """결격 체크 엔진 테스트"""
@@ -243,6 +390,195 @@ class TestDisqualificationEngine:
         result_non = self.engine.check(profile, target_non_med, severity_threshold=2)
         assert not result_non.is_disqualified
 
+    def test_rule_index_and_deferred_reason(self):
+        """대학별 룰 색인 == 전체 룰 순회 판정, explain=False는 사유만 생략"""
+        import re
+
+        profile = StudentProfile(
+            track=Track.SCIENCE,
+            korean=ExamScore(subject="국어(언매)", raw_total=80),
+            math=ExamScore(subject="수학(확통)", raw_total=75),
+            english_grade=3,
+            history_grade=5,
+            inquiry1=ExamScore(subject="생활과 윤리", raw_total=45),
+            inquiry2=ExamScore(subject="화학 Ⅰ", raw_total=48),
+        )
+        assert all(r.is_wildcard for r in self.engine._wildcard_rules)
+        assert not any(r.is_wildcard for r in self.engine._rules_by_university["서울대"])
+
+        for university, major in [("서울대", "의예"), ("연대", "공대"), ("가천대", "의학"),
+                                  ("없는대학", "KAIST"), ("포항공대", "물리")]:
+            official = self.engine._get_official_university(university)
+            expected = [
+                r.rule_id for r in self.engine.rules
+                if r.university_pattern == r".*"
+                or re.search(r.university_pattern, official, re.IGNORECASE)
+                or re.search(r.university_pattern, major, re.IGNORECASE)
+            ]
+            assert [r.rule_id for r in self.engine.applicable_rules(official, major)] == expected
+
+            target = TargetProgram(university, major)
+            for threshold in (1, 2):
+                full = self.engine.check(profile, target, severity_threshold=threshold)
+                quiet = self.engine.check(profile, target, severity_threshold=threshold, explain=False)
+                assert quiet.is_disqualified == full.is_disqualified
+                assert quiet.rules_triggered == full.rules_triggered and quiet.code == full.code
+                assert quiet.reason is None
+                assert self.engine.explain_reason(quiet, profile, target) == full.reason
+
+    def test_check_many_matches_rule_functions(self):
+        """2단계 비트셋 판정 == 룰별 check_func 평가 == check_many (사용자 정의 룰 포함)"""
+        import itertools
+        import re
+        from theory_engine.constants import DisqualificationCode
+        from theory_engine.disqualification import DisqualificationRule
+
+        engine = DisqualificationEngine()
+        engine.add_rule(DisqualificationRule(
+            rule_id="CUSTOM_001",
+            description="가천대 국어 80점 미만",
+            university_pattern=r"가천",
+            check_func=lambda p, t: p.korean.raw_total < 80,
+            code=DisqualificationCode.OTHER,
+            message_template="{university}: 국어 원점수 제한",
+            severity=2,
+        ))
+
+        profiles = [
+            StudentProfile(
+                track=track,
+                korean=ExamScore(subject="국어(언매)", raw_total=korean),
+                math=ExamScore(subject=math, raw_total=75),
+                english_grade=english,
+                history_grade=history,
+                inquiry1=ExamScore(subject=inq1, raw_total=45),
+                inquiry2=ExamScore(subject=inq2, raw_total=45),
+            )
+            for track, math, english, history, korean, (inq1, inq2) in itertools.product(
+                [Track.SCIENCE, Track.LIBERAL], ["수학(미적)", "수학(확통)"], [1, 3, 4], [3, 5], [70, 90],
+                [("물리학 Ⅰ", "화학 Ⅰ"), ("물리학 Ⅰ", "물리학 Ⅱ"), ("생활과 윤리", "화학 Ⅰ"), ("화학 Ⅰ", "화학 Ⅰ")],
+            )
+        ]
+        targets = [
+            TargetProgram(u, m)
+            for u in ["서울대", "연대", "가천대", "경희대", "없는대학"]
+            for m in ["의예", "공대", "의류학", "치의예과", "KAIST"]
+        ]
+        masks = engine.target_masks(targets)
+
+        for profile in profiles:
+            for threshold in (1, 2):
+                batch = engine.check_many(profile, targets, severity_threshold=threshold, masks=masks)
+                for i, target in enumerate(targets):
+                    official = engine._get_official_university(target.university)
+                    expected = sorted(
+                        (r for r in engine.rules
+                         if r.severity >= threshold
+                         and (r.university_pattern == r".*"
+                              or re.search(r.university_pattern, official, re.IGNORECASE)
+                              or re.search(r.university_pattern, target.major, re.IGNORECASE))
+                         and r.check_func(profile, target)),
+                        key=lambda r: -r.severity
+                    )
+                    single = engine.check(profile, target, severity_threshold=threshold, explain=False)
+                    assert single.rules_triggered == [r.rule_id for r in expected]
+                    assert batch.info_at(i) == single
+                    assert (batch.rule_code[i] == 0) == (not expected)
+
+        # 학생 × 대상 행렬 (작은 청크로 청크 경계 포함) == 셀별 check 주 결격 룰
+        for threshold in (1, 2):
+            matrix = engine.check_matrix(profiles, targets, severity_threshold=threshold, chunk_cells=7)
+            assert matrix.shape == (len(profiles), len(targets))
+            for i, profile in enumerate(profiles):
+                for j, target in enumerate(targets):
+                    single = engine.check(profile, target, severity_threshold=threshold, explain=False)
+                    assert matrix.disqualified[i, j] == single.is_disqualified
+                    assert matrix.rule_at(i, j) == (single.rules_triggered[0] if single.is_disqualified else None)
+                    assert matrix.code_at(i, j) == single.code
+
+
+    def test_restrict_sheet_rules(self, mock_excel_data):
+        """RESTRICT 블록 → 요구조건 테이블, check_disqualification/스윕에 병합"""
+        import pandas as pd
+        from theory_engine import rules
+        from theory_engine.analysis import ProgramSweep
+        from theory_engine.constants import DisqualificationCode
+        from theory_engine.disqualification import RestrictTable
+        from theory_engine.disqualification.restrict_compiler import parse_science_subjects
+
+        assert parse_science_subjects("서로 다른 과목") == (0, True)
+        assert parse_science_subjects("동일 과목 Ⅰ+Ⅱ 불가") == (0, True)
+        assert parse_science_subjects("동일 과목 가능") == (0, False)
+        assert parse_science_subjects("Ⅱ 1과목 필수, 동일 과목 가능") == (1, False)
+
+        table = RestrictTable.compile(mock_excel_data["RESTRICT"])
+        assert set(table.programs) == {
+            "한양대자연 이과", "연세대의학 이과", "서울대공대 이과", "이화여대인문 문과", "숙명여대인문 문과",
+        }
+        seoul = table.rules.loc["서울대공대 이과"]
+        assert (seoul["max_english"], seoul["max_history"]) == (2, 3)
+        assert seoul["no_second_language"] and seoul["distinct_science"]
+        assert table.rules.loc["연세대의학 이과", "min_science2"] == 1
+        assert table.rules.loc["숙명여대인문 문과", "max_english"] == 3
+        # 계열이 다른 모집단위 룰은 적용하지 않음
+        assert table.row_for("서울대", "공대", "문과") is None
+        assert table.row_for("연대", "의예", "이과") == table.row_of_program("연세대의학 이과")
+
+        profile = StudentProfile(
+            track=Track.SCIENCE,
+            korean=ExamScore(subject="국어(언매)", raw_total=85),
+            math=ExamScore(subject="수학(미적)", raw_total=82),
+            english_grade=2,
+            history_grade=3,
+            inquiry1=ExamScore(subject="화학 Ⅰ", raw_total=47),
+            inquiry2=ExamScore(subject="화학 Ⅱ", raw_total=45),
+        )
+        restrict_df = mock_excel_data["RESTRICT"]
+        seoul_result = rules.check_disqualification(restrict_df, profile, TargetProgram("서울대", "공대"))
+        assert seoul_result.is_disqualified
+        assert seoul_result.rules_triggered == ["RESTRICT_SAME_SUBJECT"]
+        assert seoul_result.code == DisqualificationCode.INQUIRY_COMBINATION
+        assert "서울대공대 이과" in seoul_result.reason
+        assert not rules.check_disqualification(restrict_df, profile, TargetProgram("연대", "의예")).is_disqualified
+        assert not rules.check_disqualification(pd.DataFrame(), profile, TargetProgram("서울대", "공대")).is_disqualified
+
+        # 엔진 룰 ID 뒤에 RESTRICT 룰 ID (위반 비트 순서)
+        profile.english_grade = 3
+        merged = rules.check_disqualification(restrict_df, profile, TargetProgram("서울대", "공대"), explain=False)
+        engine_only = self.engine.check(profile, TargetProgram("서울대", "공대"), severity_threshold=2, explain=False)
+        assert merged.rules_triggered[:len(engine_only.rules_triggered)] == engine_only.rules_triggered
+        assert merged.rules_triggered[-2:] == ["RESTRICT_ENGLISH", "RESTRICT_SAME_SUBJECT"]
+
+        # 스윕 결격 == 컬럼별 check_disqualification
+        sweep = ProgramSweep(mock_excel_data["PERCENTAGE"], restrict_df)
+        swept = sweep.sweep(10.0, profile=profile, levels=None, include_disqualified=True)
+        for row in swept.itertuples():
+            university, major, _ = CutoffExtractor.parse_program_column(row.column)
+            if university is None:
+                continue
+            expected = rules.check_disqualification(restrict_df, profile, TargetProgram(university, major))
+            assert row.disqualified == expected.is_disqualified, row.column
+
+        # 학생 × 대상 행렬 (엔진 룰 우선, 다음 RESTRICT 첫 위반)
+        liberal = StudentProfile(
+            track=Track.LIBERAL,
+            korean=ExamScore(subject="국어(화작)", raw_total=85),
+            math=ExamScore(subject="수학(확통)", raw_total=90),
+            english_grade=2,
+            history_grade=3,
+            inquiry1=ExamScore(subject="생활과 윤리", raw_total=47),
+            inquiry2=ExamScore(subject="일본어 Ⅰ", raw_total=45),
+        )
+        profiles = [profile, liberal]
+        targets = [TargetProgram(u, m) for u, m in [("서울대", "공대"), ("연대", "의예"), ("이화여대", "인문")]]
+        matrix = rules.check_disqualification_matrix(restrict_df, profiles, targets)
+        for i, p in enumerate(profiles):
+            for j, target in enumerate(targets):
+                expected = rules.check_disqualification(restrict_df, p, target, explain=False)
+                assert matrix.rule_at(i, j) == (expected.rules_triggered[0] if expected.is_disqualified else None)
+        assert matrix.rule_at(1, 2) == "RESTRICT_SECOND_FOREIGN"
+        assert sum(matrix.counts_by_rule().values()) == int(matrix.disqualified.sum())
+
 
 class TestCutoffExtractor:
     """커트라인 추출 테스트 (Mock 데이터)"""
@@ -293,6 +629,410 @@ class TestCutoffExtractor:
         # 괄호/특수문자 포함 대학도 정규화 후 정확 매핑되어야 함
         assert extractor._get_official_university("연세대(원주)") == "연세대(원주)"
 
+    def test_match_universities_bulk(self):
+        """대학명 대량 매칭: 별칭 정확 매칭 + 과도한 퍼지 매핑 방지"""
+        df = CutoffExtractor.match_universities(["연대", "고려대학교", "연대", "서울과기대"])
+
+        assert df["canonical"].tolist()[:3] == ["연세대", "고려대", "연세대"]
+        assert df["stage"].tolist()[:3] == ["exact", "exact", "exact"]
+        # 미등록 대학은 원본 유지
+        assert df.loc[3, "canonical"] == "서울과기대"
+        assert df.loc[3, "stage"] == "none"
+
+    def test_program_column_index(self):
+        """컬럼명 파싱 + 대학별/전공별 인덱스"""
+        import pandas as pd
+
+        df = pd.DataFrame({
+            "%": [0.0, 50.0, 94.0],
+            "가천의학 이과": [100.0, 70.0, 30.0],
+            "연대원주의학 이과": [99.0, 69.0, 29.0],
+            "고려대 경영 문과": [98.0, 68.0, 28.0],
+        })
+        extractor = CutoffExtractor(df)
+
+        assert extractor.program_keys["가천의학 이과"] == ("가천대", "의학", "이과")
+        assert extractor.program_keys["연대원주의학 이과"] == ("연세대(원주)", "의학", "이과")
+        assert extractor.program_keys["고려대 경영 문과"] == ("고려대", "경영", "문과")
+        assert extractor.programs_by_university("고대") == ["고려대 경영 문과"]
+        assert extractor.programs_by_major("의학") == ["가천의학 이과", "연대원주의학 이과"]
+
+    def test_column_resolution_memoized(self):
+        """같은 target 재조회 시 동일 컬럼/match_info (캐시)"""
+        import pandas as pd
+
+        df = pd.DataFrame({
+            "%": [0.0, 50.0, 94.0],
+            "가천의학 이과": [100.0, 70.0, 30.0],
+            "가천한의 이과": [99.0, 69.0, 29.0],
+        })
+        extractor = CutoffExtractor(df)
+
+        first = extractor.match_program("가천", "의예", "이과")
+        assert first.column == "가천의학 이과"
+        assert first.stage == "major_alias"
+
+        extractor.match_program("가천", "한의", "이과")
+        assert extractor.match_program("가천", "의예", "이과") is first
+
+    def test_resolve_single_pass(self, mock_excel_data, monkeypatch):
+        """resolve() == extract_cutoffs() + lookup_score(), 컬럼 매칭 1회"""
+        import pandas as pd
+
+        percentage_df = mock_excel_data["PERCENTAGE"]
+        # 누백 축 중복 → 컴파일 없이 컬럼 곡선 캐시 경로
+        duplicated = pd.concat([percentage_df, percentage_df.iloc[[0]]], ignore_index=True)
+
+        for df in (percentage_df, duplicated):
+            extractor = CutoffExtractor(df)
+            calls = []
+            original = extractor._resolve_program_column
+            monkeypatch.setattr(
+                extractor, "_resolve_program_column",
+                lambda *a: calls.append(a) or original(*a),
+            )
+            for univ, major in [("가천", "의학"), ("연세대", "의예"), ("없는대", "의학")]:
+                for pct in (0.0, 12.3, 50.0):
+                    resolved = extractor.resolve(univ, major, "이과", pct)
+                    cutoffs = extractor.extract_cutoffs(univ, major, "이과")
+                    lookup = extractor.lookup_score(univ, major, pct, "이과")
+                    assert resolved.found == cutoffs["found"]
+                    assert resolved.column == cutoffs["column"]
+                    for key in ("cutoff_safe", "cutoff_normal", "cutoff_risk"):
+                        assert getattr(resolved, key) == cutoffs[key]
+                    assert resolved.score == (lookup.score if lookup else None)
+                    assert resolved.interpolated == (lookup.interpolated if lookup else None)
+            assert len(calls) == 3
+
+    def test_resolve_many_batches_fuzzy(self, mock_excel_data, monkeypatch):
+        """resolve_many == 단건 match_program, 퍼지 단계는 질의당 1회 (배치)"""
+        pytest.importorskip("rapidfuzz")
+        from theory_engine.cutoff import cutoff_extractor as module
+
+        targets = [
+            ("이화여대", "인문학", "문과"),
+            ("숙명", "인문학", "문과"),
+            ("가천", "의학", "이과"),
+            ("서울대", "공학", "이과"),
+            ("없는대", "의학", "이과"),
+            ("이화여대", "인문학", "문과"),
+        ]
+        batched = CutoffExtractor(mock_excel_data["PERCENTAGE"])
+        calls = []
+        original = module.score_matrix
+        monkeypatch.setattr(module, "score_matrix", lambda q, *a, **kw: calls.append(list(q)) or original(q, *a, **kw))
+
+        matches = batched.resolve_many(targets)
+        assert calls == [["이화여대인문학 문과", "숙명여대인문학 문과", "서울대공학 이과", "없는대의학 이과"]]
+        assert [m.stage for m in matches] == ["fuzzy", "fuzzy", "exact", "fuzzy", "not_found", "fuzzy"]
+
+        single = CutoffExtractor(mock_excel_data["PERCENTAGE"])
+        for target, match in zip(targets, matches):
+            assert single.match_program(*target) == match
+
+    def test_fuzzy_batch_tie_parity(self, mock_excel_data):
+        """배치 퍼지 == extractOne: 소수점 근접 동점도 컬럼 순서상 첫 번째 최고점"""
+        pytest.importorskip("rapidfuzz")
+        import numpy as np
+        from rapidfuzz import fuzz, process
+        from theory_engine.matchers.bulk import score_matrix
+
+        # float32에서는 60.00000000000001 과 60.0 이 같은 값이 되어 뒤 후보가 선택됨
+        query, choices = "가대차자과", ["가자차마과", "파가차자아사과다인이"]
+        matrix = score_matrix([query], choices, fallback_scorer=None, scorer=fuzz.WRatio, dtype=np.float64)
+        best = process.extractOne(query, choices, scorer=fuzz.WRatio)
+        assert choices[int(matrix[0].argmax())] == best[0]
+        assert float(matrix[0].max()) == best[1]
+
+        extractor = CutoffExtractor(mock_excel_data["PERCENTAGE"])
+        queries = ["이화여대인문학 문과", "숙명여대인문학 문과", "서울대공학 이과", "가천의학 이과", "없는대의학 이과"]
+        extractor._fuzzy_lookup_many(queries)
+        for query in queries:
+            best = process.extractOne(query, extractor._program_column_strs, scorer=fuzz.WRatio, score_cutoff=80)
+            assert extractor._fuzzy_cache[query] == ((best[0], float(best[1])) if best else None)
+
+    def test_program_catalog(self, mock_excel_data):
+        """카탈로그 검색: 부분 문자열 호환, 별칭/자모/초성, 매칭 품질 순"""
+        from theory_engine.cutoff.program_catalog import decompose_hangul, chosung
+
+        assert decompose_hangul("가천") == "ㄱㅏㅊㅓㄴ"
+        assert decompose_hangul("의과") == "ㅇㅡㅣㄱㅗㅏ"
+        assert chosung("연세대") == "ㅇㅅㄷ"
+
+        extractor = CutoffExtractor(mock_excel_data["PERCENTAGE"])
+        for keyword in ["의학", "가", "이과", "대공", "없음", ""]:
+            assert extractor.search_programs(keyword) == [
+                c for c in extractor.program_columns if keyword in str(c)
+            ]
+
+        catalog = extractor.catalog
+        # 입력 중 음절 / 초성 / 별칭
+        assert set(catalog.autocomplete("갗")) == {"가천의학 이과", "가천한의 이과"}
+        assert set(catalog.autocomplete("ㄱㅊ")) == {"가천의학 이과", "가천한의 이과"}
+        assert catalog.autocomplete("연대 의예") == ["연세대의학 이과"]
+        assert catalog.autocomplete("snu") == ["서울대공대 이과"]
+
+        # 전공 정확 매칭이 부분 문자열보다 먼저
+        hits = catalog.search("가천 의")
+        assert [h.column for h in hits] == ["가천의학 이과", "가천한의 이과"]
+        assert hits[0].score > hits[1].score
+        assert catalog.search("인문", track="이과") == []
+
+    def test_results_are_immutable_and_thread_safe(self):
+        """매칭/조회 결과는 불변 객체, 동시 조회 시 서로 섞이지 않음"""
+        import dataclasses
+        from concurrent.futures import ThreadPoolExecutor
+        import pandas as pd
+
+        df = pd.DataFrame({
+            "%": [0.0, 50.0, 94.0],
+            "가천의학 이과": [100.0, 70.0, 30.0],
+            "가천한의 이과": [99.0, 69.0, 29.0],
+        })
+        extractor = CutoffExtractor(df)
+
+        match = extractor.match_program("가천", "의학", "이과")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            match.column = "x"
+        with pytest.raises(TypeError):
+            match.match_info["column"] = "x"
+        assert not hasattr(extractor, "_last_match_info")
+        assert not hasattr(extractor, "_last_score_lookup")
+
+        lookup = extractor.lookup_score("가천", "의학", 50.0, "이과")
+        assert (lookup.column, lookup.score, lookup.interpolated) == ("가천의학 이과", 70.0, False)
+
+        queries = [("의학", 50.0 + i % 7) if i % 2 else ("한의", 25.0 + i % 5) for i in range(400)]
+
+        def run(query):
+            major, pct = query
+            return extractor.lookup_score("가천", major, pct, "이과")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            results = list(pool.map(run, queries))
+        for (major, pct), result in zip(queries, results):
+            expected = extractor.lookup_score("가천", major, pct, "이과")
+            assert result == expected
+            assert result.column == f"가천{major} 이과"
+
+
+class TestCompiledPercentage:
+    """PERCENTAGE 컴파일 행렬 (컬럼별 계산과 동일 결과)"""
+
+    def test_parity_with_column_path(self, mock_excel_data):
+        import numpy as np
+
+        extractor = CutoffExtractor(mock_excel_data["PERCENTAGE"])
+        compiled = extractor.compiled
+        assert compiled is not None
+
+        for col in extractor.program_columns:
+            row = compiled.row_of(col)
+            assert compiled.cutoffs_of(row) == extractor._calculate_cutoffs_from_column(col)
+            curve = extractor.get_score_curve(col)
+            for pct in [0.0, 20.0, 20.25, 21.0, 37.3, 50.0, 88.8, 93.9, 120.0]:
+                assert compiled.score_at(row, pct) == extractor.score_from_curve(curve, pct)
+
+        # 결측 구간(건국자연 rows 40:44 → 누백 20.0~21.5)은 보간으로 표시
+        row = compiled.row_of("건국자연 이과")
+        assert compiled.score_at(row, 21.0)[1] is True
+        assert not compiled.observed[row, 42]
+        vector = compiled.scores_at(37.3)
+        assert vector[row] == np.interp(37.3, compiled.percentiles, compiled.scores[row])
+
+    def test_sparse_column_has_no_cutoffs(self):
+        import pandas as pd
+
+        df = pd.DataFrame({
+            "%": [0.0, 50.0, 94.0],
+            "가천의학 이과": [None, 70.0, None],
+        })
+        extractor = CutoffExtractor(df)
+        res = extractor.extract_cutoffs("가천", "의학", "이과")
+        assert res["found"] is True
+        assert res["cutoff_safe"] is None
+        assert extractor.get_score_at_percentile("가천", "의학", 50.0, "이과") is None
+
+    def test_monotone_cubic(self):
+        """PCHIP: 노드 값 유지, 구간 내 단조, 결측 행/곡선 경로 동일"""
+        import numpy as np
+        import pandas as pd
+        from theory_engine.cutoff.compiled_matrix import MONOTONE_CUBIC
+
+        df = pd.DataFrame({
+            "%": [0.0, 1.0, 2.0, 3.0],
+            "가천의학 이과": [0.0, 1.0, 4.0, 9.0],
+            "가천한의 이과": [0.0, None, 4.0, 9.0],
+        })
+        extractor = CutoffExtractor(df)
+        compiled = extractor.compiled
+
+        # scipy PchipInterpolator와 같은 기울기 규칙 (손계산 값)
+        assert compiled.evaluate_spline(np.array([1.5]), rows=[0])[0, 0] == pytest.approx(2.21875)
+        assert extractor.score_for_column("가천의학 이과", 1.0, MONOTONE_CUBIC) == (1.0, False)
+
+        grid = np.linspace(-1.0, 4.0, 501)
+        curves = compiled.evaluate_spline(grid)
+        assert curves.shape == (2, 501)
+        assert (np.diff(curves, axis=1) >= -1e-12).all()
+
+        # 결측 행: 관측 노드만으로 만든 곡선과 동일
+        curve = extractor.get_score_curve("가천한의 이과")
+        for pct in (0.5, 1.5, 2.5):
+            assert extractor.score_from_curve(curve, pct, MONOTONE_CUBIC) == \
+                extractor.score_for_column("가천한의 이과", pct, MONOTONE_CUBIC)
+
+        resolved = extractor.resolve("가천", "의학", "이과", 1.5, method=MONOTONE_CUBIC)
+        assert resolved.score == 2.22
+        assert resolved.interpolation_method == MONOTONE_CUBIC
+        assert extractor.resolve("가천", "의학", "이과", 1.5).score == 2.5
+
+    def test_monotone_cubic_edge_gaps(self, mock_excel_data):
+        """관측 범위 밖(앞/뒤 결측) 구간은 가장자리 값 고정, 곡선 전체 단조"""
+        import numpy as np
+        import pandas as pd
+        from theory_engine.cutoff.compiled_matrix import MONOTONE_CUBIC
+
+        df = pd.DataFrame({
+            "%": [0.0, 1.0, 2.0, 3.0, 4.0, 5.0],
+            "가천의학 이과": [None, 1.0, 4.0, 9.0, None, None],
+        })
+        compiled = CutoffExtractor(df).compiled
+        grid = np.linspace(-1.0, 6.0, 701)
+        curve = compiled.evaluate_spline(grid)[0]
+        assert (np.diff(curve) >= -1e-12).all()
+        assert (curve[grid <= 1.0] == 1.0).all()
+        assert (curve[grid >= 3.0] == 9.0).all()
+
+        # Mock 워크북: 마지막 관측 누백 이후 구간
+        compiled = CutoffExtractor(mock_excel_data["PERCENTAGE"]).compiled
+        row = compiled.row_of("경기인문 문과")
+        last = compiled.percentiles[compiled.observed[row]].max()
+        assert not compiled.observed[row, -1]
+        grid = np.linspace(compiled.percentiles[0], compiled.percentiles[-1], 2001)
+        curve = compiled.evaluate_spline(grid, rows=[row])[0]
+        assert (np.diff(curve) <= 1e-12).all()       # 누백↑ → 점수↓
+        edge = compiled.score_at(row, last, MONOTONE_CUBIC)[0]
+        assert compiled.score_at(row, last + 0.25, MONOTONE_CUBIC)[0] == edge
+
+    def test_percentile_grid(self, mock_excel_data):
+        """균일 격자: 관측점 정확 값, 보간은 양자화 오차(소수 2자리 1단위) 이내"""
+        import numpy as np
+        from theory_engine.cutoff import PercentileGrid
+
+        extractor = CutoffExtractor(mock_excel_data["PERCENTAGE"], grid_step=0.01)
+        compiled, grid = extractor.compiled, extractor.grid
+        assert grid.values.dtype == np.float32 and grid.values.flags.c_contiguous
+        assert grid.end >= compiled.percentiles[-1]
+
+        packed = PercentileGrid.build(compiled, step=0.01, dtype="uint16")
+        assert packed.nbytes * 2 == grid.nbytes
+
+        rng = np.random.default_rng(0)
+        pcts = np.concatenate([compiled.percentiles, rng.uniform(-1.0, 101.0, 50)])
+        for g in (grid, packed):
+            assert g.get_stats()["max_abs_error"] < 0.002
+            for row in range(len(compiled.columns)):
+                for pct in pcts:
+                    expected, grid_result = compiled.score_at(row, pct), g.score_at(row, pct)
+                    assert grid_result[1] == expected[1]
+                    assert abs(grid_result[0] - expected[0]) <= 0.0100001
+                    if not expected[1]:
+                        assert grid_result == expected
+
+        # 추출기 조회 경로도 격자 사용 (커트라인은 컴파일 값 그대로)
+        plain = CutoffExtractor(mock_excel_data["PERCENTAGE"])
+        assert extractor.extract_cutoffs("가천", "의학", "이과") == plain.extract_cutoffs("가천", "의학", "이과")
+        assert extractor.resolve("가천", "의학", "이과", 20.0).score == plain.resolve("가천", "의학", "이과", 20.0).score
+
+class TestPercentageStore:
+    """PERCENTAGE Long 저장소"""
+
+    def test_matches_legacy_melt(self, mock_excel_data):
+        """to_legacy_long == 기존 melt + dropna + rsplit 결과, 파싱 키 == CutoffExtractor"""
+        import pandas as pd
+        from theory_engine.cutoff import PercentageStore
+
+        df = mock_excel_data["PERCENTAGE"]
+        store = PercentageStore.build(df)
+
+        legacy = df.melt(id_vars=["%"], var_name="program", value_name="score")
+        legacy = legacy.rename(columns={"%": "percentile"}).dropna(subset=["score"])
+        legacy[["university_major", "track"]] = legacy["program"].str.rsplit(" ", n=1, expand=True)
+        pd.testing.assert_frame_equal(store.to_legacy_long(), legacy.reset_index(drop=True))
+
+        extractor = CutoffExtractor(df)
+        assert store.program_keys() == extractor.program_keys
+        assert CutoffExtractor(df, store=store).program_keys == extractor.program_keys
+
+        long_df = store.to_long()
+        assert long_df["program"].dtype == "category" and long_df["university"].dtype == "category"
+        gachon = long_df[long_df["program"] == "가천의학 이과"]
+        assert set(gachon["university"]) == {"가천대"} and set(gachon["track"]) == {"이과"}
+        pct, score = store.scores_of("경기인문 문과")
+        assert len(pct) == df["경기인문 문과"].notna().sum()
+        assert score[0] == df["경기인문 문과"].iloc[0]
+
+    def test_loader_builds_once_per_workbook(self, mock_excel_data, tmp_path, monkeypatch):
+        """메모리 → 디스크 → 구축 순서, 원본 mtime/크기 변경 시 재구축"""
+        from theory_engine import loader
+
+        workbook = tmp_path / "book.xlsx"
+        workbook.write_bytes(b"v1")
+        store_path = tmp_path / "percentage_store.pkl"
+        calls = []
+
+        def fake_raw(path=None):
+            calls.append(path)
+            return mock_excel_data["PERCENTAGE"]
+
+        monkeypatch.setattr(loader, "load_percentage_raw", fake_raw)
+        loader.clear_workbook_cache()
+
+        first = loader.load_percentage_store(workbook, store_path=store_path)
+        assert store_path.exists() and len(calls) == 1
+        assert loader.load_percentage_store(workbook, store_path=store_path) is first
+
+        loader.clear_workbook_cache()
+        from_disk = loader.load_percentage_store(workbook, store_path=store_path)
+        assert len(calls) == 1 and from_disk.get_stats() == first.get_stats()
+
+        workbook.write_bytes(b"v2-changed")
+        loader.load_percentage_store(workbook, store_path=store_path)
+        assert len(calls) == 2
+        loader.clear_workbook_cache()
+
+    def test_store_shared_with_extractor(self, mock_excel_data, tmp_path, monkeypatch):
+        """워크북 캐시 시트 → 캐시된 저장소를 CutoffExtractor가 재사용, 레거시 API는 디스크 미기록"""
+        from theory_engine import loader, rules
+        from theory_engine.cutoff import PercentageStore
+
+        workbook = (tmp_path / "book.xlsx").resolve()
+        workbook.write_bytes(b"v1")
+        df = mock_excel_data["PERCENTAGE"]
+        monkeypatch.setattr(loader, "load_percentage_raw", lambda path=None: df)
+        loader.clear_workbook_cache()
+        try:
+            assert loader.percentage_store_for(df) is None
+            store = loader.load_percentage_store(workbook, store_path=tmp_path / "store.pkl")
+            loader._workbook_cache[(str(workbook), False)] = {"PERCENTAGE": df}
+            loader._workbook_mtime[(str(workbook), False)] = workbook.stat().st_mtime
+            assert loader.percentage_store_for(df) is store
+            assert loader.percentage_store_for(df.copy()) is None
+
+            used = []
+            monkeypatch.setattr(store, "program_keys", lambda: used.append(1) or PercentageStore.program_keys(store))
+            monkeypatch.setattr(rules, "_cutoff_extractor_source", None)
+            extractor = rules.get_cutoff_extractor(df)
+            assert used and extractor.program_keys == CutoffExtractor(df).program_keys
+            monkeypatch.setattr(rules, "_cutoff_extractor_source", None)
+
+            loader.clear_workbook_cache()
+            monkeypatch.setattr(PercentageStore, "save", lambda *a, **k: pytest.fail("디스크 기록"))
+            assert len(loader.load_percentage_normalized(str(workbook))) == store.get_stats()["rows"]
+        finally:
+            loader.clear_workbook_cache()
+
 
 class TestIndexOptimizer:
     """INDEX 최적화 테스트 (Mock 데이터)"""
@@ -303,6 +1043,26 @@ class TestIndexOptimizer:
         assert "math_std" in IndexOptimizer.KEY_COLUMNS
         assert "track" in IndexOptimizer.KEY_COLUMNS
 
+    def test_lookup_many_matches_lookup(self, mock_excel_data):
+        """일괄 조회 == 단건 조회 (정확/근사/계열 없음)"""
+        import numpy as np
+
+        optimizer = IndexOptimizer(mock_excel_data["INDEX"])
+        rng = np.random.default_rng(0)
+        keys = np.column_stack([
+            rng.integers(95, 160, 300), rng.integers(95, 160, 300),
+            rng.integers(15, 80, 300), rng.integers(15, 80, 300),
+        ])
+        keys[:100] = keys[:100] // 5 * 5
+        for track in ("이과", "문과", "예체"):
+            batch = optimizer.lookup_many(keys, track)
+            assert batch["exact"].any() == (track != "예체")
+            for i, key in enumerate(keys):
+                single = optimizer.lookup(*(int(v) for v in key), track)
+                assert batch["found"][i] == single["found"]
+                assert batch["exact"][i] == single["exact_match"]
+                assert batch["cumulative_pct"][i] == single["cumulative_pct"]
+
 
 class TestIntegration:
     """전체 통합 테스트"""
@@ -360,6 +1120,255 @@ class TestIntegration:
         assert 0.50 <= result.probability < 0.80
 
 
+class TestProfileCache:
+    """프로필 단위 변환/INDEX 캐시 테스트 (Mock 워크북)"""
+
+    @staticmethod
+    def _profile(targets):
+        return StudentProfile(
+            track=Track.SCIENCE,
+            korean=ExamScore(subject="국어(언매)", raw_total=85),
+            math=ExamScore(subject="수학(미적)", raw_total=82),
+            english_grade=2,
+            history_grade=3,
+            inquiry1=ExamScore(subject="물리학 Ⅰ", raw_total=47),
+            inquiry2=ExamScore(subject="화학 Ⅰ", raw_total=45),
+            targets=targets,
+        )
+
+    def test_repeat_evaluation_skips_conversion(self, mock_excel_data, monkeypatch):
+        """target만 바뀐 재평가는 변환/INDEX를 다시 계산하지 않음"""
+        from theory_engine import rules
+
+        rules.clear_profile_cache()
+        calls = []
+        original = rules.convert_raw_to_standard
+        monkeypatch.setattr(
+            rules, "convert_raw_to_standard",
+            lambda *a, **kw: calls.append(a[1]) or original(*a, **kw),
+        )
+
+        first = rules.compute_theory_result(mock_excel_data, self._profile([TargetProgram("가천", "의학")]))
+        assert len(calls) == 4
+
+        second = rules.compute_theory_result(
+            mock_excel_data, self._profile([TargetProgram("건국", "자연"), TargetProgram("가천", "의학")])
+        )
+        assert len(calls) == 4
+        assert second.raw_components == first.raw_components
+        assert second.program_results[1].score_theory == first.program_results[0].score_theory
+
+        # 캐시에서 꺼낸 값 수정이 캐시에 전파되지 않음
+        second.raw_components["rawscore_keys"].append("x")
+        third = rules.compute_theory_result(mock_excel_data, self._profile([]))
+        assert third.raw_components["rawscore_keys"] == first.raw_components["rawscore_keys"]
+
+    def test_cache_invalidated_on_workbook_change(self, mock_excel_data):
+        """RAWSCORE/INDEX DataFrame이 바뀌면 캐시 무효화"""
+        from theory_engine import rules
+
+        rules.clear_profile_cache()
+        profile = self._profile([])
+        rules.compute_theory_result(mock_excel_data, profile)
+        assert rules.get_profile_cache_stats()["size"] == 1
+
+        changed = dict(mock_excel_data)
+        changed["RAWSCORE"] = mock_excel_data["RAWSCORE"].assign(**{"202511(가채점)": 0})
+        result = rules.compute_theory_result(changed, profile)
+        assert result.raw_components["korean_standard"] == 0
+        assert rules.get_profile_cache_stats()["size"] == 1
+
+
+class TestRawscoreTable:
+    """RAWSCORE 사전계산 테이블"""
+
+    @pytest.fixture
+    def table(self, mock_excel_data):
+        from theory_engine.optimizers import RawscoreTable
+        return RawscoreTable.build(
+            mock_excel_data["RAWSCORE"], subjects=["국어(언매)", "물리학 Ⅰ"]
+        )
+
+    def test_build_matches_live_conversion(self, mock_excel_data, table):
+        """테이블 결과 == 다단계 매칭 결과 (match_type 포함)"""
+        from theory_engine import rules
+
+        rawscore_df = mock_excel_data["RAWSCORE"]
+        for subject, raw in [("국어(언매)", 85), ("물리학 Ⅰ", 47), ("물리학 Ⅰ", 0)]:
+            live = rules.convert_raw_to_standard(rawscore_df, subject, raw, use_table=False)
+            hit = table.lookup(rules.normalize_subject(subject), raw)
+            assert hit["source"] == "precomputed"
+            for col in ["key", "match_type", "standard_score", "percentile", "grade", "cumulative_pct"]:
+                assert hit[col] == live[col]
+
+    def test_save_load_roundtrip(self, table, tmp_path):
+        from theory_engine.optimizers import RawscoreTable
+
+        path = table.save(tmp_path / "rawscore_table.json")
+        loaded = RawscoreTable.load(path)
+        assert loaded.get_stats() == table.get_stats()
+        assert loaded.lookup("물리학 Ⅰ", 47) == table.lookup("물리학 Ⅰ", 47)
+
+    def test_runtime_skips_fuzzy_stages(self, mock_excel_data, table, monkeypatch):
+        """테이블 담당 과목은 시트 매칭 없이 조회, 범위 밖 원점수는 곧바로 실패"""
+        from theory_engine import rules
+
+        rawscore_df = mock_excel_data["RAWSCORE"]
+        rules.set_rawscore_table(table)
+        try:
+            monkeypatch.setattr(rules, "get_subject_matcher", lambda: pytest.fail("퍼지 단계 실행"))
+            result = rules.convert_raw_to_standard(rawscore_df, "물리학 Ⅰ", 47)
+            assert result["found"] and result["source"] == "precomputed"
+            missing = rules.convert_raw_to_standard(rawscore_df, "물리학 Ⅰ", 99)
+            assert not missing["found"] and missing["source"] == "precomputed"
+            monkeypatch.undo()
+
+            # 다른 시트(지문 불일치)에는 테이블 미사용, 불일치 판정도 시트별 1회
+            changed = rawscore_df.assign(**{"202511(가채점)": 0})
+            result = rules.convert_raw_to_standard(changed, "물리학 Ⅰ", 47)
+            assert result["source"] == "rawscore" and result["standard_score"] == 0
+            monkeypatch.setattr(table, "matches", lambda df: pytest.fail("지문 재계산"))
+            result = rules.convert_raw_to_standard(changed, "물리학 Ⅰ", 47)
+            assert result["source"] == "rawscore"
+        finally:
+            rules.set_rawscore_table(None)
+
+    def test_split_scores_without_split_entries(self, mock_excel_data):
+        """공통/선택 컬럼 없는 시트: 공통/선택 입력은 총점 엔트리로 대체 (라이브 경로와 동일)"""
+        from theory_engine import rules
+        from theory_engine.optimizers import RawscoreTable
+
+        profile = StudentProfile(
+            track=Track.SCIENCE,
+            korean=ExamScore(subject="국어(언매)", raw_common=70, raw_select=15, raw_total=85),
+            math=ExamScore(subject="수학(미적)", raw_common=60, raw_select=20, raw_total=80),
+            english_grade=2,
+            history_grade=3,
+            inquiry1=ExamScore(subject="물리학 Ⅰ", raw_total=47),
+            inquiry2=ExamScore(subject="화학 Ⅰ", raw_total=45),
+            targets=[TargetProgram("가천", "의학")],
+        )
+        live = rules.compute_theory_result(mock_excel_data, profile, use_cache=False)
+
+        rawscore_df = mock_excel_data["RAWSCORE"]
+        table = RawscoreTable.build(rawscore_df, subjects=["국어", "국어(언매)", "수학(미적)"])
+        assert table.get_stats()["split_entries"] == 0 and table.metadata["split_subjects"] == 0
+
+        # 공통/선택 입력도 다단계 매칭과 같은 결과/match_type ("국어"는 영역 매칭이라 총점 입력과 다름)
+        for subject, raw, common, select in [
+            ("국어(언매)", 85, 70, 15), ("수학(미적)", 80, 60, 20), ("국어", 85, 70, 15), ("국어", 30, 20, 10),
+        ]:
+            live_conv = rules.convert_raw_to_standard(rawscore_df, subject, raw, common, select, use_table=False)
+            hit = table.lookup(rules.normalize_subject(subject), raw, common, select)
+            for col in ["key", "match_type", "standard_score", "percentile", "grade", "cumulative_pct"]:
+                assert hit[col] == live_conv[col]
+
+        rules.set_rawscore_table(table)
+        try:
+            converted = rules.convert_raw_to_standard(rawscore_df, "국어(언매)", 85, 70, 15)
+            assert converted["found"] and converted["source"] == "precomputed"
+            assert converted["key"] == "국어(언매)-70-15"
+
+            result = rules.compute_theory_result(mock_excel_data, profile, use_cache=False)
+            assert result.raw_components["korean_standard"] == live.raw_components["korean_standard"] == 135
+            assert result.raw_components["math_standard"] == live.raw_components["math_standard"]
+            assert result.raw_components["cumulative_pct"] == live.raw_components["cumulative_pct"]
+            assert result.program_results[0].level_theory == live.program_results[0].level_theory
+        finally:
+            rules.set_rawscore_table(None)
+
+
+    def test_split_grid_is_exhaustive(self, mock_excel_data, monkeypatch):
+        """공통/선택 행이 있는 과목만 격자 구축, 범위 안은 다단계 매칭과 동일, 범위 밖은 즉시 실패"""
+        import pandas as pd
+        from theory_engine import rules
+        from theory_engine.optimizers import RawscoreTable
+
+        rows = [
+            {"영역": "수학(미적)", "과목명": "수학(미적)", "원점수": raw, "공통원점수": min(raw, 14),
+             "선택원점수": raw - min(raw, 14), "202511(가채점)": 50 + raw, "백분위": raw, "등급": 5, "누적%": 100 - raw}
+            for raw in range(0, 23)
+        ]
+        rawscore_df = pd.concat([mock_excel_data["RAWSCORE"], pd.DataFrame(rows)], ignore_index=True)
+        table = RawscoreTable.build(rawscore_df, subjects=["수학(미적)", "물리학 Ⅰ"])
+        stats = table.get_stats()
+        assert stats["split_subjects"] == 1 and stats["split_entries"] == 15 * 9
+        assert table.metadata["split_entries"] == stats["split_entries"]
+        assert "split" not in table.subjects["물리학 Ⅰ"]
+
+        for common, select in [(14, 8), (10, 0), (3, 5), (0, 0)]:
+            live = rules.convert_raw_to_standard(
+                rawscore_df, "수학(미적)", common + select, common, select, use_table=False
+            )
+            hit = table.lookup("수학(미적)", common + select, common, select)
+            for col in ["key", "match_type", "standard_score", "cumulative_pct"]:
+                assert hit[col] == live[col]
+
+        rules.set_rawscore_table(table)
+        try:
+            monkeypatch.setattr(rules, "get_subject_matcher", lambda: pytest.fail("퍼지 단계 실행"))
+            monkeypatch.setattr(rules, "normalize_subject", lambda s: s)
+            missing = rules.convert_raw_to_standard(rawscore_df, "수학(미적)", 30, 20, 10)
+            assert not missing["found"] and missing["source"] == "precomputed"
+        finally:
+            rules.set_rawscore_table(None)
+
+
+class TestConversionMetrics:
+    """RAWSCORE 변환 단계별 계측"""
+
+    def test_stage_counters_and_hook(self, mock_excel_data):
+        from theory_engine import rules
+        from theory_engine.metrics import get_conversion_metrics, register_metrics_hook, unregister_metrics_hook
+
+        metrics = get_conversion_metrics()
+        metrics.reset()
+        events = []
+        register_metrics_hook(events.append)
+        try:
+            rawscore_df = mock_excel_data["RAWSCORE"]
+            rules.convert_raw_to_standard(rawscore_df, "물리학 Ⅰ", 47)
+            rules.convert_raw_to_standard(rawscore_df, "물리학 Ⅰ", 99)
+        finally:
+            unregister_metrics_hook(events.append)
+
+        snapshot = metrics.snapshot()
+        assert snapshot["total"] == 2
+        assert snapshot["counters"]["stage2_과목명"] == 1
+        assert snapshot["counters"]["not_found"] == 1
+        assert snapshot["latency_ms"]["stage2_과목명"]["count"] == 1
+        assert [e["stage"] for e in events] == ["stage2_과목명", "not_found"]
+
+    def test_stage4_samples_bounded(self):
+        from theory_engine.metrics import ConversionMetrics
+
+        metrics = ConversionMetrics(sample_size=3, log_every=100)
+        metrics.register_hook(lambda event: 1 / 0)  # hook 실패는 무시
+        for raw in range(5):
+            metrics.record("stage4_global_fuzzy", 12.0, subject="물리1", raw_score=raw,
+                           match_type="stage4_global_fuzzy(score=90)")
+        metrics.record("stage3_fuzzy", 3.0, subject="화학1", raw_score=40)
+
+        snapshot = metrics.snapshot()
+        assert [s["raw_score"] for s in snapshot["stage4_samples"]] == [2, 3, 4]
+        assert snapshot["fallback_ratio"] == 1.0
+        assert snapshot["top_fallback_inputs"][0] == {
+            "stage": "stage4_global_fuzzy", "subject": "물리1", "count": 5
+        }
+
+    def test_fallback_inputs_bounded(self):
+        """자유 입력 집계는 상한 유지, 자주 도달한 입력은 남음"""
+        from theory_engine.metrics import ConversionMetrics
+
+        metrics = ConversionMetrics(log_every=1000, fallback_max_size=10)
+        for _ in range(3):
+            metrics.record("stage3_fuzzy", 1.0, subject="물리1", raw_score=40)
+        for i in range(100):
+            metrics.record("stage3_fuzzy", 1.0, subject=f"입력{i}", raw_score=40)
+        assert len(metrics.fallback_inputs) <= 10
+        assert metrics.top_fallback_inputs(1)[0]["subject"] == "물리1"
+
+
 class TestEdgeCases:
     """경계 케이스 테스트"""
 
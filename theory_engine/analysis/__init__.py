@@ -0,0 +1,80 @@
+"""
+학생 단위 분석 모듈 (compute_theory_result 배치 확장)
+
+사용법:
+    from theory_engine.analysis import search_electives
+
+    # 국어/수학 선택과목 × 탐구 2과목 조합을 한 번에 평가, target별 순위
+    ranking = search_electives(
+        excel_data, profile,
+        math_options=[ExamScore("수학(미적)", raw_total=84), ExamScore("수학(확통)", raw_total=92)],
+        inquiry_options=[ExamScore("물리학 Ⅰ", raw_total=45), ExamScore("화학 Ⅰ", raw_total=47),
+                         ExamScore("생명과학 Ⅰ", raw_total=44)],
+        top_n=3,
+    )
+
+    from theory_engine.analysis import sweep_programs
+
+    # 누백 1개로 전체 프로그램 스윕 (적정/예상/소신, 결격 제외)
+    table = sweep_programs(excel_data, 12.3, profile=profile)
+
+    from theory_engine.analysis import simulate_portfolio
+
+    # 가채점 오차 몬테카를로: target별 확률 분포 + 가/나/다군 중 하나 이상 합격 확률
+    result = simulate_portfolio(excel_data, profile, n=20000, seed=7, groups=["가", "나", "다"])
+
+    from theory_engine.analysis import IncrementalEvaluator
+
+    # 상담 화면: 필드 1개 변경 시 의존 단계만 재계산 + 직전 결과 대비 diff
+    evaluator = IncrementalEvaluator(excel_data)
+    evaluator.evaluate(profile)
+    profile.english_grade = 3
+    update = evaluator.evaluate(profile)     # update.diff, update.stages_run
+
+    from theory_engine.analysis import analyze_sensitivity
+
+    # target × 과목: 한 단계 위 레벨까지 최소 원점수/표준점수 상승폭
+    table = analyze_sensitivity(excel_data, profile)
+"""
+
+from .elective_search import (
+    ElectiveCombo,
+    ElectiveSearch,
+    search_electives,
+    ELECTIVE_RESULT_COLUMNS,
+)
+from .program_sweep import (
+    ProgramSweep,
+    sweep_programs,
+    SWEEP_RESULT_COLUMNS,
+    DEFAULT_SWEEP_LEVELS,
+)
+from .simulation import (
+    PortfolioSimulator,
+    SimulationResult,
+    simulate_portfolio,
+    SIMULATION_RESULT_COLUMNS,
+    DEFAULT_RAW_SD,
+)
+from .incremental import (
+    IncrementalEvaluator,
+    IncrementalResult,
+    ResultDiff,
+    TargetDiff,
+    diff_results,
+    FIELD_STAGES,
+)
+from .sensitivity import (
+    SensitivityAnalyzer,
+    analyze_sensitivity,
+    SENSITIVITY_RESULT_COLUMNS,
+)
+
+__all__ = [
+    "ElectiveCombo", "ElectiveSearch", "search_electives", "ELECTIVE_RESULT_COLUMNS",
+    "ProgramSweep", "sweep_programs", "SWEEP_RESULT_COLUMNS", "DEFAULT_SWEEP_LEVELS",
+    "PortfolioSimulator", "SimulationResult", "simulate_portfolio", "SIMULATION_RESULT_COLUMNS",
+    "DEFAULT_RAW_SD",
+    "IncrementalEvaluator", "IncrementalResult", "ResultDiff", "TargetDiff", "diff_results", "FIELD_STAGES",
+    "SensitivityAnalyzer", "analyze_sensitivity", "SENSITIVITY_RESULT_COLUMNS",
+]
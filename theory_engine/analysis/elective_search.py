@@ -0,0 +1,366 @@
+"""
+선택과목 조합 탐색기
+
+국어/수학 선택과목과 탐구 2과목 조합별로 원점수를 가정했을 때
+어느 조합이 지원 대학별로 가장 유리한지 한 번의 배치로 평가합니다.
+
+compute_theory_result()를 조합 수만큼 반복하는 대신
+- 원점수 변환: (과목, 원점수, 공통, 선택) 단위로 1회
+- INDEX 조회: (국, 수, 탐1, 탐2 표준점수, 계열) 단위로 1회
+- 결격: 학생 조건 키(수학/탐구 과목 등) 단위로 check_many 1회 (대상 마스크 공유)
+- PERCENTAGE: (target, 누백) 단위로 resolve 1회 (PERCENTAGE_INTERPOLATION_POLICY 보간)
+- 확률: 고유 (target, 누백) 전체를 calculate_many 1회
+만 계산하고 모든 조합이 결과를 공유합니다.
+"""
+
+import dataclasses
+import itertools
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..config import PERCENTAGE_INTERPOLATION_POLICY, InterpolationPolicy
+from ..constants import LevelTheory
+from ..cutoff import PercentageResolution
+from ..disqualification import merge_disqualification
+from ..model import DisqualificationInfo, ExamScore, StudentProfile, TargetProgram
+from ..probability import DistributionProbabilityModel, LEVEL_CODES
+from .. import rules
+
+logger = logging.getLogger(__name__)
+
+# 결과 DataFrame 컬럼
+ELECTIVE_RESULT_COLUMNS = [
+    "university",
+    "major",
+    "rank",
+    "combo_id",
+    "korean_subject",
+    "math_subject",
+    "inquiry1_subject",
+    "inquiry2_subject",
+    "korean_standard",
+    "math_standard",
+    "inquiry1_standard",
+    "inquiry2_standard",
+    "index_found",
+    "cumulative_pct",
+    "score",
+    "cutoff_safe",
+    "cutoff_normal",
+    "cutoff_risk",
+    "probability",
+    "level",
+    "disqualified",
+    "disqualification_reason",
+]
+
+# 순위 정렬 그룹 (정상 라인 → 데이터없음 → 결격)
+_LEVEL_GROUP = {
+    LevelTheory.NO_DATA.value: 1,
+    LevelTheory.DISQUALIFIED.value: 2,
+}
+
+
+@dataclass
+class ElectiveCombo:
+    """선택과목 조합 1건"""
+    korean: ExamScore
+    math: ExamScore
+    inquiry1: ExamScore
+    inquiry2: ExamScore
+
+    def label(self) -> str:
+        return f"{self.korean.subject}/{self.math.subject}/{self.inquiry1.subject}+{self.inquiry2.subject}"
+
+
+class ElectiveSearch:
+    """선택과목 조합 배치 평가기"""
+
+    def __init__(self, excel_data: Dict[str, pd.DataFrame]):
+        """
+        Args:
+            excel_data: 엑셀 시트 dict (load_workbook 결과)
+        """
+        self.excel_data = excel_data
+        # 조합 간 공유 캐시 (같은 워크북으로 여러 번 search() 호출 시에도 재사용)
+        self._conversions: Dict[Tuple, Dict[str, Any]] = {}
+        self._index: Dict[Tuple, Dict[str, Any]] = {}
+        self._resolutions: Dict[Tuple, PercentageResolution] = {}
+
+    # ============================================================
+    # 조합 생성
+    # ============================================================
+    @staticmethod
+    def build_combos(
+        profile: StudentProfile,
+        korean_options: Optional[Sequence[ExamScore]] = None,
+        math_options: Optional[Sequence[ExamScore]] = None,
+        inquiry_options: Optional[Sequence[ExamScore]] = None
+    ) -> List[ElectiveCombo]:
+        """
+        후보 조합 생성
+
+        Args:
+            profile: 학생 프로필 (옵션 미지정 과목은 프로필 값 사용)
+            korean_options: 국어 선택과목별 가정 점수
+            math_options: 수학 선택과목별 가정 점수
+            inquiry_options: 탐구 후보 과목 (서로 다른 2과목 조합을 모두 평가)
+
+        Returns:
+            ElectiveCombo 목록 (국어 × 수학 × 탐구쌍)
+        """
+        koreans = list(korean_options) if korean_options else [profile.korean]
+        maths = list(math_options) if math_options else [profile.math]
+
+        if inquiry_options:
+            pairs = [
+                (a, b) for a, b in itertools.combinations(inquiry_options, 2)
+                if rules.normalize_subject(a.subject) != rules.normalize_subject(b.subject)
+            ]
+        else:
+            pairs = [(profile.inquiry1, profile.inquiry2)]
+
+        return [
+            ElectiveCombo(korean=k, math=m, inquiry1=i1, inquiry2=i2)
+            for k, m, (i1, i2) in itertools.product(koreans, maths, pairs)
+        ]
+
+    # ============================================================
+    # 공유 단계
+    # ============================================================
+    def _convert(self, exam: ExamScore, inquiry: bool) -> Dict[str, Any]:
+        """원점수 변환 (compute_theory_result와 동일 규칙, 결과 공유)"""
+        if inquiry:
+            # 탐구는 과목명 정규화 후 총점으로 변환
+            subject = rules.normalize_subject(exam.subject)
+            key = (subject, exam.raw_total or 0, None, None)
+        else:
+            subject = exam.subject
+            key = (subject, exam.raw_total or 0, exam.raw_common, exam.raw_select)
+
+        conv = self._conversions.get(key)
+        if conv is None:
+            conv = rules.convert_raw_to_standard(self.excel_data["RAWSCORE"], *key)
+            conv["subject"] = subject
+            self._conversions[key] = conv
+        return conv
+
+    def _lookup_index(self, stds: Tuple, track: str) -> Optional[float]:
+        """INDEX 조회 → 누백 (실패 시 None)"""
+        if "INDEX" not in self.excel_data:
+            return None
+        key = stds + (track,)
+        result = self._index.get(key)
+        if result is None:
+            result = rules.lookup_index(self.excel_data["INDEX"], *stds, track)
+            self._index[key] = result
+        if not result or not result.get("found"):
+            return None
+        return result.get("cumulative_pct")
+
+    def _resolve(self, target: TargetProgram, track: str, student_pct: float) -> PercentageResolution:
+        """(target, 누백) → 컬럼/커트라인/환산점수 (lookup_percentage와 같은 보간 정책)"""
+        key = (target.university, target.major, track, student_pct)
+        resolution = self._resolutions.get(key)
+        if resolution is None:
+            method = (
+                InterpolationPolicy.MONOTONE_CUBIC.value
+                if PERCENTAGE_INTERPOLATION_POLICY == InterpolationPolicy.MONOTONE_CUBIC
+                else InterpolationPolicy.LINEAR.value
+            )
+            extractor = rules.get_cutoff_extractor(self.excel_data["PERCENTAGE"])
+            resolution = extractor.resolve(target.university, target.major, track, float(student_pct), method)
+            if not resolution.found:
+                logger.warning(f"PERCENTAGE에서 {target.university}{target.major} 찾을 수 없음")
+            self._resolutions[key] = resolution
+        return resolution
+
+    def _disqualifications(
+        self,
+        profile: StudentProfile,
+        targets: Sequence[TargetProgram],
+        masks: np.ndarray
+    ) -> List[DisqualificationInfo]:
+        """학생 1명 × target 전체 결격 (check_disqualification(severity_threshold=2)과 같은 판정/사유)"""
+        engine = rules.get_disqualification_engine()
+        batch = engine.check_many(profile, targets, severity_threshold=2, masks=masks)
+        table = rules.get_restrict_table(self.excel_data.get("RESTRICT", pd.DataFrame()))
+
+        infos = []
+        for j, target in enumerate(targets):
+            info = batch.info_at(j)
+            if info.is_disqualified:
+                info.reason = engine.explain_reason(info, profile, target)
+            elif table is not None:
+                info = merge_disqualification(info, table.check(profile, target, severity_threshold=2))
+            infos.append(info)
+        return infos
+
+    def _probabilities(self, resolutions: Sequence[PercentageResolution]) -> Tuple[np.ndarray, np.ndarray]:
+        """resolve 결과 목록 → (확률, 레벨) 일괄 계산 (calculate_probability와 같은 모델)"""
+        def values(name: str) -> np.ndarray:
+            return np.array(
+                [np.nan if getattr(r, name) is None else getattr(r, name) for r in resolutions], dtype=np.float64
+            )
+
+        scores = np.array([r.score or 0 for r in resolutions], dtype=np.float64)
+        columns = [r.column for r in resolutions]
+        model = rules.get_probability_model()
+        result = model.calculate_many(
+            scores, values("cutoff_safe"), values("cutoff_normal"), values("cutoff_risk"), columns
+        )
+        probability, level_code = result.probability.copy(), result.level_code.copy()
+
+        compiled = rules.get_cutoff_extractor(self.excel_data["PERCENTAGE"]).compiled
+        if isinstance(model, DistributionProbabilityModel) and compiled is not None:
+            rows = [compiled.row_of(c) for c in columns]
+            use = np.array([i for i, row in enumerate(rows) if row is not None], dtype=np.intp)
+            if len(use):
+                fitted = model.calculate_rows(scores[use], compiled, [rows[i] for i in use])
+                probability[use] = fitted.probability
+                level_code[use] = fitted.level_code
+        return probability, np.asarray(LEVEL_CODES, dtype=object)[level_code]
+
+    # ============================================================
+    # 탐색
+    # ============================================================
+    def search(
+        self,
+        profile: StudentProfile,
+        korean_options: Optional[Sequence[ExamScore]] = None,
+        math_options: Optional[Sequence[ExamScore]] = None,
+        inquiry_options: Optional[Sequence[ExamScore]] = None,
+        targets: Optional[Sequence[TargetProgram]] = None,
+        top_n: Optional[int] = None
+    ) -> pd.DataFrame:
+        """
+        전체 조합 평가 후 target별 순위
+
+        Args:
+            profile: 학생 프로필
+            korean_options / math_options / inquiry_options: build_combos() 참조
+            targets: 평가 대상 (None이면 profile.targets)
+            top_n: target별 상위 N개만 반환 (None이면 전체)
+
+        Returns:
+            DataFrame (ELECTIVE_RESULT_COLUMNS), target 순서 → rank 순 정렬
+            - rank: target 내 순위 (결격/데이터없음은 최하위, 이후 확률↓, 환산점수↓)
+        """
+        combos = self.build_combos(profile, korean_options, math_options, inquiry_options)
+        targets = list(targets) if targets is not None else list(profile.targets)
+        track = profile.track.value
+        has_percentage = "PERCENTAGE" in self.excel_data
+
+        engine = rules.get_disqualification_engine()
+        masks = engine.target_masks(targets)
+        disquals: Dict[Tuple, List[DisqualificationInfo]] = {}
+
+        rows: List[Dict[str, Any]] = []
+        pending: Dict[Tuple[int, float], List[Dict[str, Any]]] = {}
+        for combo_id, combo in enumerate(combos):
+            korean = self._convert(combo.korean, inquiry=False)
+            math = self._convert(combo.math, inquiry=False)
+            inq1 = self._convert(combo.inquiry1, inquiry=True)
+            inq2 = self._convert(combo.inquiry2, inquiry=True)
+
+            stds = tuple(
+                conv.get("standard_score") or 0 for conv in (korean, math, inq1, inq2)
+            )
+            cumulative_pct = self._lookup_index(stds, track)
+            student_pct = cumulative_pct if cumulative_pct else 50.0
+
+            combo_profile = dataclasses.replace(
+                profile,
+                korean=combo.korean,
+                math=combo.math,
+                inquiry1=combo.inquiry1,
+                inquiry2=combo.inquiry2,
+            )
+            # 결격은 학생 조건 키(수학/탐구 과목, 영어/한국사 등급)에만 의존 → 키별 1회
+            profile_key = engine.profile_key(combo_profile)
+            if profile_key not in disquals:
+                disquals[profile_key] = self._disqualifications(combo_profile, targets, masks)
+
+            base = {
+                "combo_id": combo_id,
+                "korean_subject": combo.korean.subject,
+                "math_subject": combo.math.subject,
+                "inquiry1_subject": inq1["subject"],
+                "inquiry2_subject": inq2["subject"],
+                "korean_standard": korean.get("standard_score"),
+                "math_standard": math.get("standard_score"),
+                "inquiry1_standard": inq1.get("standard_score"),
+                "inquiry2_standard": inq2.get("standard_score"),
+                "index_found": cumulative_pct is not None,
+                "cumulative_pct": cumulative_pct,
+            }
+
+            for target_idx, (target, disqual) in enumerate(zip(targets, disquals[profile_key])):
+                row = dict(base, _target=target_idx, university=target.university, major=target.major)
+                row.update(score=None, cutoff_safe=None, cutoff_normal=None, cutoff_risk=None,
+                           probability=None, disqualified=False, disqualification_reason=None)
+
+                if disqual.is_disqualified:
+                    row.update(level=LevelTheory.DISQUALIFIED.value, disqualified=True,
+                               disqualification_reason=disqual.reason)
+                elif has_percentage and self._resolve(target, track, student_pct).found:
+                    # 확률/레벨은 고유 (target, 누백) 단위로 아래에서 일괄 계산
+                    pending.setdefault((target_idx, student_pct), []).append(row)
+                else:
+                    row["level"] = LevelTheory.NO_DATA.value
+                rows.append(row)
+
+        if pending:
+            keys = list(pending)
+            resolutions = [self._resolve(targets[t], track, pct) for t, pct in keys]
+            probability, levels = self._probabilities(resolutions)
+            for key, resolution, prob, level in zip(keys, resolutions, probability, levels):
+                for row in pending[key]:
+                    row.update(
+                        score=resolution.score,
+                        cutoff_safe=resolution.cutoff_safe,
+                        cutoff_normal=resolution.cutoff_normal,
+                        cutoff_risk=resolution.cutoff_risk,
+                        probability=float(prob),
+                        level=rules.level_to_theory(level).value,
+                    )
+
+        return self._rank(rows, top_n)
+
+    @staticmethod
+    def _rank(rows: List[Dict[str, Any]], top_n: Optional[int]) -> pd.DataFrame:
+        """target별 순위 부여"""
+        if not rows:
+            return pd.DataFrame(columns=ELECTIVE_RESULT_COLUMNS)
+
+        df = pd.DataFrame(rows)
+        df["_group"] = df["level"].map(_LEVEL_GROUP).fillna(0)
+        df = df.sort_values(
+            ["_target", "_group", "probability", "score", "combo_id"],
+            ascending=[True, True, False, False, True],
+            na_position="last",
+            kind="mergesort",
+        )
+        df["rank"] = df.groupby("_target").cumcount() + 1
+        if top_n is not None:
+            df = df[df["rank"] <= top_n]
+        return df[ELECTIVE_RESULT_COLUMNS].reset_index(drop=True)
+
+
+def search_electives(
+    excel_data: Dict[str, pd.DataFrame],
+    profile: StudentProfile,
+    korean_options: Optional[Sequence[ExamScore]] = None,
+    math_options: Optional[Sequence[ExamScore]] = None,
+    inquiry_options: Optional[Sequence[ExamScore]] = None,
+    targets: Optional[Sequence[TargetProgram]] = None,
+    top_n: Optional[int] = None
+) -> pd.DataFrame:
+    """ElectiveSearch(excel_data).search(...) 간편 함수"""
+    return ElectiveSearch(excel_data).search(
+        profile, korean_options, math_options, inquiry_options, targets, top_n
+    )
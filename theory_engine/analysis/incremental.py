@@ -0,0 +1,363 @@
+"""
+증분 재평가 (상담 화면에서 입력 필드 1개 변경 시)
+
+compute_theory_result()를 단계로 나누고 단계별 입력 필드만으로 결과를 캐시합니다.
+필드가 바뀌면 그 필드에 의존하는 단계만 다시 계산하고 나머지는 이전 중간 결과를 재사용합니다.
+
+    필드                              단계
+    korean / math / inquiry 원점수    conversion → index → scoring
+    math / inquiry 과목명             conversion → index → scoring, disqualification
+    track                             index → scoring, disqualification
+    english_grade / history_grade     disqualification
+    targets                           (추가된 target만) disqualification, scoring
+
+- conversion: 과목 단위 (과목, 원점수, 공통, 선택)
+- index: (국, 수, 탐1, 탐2 표준점수, 계열) - 표준점수가 같으면 변환이 다시 돌아도 재사용
+- scoring: (target, 계열, 누백) - PERCENTAGE 조회 + 확률
+- disqualification: (target, 결격 판정 필드) - check_func 사용자 룰이 있으면 전체 필드
+
+결과는 compute_theory_result()와 같고 (performance_ms/computed_at 제외),
+직전 결과 대비 변경 사항(ResultDiff)을 함께 반환합니다.
+
+사용법:
+    evaluator = IncrementalEvaluator(excel_data)
+    first = evaluator.evaluate(profile)
+    profile.english_grade = 3
+    second = evaluator.evaluate(profile)
+    second.changed_fields      # ["english_grade"]
+    second.stages_run          # {"conversion": 0, "index": 0, "disqualification": 3, "scoring": 0}
+    second.diff.targets        # 레벨/확률/결격이 바뀐 target
+"""
+
+import copy
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from ..model import DisqualificationInfo, ProgramResult, StudentProfile, TargetProgram, TheoryResult
+from .. import rules
+
+logger = logging.getLogger(__name__)
+
+# 단계 이름 (실행 순서)
+STAGES = ("conversion", "index", "disqualification", "scoring")
+
+# StudentProfile 필드 → 직접 의존 단계 (하위 단계 전파는 중간 결과 키로 결정)
+FIELD_STAGES: Dict[str, Tuple[str, ...]] = {
+    "track": ("index", "disqualification", "scoring"),
+    "korean.subject": ("conversion",),
+    "korean.raw": ("conversion",),
+    "math.subject": ("conversion", "disqualification"),
+    "math.raw": ("conversion",),
+    "inquiry1.subject": ("conversion", "disqualification"),
+    "inquiry1.raw": ("conversion",),
+    "inquiry2.subject": ("conversion", "disqualification"),
+    "inquiry2.raw": ("conversion",),
+    "english_grade": ("disqualification",),
+    "history_grade": ("disqualification",),
+    "targets": ("disqualification", "scoring"),
+}
+
+# 결격 판정 필드 (내장 룰 + RESTRICT 룰)
+DISQUALIFICATION_FIELDS = tuple(
+    name for name, stages in FIELD_STAGES.items() if "disqualification" in stages and name != "targets"
+)
+
+# ProgramResult 비교 항목
+DIFF_FIELDS = (
+    "level_theory", "p_theory", "score_theory", "cutoff_safe", "cutoff_normal", "cutoff_risk",
+)
+
+# 단계별 캐시 크기
+DEFAULT_CACHE_SIZE = 4096
+
+
+def profile_fields(profile: StudentProfile) -> Dict[str, Any]:
+    """StudentProfile → 필드 경로별 값 (FIELD_STAGES 키, gpa_score 등 계산 미사용 필드 제외)"""
+    def exam(name: str) -> Dict[str, Any]:
+        score = getattr(profile, name)
+        if score is None:
+            return {f"{name}.subject": None, f"{name}.raw": None}
+        return {
+            f"{name}.subject": score.subject,
+            f"{name}.raw": (score.raw_total, score.raw_common, score.raw_select),
+        }
+
+    fields: Dict[str, Any] = {"track": profile.track}
+    for name in ("korean", "math", "inquiry1", "inquiry2"):
+        fields.update(exam(name))
+    fields["english_grade"] = profile.english_grade
+    fields["history_grade"] = profile.history_grade
+    fields["targets"] = tuple(_target_key(t) for t in profile.targets)
+    return fields
+
+
+def _target_key(target: TargetProgram) -> Tuple:
+    return (
+        target.university, target.major, target.admission_type,
+        target.suneung_ratio, target.inquiry_combination_code,
+    )
+
+
+# ============================================================
+# 결과 비교
+# ============================================================
+@dataclass
+class TargetDiff:
+    """target 1개 변경 사항"""
+    target: TargetProgram
+    changes: Dict[str, Tuple[Any, Any]]      # 항목 → (이전, 현재)
+
+
+@dataclass
+class ResultDiff:
+    """직전 결과 대비 변경 사항"""
+    components: Dict[str, Tuple[Any, Any]] = field(default_factory=dict)   # raw_components
+    targets: List[TargetDiff] = field(default_factory=list)
+    added: List[TargetProgram] = field(default_factory=list)
+    removed: List[TargetProgram] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.components or self.targets or self.added or self.removed)
+
+
+def _program_values(program: ProgramResult) -> Dict[str, Any]:
+    values = {name: getattr(program, name) for name in DIFF_FIELDS}
+    disqual = program.disqualification
+    values.update(
+        disqualified=disqual.is_disqualified,
+        disqualification_code=disqual.code,
+        rules_triggered=tuple(disqual.rules_triggered or ()),
+        disqualification_reason=disqual.reason,
+    )
+    return values
+
+
+def diff_results(previous: Optional[TheoryResult], current: TheoryResult) -> ResultDiff:
+    """
+    두 TheoryResult 비교 (target은 대학/전공/전형 키로 대응)
+
+    previous가 None이면 모든 target이 added입니다.
+    """
+    diff = ResultDiff()
+    if previous is None:
+        diff.added = [p.target for p in current.program_results]
+        return diff
+
+    for key in sorted(set(previous.raw_components) | set(current.raw_components)):
+        before, after = previous.raw_components.get(key), current.raw_components.get(key)
+        if before != after:
+            diff.components[key] = (before, after)
+
+    before_programs = {_target_key(p.target): p for p in previous.program_results}
+    after_keys = set()
+    for program in current.program_results:
+        key = _target_key(program.target)
+        after_keys.add(key)
+        old = before_programs.get(key)
+        if old is None:
+            diff.added.append(program.target)
+            continue
+        before, after = _program_values(old), _program_values(program)
+        changes = {name: (before[name], after[name]) for name in before if before[name] != after[name]}
+        if changes:
+            diff.targets.append(TargetDiff(target=program.target, changes=changes))
+    diff.removed = [p.target for k, p in before_programs.items() if k not in after_keys]
+    return diff
+
+
+@dataclass
+class IncrementalResult:
+    """증분 평가 결과"""
+    result: TheoryResult
+    diff: ResultDiff
+    changed_fields: List[str]                # 직전 평가 대비 바뀐 필드 (첫 평가는 전체)
+    stages_run: Dict[str, int]               # 단계별 실제 계산 횟수 (캐시 적중 제외)
+
+
+# ============================================================
+# 평가기
+# ============================================================
+class _StageCache(OrderedDict):
+    """단계 결과 LRU"""
+
+    def __init__(self, max_size: int):
+        super().__init__()
+        self.max_size = max_size
+
+    def lookup(self, key: Tuple) -> Any:
+        value = self.get(key)
+        if value is not None:
+            self.move_to_end(key)
+        return value
+
+    def store(self, key: Tuple, value: Any) -> Any:
+        self[key] = value
+        self.move_to_end(key)
+        while len(self) > self.max_size:
+            self.popitem(last=False)
+        return value
+
+
+class IncrementalEvaluator:
+    """필드 의존성 기반 증분 compute_theory_result (학생 1명 상담 세션용)"""
+
+    def __init__(self, excel_data: Dict[str, pd.DataFrame], cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Args:
+            excel_data: 엑셀 시트 dict (load_workbook 결과)
+            cache_size: 단계별 캐시 항목 수 상한
+        """
+        self.excel_data = excel_data
+        self._caches = {stage: _StageCache(cache_size) for stage in STAGES}
+        self._sources: Tuple = ()
+        self._rules_version = -1
+        self.previous: Optional[TheoryResult] = None
+        self._previous_fields: Optional[Dict[str, Any]] = None
+
+    def _check_sources(self) -> None:
+        """워크북 시트/엔진 룰/확률 모델이 바뀌면 캐시 전체 무효화"""
+        engine = rules.get_disqualification_engine()
+        sources = tuple(self.excel_data.get(name) for name in ("RAWSCORE", "INDEX", "PERCENTAGE", "RESTRICT"))
+        sources += (engine, rules.get_probability_model())
+        if (
+            len(sources) != len(self._sources)
+            or any(a is not b for a, b in zip(sources, self._sources))
+            or engine.rules_version != self._rules_version
+        ):
+            if self._sources:
+                logger.debug("증분 평가 캐시 무효화 (워크북/룰 변경)")
+            for cache in self._caches.values():
+                cache.clear()
+            self._sources = sources
+            self._rules_version = engine.rules_version
+
+    # ============================================================
+    # 단계
+    # ============================================================
+    def _convert(self, profile: StudentProfile, name: str, runs: Dict[str, int]) -> Dict[str, Any]:
+        exam = getattr(profile, name)
+        inquiry = name.startswith("inquiry")
+        key = (inquiry,) + ((exam.subject, exam.raw_total, exam.raw_common, exam.raw_select) if exam else (None,))
+        conv = self._caches["conversion"].lookup(key)
+        if conv is None:
+            runs["conversion"] += 1
+            conv = self._caches["conversion"].store(key, rules.convert_exam(self.excel_data, exam, inquiry))
+        return conv
+
+    def _components(self, profile: StudentProfile, runs: Dict[str, int]) -> Dict[str, Any]:
+        """원점수 변환 + INDEX → raw_components"""
+        convs = [self._convert(profile, name, runs) for name in ("korean", "math", "inquiry1", "inquiry2")]
+        components = rules.conversion_components(*convs)
+
+        stds = tuple(conv.get("standard_score") or 0 for conv in convs)
+        key = stds + (profile.track.value,)
+        index = self._caches["index"].lookup(key)
+        if index is None:
+            runs["index"] += 1
+            index = self._caches["index"].store(
+                key, rules.index_components(self.excel_data, stds, profile.track.value)
+            )
+        components.update(copy.deepcopy(index))
+        return components
+
+    def _disqualification(
+        self,
+        profile: StudentProfile,
+        target: TargetProgram,
+        fields: Dict[str, Any],
+        runs: Dict[str, int]
+    ) -> DisqualificationInfo:
+        if rules.get_disqualification_engine().has_custom_rules:
+            # 사용자 정의 check_func는 어떤 필드를 읽는지 알 수 없음 → 전체 필드
+            profile_key = tuple((k, v) for k, v in fields.items() if k != "targets")
+        else:
+            profile_key = tuple(fields[k] for k in DISQUALIFICATION_FIELDS)
+        key = (_target_key(target), profile_key)
+        disqual = self._caches["disqualification"].lookup(key)
+        if disqual is None:
+            runs["disqualification"] += 1
+            disqual = self._caches["disqualification"].store(key, rules.check_disqualification(
+                self.excel_data.get("RESTRICT", pd.DataFrame()), profile, target, severity_threshold=2
+            ))
+        return copy.deepcopy(disqual)
+
+    def _score(
+        self,
+        target: TargetProgram,
+        track: str,
+        cumulative_pct: Optional[float],
+        runs: Dict[str, int]
+    ) -> Optional[Dict[str, Any]]:
+        key = (_target_key(target), track, cumulative_pct)
+        cache = self._caches["scoring"]
+        if key in cache:
+            return cache.lookup(key)
+        runs["scoring"] += 1
+        return cache.store(key, rules.score_target(self.excel_data, target, track, cumulative_pct))
+
+    # ============================================================
+    # 평가
+    # ============================================================
+    def changed_fields(self, profile: StudentProfile) -> List[str]:
+        """직전 평가 대비 바뀐 필드 (첫 평가는 전체 필드)"""
+        fields = profile_fields(profile)
+        if self._previous_fields is None:
+            return list(fields)
+        return [name for name, value in fields.items() if self._previous_fields.get(name) != value]
+
+    @staticmethod
+    def affected_stages(changed: List[str]) -> List[str]:
+        """바뀐 필드가 직접 의존하는 단계 (STAGES 순서)"""
+        stages = {stage for name in changed for stage in FIELD_STAGES.get(name, ())}
+        return [stage for stage in STAGES if stage in stages]
+
+    def evaluate(self, profile: StudentProfile) -> IncrementalResult:
+        """
+        프로필 평가 (compute_theory_result와 같은 결과 + 직전 결과 대비 diff)
+
+        Returns:
+            IncrementalResult
+        """
+        self._check_sources()
+        fields = profile_fields(profile)
+        changed = self.changed_fields(profile)
+        runs = {stage: 0 for stage in STAGES}
+        track = profile.track.value
+
+        result = TheoryResult()
+        result.raw_components.update(self._components(profile, runs))
+        cumulative_pct = result.raw_components.get("cumulative_pct")
+
+        # 새로 점수를 계산할 target만 컬럼 일괄 매칭
+        if "PERCENTAGE" in self.excel_data:
+            pending = [
+                (t.university, t.major, track) for t in profile.targets
+                if (_target_key(t), track, cumulative_pct) not in self._caches["scoring"]
+            ]
+            if pending:
+                rules.get_cutoff_extractor(self.excel_data["PERCENTAGE"]).resolve_many(pending)
+
+        for target in profile.targets:
+            started_at = time.perf_counter()
+            disqual = self._disqualification(profile, target, fields, runs)
+            scored = None if disqual.is_disqualified else self._score(target, track, cumulative_pct, runs)
+            result.program_results.append(rules.build_program_result(target, disqual, scored, started_at))
+
+        diff = diff_results(self.previous, result)
+        self.previous = result
+        self._previous_fields = fields
+        logger.debug(f"증분 평가: 변경 {changed} → 실행 {runs}")
+        return IncrementalResult(result=result, diff=diff, changed_fields=changed, stages_run=runs)
+
+    def reset(self) -> None:
+        """직전 결과/캐시 초기화"""
+        for cache in self._caches.values():
+            cache.clear()
+        self.previous = None
+        self._previous_fields = None
@@ -0,0 +1,311 @@
+"""
+전체 프로그램 스윕 ("이 누백이면 어디까지 가능한가")
+
+누백 1개에 대해 PERCENTAGE의 모든 프로그램 점수를 컴파일 행렬에서 한 번에 보간하고
+커트라인 벡터와 비교하여 적정/예상/소신 프로그램 목록을 만듭니다.
+compute_theory_result()에 target ~1100개를 넘기는 것과 같은 결과를
+컬럼 매칭/슬라이싱 없이 계산합니다.
+
+사용법:
+    sweep = ProgramSweep(excel_data["PERCENTAGE"], excel_data.get("RESTRICT"))
+    table = sweep.sweep(12.3, profile=profile)                # 적정/예상/소신만
+    table = sweep.sweep(12.3, track="이과", levels=None)      # 전체
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..config import PERCENTAGE_INTERPOLATION_POLICY, InterpolationPolicy
+from ..constants import LevelTheory
+from ..disqualification import RestrictProfile
+from ..model import StudentProfile, TargetProgram
+from ..probability.admission_model import LEVEL_CODES, round_like_python
+from ..probability.distribution_model import DistributionProbabilityModel
+from .. import rules
+
+logger = logging.getLogger(__name__)
+
+# 결과 DataFrame 컬럼
+SWEEP_RESULT_COLUMNS = [
+    "column",
+    "university",
+    "major",
+    "track",
+    "score",
+    "cutoff_safe",
+    "cutoff_normal",
+    "cutoff_risk",
+    "margin",
+    "probability",
+    "level",
+    "disqualified",
+    "disqualification_reason",
+]
+
+# 기본 필터 (상담용: 지원 가능 라인)
+DEFAULT_SWEEP_LEVELS = (
+    LevelTheory.SAFE.value,
+    LevelTheory.NORMAL.value,
+    LevelTheory.RISK.value,
+)
+
+# 정렬 순서
+_LEVEL_ORDER = {
+    LevelTheory.SAFE.value: 0,
+    LevelTheory.NORMAL.value: 1,
+    LevelTheory.RISK.value: 2,
+    LevelTheory.REACH.value: 3,
+    LevelTheory.NO_DATA.value: 4,
+    LevelTheory.DISQUALIFIED.value: 5,
+}
+
+# calculate_many() 레벨 코드 → LevelTheory 값
+_THEORY_BY_CODE = np.array([rules.level_to_theory(level).value for level in LEVEL_CODES], dtype=object)
+
+
+class ProgramSweep:
+    """PERCENTAGE 전체 프로그램 스윕"""
+
+    def __init__(
+        self,
+        percentage_df: pd.DataFrame,
+        restrict_df: Optional[pd.DataFrame] = None,
+        method: Optional[str] = None
+    ):
+        """
+        Args:
+            percentage_df: PERCENTAGE 시트 DataFrame
+            restrict_df: RESTRICT 시트 DataFrame (주어지면 모집단위별 요구조건 결격 포함)
+            method: 보간 방식 ("linear" | "monotone_cubic"),
+                    None이면 PERCENTAGE_INTERPOLATION_POLICY (lookup_percentage와 같은 규칙)
+        """
+        if method is None:
+            method = (
+                InterpolationPolicy.MONOTONE_CUBIC.value
+                if PERCENTAGE_INTERPOLATION_POLICY == InterpolationPolicy.MONOTONE_CUBIC
+                else InterpolationPolicy.LINEAR.value
+            )
+        if method not in (InterpolationPolicy.LINEAR.value, InterpolationPolicy.MONOTONE_CUBIC.value):
+            raise ValueError(f"지원하지 않는 보간 방식: {method}")
+        self.method = method
+        self.extractor = rules.get_cutoff_extractor(percentage_df)
+        self.compiled = self.extractor.compiled
+        if self.compiled is None:
+            raise ValueError("PERCENTAGE 컴파일 실패 (누백 축 확인 필요) - 스윕 불가")
+
+        # 프로그램 컬럼 → 컴파일 행 / 파싱 키 (생성 시 1회)
+        self.columns: List[str] = list(self.extractor._program_column_strs)
+        self.rows = np.array([self.compiled.row_of(c) for c in self.columns], dtype=np.intp)
+        keys = [self.extractor.program_keys[c] for c in self.columns]
+        self.universities = [official or col for (official, _, _), col in zip(keys, self.columns)]
+        self.majors = [major for _, major, _ in keys]
+        self.tracks = np.array([track for _, _, track in keys], dtype=object)
+
+        # 커트라인도 같은 보간 방식 (단조 3차면 컴파일 행렬의 spline_cutoffs)
+        if method == InterpolationPolicy.MONOTONE_CUBIC.value:
+            self.cutoffs = self.compiled.spline_cutoffs[self.rows]  # (N, 3)
+        else:
+            self.cutoffs = self.compiled.cutoffs[self.rows]
+        self.valid = self.compiled.valid[self.rows]
+
+        # 결격 대상 목록 / 엔진별 룰 마스크 (첫 프로필 체크 시 1회)
+        self._targets: Optional[List[TargetProgram]] = None
+        self._target_masks: Optional[Tuple[Any, int, np.ndarray]] = None
+
+        # RESTRICT 룰 테이블 행 (컬럼명 정확 일치, 없으면 -1)
+        self.restrict = rules.get_restrict_table(restrict_df)
+        self.restrict_rows = np.full(len(self.columns), -1, dtype=np.intp)
+        if self.restrict is not None:
+            for i, column in enumerate(self.columns):
+                row = self.restrict.row_of_program(column)
+                if row is not None:
+                    self.restrict_rows[i] = row
+
+    # ============================================================
+    # 점수/확률
+    # ============================================================
+    def scores_at(self, cumulative_pct: float) -> np.ndarray:
+        """
+        전체 프로그램 환산점수 (score_for_column(method)과 동일 규칙, 벡터화)
+
+        관측된 누백과 일치하면 관측값, 아니면 self.method 보간
+        (선형 or 단조 3차 스플라인 계수) 후 소수 2자리 반올림.
+        유효 데이터 2개 미만 프로그램은 NaN.
+        """
+        compiled = self.compiled
+        pct = float(cumulative_pct)
+        scores = compiled.scores_at(pct, self.method)[self.rows]
+
+        close = np.isclose(compiled.percentiles, pct, atol=1e-9)
+        if close.any():
+            j = int(close.argmax())
+            exact = compiled.observed[self.rows, j]
+            scores = np.where(exact, compiled.scores[self.rows, j], scores)
+
+        # np.round와 Python round()의 .xx5 처리 차이 → Python round 에뮬레이션
+        rounded = round_like_python(scores, 2)
+        rounded[~self.valid] = np.nan
+        return rounded
+
+    def _probabilities(self, scores: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        프로그램별 확률/레벨 (calculate_many, 분포 모드는 컬럼 곡선 적합 파라미터)
+
+        점수가 없는 프로그램(NaN)은 계산하지 않고 알수없음 (확률 NaN).
+        """
+        probability = np.full(len(scores), np.nan)
+        level_values = np.full(len(scores), LevelTheory.NO_DATA.value, dtype=object)
+        has = ~np.isnan(scores)
+        if not has.any():
+            return probability, level_values
+
+        model = rules.get_probability_model()
+        if isinstance(model, DistributionProbabilityModel):
+            result = model.calculate_rows(scores[has], self.compiled, self.rows[has])
+        else:
+            cutoffs = self.cutoffs[has]
+            result = model.calculate_many(
+                scores[has],
+                cutoffs[:, 0],
+                cutoffs[:, 1],
+                cutoffs[:, 2],
+                [c for c, keep in zip(self.columns, has) if keep] if model.calibration is not None else None,
+            )
+        probability[has] = result.probability
+        level_values[has] = _THEORY_BY_CODE[result.level_code]
+        return probability, level_values
+
+    def _disqualifications(
+        self,
+        profile: StudentProfile,
+        mask: np.ndarray
+    ) -> Tuple[np.ndarray, List[Optional[str]]]:
+        """
+        결격 일괄 체크 (check_many 비트 연산 + RESTRICT 요구조건 벡터 비교)
+
+        사유는 결격 프로그램만 만들고 엔진 사유는 (대학, 전공) 단위 메모이즈.
+        """
+        engine = rules.get_disqualification_engine()
+        if self._targets is None:
+            self._targets = [TargetProgram(u, m) for u, m in zip(self.universities, self.majors)]
+        cached = self._target_masks
+        if cached is None or cached[0] is not engine or cached[1] != engine.rules_version:
+            # 엔진/룰 구성별 1회 (룰 마스크는 프로그램 목록에만 의존)
+            cached = self._target_masks = (engine, engine.rules_version, engine.target_masks(self._targets))
+        masks = cached[2]
+
+        result = engine.check_many(profile, self._targets, severity_threshold=2, masks=masks)
+        restrict_code = self._restrict_violations(profile)
+        disqualified = (result.disqualified | (restrict_code > 0)) & mask
+        reasons: List[Optional[str]] = [None] * len(self.columns)
+        memo: Dict[Tuple[str, str], Optional[str]] = {}
+        for i in np.flatnonzero(disqualified):
+            if not result.disqualified[i]:
+                reasons[i] = self.restrict.format_reason(int(self.restrict_rows[i]), int(restrict_code[i]) - 1)
+                continue
+            key = (self.universities[i], self.majors[i])
+            if key not in memo:
+                memo[key] = engine.explain_reason(result.info_at(i), profile, self._targets[i])
+            reasons[i] = memo[key]
+        return disqualified, reasons
+
+    def _restrict_violations(self, profile: StudentProfile) -> np.ndarray:
+        """RESTRICT 주 위반 번호 (uint8, 0=없음/룰 없음)"""
+        codes = np.zeros(len(self.columns), dtype=np.uint8)
+        if self.restrict is None:
+            return codes
+        has_rule = self.restrict_rows >= 0
+        violations = self.restrict.evaluate(RestrictProfile.from_profile(profile), self.restrict_rows[has_rule])
+        codes[has_rule] = self.restrict.primary_violation(violations)
+        return codes
+
+    # ============================================================
+    # 스윕
+    # ============================================================
+    def sweep(
+        self,
+        cumulative_pct: float,
+        profile: Optional[StudentProfile] = None,
+        track: Optional[str] = None,
+        levels: Optional[Sequence[str]] = DEFAULT_SWEEP_LEVELS,
+        include_disqualified: bool = False
+    ) -> pd.DataFrame:
+        """
+        누백 1개로 전체 프로그램 평가
+
+        Args:
+            cumulative_pct: 학생 누적백분위
+            profile: 학생 프로필 (주어지면 결격 체크, 계열 기본값)
+            track: 계열 필터 ("이과" | "문과", 계열 없는 컬럼은 항상 포함)
+            levels: 포함할 레벨 (LevelTheory 값), None이면 전체
+            include_disqualified: 결격 프로그램 포함 여부
+
+        Returns:
+            DataFrame (SWEEP_RESULT_COLUMNS)
+            정렬: 레벨(적정→…→불가) → 확률↓ → margin(점수-예상컷)↓
+        """
+        if track is None and profile is not None:
+            track = profile.track.value
+
+        mask = np.ones(len(self.columns), dtype=bool)
+        if track:
+            mask &= (self.tracks == track) | (self.tracks == "")
+
+        scores = self.scores_at(cumulative_pct)
+        probabilities, level_values = self._probabilities(scores)
+
+        df = pd.DataFrame({
+            "column": self.columns,
+            "university": self.universities,
+            "major": self.majors,
+            "track": self.tracks,
+            "score": scores,
+            "cutoff_safe": self.cutoffs[:, 0],
+            "cutoff_normal": self.cutoffs[:, 1],
+            "cutoff_risk": self.cutoffs[:, 2],
+            "margin": scores - self.cutoffs[:, 1],
+            "probability": probabilities,
+            "level": level_values,
+            "disqualified": False,
+            "disqualification_reason": None,
+        }, columns=SWEEP_RESULT_COLUMNS)
+
+        if profile is not None:
+            disqualified, reasons = self._disqualifications(profile, mask)
+            df["disqualified"] = disqualified
+            df["disqualification_reason"] = reasons
+            df.loc[disqualified, ["probability", "score", "margin"]] = np.nan
+            df.loc[disqualified, "level"] = LevelTheory.DISQUALIFIED.value
+
+        if not include_disqualified:
+            mask &= ~df["disqualified"].to_numpy()
+        df = df[mask]
+
+        if levels is not None:
+            df = df[df["level"].isin(list(levels))]
+
+        df = df.assign(_order=df["level"].map(_LEVEL_ORDER))
+        df = df.sort_values(
+            ["_order", "probability", "margin", "column"],
+            ascending=[True, False, False, True],
+            na_position="last",
+            kind="mergesort",
+        )
+        return df[SWEEP_RESULT_COLUMNS].reset_index(drop=True)
+
+
+def sweep_programs(
+    excel_data: Dict[str, pd.DataFrame],
+    cumulative_pct: float,
+    profile: Optional[StudentProfile] = None,
+    track: Optional[str] = None,
+    levels: Optional[Sequence[str]] = DEFAULT_SWEEP_LEVELS,
+    include_disqualified: bool = False
+) -> pd.DataFrame:
+    """ProgramSweep(excel_data["PERCENTAGE"], excel_data["RESTRICT"]).sweep(...) 간편 함수"""
+    return ProgramSweep(excel_data["PERCENTAGE"], excel_data.get("RESTRICT")).sweep(
+        cumulative_pct, profile, track, levels, include_disqualified
+    )
@@ -0,0 +1,75 @@
+"""
+과목별 원점수 변경 → 표준점수 변환 (시뮬레이션/민감도 분석 공용)
+
+가채점 오차 표본(simulation)과 원점수 상승 후보(sensitivity)는 모두
+"한 과목 원점수를 delta만큼 바꾼 ExamScore 목록 → 표준점수 배열" 단계를 거칩니다.
+
+사용법:
+    from theory_engine.analysis.score_perturbation import RAW_MAX, perturb_exam, standard_scores
+
+    exams = perturb_exam(profile.math, np.arange(1, 6), RAW_MAX["math"])
+    stds = standard_scores(excel_data["RAWSCORE"], exams, inquiry=False)
+"""
+
+import dataclasses
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..model import ExamScore
+from .. import rules
+
+# 점수 과목 (StudentProfile 필드명)
+SCORE_SUBJECTS = ("korean", "math", "inquiry1", "inquiry2")
+
+# 과목별 원점수 만점
+RAW_MAX = {
+    "korean": 100,
+    "math": 100,
+    "inquiry1": 50,
+    "inquiry2": 50,
+}
+
+
+def perturb_exam(exam: Optional[ExamScore], delta: np.ndarray, raw_max: int) -> Optional[List[ExamScore]]:
+    """
+    원점수 변경 → ExamScore 목록 (delta 인덱스 순)
+
+    총점은 0 ~ raw_max로 자르고, 공통/선택 분리 점수는 선택 점수에 같은 delta를 적용합니다.
+    """
+    if exam is None:
+        return None
+    total = exam.raw_total or 0
+    if exam.raw_select is not None:
+        select = exam.raw_select
+        common = exam.raw_common or 0
+        return [
+            dataclasses.replace(
+                exam,
+                raw_select=int(np.clip(select + d, 0, max(raw_max - common, 0))),
+                raw_total=int(np.clip(total + d, 0, raw_max)),
+            )
+            for d in delta
+        ]
+    return [dataclasses.replace(exam, raw_total=int(np.clip(total + d, 0, raw_max))) for d in delta]
+
+
+def standard_scores(
+    rawscore_df: pd.DataFrame,
+    exams: List[ExamScore],
+    inquiry: bool
+) -> np.ndarray:
+    """ExamScore 목록 → 표준점수 배열 (compute_theory_result와 같은 변환 인자, 실패는 0)"""
+    stds = []
+    for exam in exams:
+        if inquiry:
+            conv = rules.convert_raw_to_standard(
+                rawscore_df, rules.normalize_subject(exam.subject), exam.raw_total or 0
+            )
+        else:
+            conv = rules.convert_raw_to_standard(
+                rawscore_df, exam.subject, exam.raw_total or 0, exam.raw_common, exam.raw_select
+            )
+        stds.append(conv.get("standard_score") or 0)
+    return np.asarray(stds, dtype=np.int64)
@@ -0,0 +1,326 @@
+"""
+점수 민감도 (what-if): target별로 한 단계 위 레벨까지 필요한 과목별 최소 점수 상승폭
+
+"수학 몇 점 더 받으면 X대학이 소신 → 예상이 되나"를 파이프라인 반복 실행 없이 계산합니다.
+나머지 과목은 그대로 두고 한 과목만 올렸을 때:
+
+- RAWSCORE: 과목별 (현재 원점수 + 1 ~ 만점) 후보를 한 번에 변환하고,
+  단조 변환표에서 표준점수가 처음 바뀌는 원점수만 후보로 남김 (같은 표준점수 = 같은 결과)
+- INDEX: 전 과목 후보 표준점수 조합을 lookup_index_many 1회로 조회
+  (실패/0이면 compute_theory_result와 같이 누백 50)
+- PERCENTAGE: 고유 누백 × target 환산점수를 컴파일 행렬로 일괄 조회
+- 확률/레벨: (후보 × target) 일괄 계산 (calculate_many / 분포 모드 calculate_rows)
+- 최소 상승폭: 후보 순(원점수 증가) 누적 최고 레벨 배열에서 목표 레벨 이진 탐색
+
+사용법:
+    from theory_engine.analysis import analyze_sensitivity
+
+    table = analyze_sensitivity(excel_data, profile)
+    table[table["subject"] == "math"][["university", "major", "level", "next_level", "raw_delta"]]
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..config import PERCENTAGE_INTERPOLATION_POLICY, InterpolationPolicy
+from ..constants import LevelTheory
+from ..model import StudentProfile, TargetProgram
+from ..probability.admission_model import LEVEL_CODE, LEVEL_CODES
+from ..probability.distribution_model import DistributionProbabilityModel
+from .. import rules
+from .program_sweep import ProgramSweep
+from .score_perturbation import RAW_MAX, SCORE_SUBJECTS, perturb_exam, standard_scores
+
+logger = logging.getLogger(__name__)
+
+# 레벨 코드 (LEVEL_CODES 인덱스, 작을수록 좋음), 알수없음은 목표 레벨 없음
+_NO_DATA_CODE = LEVEL_CODE["알수없음"]
+
+# 결과 DataFrame 컬럼
+SENSITIVITY_RESULT_COLUMNS = [
+    "university",
+    "major",
+    "subject",
+    "level",
+    "next_level",
+    "reachable",
+    "raw",
+    "raw_delta",
+    "required_raw",
+    "standard",
+    "standard_delta",
+    "required_standard",
+    "cumulative_pct",
+    "required_cumulative_pct",
+    "score",
+    "required_score",
+    "probability",
+    "required_probability",
+]
+
+
+@dataclass
+class _Candidates:
+    """과목별 상승 후보 (원점수 증가 순, 표준점수가 바뀌는 지점만)"""
+    subject: str
+    raw: int                     # 현재 원점수
+    standard: int                # 현재 표준점수
+    raw_delta: np.ndarray        # (C,) 원점수 상승폭
+    standards: np.ndarray        # (C,) 상승 후 표준점수
+
+
+class SensitivityAnalyzer:
+    """target × 과목 최소 상승폭 계산기"""
+
+    def __init__(self, excel_data: Dict[str, pd.DataFrame]):
+        """
+        Args:
+            excel_data: 엑셀 시트 dict (load_workbook 결과)
+        """
+        self.excel_data = excel_data
+        self._sweep: Optional[ProgramSweep] = None
+
+    # ============================================================
+    # 후보 생성 (RAWSCORE)
+    # ============================================================
+    def _candidates(self, profile: StudentProfile, name: str) -> Optional[_Candidates]:
+        """한 과목 원점수 상승 후보 → 표준점수가 처음 바뀌는 원점수만"""
+        exam = getattr(profile, name)
+        if exam is None:
+            return None
+        inquiry = name.startswith("inquiry")
+        raw = exam.raw_total or 0
+        standard = int(standard_scores(self.excel_data["RAWSCORE"], [exam], inquiry)[0])
+
+        deltas = np.arange(1, max(RAW_MAX[name] - raw, 0) + 1, dtype=np.int64)
+        if not len(deltas):
+            return _Candidates(name, raw, standard, deltas, deltas.copy())
+        exams = perturb_exam(exam, deltas, RAW_MAX[name])
+        stds = standard_scores(self.excel_data["RAWSCORE"], exams, inquiry)
+
+        # 단조 변환표: 새 표준점수의 최소 원점수만 (현재 표준점수와 같은 구간 제외)
+        values, first = np.unique(stds, return_index=True)
+        keep = np.sort(first[values != standard])
+        return _Candidates(name, raw, standard, deltas[keep], stds[keep])
+
+    # ============================================================
+    # INDEX / PERCENTAGE / 확률
+    # ============================================================
+    def _cumulative_pct(self, keys: np.ndarray, track: str) -> np.ndarray:
+        """(K, 4) 표준점수 → 파이프라인 누백 (실패/0 → 50.0)"""
+        if "INDEX" not in self.excel_data or not len(keys):
+            return np.full(len(keys), 50.0)
+        found = rules.lookup_index_many(self.excel_data["INDEX"], keys, track)
+        pct = np.where(found["found"], found["cumulative_pct"], np.nan)
+        return np.where(~np.isnan(pct) & (pct != 0), pct, 50.0)
+
+    def _scores(self, columns: List[Any], pcts: np.ndarray) -> np.ndarray:
+        """(U,) 누백 × (T,) 컬럼 → 환산점수 (lookup_percentage와 같은 보간 규칙, 없으면 0)"""
+        extractor = rules.get_cutoff_extractor(self.excel_data["PERCENTAGE"])
+        scores = np.zeros((len(pcts), len(columns)))
+        if not columns:
+            return scores
+
+        cubic = PERCENTAGE_INTERPOLATION_POLICY == InterpolationPolicy.MONOTONE_CUBIC
+        if not cubic and extractor.compiled is not None:
+            if self._sweep is None or self._sweep.extractor is not extractor:
+                self._sweep = ProgramSweep(self.excel_data["PERCENTAGE"])
+            position = {c: i for i, c in enumerate(self._sweep.columns)}
+            idx = [position.get(str(c)) for c in columns]
+            if all(i is not None for i in idx):
+                matrix = np.stack([self._sweep.scores_at(float(p)) for p in pcts])
+                return np.nan_to_num(matrix[:, idx], nan=0.0)
+
+        method = InterpolationPolicy.MONOTONE_CUBIC.value if cubic else InterpolationPolicy.LINEAR.value
+        for u, pct in enumerate(pcts):
+            for t, column in enumerate(columns):
+                looked_up = extractor.score_for_column(column, float(pct), method)
+                scores[u, t] = (looked_up[0] if looked_up else None) or 0
+        return scores
+
+    def _levels(
+        self,
+        scores: np.ndarray,
+        columns: List[Any],
+        cutoffs: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """(U, T) 환산점수 → (확률, 레벨 코드) (calculate_probability와 같은 모델)"""
+        model = rules.get_probability_model()
+        result = model.calculate_many(
+            scores, cutoffs[:, 0], cutoffs[:, 1], cutoffs[:, 2],
+            columns if model.calibration is not None else None,
+        )
+        probability = np.broadcast_to(result.probability, scores.shape).copy()
+        level_code = np.broadcast_to(result.level_code, scores.shape).copy()
+
+        compiled = rules.get_cutoff_extractor(self.excel_data["PERCENTAGE"]).compiled
+        if isinstance(model, DistributionProbabilityModel) and compiled is not None:
+            for t, column in enumerate(columns):
+                row = compiled.row_of(column)
+                if row is not None:
+                    rows = model.calculate_rows(scores[:, t], compiled, np.full(len(scores), row))
+                    probability[:, t] = rows.probability
+                    level_code[:, t] = rows.level_code
+        return probability, level_code
+
+    # ============================================================
+    # 분석
+    # ============================================================
+    def analyze(
+        self,
+        profile: StudentProfile,
+        targets: Optional[Sequence[TargetProgram]] = None,
+        subjects: Sequence[str] = SCORE_SUBJECTS
+    ) -> pd.DataFrame:
+        """
+        target × 과목별 한 단계 위 레벨까지 최소 상승폭
+
+        Args:
+            profile: 학생 프로필
+            targets: 평가 대상 (None이면 profile.targets)
+            subjects: 올려볼 과목 (korean/math/inquiry1/inquiry2)
+
+        Returns:
+            DataFrame (SENSITIVITY_RESULT_COLUMNS), target 순 → subjects 순
+            - level: 현재 레벨 (compute_theory_result와 같음)
+            - next_level: 목표 레벨 (적정/결격/데이터없음이면 None)
+            - reachable: 만점까지 올려서 목표 레벨 도달 여부
+            - raw_delta / standard_delta: 최소 원점수/표준점수 상승폭 (도달 불가면 NaN)
+        """
+        targets = list(targets if targets is not None else profile.targets)
+        unknown = [s for s in subjects if s not in SCORE_SUBJECTS]
+        if unknown:
+            raise ValueError(f"알 수 없는 과목: {unknown} (가능: {SCORE_SUBJECTS})")
+        track = profile.track.value
+
+        candidates = [self._candidates(profile, s) for s in SCORE_SUBJECTS]
+        base_key = np.array([c.standard if c is not None else 0 for c in candidates], dtype=np.int64)
+
+        # 기준(현재) + 과목별 후보 → 표준점수 조합 (K, 4)
+        keys = [base_key[None, :]]
+        segments: Dict[str, slice] = {}
+        start = 1
+        for k, cand in enumerate(candidates):
+            if cand is None or cand.subject not in subjects:
+                continue
+            block = np.repeat(base_key[None, :], len(cand.standards), axis=0)
+            block[:, k] = cand.standards
+            keys.append(block)
+            segments[cand.subject] = slice(start, start + len(block))
+            start += len(block)
+        keys = np.concatenate(keys)
+        pcts = self._cumulative_pct(keys, track)
+
+        # target별 결격/컬럼/커트라인 (점수와 무관)
+        specs = self._specs(profile, targets)
+        live = [t for t, spec in enumerate(specs) if spec["column"] is not None and not spec["disqualified"]]
+        live_col = {t: i for i, t in enumerate(live)}
+        columns = [specs[t]["column"] for t in live]
+
+        unique_pct, inverse = np.unique(pcts, return_inverse=True)
+        inverse = inverse.ravel()
+        if "PERCENTAGE" in self.excel_data and live:
+            cutoffs = np.array([specs[t]["cutoffs"] for t in live], dtype=np.float64)
+            scores = self._scores(columns, unique_pct)
+            probability, level_code = self._levels(scores, columns, cutoffs)
+        else:
+            scores = probability = np.zeros((len(unique_pct), 0))
+            level_code = np.zeros((len(unique_pct), 0), dtype=np.uint8)
+
+        rows = []
+        by_subject = {c.subject: c for c in candidates if c is not None}
+        for t, (target, spec) in enumerate(zip(targets, specs)):
+            col = live_col.get(t)
+            base_code = int(level_code[inverse[0], col]) if col is not None else None
+            if spec["disqualified"]:
+                level = LevelTheory.DISQUALIFIED.value
+            elif base_code is None:
+                level = LevelTheory.NO_DATA.value
+            else:
+                level = rules.level_to_theory(LEVEL_CODES[base_code]).value
+
+            goal = base_code - 1 if base_code is not None and 0 < base_code < _NO_DATA_CODE else None
+            for name in subjects:
+                cand = by_subject.get(name)
+                row = {
+                    "university": target.university,
+                    "major": target.major,
+                    "subject": name,
+                    "level": level,
+                    "next_level": rules.level_to_theory(LEVEL_CODES[goal]).value if goal is not None else None,
+                    "reachable": False,
+                    "raw": cand.raw if cand else None,
+                    "raw_delta": np.nan,
+                    "required_raw": np.nan,
+                    "standard": cand.standard if cand else None,
+                    "standard_delta": np.nan,
+                    "required_standard": np.nan,
+                    "cumulative_pct": float(pcts[0]),
+                    "required_cumulative_pct": np.nan,
+                    "score": float(scores[inverse[0], col]) if col is not None else np.nan,
+                    "required_score": np.nan,
+                    "probability": float(probability[inverse[0], col]) if col is not None else np.nan,
+                    "required_probability": np.nan,
+                }
+                segment = segments.get(name)
+                if goal is not None and cand is not None and segment is not None and len(cand.raw_delta):
+                    found = self._first_reaching(level_code[inverse[segment], col], goal)
+                    if found is not None:
+                        k = segment.start + found
+                        row.update(
+                            reachable=True,
+                            raw_delta=int(cand.raw_delta[found]),
+                            required_raw=cand.raw + int(cand.raw_delta[found]),
+                            standard_delta=int(cand.standards[found]) - cand.standard,
+                            required_standard=int(cand.standards[found]),
+                            required_cumulative_pct=float(pcts[k]),
+                            required_score=float(scores[inverse[k], col]),
+                            required_probability=float(probability[inverse[k], col]),
+                        )
+                rows.append(row)
+
+        logger.debug(f"민감도 분석: target {len(targets)}개 × 과목 {len(subjects)}개, 후보 {len(keys) - 1}개")
+        return pd.DataFrame(rows, columns=SENSITIVITY_RESULT_COLUMNS)
+
+    @staticmethod
+    def _first_reaching(level_codes: np.ndarray, goal: int) -> Optional[int]:
+        """후보 순 레벨 코드에서 목표 레벨 이상이 처음 나오는 위치 (누적 최고 레벨 이진 탐색)"""
+        best = np.minimum.accumulate(level_codes.astype(np.int64))      # 비증가
+        pos = int(np.searchsorted(-best, -goal, side="left"))
+        return pos if pos < len(best) else None
+
+    def _specs(self, profile: StudentProfile, targets: Sequence[TargetProgram]) -> List[Dict[str, Any]]:
+        """target별 결격/컬럼/커트라인"""
+        extractor = rules.get_cutoff_extractor(self.excel_data["PERCENTAGE"]) \
+            if "PERCENTAGE" in self.excel_data else None
+        specs = []
+        for target in targets:
+            disqual = rules.check_disqualification(
+                self.excel_data.get("RESTRICT", pd.DataFrame()), profile, target,
+                severity_threshold=2, explain=False
+            )
+            spec = {"disqualified": disqual.is_disqualified, "column": None, "cutoffs": (np.nan,) * 3}
+            if extractor is not None:
+                found = extractor.extract_cutoffs(target.university, target.major, profile.track.value)
+                if found.get("found"):
+                    spec["column"] = found["column"]
+                    spec["cutoffs"] = tuple(
+                        np.nan if found.get(key) is None else float(found[key])
+                        for key in ("cutoff_safe", "cutoff_normal", "cutoff_risk")
+                    )
+            specs.append(spec)
+        return specs
+
+
+def analyze_sensitivity(
+    excel_data: Dict[str, pd.DataFrame],
+    profile: StudentProfile,
+    targets: Optional[Sequence[TargetProgram]] = None,
+    subjects: Sequence[str] = SCORE_SUBJECTS
+) -> pd.DataFrame:
+    """SensitivityAnalyzer(excel_data).analyze(...) 간편 함수"""
+    return SensitivityAnalyzer(excel_data).analyze(profile, targets, subjects)
@@ -0,0 +1,366 @@
+"""
+지원 포트폴리오 몬테카를로 시뮬레이션 (가채점 → 최종 점수 불확실성)
+
+가채점 원점수에 과목별 오차를 더한 점수 벡터 N개를 뽑아
+RAWSCORE → INDEX → PERCENTAGE → 확률 경로를 한 번에 통과시키고,
+target별 확률 분포와 "가/나/다군 중 하나 이상 합격" 확률을 계산합니다.
+
+- 점수 오차: 과목별 정규분포 N(0, σ) 반올림 정수, 원점수 범위로 자름
+  (공통/선택 분리 점수는 선택 점수에 같은 오차 적용)
+- RAWSCORE: (과목, 원점수) 고유값만 변환 → 배열 인덱스로 전파
+- INDEX: (국, 수, 탐1, 탐2 표준점수) 고유 조합만 IndexOptimizer.lookup_many로 일괄 조회
+  (정확 키는 dict, 근사는 청크 단위 L1 argmin; 실패 시 compute_theory_result와 같이 누백 50)
+- PERCENTAGE: (고유 누백 × target)만 조회 (PERCENTAGE_INTERPOLATION_POLICY 보간, 커트라인 포함),
+  확률은 calculate_many/calculate_rows 일괄 계산
+- 포트폴리오: 같은 점수 표본 안에서 target 간 합격은 독립으로 보고
+  P(하나 이상) = 평균[1 - Π(1 - p_t)] (점수 공유에 따른 상관은 표본 단위로 반영)
+
+난수는 seed → SeedSequence.spawn()으로 청크별 독립 스트림을 만들기 때문에
+청크 크기가 같으면 프로세스 수(max_workers)와 무관하게 결과가 같습니다.
+
+사용법:
+    from theory_engine.analysis import simulate_portfolio
+
+    result = simulate_portfolio(excel_data, profile, n=20000, seed=7, groups=["가", "나", "다"])
+    result.portfolio_probability        # 하나 이상 합격 확률
+    result.group_probabilities          # {"가": ..., "나": ..., "다": ...}
+    result.targets                      # target별 평균/분위 확률 DataFrame
+
+    # 대규모 N: 청크 단위 프로세스 풀
+    result = simulate_portfolio(excel_data, profile, n=1_000_000, seed=7, max_workers=4)
+"""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..config import PERCENTAGE_INTERPOLATION_POLICY, InterpolationPolicy
+from ..model import StudentProfile, TargetProgram
+from ..probability.distribution_model import DistributionProbabilityModel
+from .. import rules
+from .score_perturbation import RAW_MAX, SCORE_SUBJECTS, perturb_exam, standard_scores
+
+logger = logging.getLogger(__name__)
+
+# 과목별 가채점 오차 표준편차 (원점수)
+DEFAULT_RAW_SD = {
+    "korean": 2.0,
+    "math": 2.0,
+    "inquiry1": 1.5,
+    "inquiry2": 1.5,
+}
+
+# 청크당 표본 수 (결과 재현성 단위)
+DEFAULT_CHUNK_SIZE = 20000
+
+# 결과 DataFrame 컬럼
+SIMULATION_RESULT_COLUMNS = [
+    "university",
+    "major",
+    "group",
+    "column",
+    "found",
+    "disqualified",
+    "mean_probability",
+    "p05_probability",
+    "p50_probability",
+    "p95_probability",
+    "baseline_probability",
+]
+
+
+@dataclass
+class SimulationResult:
+    """시뮬레이션 결과"""
+    n_draws: int
+    seed: Optional[int]
+    portfolio_probability: float
+    group_probabilities: Dict[str, float]
+    targets: pd.DataFrame
+    cumulative_pct_quantiles: Dict[str, Optional[float]] = field(default_factory=dict)
+    index_miss_rate: float = 0.0
+
+
+@dataclass
+class _TargetSpec:
+    """target별 PERCENTAGE 매칭 결과 (시뮬레이션 동안 고정)"""
+    target: TargetProgram
+    group: str
+    column: Optional[str]
+    cutoffs: Tuple[float, float, float]
+    disqualified: bool
+    method: str = InterpolationPolicy.LINEAR.value   # 보간 방식 (커트라인/점수 공통, 작업 프로세스에 그대로 전달)
+
+
+# ============================================================
+# 표본 청크 (프로세스 풀 작업 단위)
+# ============================================================
+def _simulate_chunk(
+    excel_data: Dict[str, pd.DataFrame],
+    profile: StudentProfile,
+    specs: List[_TargetSpec],
+    raw_sd: Dict[str, float],
+    n: int,
+    seed_seq: Optional[np.random.SeedSequence]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    표본 n개 평가
+
+    Returns:
+        (probabilities (n, T), cumulative_pct (n,), index_found (n,))
+    """
+    rng = np.random.default_rng(seed_seq)
+    codes = np.empty((n, len(SCORE_SUBJECTS)), dtype=np.int64)
+
+    # 1. 원점수 오차 → 과목별 고유값만 RAWSCORE 변환
+    for k, name in enumerate(SCORE_SUBJECTS):
+        sd = float(raw_sd.get(name, 0.0))
+        delta = np.rint(rng.normal(0.0, sd, n)).astype(np.int64) if sd > 0 else np.zeros(n, dtype=np.int64)
+        unique_delta, inverse = np.unique(delta, return_inverse=True)
+        exams = perturb_exam(getattr(profile, name), unique_delta, RAW_MAX[name])
+        if exams is None:
+            codes[:, k] = 0
+            continue
+        stds = standard_scores(excel_data["RAWSCORE"], exams, inquiry=name.startswith("inquiry"))
+        codes[:, k] = stds[inverse.ravel()]
+
+    # 2. INDEX: 고유 표준점수 조합만 조회
+    unique_stds, inverse = np.unique(codes, axis=0, return_inverse=True)
+    inverse = inverse.ravel()
+    unique_pct = np.full(len(unique_stds), np.nan)
+    if "INDEX" in excel_data:
+        found = rules.lookup_index_many(excel_data["INDEX"], unique_stds, profile.track.value)
+        unique_pct = np.where(found["found"], found["cumulative_pct"], np.nan)
+    # compute_theory_result와 동일: 누백 0/없음 → 50.0
+    index_found = ~np.isnan(unique_pct) & (unique_pct != 0)
+    lookup_pct = np.where(index_found, unique_pct, 50.0)
+
+    # 3. PERCENTAGE: 고유 누백 × target 환산점수
+    probabilities = np.full((n, len(specs)), np.nan)
+    if "PERCENTAGE" in excel_data and specs:
+        extractor = rules.get_cutoff_extractor(excel_data["PERCENTAGE"])
+        pct_values, pct_inverse = np.unique(lookup_pct, return_inverse=True)
+        pct_inverse = pct_inverse.ravel()
+        scores = np.zeros((len(pct_values), len(specs)))
+        for t, spec in enumerate(specs):
+            if spec.column is None or spec.disqualified:
+                continue
+            for u, pct in enumerate(pct_values):
+                looked_up = extractor.score_for_column(spec.column, float(pct), spec.method)
+                scores[u, t] = (looked_up[0] if looked_up else None) or 0
+
+        # 4. 확률 (고유 누백 × target 일괄)
+        unique_prob = _probabilities(scores, specs, extractor)
+        probabilities = unique_prob[pct_inverse[inverse]]
+
+    return probabilities, unique_pct[inverse], index_found[inverse]
+
+
+def _probabilities(scores: np.ndarray, specs: List[_TargetSpec], extractor: Any) -> np.ndarray:
+    """(U, T) 환산점수 → 확률 (calculate_probability와 같은 모델/규칙)"""
+    model = rules.get_probability_model()
+    cutoffs = np.array([spec.cutoffs for spec in specs], dtype=np.float64)     # (T, 3)
+    columns = [spec.column for spec in specs] if model.calibration is not None else None
+    probs = np.broadcast_to(
+        model.calculate_many(scores, cutoffs[:, 0], cutoffs[:, 1], cutoffs[:, 2], columns).probability,
+        scores.shape,
+    ).copy()
+
+    compiled = extractor.compiled
+    if isinstance(model, DistributionProbabilityModel) and compiled is not None:
+        for t, spec in enumerate(specs):
+            row = compiled.row_of(spec.column) if spec.column is not None else None
+            if row is not None:
+                probs[:, t] = model.calculate_rows(scores[:, t], compiled, np.full(len(scores), row)).probability
+
+    for t, spec in enumerate(specs):
+        if spec.disqualified:
+            probs[:, t] = 0.0
+        elif spec.column is None:
+            probs[:, t] = np.nan
+    return probs
+
+
+# ============================================================
+# 시뮬레이터
+# ============================================================
+class PortfolioSimulator:
+    """지원 포트폴리오 몬테카를로 시뮬레이터"""
+
+    def __init__(
+        self,
+        excel_data: Dict[str, pd.DataFrame],
+        raw_sd: Optional[Dict[str, float]] = None
+    ):
+        """
+        Args:
+            excel_data: 엑셀 시트 dict (load_workbook 결과)
+            raw_sd: 과목별 원점수 오차 표준편차 (korean/math/inquiry1/inquiry2, 기본 DEFAULT_RAW_SD)
+        """
+        self.excel_data = excel_data
+        self.raw_sd = dict(DEFAULT_RAW_SD)
+        self.raw_sd.update(raw_sd or {})
+
+    def _specs(
+        self,
+        profile: StudentProfile,
+        targets: Sequence[TargetProgram],
+        groups: Sequence[str]
+    ) -> List[_TargetSpec]:
+        """target별 컬럼/커트라인/결격 (점수와 무관, 1회, lookup_percentage와 같은 보간 정책)"""
+        specs = []
+        extractor = rules.get_cutoff_extractor(self.excel_data["PERCENTAGE"]) \
+            if "PERCENTAGE" in self.excel_data else None
+        method = (
+            InterpolationPolicy.MONOTONE_CUBIC.value
+            if PERCENTAGE_INTERPOLATION_POLICY == InterpolationPolicy.MONOTONE_CUBIC
+            else InterpolationPolicy.LINEAR.value
+        )
+        for target, group in zip(targets, groups):
+            disqual = rules.check_disqualification(
+                self.excel_data.get("RESTRICT", pd.DataFrame()), profile, target,
+                severity_threshold=2, explain=False
+            )
+            column, cutoffs = None, (np.nan, np.nan, np.nan)
+            if extractor is not None:
+                # 단조 3차면 컴파일 행렬의 spline_cutoffs (커트라인은 누백과 무관)
+                found = extractor.resolve(target.university, target.major, profile.track.value, method=method)
+                if found.found:
+                    column = found.column
+                    cutoffs = tuple(
+                        np.nan if value is None else float(value)
+                        for value in (found.cutoff_safe, found.cutoff_normal, found.cutoff_risk)
+                    )
+            specs.append(_TargetSpec(target, group, column, cutoffs, disqual.is_disqualified, method))
+        return specs
+
+    def simulate(
+        self,
+        profile: StudentProfile,
+        n: int = 10000,
+        seed: Optional[int] = None,
+        groups: Optional[Sequence[str]] = None,
+        targets: Optional[Sequence[TargetProgram]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: Optional[int] = None
+    ) -> SimulationResult:
+        """
+        몬테카를로 시뮬레이션
+
+        Args:
+            profile: 학생 프로필 (가채점 원점수)
+            n: 표본 수
+            seed: 난수 시드 (같은 seed + chunk_size → 같은 결과)
+            groups: target별 모집군 ("가"/"나"/"다", None이면 target마다 별도 그룹)
+            targets: 평가 대상 (None이면 profile.targets)
+            chunk_size: 청크당 표본 수
+            max_workers: 프로세스 수 (None/1이면 현재 프로세스에서 순차 실행)
+
+        Returns:
+            SimulationResult
+        """
+        targets = list(targets if targets is not None else profile.targets)
+        if groups is None:
+            groups = [str(i) for i in range(len(targets))]
+        if len(groups) != len(targets):
+            raise ValueError(f"groups 길이({len(groups)})가 targets 길이({len(targets)})와 다름")
+        if n <= 0:
+            raise ValueError(f"표본 수는 양수여야 함: {n}")
+
+        specs = self._specs(profile, targets, groups)
+        sizes = [min(chunk_size, n - start) for start in range(0, n, chunk_size)]
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        args = [(self.excel_data, profile, specs, self.raw_sd, size, s) for size, s in zip(sizes, seeds)]
+
+        if max_workers and max_workers > 1 and len(args) > 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                chunks = list(pool.map(_simulate_chunk, *zip(*args)))
+        else:
+            chunks = [_simulate_chunk(*a) for a in args]
+
+        probabilities = np.concatenate([c[0] for c in chunks])
+        cumulative_pct = np.concatenate([c[1] for c in chunks])
+        index_found = np.concatenate([c[2] for c in chunks])
+
+        # 기준값 (오차 없음)
+        baseline = _simulate_chunk(self.excel_data, profile, specs, {}, 1, None)[0][0]
+
+        result = self._summarize(specs, probabilities, baseline, cumulative_pct, index_found, seed)
+        logger.info(
+            f"포트폴리오 시뮬레이션: {n}회, target {len(specs)}개, "
+            f"하나 이상 합격 {result.portfolio_probability:.4f}"
+        )
+        return result
+
+    @staticmethod
+    def _summarize(
+        specs: List[_TargetSpec],
+        probabilities: np.ndarray,
+        baseline: np.ndarray,
+        cumulative_pct: np.ndarray,
+        index_found: np.ndarray,
+        seed: Optional[int]
+    ) -> SimulationResult:
+        """표본 확률 → target/그룹/포트폴리오 요약"""
+        n = len(probabilities)
+        known = np.nan_to_num(probabilities, nan=0.0)
+
+        group_probabilities: Dict[str, float] = {}
+        for group in dict.fromkeys(spec.group for spec in specs):
+            cols = [t for t, spec in enumerate(specs) if spec.group == group]
+            miss_all = np.prod(1.0 - known[:, cols], axis=1)
+            group_probabilities[group] = round(float(np.mean(1.0 - miss_all)), 4)
+        portfolio = float(np.mean(1.0 - np.prod(1.0 - known, axis=1))) if specs else 0.0
+
+        rows = []
+        for t, spec in enumerate(specs):
+            column = probabilities[:, t]
+            has = spec.column is not None and not spec.disqualified
+            q05, q50, q95 = np.quantile(column, [0.05, 0.5, 0.95]) if has else (np.nan,) * 3
+            rows.append({
+                "university": spec.target.university,
+                "major": spec.target.major,
+                "group": spec.group,
+                "column": spec.column,
+                "found": spec.column is not None,
+                "disqualified": spec.disqualified,
+                "mean_probability": round(float(np.mean(column)), 4) if has else (0.0 if spec.disqualified else np.nan),
+                "p05_probability": q05,
+                "p50_probability": q50,
+                "p95_probability": q95,
+                "baseline_probability": baseline[t],
+            })
+
+        valid_pct = cumulative_pct[index_found]
+        quantiles = {
+            key: (float(np.quantile(valid_pct, q)) if valid_pct.size else None)
+            for key, q in (("p05", 0.05), ("p50", 0.5), ("p95", 0.95))
+        }
+        return SimulationResult(
+            n_draws=n,
+            seed=seed,
+            portfolio_probability=round(portfolio, 4),
+            group_probabilities=group_probabilities,
+            targets=pd.DataFrame(rows, columns=SIMULATION_RESULT_COLUMNS),
+            cumulative_pct_quantiles=quantiles,
+            index_miss_rate=round(float(1.0 - index_found.mean()), 4) if n else 0.0,
+        )
+
+
+def simulate_portfolio(
+    excel_data: Dict[str, pd.DataFrame],
+    profile: StudentProfile,
+    n: int = 10000,
+    seed: Optional[int] = None,
+    groups: Optional[Sequence[str]] = None,
+    raw_sd: Optional[Dict[str, float]] = None,
+    max_workers: Optional[int] = None
+) -> SimulationResult:
+    """PortfolioSimulator(excel_data, raw_sd).simulate(...) 간편 함수"""
+    return PortfolioSimulator(excel_data, raw_sd).simulate(
+        profile, n=n, seed=seed, groups=groups, max_workers=max_workers
+    )
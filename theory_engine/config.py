@@ -109,6 +109,7 @@ class InterpolationPolicy(Enum):
     NEAREST_LOWER = "nearest_lower"   # 가장 가까운 아래 값
     NEAREST_UPPER = "nearest_upper"   # 가장 가까운 위 값
     LINEAR = "linear"                 # 선형 보간
+    MONOTONE_CUBIC = "monotone_cubic" # 단조 3차 보간 (PCHIP, PERCENTAGE 점수 곡선)
     NONE = "none"                     # 없으면 None
 
 
@@ -116,6 +117,49 @@ class InterpolationPolicy(Enum):
 PERCENTAGE_INTERPOLATION_POLICY = InterpolationPolicy.NEAREST_LOWER
 INDEX_NOT_FOUND_POLICY = "warn"  # "error" | "warn" | "silent"
 
+# PERCENTAGE 균일 격자 재표본화 (None이면 미사용, 예: 0.01 → 0.01% 간격)
+# 선형 보간 조회를 인덱스 산술로 처리, float32/uint16 양자화로 소수 2자리 반올림 경계에서 0.01 차이 가능
+PERCENTAGE_GRID_STEP: Optional[float] = None
+PERCENTAGE_GRID_DTYPE = "float32"  # "float32" | "uint16"
+
+# ============================================================
+# 확률 모델
+# ============================================================
+# "linear": 커트라인 3개 사이 구간 선형 (기본)
+# "distribution": PERCENTAGE 곡선에 로지스틱 CDF 적합 (프로그램별 파라미터 1회 적합)
+PROBABILITY_MODE = "linear"
+
+# 분포 적합에 사용할 누백 범위 (0/100%는 logit 발산으로 제외)
+DISTRIBUTION_FIT_RANGE = (1.0, 99.0)
+
+# 과거 결과 기반 확률 보정 테이블 적용 (weights/probability_calibration.json, 파일 없으면 미보정)
+# 생성: python tools/fit_probability_calibration.py --outcomes <CSV/Parquet>
+USE_PROBABILITY_CALIBRATION = False
+
+# ============================================================
+# 캐시 설정
+# ============================================================
+# 프로필 단위 변환/INDEX 결과 캐시 (LRU, 워크북 변경 시 무효화)
+PROFILE_CACHE_MAX_SIZE = 256
+
+# RAWSCORE 사전계산 테이블 사용 (weights/rawscore_table.json, 지문 불일치 시 자동 미사용)
+USE_PRECOMPUTED_RAWSCORE = True
+
+# ============================================================
+# 계측(metrics) 설정
+# ============================================================
+METRICS_ENABLED = True
+
+# 지연시간 히스토그램 버킷 상한 (ms, 마지막 버킷은 +Inf)
+METRICS_LATENCY_BUCKETS_MS = (0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0, 500.0, 1000.0)
+
+# Stage 4 도달 입력 샘플 로그 (최근 N건 보관, N건마다 1건 INFO 로그)
+METRICS_STAGE4_SAMPLE_SIZE = 200
+METRICS_STAGE4_LOG_EVERY = 10
+
+# 별칭 추가 후보(퍼지 단계 도달 입력) 집계 상한 (초과 시 상위 절반만 유지)
+METRICS_FALLBACK_INPUTS_MAX_SIZE = 1000
+
 
 if __name__ == "__main__":
     print(f"Engine Version: {ENGINE_VERSION}")
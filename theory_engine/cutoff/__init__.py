@@ -6,8 +6,46 @@
 
     extractor = CutoffExtractor(percentage_df)
     cutoffs = extractor.extract_cutoffs("가천", "의학", "이과")
+
+    # 매칭/점수 조회 결과는 불변 객체로 반환 (스레드 간 공유 가능)
+    match = extractor.match_program("가천", "의예", "이과")    # ProgramMatch
+    lookup = extractor.lookup_score("가천", "의학", 12.3, "이과")  # ScoreLookup
+
+    # 컬럼 매칭 1회로 커트라인 + 환산점수 + 보간 여부
+    resolved = extractor.resolve("가천", "의학", "이과", 12.3)   # PercentageResolution
+
+    # 단조 3차(PCHIP) 보간: 계수는 컴파일 행렬에 1회 계산
+    resolved = extractor.resolve("가천", "의학", "이과", 12.3, method="monotone_cubic")
+    curves = compiled.evaluate_spline(np.linspace(0, 100, 501))   # (프로그램, 누백)
+
+    # 대상 선택기 자동완성 (별칭/자모/초성, 매칭 품질 순)
+    extractor.autocomplete_programs("ㄱㅊ 의")      # ["가천의학 이과", ...]
+    extractor.catalog.search("연대 의예", limit=5)  # CatalogHit 목록
+
+    # 균일 누백 격자 (선택): 선형 점수 조회를 검색 없는 인덱스 산술로
+    extractor = CutoffExtractor(percentage_df, grid_step=0.01, grid_dtype="float32")
+    extractor.grid.score_at(row, 12.34)
+
+    # PERCENTAGE Long 저장소 (워크북 버전별 1회 구축, 프로그램 메타 파싱 공유)
+    store = loader.load_percentage_store()
+    extractor = CutoffExtractor(percentage_df, store=store)
+    long_df = store.to_long()   # percentile, program_id, program/university/major/track(categorical), score
+
+    # 전체 프로그램 점수 행렬 (생성 시 1회 컴파일)
+    compiled = extractor.compiled
+    scores = compiled.scores_at(12.3)   # 모든 프로그램의 누백 12.3 점수
 """
 
+from .compiled_matrix import CompiledPercentage
 from .cutoff_extractor import CutoffExtractor
+from .match_result import PercentageResolution, ProgramMatch, ScoreLookup
+from .percentage_store import PercentageStore
+from .percentile_grid import PercentileGrid
+from .program_catalog import CatalogHit, ProgramCatalog, ProgramEntry
 
-__all__ = ["CutoffExtractor"]
+__all__ = [
+    "CutoffExtractor", "CompiledPercentage",
+    "ProgramMatch", "ScoreLookup", "PercentageResolution",
+    "ProgramCatalog", "ProgramEntry", "CatalogHit",
+    "PercentileGrid", "PercentageStore",
+]
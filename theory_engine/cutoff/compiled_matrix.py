@@ -0,0 +1,366 @@
+"""
+PERCENTAGE 시트 컴파일 (전체 프로그램 점수 행렬)
+
+CutoffExtractor가 프로그램마다 두 컬럼을 잘라 to_numeric/dropna/sort 하던 작업을
+생성 시 1회로 모읍니다.
+
+- percentiles: 정렬된 누백 벡터 (P,)
+- scores: 프로그램 × 누백 점수 행렬 (C, P)
+  - 내부 결측은 양옆 관측값으로 선형 보간, 범위 밖은 가장자리 값으로 채움
+    → 각 행의 구간 선형 함수가 "결측 제거 후 np.interp"와 동일
+- observed: 실제 관측값 여부 (C, P) — 정확 값/보간 여부 판정용
+- lo / hi: 컬럼별 유효 누백 범위
+- cutoffs: 프로그램별 적정/예상/소신 커트라인 (C, 3), 유효 데이터 2개 미만이면 NaN
+- spline_coefficients: 단조 3차(PCHIP) 구간 계수 (C, P-1, 4), 첫 사용 시 1회 계산
+
+사용법:
+    compiled = CompiledPercentage.compile(percentage_df, "%")
+    row = compiled.row_of("가천의학 이과")
+    compiled.cutoffs_of(row)          # {"cutoff_safe": ..., ...}
+    compiled.score_at(row, 12.3)      # (score, interpolated)
+    compiled.scores_at(12.3)          # 전체 프로그램 점수 벡터
+
+    # 단조 3차 보간 (곡선 시각화: 여러 누백 × 여러 프로그램)
+    compiled.score_at(row, 12.3, method=MONOTONE_CUBIC)
+    compiled.evaluate_spline(np.linspace(0, 100, 501))   # (C, 501)
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 커트라인 키 순서 (cutoffs 행렬 컬럼 순서)
+CUTOFF_KEYS = ("cutoff_safe", "cutoff_normal", "cutoff_risk")
+
+# 보간에 필요한 최소 유효 데이터 수
+MIN_VALID_POINTS = 2
+
+# 보간 방식 (InterpolationPolicy 값과 동일 문자열)
+LINEAR = "linear"
+MONOTONE_CUBIC = "monotone_cubic"
+
+
+# ============================================================
+# 단조 3차 보간 (PCHIP, Fritsch–Carlson)
+# ============================================================
+def pchip_derivatives(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """
+    PCHIP 노드 기울기 (scipy.interpolate.PchipInterpolator와 같은 규칙)
+
+    Args:
+        x: 증가하는 노드 (n,)
+        y: 노드 값 (R, n) — 여러 곡선을 한 번에 처리
+
+    Returns:
+        (R, n) 노드별 1차 도함수
+    """
+    h = np.diff(x)
+    delta = np.diff(y, axis=1) / h
+    d = np.zeros_like(y)
+    n = len(x)
+    if n == 2:
+        d[:, 0] = d[:, 1] = delta[:, 0]
+        return d
+
+    # 내부 노드: 부호가 바뀌거나 평탄하면 0, 아니면 가중 조화평균
+    d_prev, d_next = delta[:, :-1], delta[:, 1:]
+    w1 = 2.0 * h[1:] + h[:-1]
+    w2 = h[1:] + 2.0 * h[:-1]
+    same_sign = (np.sign(d_prev) * np.sign(d_next)) > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        harmonic = (w1 + w2) / (w1 / d_prev + w2 / d_next)
+    d[:, 1:-1] = np.where(same_sign, harmonic, 0.0)
+
+    d[:, 0] = _pchip_edge(h[0], h[1], delta[:, 0], delta[:, 1])
+    d[:, -1] = _pchip_edge(h[-1], h[-2], delta[:, -1], delta[:, -2])
+    return d
+
+
+def _pchip_edge(h0: float, h1: float, m0: np.ndarray, m1: np.ndarray) -> np.ndarray:
+    """끝점 기울기 (3점 비중심 공식 + 단조성 보정)"""
+    d = ((2.0 * h0 + h1) * m0 - h0 * m1) / (h0 + h1)
+    d = np.where(np.sign(d) != np.sign(m0), 0.0, d)
+    overshoot = (np.sign(m0) != np.sign(m1)) & (np.abs(d) > 3.0 * np.abs(m0))
+    return np.where(overshoot, 3.0 * m0, d)
+
+
+def hermite_coefficients(x: np.ndarray, y: np.ndarray, d: np.ndarray) -> np.ndarray:
+    """
+    구간별 3차 계수 (t = 누백 - x_j 기준 a + b·t + c·t² + e·t³)
+
+    Returns:
+        (R, n-1, 4) — [a, b, c, e]
+    """
+    h = np.diff(x)
+    delta = np.diff(y, axis=1) / h
+    d0, d1 = d[:, :-1], d[:, 1:]
+    coef = np.empty(y.shape[:1] + (len(h), 4))
+    coef[..., 0] = y[:, :-1]
+    coef[..., 1] = d0
+    coef[..., 2] = (3.0 * delta - 2.0 * d0 - d1) / h
+    coef[..., 3] = (d0 + d1 - 2.0 * delta) / (h * h)
+    return coef
+
+
+def horner(coef: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """계수 배열(..., 4)을 t(...)에서 평가"""
+    return coef[..., 0] + t * (coef[..., 1] + t * (coef[..., 2] + t * coef[..., 3]))
+
+
+def _hermite_at(x: np.ndarray, coef: np.ndarray, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """단일 곡선 (1, n-1, 4)의 값/도함수 (범위 밖은 가장자리 값, 기울기 0)"""
+    clipped = np.clip(points, x[0], x[-1])
+    j = np.clip(np.searchsorted(x, clipped, side="right") - 1, 0, len(x) - 2)
+    t = clipped - x[j]
+    c = coef[0, j]
+    values = horner(c, t)
+    slopes = c[:, 1] + t * (2.0 * c[:, 2] + 3.0 * t * c[:, 3])
+    slopes = np.where((points < x[0]) | (points > x[-1]), 0.0, slopes)
+    return values, slopes
+
+
+class CompiledPercentage:
+    """PERCENTAGE 시트 컴파일 결과 (읽기 전용)"""
+
+    def __init__(
+        self,
+        percentiles: np.ndarray,
+        scores: np.ndarray,
+        observed: np.ndarray,
+        columns: List[str],
+        cutoff_percentiles: Sequence[float]
+    ):
+        """
+        Args:
+            percentiles: 정렬된 누백 (P,)
+            scores: 결측 보간된 점수 행렬 (C, P)
+            observed: 관측 여부 (C, P)
+            columns: 행 순서의 컬럼명 (C,)
+            cutoff_percentiles: 적정/예상/소신 누백
+        """
+        self.percentiles = percentiles
+        self.scores = scores
+        self.observed = observed
+        self.columns = columns
+        self.row_index: Dict[str, int] = {}
+        for row, col in enumerate(columns):
+            self.row_index.setdefault(col, row)
+
+        counts = observed.sum(axis=1)
+        self.valid = counts >= MIN_VALID_POINTS
+        first = observed.argmax(axis=1)
+        last = observed.shape[1] - 1 - observed[:, ::-1].argmax(axis=1)
+        self.lo = np.where(counts > 0, percentiles[first], np.nan) if len(percentiles) else np.array([])
+        self.hi = np.where(counts > 0, percentiles[last], np.nan) if len(percentiles) else np.array([])
+
+        self.cutoff_percentiles = tuple(float(p) for p in cutoff_percentiles)
+        self.cutoffs = np.full((len(columns), len(self.cutoff_percentiles)), np.nan)
+        for k, pct in enumerate(self.cutoff_percentiles):
+            # np.round는 Python round()와 .xx5 경계 처리가 달라 원소별 round 사용
+            self.cutoffs[:, k] = [round(float(v), 2) for v in self.scores_at(pct)]
+        self.cutoffs[~self.valid] = np.nan
+
+        # 단조 3차 보간 (첫 사용 시 계산)
+        self._spline_coefficients: Optional[np.ndarray] = None
+        self._spline_cutoffs: Optional[np.ndarray] = None
+
+    # ============================================================
+    # 컴파일
+    # ============================================================
+    @classmethod
+    def compile(
+        cls,
+        df: pd.DataFrame,
+        percentile_col: Any,
+        cutoff_percentiles: Sequence[float] = (20.0, 50.0, 80.0)
+    ) -> Optional["CompiledPercentage"]:
+        """
+        PERCENTAGE DataFrame 컴파일
+
+        Args:
+            df: PERCENTAGE 시트 DataFrame (첫 컬럼 누백)
+            percentile_col: 누백 컬럼명
+            cutoff_percentiles: 적정/예상/소신 누백
+
+        Returns:
+            CompiledPercentage, 누백 축이 중복/비어 있으면 None (기존 컬럼별 계산 사용)
+        """
+        pct = pd.to_numeric(df[percentile_col], errors="coerce").to_numpy(dtype=float)
+        keep = ~np.isnan(pct)
+        pct = pct[keep]
+        if len(pct) < MIN_VALID_POINTS or len(np.unique(pct)) != len(pct):
+            logger.warning("PERCENTAGE 누백 축이 비었거나 중복 → 컴파일 생략")
+            return None
+
+        order = np.argsort(pct, kind="mergesort")
+        percentiles = pct[order]
+
+        columns = [str(c) for c in df.columns[1:]]
+        body = df.iloc[:, 1:].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+        raw = body[keep][order].T  # (C, P)
+
+        observed = ~np.isnan(raw)
+        scores = np.empty_like(raw)
+        for row in range(raw.shape[0]):
+            mask = observed[row]
+            if mask.all():
+                scores[row] = raw[row]
+            elif mask.any():
+                # 결측 제거 후 np.interp 와 동일한 구간 선형 함수로 채움
+                scores[row] = np.interp(percentiles, percentiles[mask], raw[row, mask])
+            else:
+                scores[row] = np.nan
+
+        logger.info(f"PERCENTAGE 컴파일: {scores.shape[0]}개 컬럼 × {scores.shape[1]}개 누백")
+        return cls(percentiles, scores, observed, columns, cutoff_percentiles)
+
+    # ============================================================
+    # 조회
+    # ============================================================
+    def row_of(self, column: Any) -> Optional[int]:
+        """컬럼명 → 행 번호 (유효 데이터 2개 미만 포함, 없으면 None)"""
+        return self.row_index.get(str(column))
+
+    def cutoffs_of(self, row: int, method: str = LINEAR) -> Dict[str, Optional[float]]:
+        """행의 적정/예상/소신 커트라인"""
+        values = self.spline_cutoffs[row] if method == MONOTONE_CUBIC else self.cutoffs[row]
+        return {
+            key: (None if np.isnan(v) else float(v))
+            for key, v in zip(CUTOFF_KEYS, values)
+        }
+
+    def score_at(
+        self,
+        row: int,
+        percentile: float,
+        method: str = LINEAR
+    ) -> Optional[Tuple[float, bool]]:
+        """
+        행의 특정 누백 환산점수
+
+        관측된 누백과 (np.isclose 기준) 일치하면 해당 값, 아니면 보간 (선형 or 단조 3차).
+
+        Returns:
+            (score, interpolated), 유효 데이터 2개 미만이면 None
+        """
+        if not self.valid[row]:
+            return None
+
+        exact = np.isclose(self.percentiles, percentile, atol=1e-9) & self.observed[row]
+        if exact.any():
+            return round(float(self.scores[row, exact.argmax()]), 2), False
+        if method == MONOTONE_CUBIC:
+            value = self.evaluate_spline(np.array([percentile], dtype=float), rows=[row])[0, 0]
+            return round(float(value), 2), True
+        return round(float(np.interp(percentile, self.percentiles, self.scores[row])), 2), True
+
+    def scores_at(self, percentile: float, method: str = LINEAR) -> np.ndarray:
+        """
+        전체 행의 특정 누백 점수 (벡터화 보간, 반올림 없음)
+
+        Returns:
+            (C,) 점수 벡터 (유효 데이터 없는 행은 NaN)
+        """
+        if method == MONOTONE_CUBIC:
+            return self.evaluate_spline(np.array([percentile], dtype=float))[:, 0]
+
+        grid = self.percentiles
+        if percentile <= grid[0]:
+            return self.scores[:, 0].copy()
+        if percentile >= grid[-1]:
+            return self.scores[:, -1].copy()
+
+        j = int(np.searchsorted(grid, percentile, side="right")) - 1
+        left = self.scores[:, j]
+        slope = (self.scores[:, j + 1] - left) / (grid[j + 1] - grid[j])
+        return slope * (percentile - grid[j]) + left
+
+    # ============================================================
+    # 단조 3차 보간
+    # ============================================================
+    @property
+    def spline_coefficients(self) -> np.ndarray:
+        """
+        행별 PCHIP 계수를 공통 누백 격자 구간으로 표현 (C, P-1, 4)
+
+        관측값만을 노드로 한 PCHIP을 격자점에서의 값/기울기로 다시 쓴 것이라
+        (구간 안에서는 같은 3차식) 결측이 있는 행도 같은 격자로 평가할 수 있습니다.
+        관측 범위 밖 격자 구간은 상수 계수로 두어 np.interp와 같이 가장자리 값으로
+        고정됩니다 (경계 노드 바깥쪽 기울기 0, 단조성 유지).
+        """
+        if self._spline_coefficients is None:
+            grid = self.percentiles
+            values = self.scores.copy()
+            slopes = np.zeros_like(values)
+
+            full = self.observed.all(axis=1)
+            if full.any():
+                slopes[full] = pchip_derivatives(grid, values[full])
+
+            for row in np.flatnonzero(self.valid & ~full):
+                mask = self.observed[row]
+                x, y = grid[mask], self.scores[row, mask][None, :]
+                coef = hermite_coefficients(x, y, pchip_derivatives(x, y))
+                values[row], slopes[row] = _hermite_at(x, coef, grid)
+
+            coef = hermite_coefficients(grid, values, slopes)
+
+            # 관측 범위 [lo, hi] 밖 구간: 가장자리 값 상수
+            observed = self.observed & self.valid[:, None]
+            first = observed.argmax(axis=1)[:, None]
+            last = (observed.shape[1] - 1 - observed[:, ::-1].argmax(axis=1))[:, None]
+            j = np.arange(coef.shape[1])[None, :]
+            outside = ((j + 1 <= first) | (j >= last)) & self.valid[:, None]
+            coef[outside, 1:] = 0.0
+
+            self._spline_coefficients = coef
+        return self._spline_coefficients
+
+    @property
+    def spline_cutoffs(self) -> np.ndarray:
+        """단조 3차 보간 기준 적정/예상/소신 커트라인 (C, 3)"""
+        if self._spline_cutoffs is None:
+            pcts = np.array(self.cutoff_percentiles, dtype=float)
+            values = self.evaluate_spline(pcts)
+            cutoffs = np.array([[round(float(v), 2) for v in row] for row in values]).reshape(values.shape)
+            cutoffs[~self.valid] = np.nan
+            self._spline_cutoffs = cutoffs
+        return self._spline_cutoffs
+
+    def evaluate_spline(
+        self,
+        percentiles: np.ndarray,
+        rows: Optional[Sequence[int]] = None
+    ) -> np.ndarray:
+        """
+        여러 누백 × 여러 프로그램 단조 3차 보간 (벡터화 Horner, 반올림 없음)
+
+        Args:
+            percentiles: 누백 배열 (K,)
+            rows: 평가할 행 (None이면 전체)
+
+        Returns:
+            (R, K) 점수 행렬
+        """
+        grid = self.percentiles
+        pcts = np.clip(np.asarray(percentiles, dtype=float), grid[0], grid[-1])
+        j = np.clip(np.searchsorted(grid, pcts, side="right") - 1, 0, len(grid) - 2)
+        t = pcts - grid[j]
+
+        coef = self.spline_coefficients
+        if rows is not None:
+            coef = coef[np.asarray(rows, dtype=np.intp)]
+        return horner(coef[:, j, :], t)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 정보"""
+        return {
+            "columns": len(self.columns),
+            "percentiles": len(self.percentiles),
+            "valid_columns": int(self.valid.sum()),
+            "observed_ratio": round(float(self.observed.mean()), 4) if self.observed.size else 0.0,
+        }
@@ -6,16 +6,36 @@ PERCENTAGE 시트에서 대학/전공별 커트라인(80%/50%/20%) 추출
 """
 
 import re
+import difflib
 import pandas as pd
 import numpy as np
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from ..matchers.bulk import HAS_RAPIDFUZZ, dedupe_inputs, expand_results, fuzz, process, score_matrix
+from .compiled_matrix import (
+    LINEAR,
+    MONOTONE_CUBIC,
+    CompiledPercentage,
+    hermite_coefficients,
+    horner,
+    pchip_derivatives,
+)
+from .match_result import PercentageResolution, ProgramMatch, ScoreLookup
+from .percentage_store import PercentageStore
+from .percentile_grid import PercentileGrid
+from .program_catalog import ProgramCatalog
 
 logger = logging.getLogger(__name__)
 
 
 class CutoffExtractor:
-    """커트라인 자동 추출기 v2 (Alias 지원)"""
+    """
+    커트라인 자동 추출기 v2 (Alias 지원)
+
+    호출별 상태를 인스턴스에 남기지 않습니다 (매칭/조회 정보는 ProgramMatch/ScoreLookup으로 반환).
+    내부 캐시는 같은 입력에 같은 값을 채우는 메모이즈뿐이므로 여러 스레드가 한 인스턴스를 공유해도 됩니다.
+    """
 
     # 기준 확률 라인
     CUTOFF_PERCENTILES = {
@@ -120,37 +140,67 @@ class CutoffExtractor:
         "공공": ["공공정책", "행정"],
     }
 
+    # 정규화 전공명 집합 (컬럼명 파싱용, 지연 구축)
+    _KNOWN_MAJORS: Set[str] = set()
+
     @classmethod
     def _build_alias_reverse_map(cls):
         """별칭 → 공식 대학명 역매핑 구축"""
         if cls.ALIAS_TO_OFFICIAL:
             return  # 이미 구축됨
 
+        # 지역 dict에 구축 후 한 번에 반영 (다른 스레드가 절반만 채워진 매핑을 보지 않도록)
+        mapping: Dict[str, str] = {}
         for official, aliases in cls.UNIVERSITY_ALIASES.items():
             # 공식 대학명 자체도 매핑
-            cls.ALIAS_TO_OFFICIAL[cls._normalize_university(official)] = official
-            cls.ALIAS_TO_OFFICIAL[cls._normalize_university(official.replace("대", ""))] = official  # "서울" → "서울대"
+            mapping[cls._normalize_university(official)] = official
+            mapping[cls._normalize_university(official.replace("대", ""))] = official  # "서울" → "서울대"
 
             # 모든 별칭 매핑
             for alias in aliases:
-                cls.ALIAS_TO_OFFICIAL[cls._normalize_university(alias)] = official
+                mapping[cls._normalize_university(alias)] = official
 
+        cls.ALIAS_TO_OFFICIAL.update(mapping)
         logger.debug(f"대학 Alias 역매핑 구축: {len(cls.ALIAS_TO_OFFICIAL)}개")
 
-    def __init__(self, percentage_df: pd.DataFrame):
+    def __init__(
+        self,
+        percentage_df: pd.DataFrame,
+        grid_step: Optional[float] = None,
+        grid_dtype: str = "float32",
+        store: Optional[PercentageStore] = None
+    ):
         """
         Args:
             percentage_df: PERCENTAGE 시트 DataFrame
+            grid_step: 균일 누백 격자 간격 (None이면 미사용, 선형 점수 조회를 격자로 처리)
+            grid_dtype: 격자 저장 형식 ("float32" | "uint16")
+            store: 같은 시트로 만든 PercentageStore (주어지면 컬럼 파싱 결과 재사용)
         """
         # Alias 역매핑 구축
         self._build_alias_reverse_map()
 
         self.df = percentage_df.copy()
         self._cache: Dict[str, Dict] = {}
-        # 마지막 매칭/보간 정보 (Explainability/디버깅용)
-        self._last_match_info: Dict[str, Any] = {}
-        self._last_score_lookup: Dict[str, Any] = {}
+        # (대학, 전공, 계열) → ProgramMatch 캐시
+        self._column_cache: Dict[Tuple[str, str, str], ProgramMatch] = {}
+        # 퍼지 질의("공식대학명+전공 계열") → (후보 컬럼, 점수) or None
+        self._fuzzy_cache: Dict[str, Optional[Tuple[str, float]]] = {}
+        # 컬럼 → 커트라인 / (누백, 점수) 곡선 캐시 (컴파일 불가 시 컬럼 단위 계산 재사용)
+        self._cutoffs_by_column: Dict[Tuple[str, str], Dict[str, Optional[float]]] = {}
+        self._curve_cache: Dict[str, Optional[Tuple[np.ndarray, np.ndarray]]] = {}
+        # 검색/자동완성 카탈로그 (첫 검색 시 구축)
+        self._catalog: Optional[ProgramCatalog] = None
         self._analyze_structure()
+        self._build_column_index(store.program_keys() if store is not None else None)
+        # 전체 프로그램 점수 행렬/커트라인 (누백 축 이상 시 None → 컬럼별 계산)
+        self.compiled: Optional[CompiledPercentage] = CompiledPercentage.compile(
+            self.df, self.percentile_col, tuple(self.CUTOFF_PERCENTILES.values())
+        )
+        # 균일 누백 격자 (선택, 커트라인은 컴파일 행렬의 정확 값 유지)
+        self.grid: Optional[PercentileGrid] = None
+        if grid_step and self.compiled is not None:
+            self.grid = PercentileGrid.build(self.compiled, grid_step, grid_dtype)
 
     @staticmethod
     def _normalize_university(name: str) -> str:
@@ -180,6 +230,63 @@ class CutoffExtractor:
         # 매칭 실패 시 원본 반환 (과도한 부분매칭은 오매핑 위험)
         return name
 
+    @classmethod
+    def match_universities(
+        cls,
+        names: Sequence[str],
+        threshold: float = 85.0
+    ) -> pd.DataFrame:
+        """
+        대학명 대량 매칭 (온보딩 업로드용)
+
+        입력을 중복 제거한 뒤 Alias 역매핑으로 정확 매칭하고, 남은 입력만
+        정규화된 Alias 전체와 한 번에 유사도를 계산합니다
+        (rapidfuzz 있으면 process.cdist, 없으면 difflib 비율).
+
+        Args:
+            names: 입력 대학명 목록
+            threshold: 퍼지 매칭 임계값 (0-100)
+
+        Returns:
+            DataFrame (input, normalized, canonical, score, stage), 입력 순서 유지
+            - canonical: 공식 대학명 (매칭 실패 시 원본)
+            - stage: "exact" | "fuzzy" | "none"
+        """
+        cls._build_alias_reverse_map()
+        codes, uniques = dedupe_inputs(names)
+
+        normalized = [cls._normalize_university(u) for u in uniques]
+        canonical: List[Optional[str]] = list(uniques)
+        scores = [0.0] * len(uniques)
+        stages = ["none"] * len(uniques)
+
+        pending: List[int] = []
+        for i, norm in enumerate(normalized):
+            if not norm:
+                continue
+            official = cls.ALIAS_TO_OFFICIAL.get(norm)
+            if official is not None:
+                canonical[i], scores[i], stages[i] = official, 100.0, "exact"
+            else:
+                pending.append(i)
+
+        if pending:
+            aliases = list(cls.ALIAS_TO_OFFICIAL.keys())
+            matrix = score_matrix(
+                [normalized[i] for i in pending],
+                aliases,
+                fallback_scorer=lambda a, b: difflib.SequenceMatcher(None, a, b).ratio() * 100,
+            )
+            best_idx = matrix.argmax(axis=1)
+            best_scores = matrix[range(len(pending)), best_idx]
+            for row, i in enumerate(pending):
+                if float(best_scores[row]) >= threshold:
+                    canonical[i] = cls.ALIAS_TO_OFFICIAL[aliases[best_idx[row]]]
+                    scores[i] = float(best_scores[row])
+                    stages[i] = "fuzzy"
+
+        return expand_results(codes, names, normalized, canonical, scores, stages)
+
     def _analyze_structure(self):
         """시트 구조 분석"""
         logger.info(f"PERCENTAGE 시트 분석: {self.df.shape}")
@@ -199,6 +306,136 @@ class CutoffExtractor:
         if self.program_columns:
             logger.debug(f"샘플 컬럼: {self.program_columns[:5]}")
 
+    # ============================================================
+    # 컬럼명 인덱스
+    # ============================================================
+    def _build_column_index(
+        self,
+        parsed_keys: Optional[Dict[str, Tuple[Optional[str], str, str]]] = None
+    ):
+        """
+        컬럼명 1회 정규화 + 조회용 인덱스 구축
+
+        - 정확 매칭: 컬럼 문자열 → 첫 위치
+        - 포함 매칭: 부분 문자열(needle) → 포함 컬럼 위치 집합 (needle별 지연 계산 후 메모이즈)
+        - 프로그램 컬럼 파싱: (공식 대학명, 정규화 전공, 계열) + 대학별/전공별 인덱스
+          (parsed_keys에 있는 컬럼은 재파싱하지 않음)
+        """
+        parsed_keys = parsed_keys or {}
+        self._columns: List[Any] = list(self.df.columns)
+        self._column_strs: List[str] = [str(c) for c in self._columns]
+        self._column_norms: List[str] = [self._normalize_university(c) for c in self._column_strs]
+
+        self._column_pos: Dict[str, int] = {}
+        for pos, col_str in enumerate(self._column_strs):
+            self._column_pos.setdefault(col_str, pos)
+
+        self._norm_postings: Dict[str, FrozenSet[int]] = {}
+        self._raw_postings: Dict[str, FrozenSet[int]] = {}
+        self._program_column_strs: List[str] = [str(c) for c in self.program_columns]
+
+        self.program_keys: Dict[str, Tuple[Optional[str], str, str]] = {}
+        self._by_university: Dict[str, List[str]] = {}
+        self._by_major: Dict[str, List[str]] = {}
+        for col_str in self._program_column_strs:
+            key = parsed_keys.get(col_str) or self.parse_program_column(col_str)
+            self.program_keys[col_str] = key
+            official, major_norm, _ = key
+            if official is not None:
+                self._by_university.setdefault(official, []).append(col_str)
+            self._by_major.setdefault(major_norm, []).append(col_str)
+
+    @classmethod
+    def parse_program_column(cls, column: str) -> Tuple[Optional[str], str, str]:
+        """
+        프로그램 컬럼명 파싱
+
+        Args:
+            column: PERCENTAGE 컬럼명 (예: "가천의학 이과")
+
+        Returns:
+            (공식 대학명 or None, 정규화 전공명, 계열)
+            예: ("가천대", "의학", "이과")
+        """
+        cls._build_alias_reverse_map()
+        text = str(column).strip()
+
+        track = ""
+        for candidate in ("이과", "문과"):
+            if text.endswith(candidate):
+                track = candidate
+                text = text[: -len(candidate)].strip()
+                break
+
+        body = cls._normalize_university(text)
+
+        # 대학 별칭 접두어 후보 (긴 것부터)
+        splits = [
+            (cls.ALIAS_TO_OFFICIAL[body[:end]], body[end:])
+            for end in range(len(body), 0, -1)
+            if body[:end] in cls.ALIAS_TO_OFFICIAL
+        ]
+        if not splits:
+            return None, body, track
+
+        # 나머지가 알려진 전공명인 분할 우선 ("가천의|학" 대신 "가천|의학")
+        known_majors = cls._known_majors()
+        for official, major in splits:
+            if major in known_majors:
+                return official, major, track
+        return splits[0][0], splits[0][1], track
+
+    @classmethod
+    def _known_majors(cls) -> Set[str]:
+        """MAJOR_ALIASES 전체(키 + 별칭)의 정규화 전공명"""
+        if not cls._KNOWN_MAJORS:
+            cls._KNOWN_MAJORS = {
+                cls._normalize_university(name)
+                for major, aliases in cls.MAJOR_ALIASES.items()
+                for name in [major, *aliases]
+            }
+        return cls._KNOWN_MAJORS
+
+    def programs_by_university(self, university: str) -> List[str]:
+        """공식 대학명(별칭 허용) 기준 프로그램 컬럼 목록"""
+        return list(self._by_university.get(self._get_official_university(university), []))
+
+    def programs_by_major(self, major: str) -> List[str]:
+        """정규화 전공명 기준 프로그램 컬럼 목록"""
+        return list(self._by_major.get(self._normalize_university(major), []))
+
+    def _positions_containing(self, needle: str, normalized: bool = True) -> FrozenSet[int]:
+        """needle을 포함하는 컬럼 위치 집합 (정규화 컬럼명 or 원본 컬럼명 기준)"""
+        postings = self._norm_postings if normalized else self._raw_postings
+        positions = postings.get(needle)
+        if positions is None:
+            haystack = self._column_norms if normalized else self._column_strs
+            positions = frozenset(i for i, text in enumerate(haystack) if needle in text)
+            postings[needle] = positions
+        return positions
+
+    def _first_containing(
+        self,
+        univ_names: List[str],
+        major: str,
+        track: str
+    ) -> Optional[int]:
+        """
+        (대학명 중 하나 ⊂ 컬럼) ∧ (전공 ⊂ 컬럼) ∧ (계열 ⊂ 원본 컬럼) 을 만족하는 첫 컬럼 위치
+        """
+        candidates = self._positions_containing(self._normalize_university(major))
+        if not candidates:
+            return None
+
+        univ_positions: Set[int] = set()
+        for univ_name in univ_names:
+            univ_positions |= self._positions_containing(self._normalize_university(univ_name))
+        candidates = candidates & univ_positions
+
+        if track and candidates:
+            candidates = candidates & self._positions_containing(track, normalized=False)
+        return min(candidates) if candidates else None
+
     def extract_cutoffs(
         self,
         university: str,
@@ -223,32 +460,140 @@ class CutoffExtractor:
             }
         """
         cache_key = f"{university}_{major}_{track}"
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            return self._copy_result(cached)
 
         # 컬럼 찾기
-        program_col = self._find_program_column(university, major, track)
+        match = self.match_program(university, major, track)
 
-        if program_col is None:
+        if not match.found:
             result = {
                 'found': False,
                 'column': None,
                 'cutoff_safe': None,
                 'cutoff_normal': None,
                 'cutoff_risk': None,
-                'match_info': dict(self._last_match_info) if self._last_match_info else {},
+                'match_info': match.match_info_dict(),
             }
-            self._cache[cache_key] = result
-            return result
-
-        # 커트라인 계산
-        result = self._calculate_cutoffs(program_col)
-        result['found'] = True
-        result['column'] = program_col
-        result['match_info'] = dict(self._last_match_info) if self._last_match_info else {}
+        else:
+            # 커트라인 계산
+            result = dict(self._column_cutoffs(match.column))
+            result['found'] = True
+            result['column'] = match.column
+            result['match_info'] = match.match_info_dict()
 
         self._cache[cache_key] = result
-        return result
+        return self._copy_result(result)
+
+    @staticmethod
+    def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        """캐시된 결과의 호출자 소유 복사본 (match_info 포함)"""
+        copied = dict(result)
+        copied['match_info'] = dict(result['match_info'])
+        return copied
+
+    def match_program(
+        self,
+        university: str,
+        major: str,
+        track: str = ""
+    ) -> ProgramMatch:
+        """
+        대학/전공에 해당하는 컬럼 매칭 (v2: Alias 지원, 결과 메모이즈)
+
+        Returns:
+            ProgramMatch (불변, column=None이면 매칭 실패)
+        """
+        match = self._cached_match(university, major, track)
+        if not match.found:
+            logger.warning(
+                f"컬럼 없음: {university}({match.match_info['university_official']})+{major} (전공명 필수)"
+            )
+        return match
+
+    def _cached_match(self, university: str, major: str, track: str) -> ProgramMatch:
+        """match_program 본체 (경고 없음)"""
+        cache_key = (university, major, track)
+        match = self._column_cache.get(cache_key)
+        if match is None:
+            column, match_info = self._resolve_program_column(university, major, track)
+            match = ProgramMatch(column, match_info)
+            self._column_cache[cache_key] = match
+        return match
+
+    def resolve_many(self, targets: Sequence[Tuple[str, str, str]]) -> List[ProgramMatch]:
+        """
+        여러 target 일괄 매칭
+
+        인덱스 단계(exact~major_alias)에서 풀리지 않은 target만 모아
+        퍼지 단계를 process.cdist 한 번으로 계산한 뒤 결과를 캐시에 채웁니다.
+
+        Args:
+            targets: (대학, 전공, 계열) 목록
+
+        Returns:
+            ProgramMatch 목록 (입력 순서)
+        """
+        pending: Dict[Tuple[str, str, str], None] = {}
+        queries: List[str] = []
+        for key in targets:
+            key = tuple(key)
+            if key in self._column_cache or key in pending:
+                continue
+            column, match_info = self._resolve_program_column(*key, allow_fuzzy=False)
+            if column is not None:
+                self._column_cache[key] = ProgramMatch(column, match_info)
+            else:
+                pending[key] = None
+                queries.append(self._fuzzy_query(match_info["university_official"], key[1], key[2]))
+
+        self._fuzzy_lookup_many(queries)
+        return [self._cached_match(*key) for key in targets]
+
+    # ============================================================
+    # 퍼지 단계 (질의별 메모이즈, 배치는 cdist)
+    # ============================================================
+    @staticmethod
+    def _fuzzy_query(official_univ: str, major: str, track: str) -> str:
+        """퍼지 질의 문자열 ("가천대의학 이과")"""
+        query = f"{official_univ}{major}"
+        return f"{query} {track}" if track else query
+
+    def _fuzzy_lookup(self, query: str) -> Optional[Tuple[str, float]]:
+        """질의 1건 퍼지 매칭 (WRatio, score_cutoff=80)"""
+        if query not in self._fuzzy_cache:
+            self._fuzzy_lookup_many([query])
+        return self._fuzzy_cache.get(query)
+
+    def _fuzzy_lookup_many(self, queries: Sequence[str]) -> None:
+        """
+        미캐시 질의를 한 번에 퍼지 매칭해 _fuzzy_cache에 채움
+
+        process.extractOne(WRatio, score_cutoff=80)과 같은 결과:
+        질의별 최고 점수 후보(동점이면 컬럼 순서상 첫 번째), 80 미만이면 None.
+        """
+        todo = list(dict.fromkeys(q for q in queries if q not in self._fuzzy_cache))
+        if not todo:
+            return
+        if not HAS_RAPIDFUZZ or not self._program_column_strs:
+            for query in todo:
+                self._fuzzy_cache[query] = None
+            return
+
+        choices = self._program_column_strs
+        if len(todo) == 1:
+            best = process.extractOne(todo[0], choices, scorer=fuzz.WRatio, score_cutoff=80)
+            self._fuzzy_cache[todo[0]] = (best[0], float(best[1])) if best else None
+            return
+
+        # float64: 단건 WRatio와 같은 값 → 동점 판정(첫 번째 최고점)도 extractOne과 동일
+        matrix = score_matrix(todo, choices, fallback_scorer=None, scorer=fuzz.WRatio, dtype=np.float64)
+        best_idx = matrix.argmax(axis=1)
+        for row, query in enumerate(todo):
+            candidate = choices[int(best_idx[row])]
+            score = float(matrix[row, best_idx[row]])
+            self._fuzzy_cache[query] = (candidate, score) if score >= 80 else None
 
     def _find_program_column(
         self,
@@ -256,7 +601,27 @@ class CutoffExtractor:
         major: str,
         track: str = ""
     ) -> Optional[str]:
-        """대학/전공에 해당하는 컬럼 찾기 (v2: Alias 지원)"""
+        """대학/전공에 해당하는 컬럼 (match_program().column)"""
+        return self.match_program(university, major, track).column
+
+    def _resolve_program_column(
+        self,
+        university: str,
+        major: str,
+        track: str = "",
+        allow_fuzzy: bool = True
+    ) -> Tuple[Optional[Any], Dict[str, Any]]:
+        """
+        컬럼 해석 본체
+
+        allow_fuzzy=False면 퍼지 이후 단계를 건너뜁니다 (resolve_many 1차 패스).
+
+        단계별 우선순위와 "컬럼 순서상 첫 번째" 규칙은 기존 전체 스캔과 동일하며,
+        스캔 대신 컬럼 인덱스(정확 매칭 dict, 부분 문자열 위치 집합)를 사용합니다.
+
+        Returns:
+            (컬럼 or None, match_info)
+        """
 
         # 1. 공식 대학명 변환
         official_univ = self._get_official_university(university)
@@ -276,6 +641,11 @@ class CutoffExtractor:
             "column": None,
         }
 
+        def found(pos: int, stage: str) -> Tuple[Any, Dict[str, Any]]:
+            match_info["match_stage"] = stage
+            match_info["column"] = self._column_strs[pos]
+            return self._columns[pos], match_info
+
         # 2. 모든 별칭 수집
         all_univ_names = [official_univ]
         if official_univ in self.UNIVERSITY_ALIASES:
@@ -293,116 +663,141 @@ class CutoffExtractor:
                 patterns.append(f"{univ_name}{major}{track}")   # "가천의학이과"
                 patterns.append(f"{univ_name} {major} {track}") # "가천 의학 이과"
 
-        # 4. 정확한 매칭 (우선순위 최고)
-        for col in self.df.columns:
-            col_str = str(col)
-            for pattern in patterns:
-                if pattern == col_str:
-                    logger.debug(f"정확 매칭: '{pattern}' → '{col_str}'")
-                    match_info["match_stage"] = "exact"
-                    match_info["column"] = col_str
-                    self._last_match_info = match_info
-                    return col
+        # 4. 정확한 매칭 (우선순위 최고, 컬럼 순서상 첫 번째)
+        exact_positions = [self._column_pos[p] for p in patterns if p in self._column_pos]
+        if exact_positions:
+            pos = min(exact_positions)
+            logger.debug(f"정확 매칭: → '{self._column_strs[pos]}'")
+            return found(pos, "exact")
 
         # 5. 포함 매칭 (대학명 + 전공 모두 포함)
-        for col in self.df.columns:
-            col_str = str(col)
-            col_normalized = self._normalize_university(col_str)
-
-            for univ_name in all_univ_names:
-                univ_normalized = self._normalize_university(univ_name)
-                major_normalized = self._normalize_university(major)
-
-                if univ_normalized in col_normalized and major_normalized in col_normalized:
-                    # track도 확인 (있으면)
-                    if not track or track in col_str:
-                        logger.debug(f"포함 매칭: '{univ_name}+{major}' → '{col_str}'")
-                        match_info["match_stage"] = "contains"
-                        match_info["column"] = col_str
-                        self._last_match_info = match_info
-                        return col
+        pos = self._first_containing(all_univ_names, major, track)
+        if pos is not None:
+            logger.debug(f"포함 매칭: '{university}+{major}' → '{self._column_strs[pos]}'")
+            return found(pos, "contains")
 
         # 6. 전공 Alias 확장 매칭
         # "의예" → "의학", "의대" 등 유사 전공명으로 재시도
-        major_aliases = self._get_major_aliases(major)
-        for major_alias in major_aliases:
-            for col in self.df.columns:
-                col_str = str(col)
-                col_normalized = self._normalize_university(col_str)
-                major_alias_normalized = self._normalize_university(major_alias)
-                for univ_name in all_univ_names:
-                    univ_normalized = self._normalize_university(univ_name)
-                    if univ_normalized in col_normalized and major_alias_normalized in col_normalized:
-                        if not track or track in col_str:
-                            logger.info(f"전공Alias 매칭: '{major}' → '{major_alias}' (컬럼: '{col_str}')")
-                            match_info["match_stage"] = "major_alias"
-                            match_info["major_used"] = major_alias
-                            match_info["major_method"] = "alias"
-                            match_info["alias_chain"] = [major, major_alias]
-                            match_info["column"] = col_str
-                            self._last_match_info = match_info
-                            return col
+        for major_alias in self._get_major_aliases(major):
+            pos = self._first_containing(all_univ_names, major_alias, track)
+            if pos is not None:
+                logger.info(f"전공Alias 매칭: '{major}' → '{major_alias}' (컬럼: '{self._column_strs[pos]}')")
+                match_info["major_used"] = major_alias
+                match_info["major_method"] = "alias"
+                match_info["alias_chain"] = [major, major_alias]
+                return found(pos, "major_alias")
+
+        if not allow_fuzzy:
+            match_info["match_stage"] = "not_found"
+            return None, match_info
 
         # 7. 퍼지 매칭 (rapidfuzz 사용 가능 시) - 마지막 보조 수단
-        try:
-            from rapidfuzz import fuzz, process
-
-            best_pattern = f"{official_univ}{major}"
-            if track:
-                best_pattern = f"{best_pattern} {track}"
-
-            result = process.extractOne(
-                query=best_pattern,
-                choices=[str(c) for c in self.program_columns],
-                scorer=fuzz.WRatio,
-                score_cutoff=80
-            )
-            if result:
-                candidate = result[0]
-                candidate_norm = self._normalize_university(candidate)
-                if (
-                    self._normalize_university(official_univ) in candidate_norm
-                    and (not track or track in candidate)
-                ):
-                    logger.debug(f"퍼지 매칭: '{best_pattern}' → '{candidate}' (score={result[1]})")
-                    for col in self.df.columns:
-                        if str(col) == candidate:
-                            match_info["match_stage"] = "fuzzy"
-                            match_info["fuzzy_score"] = float(result[1])
-                            match_info["column"] = candidate
-                            self._last_match_info = match_info
-                            return col
-        except ImportError:
-            pass  # rapidfuzz 없으면 스킵
+        best_pattern = self._fuzzy_query(official_univ, major, track)
+        result = self._fuzzy_lookup(best_pattern)
+        if result:
+            candidate, fuzzy_score = result
+            candidate_norm = self._normalize_university(candidate)
+            if (
+                self._normalize_university(official_univ) in candidate_norm
+                and (not track or track in candidate)
+                and candidate in self._column_pos
+            ):
+                logger.debug(f"퍼지 매칭: '{best_pattern}' → '{candidate}' (score={fuzzy_score})")
+                match_info["fuzzy_score"] = fuzzy_score
+                return found(self._column_pos[candidate], "fuzzy")
 
         # 8. 대학+전공 원본 텍스트 매칭 (최후 수단)
         # 주의: 대학명만 매칭하면 오매칭 위험 ("연세대의예" → "연세간호" 방지)
-        major_normalized = self._normalize_university(major)
-        for col in self.df.columns:
-            col_str = str(col)
-            col_normalized = self._normalize_university(col_str)
-            for univ_name in all_univ_names:
-                univ_normalized = self._normalize_university(univ_name)
-                if univ_normalized in col_normalized and major_normalized in col_normalized:
-                    if not track or track in col_str:
-                        logger.debug(f"대학+전공 매칭: '{univ_name}+{major}' → '{col_str}'")
-                        match_info["match_stage"] = "raw_contains"
-                        match_info["column"] = col_str
-                        self._last_match_info = match_info
-                        return col
+        pos = self._first_containing(all_univ_names, major, track)
+        if pos is not None:
+            logger.debug(f"대학+전공 매칭: '{university}+{major}' → '{self._column_strs[pos]}'")
+            return found(pos, "raw_contains")
 
         # 찾지 못함 - 반드시 대학+전공 조합 필요
-        logger.warning(f"컬럼 없음: {university}({official_univ})+{major} (전공명 필수)")
         match_info["match_stage"] = "not_found"
-        self._last_match_info = match_info
-        return None
+        return None, match_info
+
+    def resolve(
+        self,
+        university: str,
+        major: str,
+        track: str = "",
+        percentile: float = 50.0,
+        method: str = LINEAR
+    ) -> PercentageResolution:
+        """
+        컬럼 매칭 + 커트라인 + 누백 환산점수를 한 번에 조회
+
+        extract_cutoffs() + get_score_at_percentile()와 같은 결과를
+        컬럼 매칭 1회, 컬럼별 캐시(컴파일 행/곡선) 재사용으로 계산합니다.
+
+        Args:
+            method: 보간 방식 ("linear" | "monotone_cubic"), 커트라인/점수 모두 적용
+
+        Returns:
+            PercentageResolution (불변)
+        """
+        match = self.match_program(university, major, track)
+        pct_value = float(percentile)
+        if not match.found:
+            return PercentageResolution(match=match, percentile=pct_value)
+
+        cutoffs = self._column_cutoffs(match.column, method)
+        try:
+            looked_up = self.score_for_column(match.column, pct_value, method)
+        except Exception:
+            looked_up = None
+
+        score, interpolated, used_method = None, None, None
+        if looked_up is not None:
+            score, interpolated = looked_up
+            used_method = method
+
+        return PercentageResolution(
+            match=match,
+            percentile=pct_value,
+            score=score,
+            cutoff_safe=cutoffs.get('cutoff_safe'),
+            cutoff_normal=cutoffs.get('cutoff_normal'),
+            cutoff_risk=cutoffs.get('cutoff_risk'),
+            interpolated=interpolated,
+            interpolation_method=used_method,
+        )
+
+    def _column_cutoffs(self, program_col: Any, method: str = LINEAR) -> Dict[str, Optional[float]]:
+        """컬럼별 커트라인 (메모이즈, 읽기 전용으로 사용)"""
+        key = (str(program_col), method)
+        cutoffs = self._cutoffs_by_column.get(key)
+        if cutoffs is None:
+            cutoffs = self._calculate_cutoffs(program_col, method)
+            self._cutoffs_by_column[key] = cutoffs
+        return cutoffs
 
     def _get_major_aliases(self, major: str) -> List[str]:
         """전공명 별칭 반환"""
         return self.MAJOR_ALIASES.get(major, [])
 
-    def _calculate_cutoffs(self, program_col: str) -> Dict[str, Optional[float]]:
-        """커트라인 계산"""
+    def _compiled_row(self, program_col: Any) -> Optional[int]:
+        """컴파일 행렬의 행 번호 (누백 컬럼 자체/미컴파일이면 None)"""
+        if self.compiled is None or str(program_col) == str(self.percentile_col):
+            return None
+        return self.compiled.row_of(program_col)
+
+    def _calculate_cutoffs(self, program_col: str, method: str = LINEAR) -> Dict[str, Optional[float]]:
+        """커트라인 계산 (컴파일 행렬의 사전계산 값 우선)"""
+        row = self._compiled_row(program_col)
+        if row is not None:
+            return self.compiled.cutoffs_of(row, method)
+        if method == MONOTONE_CUBIC:
+            curve = self.get_score_curve(program_col)
+            if curve is None:
+                return {'cutoff_safe': None, 'cutoff_normal': None, 'cutoff_risk': None}
+            values = [self.score_from_curve(curve, pct, method)[0] for pct in self.CUTOFF_PERCENTILES.values()]
+            return dict(zip(('cutoff_safe', 'cutoff_normal', 'cutoff_risk'), values))
+        return self._calculate_cutoffs_from_column(program_col)
+
+    def _calculate_cutoffs_from_column(self, program_col: str) -> Dict[str, Optional[float]]:
+        """커트라인 계산 (컬럼 단위)"""
 
         # 데이터 추출
         df_subset = self.df[[self.percentile_col, program_col]].copy()
@@ -452,10 +847,90 @@ class CutoffExtractor:
         track: str = ""
     ) -> Optional[float]:
         """특정 누백에서의 환산점수 조회"""
+        lookup = self.lookup_score(university, major, percentile, track)
+        return lookup.score if lookup is not None else None
+
+    def lookup_score(
+        self,
+        university: str,
+        major: str,
+        percentile: float,
+        track: str = "",
+        method: str = LINEAR
+    ) -> Optional[ScoreLookup]:
+        """
+        특정 누백에서의 환산점수 조회 (보간 정보 포함)
+
+        Returns:
+            ScoreLookup (불변), 컬럼 없음/유효 데이터 부족/조회 실패 시 None
+        """
+        match = self.match_program(university, major, track)
+        if not match.found:
+            return None
+        return self.lookup_column_score(match.column, percentile, method)
+
+    def lookup_column_score(
+        self,
+        program_col: Any,
+        percentile: float,
+        method: str = LINEAR
+    ) -> Optional[ScoreLookup]:
+        """해석된 컬럼의 환산점수 조회 (ScoreLookup)"""
+        try:
+            pct_value = float(percentile)
+            looked_up = self.score_for_column(program_col, pct_value, method)
+        except Exception:
+            return None
+        if looked_up is None:
+            return None
+
+        score, interpolated = looked_up
+        return ScoreLookup(
+            column=str(program_col),
+            percentile=pct_value,
+            score=score,
+            interpolated=interpolated,
+            interpolation_method=method,
+        )
 
-        program_col = self._find_program_column(university, major, track)
-        if program_col is None:
+    def score_for_column(
+        self,
+        program_col: Any,
+        percentile: float,
+        method: str = LINEAR
+    ) -> Optional[Tuple[float, bool]]:
+        """
+        해석된 컬럼의 특정 누백 환산점수
+
+        Args:
+            method: 보간 방식 ("linear" | "monotone_cubic")
+
+        Returns:
+            (score, interpolated), 유효 데이터 2개 미만이면 None
+        """
+        row = self._compiled_row(program_col)
+        if row is not None:
+            if self.grid is not None and method == LINEAR:
+                return self.grid.score_at(row, float(percentile))
+            return self.compiled.score_at(row, float(percentile), method)
+
+        curve = self.get_score_curve(program_col)
+        if curve is None:
             return None
+        return self.score_from_curve(curve, float(percentile), method)
+
+    def get_score_curve(self, program_col: str) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+        컬럼의 (누백, 환산점수) 곡선 (결측 제거, 누백 오름차순)
+
+        같은 컬럼을 여러 누백에서 조회할 때 재사용합니다.
+
+        Returns:
+            (pct_arr, score_arr), 유효 데이터 2개 미만이면 None
+        """
+        key = str(program_col)
+        if key in self._curve_cache:
+            return self._curve_cache[key]
 
         df_subset = self.df[[self.percentile_col, program_col]].copy()
         df_subset.columns = ['pct', 'score']
@@ -464,40 +939,62 @@ class CutoffExtractor:
         df_subset['score'] = pd.to_numeric(df_subset['score'], errors='coerce')
         df_subset = df_subset.dropna().sort_values('pct')
 
-        if len(df_subset) < 2:
-            return None
+        curve = None
+        if len(df_subset) >= 2:
+            curve = (df_subset['pct'].to_numpy(), df_subset['score'].to_numpy())
+            for arr in curve:
+                arr.setflags(write=False)
+        self._curve_cache[key] = curve
+        return curve
 
-        try:
-            pct_value = float(percentile)
-            pct_arr = df_subset['pct'].values
-            score_arr = df_subset['score'].values
-
-            # 정확 값 존재 여부 (float 오차 고려)
-            exact_mask = np.isclose(pct_arr, pct_value, atol=1e-9)
-            if exact_mask.any():
-                score = score_arr[exact_mask.argmax()]
-                interpolated = False
-            else:
-                score = np.interp(pct_value, pct_arr, score_arr)
-                interpolated = True
-
-            self._last_score_lookup = {
-                "column": str(program_col),
-                "percentile": pct_value,
-                "interpolated": interpolated,
-                "interpolation_method": "linear",
-            }
-            return round(float(score), 2)
-        except Exception:
-            return None
+    @staticmethod
+    def score_from_curve(
+        curve: Tuple[np.ndarray, np.ndarray],
+        percentile: float,
+        method: str = LINEAR
+    ) -> Tuple[float, bool]:
+        """
+        곡선에서 누백의 환산점수 (정확 값 우선, 없으면 선형/단조 3차 보간)
+
+        누백이 중복된 곡선은 단조 3차 보간이 정의되지 않아 선형 보간을 사용합니다.
+
+        Returns:
+            (score, interpolated)
+        """
+        pct_arr, score_arr = curve
+
+        # 정확 값 존재 여부 (float 오차 고려)
+        exact_mask = np.isclose(pct_arr, percentile, atol=1e-9)
+        if exact_mask.any():
+            return round(float(score_arr[exact_mask.argmax()]), 2), False
+
+        if method == MONOTONE_CUBIC and np.all(np.diff(pct_arr) > 0):
+            x = np.asarray(pct_arr, dtype=float)
+            y = np.asarray(score_arr, dtype=float)[None, :]
+            pct = min(max(percentile, x[0]), x[-1])
+            j = min(max(int(np.searchsorted(x, pct, side="right")) - 1, 0), len(x) - 2)
+            coef = hermite_coefficients(x, y, pchip_derivatives(x, y))[0, j]
+            return round(float(horner(coef, pct - x[j])), 2), True
+        return round(float(np.interp(percentile, pct_arr, score_arr)), 2), True
 
     def list_available_programs(self) -> List[str]:
         """사용 가능한 대학/전공 목록"""
         return self.program_columns
 
+    @property
+    def catalog(self) -> ProgramCatalog:
+        """프로그램 카탈로그 (접두사/자모/초성 검색 인덱스)"""
+        if self._catalog is None:
+            self._catalog = ProgramCatalog.from_extractor(self)
+        return self._catalog
+
     def search_programs(self, keyword: str) -> List[str]:
-        """키워드로 대학/전공 검색"""
-        return [col for col in self.program_columns if keyword in str(col)]
+        """키워드로 대학/전공 검색 (컬럼명 부분 문자열, 컬럼 순서)"""
+        return self.catalog.containing(keyword)
+
+    def autocomplete_programs(self, query: str, limit: int = 10, track: str = "") -> List[str]:
+        """대상 선택기 자동완성 (별칭/자모/초성 허용, 매칭 품질 순)"""
+        return self.catalog.autocomplete(query, limit=limit, track=track)
 
     def get_stats(self) -> Dict:
         """통계 정보"""
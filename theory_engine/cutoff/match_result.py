@@ -0,0 +1,92 @@
+"""
+CutoffExtractor 조회 결과 (불변 객체)
+
+컬럼 매칭/점수 조회 메타데이터를 인스턴스 속성(_last_*)에 남기지 않고
+호출마다 결과 객체로 돌려줍니다. 하나의 CutoffExtractor를 여러 스레드가
+공유해도 다른 호출의 결과가 섞이지 않습니다.
+"""
+
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+
+def _freeze(info: Optional[Mapping[str, Any]]) -> Mapping[str, Any]:
+    """dict 복사본의 읽기 전용 뷰 (alias_chain 등 리스트는 튜플로)"""
+    frozen = {
+        key: tuple(value) if isinstance(value, list) else value
+        for key, value in (info or {}).items()
+    }
+    return MappingProxyType(frozen)
+
+
+@dataclass(frozen=True)
+class ProgramMatch:
+    """(대학, 전공, 계열) → PERCENTAGE 컬럼 매칭 결과"""
+    column: Optional[Any]
+    match_info: Mapping[str, Any] = field(default_factory=lambda: MappingProxyType({}))
+
+    def __post_init__(self):
+        if not isinstance(self.match_info, MappingProxyType):
+            object.__setattr__(self, "match_info", _freeze(self.match_info))
+
+    @property
+    def found(self) -> bool:
+        return self.column is not None
+
+    @property
+    def stage(self) -> Optional[str]:
+        """매칭 단계 (exact/contains/major_alias/fuzzy/raw_contains/not_found)"""
+        return self.match_info.get("match_stage")
+
+    def match_info_dict(self) -> Dict[str, Any]:
+        """기존 dict 형식 match_info (호출자 소유 복사본)"""
+        return {
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in self.match_info.items()
+        }
+
+
+@dataclass(frozen=True)
+class ScoreLookup:
+    """특정 누백의 환산점수 조회 결과"""
+    column: str
+    percentile: float
+    score: float
+    interpolated: bool
+    interpolation_method: str = "linear"
+
+
+@dataclass(frozen=True)
+class PercentageResolution:
+    """컬럼 매칭 + 커트라인 + 누백 환산점수 (CutoffExtractor.resolve 결과)"""
+    match: ProgramMatch
+    percentile: float
+    score: Optional[float] = None
+    cutoff_safe: Optional[float] = None
+    cutoff_normal: Optional[float] = None
+    cutoff_risk: Optional[float] = None
+    interpolated: Optional[bool] = None
+    interpolation_method: Optional[str] = None
+
+    @property
+    def found(self) -> bool:
+        return self.match.found
+
+    @property
+    def column(self) -> Optional[Any]:
+        return self.match.column
+
+    def to_dict(self) -> Dict[str, Any]:
+        """rules.lookup_percentage() 반환 형식"""
+        return {
+            "found": self.found,
+            "score": self.score,
+            "cutoff_safe": self.cutoff_safe,
+            "cutoff_normal": self.cutoff_normal,
+            "cutoff_risk": self.cutoff_risk,
+            "column": self.column,
+            "match_info": self.match.match_info_dict(),
+            "interpolated": self.interpolated,
+            "interpolation_method": self.interpolation_method,
+        }
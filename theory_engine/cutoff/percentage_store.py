@@ -0,0 +1,262 @@
+"""
+PERCENTAGE Long 형태 저장소 (프로그램 메타데이터 1회 파싱)
+
+1100+ 컬럼 Wide 시트를 요청마다 melt 하지 않도록
+- programs: program_id → (컬럼명, 공식 대학명, 전공, 계열, 프로그램 여부)
+- long: (percentile, program_id, score) 열 배열 (결측 제외, melt와 같은 순서)
+로 한 번 변환하고 워크북(경로 + mtime + 크기 + EXCEL_VERSION)별로 pickle 캐시합니다.
+CutoffExtractor, 리포트, 분석 배치가 같은 저장소를 공유합니다.
+
+사용법:
+    from theory_engine.loader import load_percentage_store
+
+    store = load_percentage_store()          # 워크북 변경 시에만 재구축
+    store.programs                            # program_id 인덱스 메타 DataFrame
+    store.to_long()                           # Long DataFrame (program/university/major/track categorical)
+    store.scores_of("가천의학 이과")           # (percentile, score) 배열
+"""
+
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 기본 저장 경로 (weights/ 아래 pickle, 워크북 버전별 1개)
+DEFAULT_STORE_PATH = Path(__file__).parent.parent / "weights" / "percentage_store.pkl"
+
+
+def percentage_fingerprint(percentage_df: pd.DataFrame) -> str:
+    """PERCENTAGE 시트 지문 (컬럼명 + 숫자 셀 값)"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\x1f".join(str(c) for c in percentage_df.columns).encode("utf-8"))
+    values = percentage_df.apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+    digest.update(np.ascontiguousarray(values).tobytes())
+    return f"{percentage_df.shape[0]}x{percentage_df.shape[1]}:{digest.hexdigest()}"
+
+
+class PercentageStore:
+    """PERCENTAGE Long 형태 저장소 (읽기 전용)"""
+
+    FORMAT_VERSION = 1
+
+    # programs 메타 컬럼
+    PROGRAM_COLUMNS = ["column", "university", "major", "track", "is_program"]
+
+    def __init__(
+        self,
+        programs: pd.DataFrame,
+        percentile: np.ndarray,
+        program_id: np.ndarray,
+        score: np.ndarray,
+        metadata: Dict[str, Any]
+    ):
+        """
+        Args:
+            programs: program_id 인덱스 메타 DataFrame (PROGRAM_COLUMNS)
+            percentile / program_id / score: Long 열 배열 (같은 길이)
+            metadata: 포맷/엑셀 버전, 원본 지문 등
+        """
+        self.programs = programs
+        self.percentile = percentile
+        self.program_id = program_id
+        self.score = score
+        self.metadata = metadata
+
+        # program_id별 연속 구간 (long은 program_id 순으로 정렬되어 있음)
+        bounds = np.searchsorted(program_id, np.arange(len(programs) + 1))
+        self._bounds = bounds
+        self._id_of: Dict[str, int] = {}
+        for pid, col in enumerate(programs["column"]):
+            self._id_of.setdefault(col, pid)
+
+    # ============================================================
+    # 구축
+    # ============================================================
+    @classmethod
+    def build(
+        cls,
+        percentage_df: pd.DataFrame,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> "PercentageStore":
+        """
+        Wide PERCENTAGE → Long 저장소
+
+        - 프로그램 컬럼 파싱은 CutoffExtractor.parse_program_column과 동일 규칙
+        - 행 순서는 DataFrame.melt와 동일 (컬럼 순 → 원본 행 순), 결측 점수 제외
+        """
+        from ..config import EXCEL_VERSION
+        from .cutoff_extractor import CutoffExtractor
+
+        percentile_col = percentage_df.columns[0]
+        columns = [str(c) for c in percentage_df.columns[1:]]
+
+        parsed = [CutoffExtractor.parse_program_column(c) for c in columns]
+        programs = pd.DataFrame({
+            "column": columns,
+            "university": [official for official, _, _ in parsed],
+            "major": [major for _, major, _ in parsed],
+            "track": [track for _, _, track in parsed],
+            "is_program": [not (c.startswith("Unnamed") or c.startswith("★")) for c in columns],
+        }, columns=cls.PROGRAM_COLUMNS)
+        programs.index.name = "program_id"
+
+        pct = pd.to_numeric(percentage_df[percentile_col], errors="coerce").to_numpy(dtype=np.float64)
+        body = percentage_df.iloc[:, 1:].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=np.float64)
+
+        # (C, R) 순회 = melt 순서
+        scores = body.T
+        mask = ~np.isnan(scores)
+        program_id = np.repeat(np.arange(len(columns), dtype=np.int32), mask.sum(axis=1))
+        percentile = np.broadcast_to(pct, scores.shape)[mask]
+        score = scores[mask]
+
+        meta = {
+            "format_version": cls.FORMAT_VERSION,
+            "excel_version": EXCEL_VERSION,
+            "fingerprint": percentage_fingerprint(percentage_df),
+            "percentile_column": str(percentile_col),
+        }
+        meta.update(metadata or {})
+
+        logger.info(f"PERCENTAGE 저장소 구축: {len(columns)}개 프로그램, {len(score)}행")
+        return cls(programs, percentile, program_id, score, meta)
+
+    # ============================================================
+    # 저장/로드
+    # ============================================================
+    def save(self, path: Optional[str] = None) -> Path:
+        """pickle 저장"""
+        path = Path(path) if path is not None else DEFAULT_STORE_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+        pd.to_pickle({
+            "metadata": self.metadata,
+            "programs": self.programs,
+            "percentile": self.percentile,
+            "program_id": self.program_id,
+            "score": self.score,
+        }, path)
+        logger.info(f"PERCENTAGE 저장소 저장: {path}")
+        return path
+
+    @classmethod
+    def load(
+        cls,
+        path: Optional[str] = None,
+        expected: Optional[Dict[str, Any]] = None
+    ) -> Optional["PercentageStore"]:
+        """
+        저장소 로드
+
+        Args:
+            path: pickle 경로 (None이면 DEFAULT_STORE_PATH)
+            expected: 일치해야 하는 메타데이터 (예: 원본 경로/mtime/크기)
+
+        Returns:
+            PercentageStore, 파일이 없거나 포맷/버전/메타가 다르면 None
+        """
+        from ..config import EXCEL_VERSION
+
+        path = Path(path) if path is not None else DEFAULT_STORE_PATH
+        if not path.exists():
+            return None
+
+        try:
+            data = pd.read_pickle(path)
+        except Exception as e:
+            logger.warning(f"PERCENTAGE 저장소 로드 실패: {path} ({e})")
+            return None
+
+        metadata = data.get("metadata", {})
+        required = {"format_version": cls.FORMAT_VERSION, "excel_version": EXCEL_VERSION}
+        required.update(expected or {})
+        for key, value in required.items():
+            if metadata.get(key) != value:
+                logger.info(f"PERCENTAGE 저장소 무효({key}: {metadata.get(key)} != {value}): {path}")
+                return None
+
+        logger.info(f"PERCENTAGE 저장소 로드: {path}")
+        return cls(data["programs"], data["percentile"], data["program_id"], data["score"], metadata)
+
+    def matches(self, percentage_df: pd.DataFrame) -> bool:
+        """저장소가 주어진 PERCENTAGE 시트로 만들어졌는지 (지문 비교)"""
+        return self.metadata.get("fingerprint") == percentage_fingerprint(percentage_df)
+
+    # ============================================================
+    # 조회
+    # ============================================================
+    def program_keys(self) -> Dict[str, Tuple[Optional[str], str, str]]:
+        """프로그램 컬럼 → (공식 대학명, 정규화 전공, 계열) (CutoffExtractor.program_keys 형식)"""
+        programs = self.programs[self.programs["is_program"]]
+        return {
+            col: (univ if isinstance(univ, str) else None, major, track)
+            for col, univ, major, track in zip(
+                programs["column"], programs["university"], programs["major"], programs["track"]
+            )
+        }
+
+    def scores_of(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        """프로그램 1개의 (percentile, score) 배열 (원본 행 순서, 결측 제외)"""
+        pid = self._id_of.get(str(column))
+        if pid is None:
+            raise KeyError(column)
+        lo, hi = self._bounds[pid], self._bounds[pid + 1]
+        return self.percentile[lo:hi], self.score[lo:hi]
+
+    def to_long(self, with_metadata: bool = True) -> pd.DataFrame:
+        """
+        Long DataFrame
+
+        Returns:
+            percentile, program_id, program(categorical), score
+            [+ university, major, track (categorical)]
+        """
+        programs = self.programs
+        df = pd.DataFrame({
+            "percentile": self.percentile,
+            "program_id": self.program_id,
+            "program": self._categorical(programs["column"]),
+            "score": self.score,
+        })
+        if with_metadata:
+            for key in ("university", "major", "track"):
+                df[key] = self._categorical(programs[key])
+        return df
+
+    def _categorical(self, values: pd.Series) -> pd.Categorical:
+        """프로그램 단위 값 → Long 행 단위 categorical (program_id 코드 재사용)"""
+        categories = values.astype("category")
+        codes = categories.cat.codes.to_numpy()[self.program_id]
+        return pd.Categorical.from_codes(codes, categories=categories.cat.categories)
+
+    def to_legacy_long(self) -> pd.DataFrame:
+        """
+        loader.load_percentage_normalized() 기존 반환 형식
+
+        Returns:
+            percentile, program, score, university_major, track
+            (university_major/track은 program 문자열 rsplit(" ", 1) 규칙, 공백 없으면 track=None)
+        """
+        columns = self.programs["column"]
+        split = columns.str.rsplit(" ", n=1, expand=True).reindex(columns=[0, 1])
+        return pd.DataFrame({
+            "percentile": self.percentile,
+            "program": columns.to_numpy()[self.program_id],
+            "score": self.score,
+            "university_major": split[0].to_numpy()[self.program_id],
+            "track": split[1].to_numpy()[self.program_id],
+        })
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 정보"""
+        return {
+            "programs": int(self.programs["is_program"].sum()),
+            "columns": len(self.programs),
+            "rows": len(self.score),
+            "nbytes": int(self.percentile.nbytes + self.program_id.nbytes + self.score.nbytes),
+            "excel_version": self.metadata.get("excel_version"),
+        }
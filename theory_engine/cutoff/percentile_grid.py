@@ -0,0 +1,223 @@
+"""
+PERCENTAGE 균일 누백 격자 (고정 간격 재표본화)
+
+컴파일 행렬(CompiledPercentage)의 프로그램별 선형 곡선을 0.01% 같은 균일 간격
+격자로 미리 재표본화해 연속 배열(float32 또는 uint16)로 보관합니다.
+조회는 검색 없이 인덱스 산술 + 이웃 두 점 선형 혼합입니다.
+
+- values: (C, N) 격자 점수 (float32, 또는 uint16 + 컬럼별 offset/scale)
+- lo / hi: 컬럼별 유효 누백 범위 (원본 관측 기준)
+- 관측 누백과 일치하는 조회는 원본 관측값을 그대로 반환 (exact 판정은 CompiledPercentage와 동일)
+
+정밀도:
+- float32: 격자점 값 오차 ~1e-5 (소수 2자리 반올림 경계에서 드물게 0.01 차이)
+- uint16: 컬럼별 범위/65535 양자화 (점수 범위 100 기준 ~0.0015)
+기본은 사용하지 않으며 config.PERCENTAGE_GRID_STEP으로 켭니다.
+
+사용법:
+    grid = PercentileGrid.build(compiled, step=0.01, dtype="float32")
+    grid.score_at(row, 12.34)     # (score, interpolated)
+    grid.scores_at(12.34)         # 전체 프로그램 점수 벡터
+"""
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+from .compiled_matrix import CompiledPercentage
+
+logger = logging.getLogger(__name__)
+
+# 지원 저장 형식
+GRID_DTYPES = ("float32", "uint16")
+
+# 재표본화 시 한 번에 처리할 행 수 (float64 중간 배열 크기 제한)
+_BUILD_CHUNK_ROWS = 128
+
+_UINT16_MAX = 65535
+
+
+class PercentileGrid:
+    """균일 누백 격자 (읽기 전용)"""
+
+    def __init__(
+        self,
+        compiled: CompiledPercentage,
+        start: float,
+        step: float,
+        values: np.ndarray,
+        offset: Optional[np.ndarray] = None,
+        scale: Optional[np.ndarray] = None
+    ):
+        """
+        Args:
+            compiled: 원본 컴파일 행렬 (관측값/유효 여부 참조)
+            start: 격자 시작 누백
+            step: 격자 간격
+            values: (C, N) 격자 점수 (float32 or uint16)
+            offset / scale: uint16 복원 계수 (C,) — score = value * scale + offset
+        """
+        self.compiled = compiled
+        self.start = float(start)
+        self.step = float(step)
+        self.values = values
+        self.offset = offset
+        self.scale = scale
+        self.size = values.shape[1]
+        self.end = self.start + self.step * (self.size - 1)
+        self.valid = compiled.valid
+        self.lo = compiled.lo
+        self.hi = compiled.hi
+
+        # 격자 인덱스 → 원본 관측 누백 위치 (없으면 -1)
+        self.knot_of = np.full(self.size, -1, dtype=np.int32)
+        positions = np.rint((compiled.percentiles - self.start) / self.step).astype(np.int64)
+        on_grid = np.isclose(self.start + positions * self.step, compiled.percentiles, atol=1e-9, rtol=0.0)
+        self.knot_of[positions[on_grid]] = np.flatnonzero(on_grid)
+
+    # ============================================================
+    # 구축
+    # ============================================================
+    @classmethod
+    def build(
+        cls,
+        compiled: CompiledPercentage,
+        step: float = 0.01,
+        dtype: str = "float32"
+    ) -> "PercentileGrid":
+        """
+        컴파일 행렬을 균일 격자로 재표본화
+
+        Args:
+            compiled: CompiledPercentage
+            step: 격자 간격 (누백 %)
+            dtype: "float32" | "uint16"
+        """
+        if dtype not in GRID_DTYPES:
+            raise ValueError(f"지원하지 않는 격자 형식: {dtype} (가능: {GRID_DTYPES})")
+        if step <= 0:
+            raise ValueError(f"격자 간격은 양수여야 함: {step}")
+
+        x = compiled.percentiles
+        start = float(x[0])
+        # 마지막 관측 누백을 덮도록 올림 (범위 밖 격자점은 가장자리 값 = np.interp와 동일)
+        size = int(np.ceil((x[-1] - start) / step - 1e-9)) + 1
+        grid = np.minimum(start + step * np.arange(size), x[-1])
+
+        # 공통 격자 → 원본 구간 (모든 행 공유)
+        j = np.clip(np.searchsorted(x, grid, side="right") - 1, 0, len(x) - 2)
+        w = (grid - x[j]) / (x[j + 1] - x[j])
+
+        rows = compiled.scores.shape[0]
+        offset = scale = None
+        if dtype == "float32":
+            values = np.empty((rows, size), dtype=np.float32)
+        else:
+            values = np.zeros((rows, size), dtype=np.uint16)
+            offset = np.zeros(rows)
+            scale = np.ones(rows)
+
+        for begin in range(0, rows, _BUILD_CHUNK_ROWS):
+            block = compiled.scores[begin:begin + _BUILD_CHUNK_ROWS]
+            resampled = block[:, j] * (1.0 - w) + block[:, j + 1] * w
+            if dtype == "float32":
+                values[begin:begin + len(block)] = resampled
+                continue
+
+            with np.errstate(invalid="ignore"):
+                low = np.nanmin(resampled, axis=1) if resampled.size else np.zeros(len(block))
+                high = np.nanmax(resampled, axis=1) if resampled.size else np.zeros(len(block))
+            low = np.nan_to_num(low)
+            span = np.nan_to_num(high) - low
+            block_scale = np.where(span > 0, span / _UINT16_MAX, 1.0)
+            codes = np.rint((resampled - low[:, None]) / block_scale[:, None])
+            values[begin:begin + len(block)] = np.nan_to_num(codes).clip(0, _UINT16_MAX)
+            offset[begin:begin + len(block)] = low
+            scale[begin:begin + len(block)] = block_scale
+
+        logger.info(
+            f"PERCENTAGE 격자: {rows}개 컬럼 × {size}점 (간격 {step}, {dtype}, "
+            f"{values.nbytes / 1e6:.1f}MB)"
+        )
+        return cls(compiled, start, step, values, offset, scale)
+
+    # ============================================================
+    # 조회
+    # ============================================================
+    def _decode(self, row: Any, raw: np.ndarray) -> np.ndarray:
+        """저장값 → 점수"""
+        if self.scale is None:
+            return raw.astype(np.float64)
+        return raw * self.scale[row] + self.offset[row]
+
+    def _position(self, percentile: float) -> Tuple[int, float]:
+        """누백 → (왼쪽 격자 인덱스, 혼합 비율)"""
+        pos = (min(max(percentile, self.start), self.end) - self.start) / self.step
+        i = min(int(pos), self.size - 2)
+        return i, pos - i
+
+    def score_at(self, row: int, percentile: float) -> Optional[Tuple[float, bool]]:
+        """
+        행의 특정 누백 환산점수 (CompiledPercentage.score_at과 같은 계약)
+
+        Returns:
+            (score, interpolated), 유효 데이터 2개 미만이면 None
+        """
+        if not self.valid[row]:
+            return None
+
+        # 관측 누백 일치: 가장 가까운 격자점의 원본 누백만 확인 (np.isclose 기본 허용오차)
+        nearest = int(round((percentile - self.start) / self.step))
+        if 0 <= nearest < self.size:
+            knot = self.knot_of[nearest]
+            if knot >= 0 and self.compiled.observed[row, knot]:
+                knot_pct = self.compiled.percentiles[knot]
+                if abs(knot_pct - percentile) <= 1e-9 + 1e-5 * abs(percentile):
+                    return round(float(self.compiled.scores[row, knot]), 2), False
+
+        i, frac = self._position(percentile)
+        left, right = self._decode(row, self.values[row, i:i + 2])
+        return round(float(left + frac * (right - left)), 2), True
+
+    def scores_at(self, percentile: float) -> np.ndarray:
+        """
+        전체 행의 특정 누백 점수 (반올림 없음)
+
+        Returns:
+            (C,) 점수 벡터 (유효 데이터 2개 미만 행은 NaN)
+        """
+        i, frac = self._position(percentile)
+        pair = self.values[:, i:i + 2]
+        if self.scale is None:
+            left, right = pair[:, 0].astype(np.float64), pair[:, 1].astype(np.float64)
+        else:
+            left = pair[:, 0] * self.scale + self.offset
+            right = pair[:, 1] * self.scale + self.offset
+        scores = left + frac * (right - left)
+        scores[~self.valid] = np.nan
+        return scores
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.values.nbytes)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 정보 (관측점 기준 최대 재표본화 오차 포함)"""
+        compiled = self.compiled
+        on_grid = self.knot_of >= 0
+        knots = self.knot_of[on_grid]
+        max_error = 0.0
+        if knots.size and self.valid.any():
+            rows = np.flatnonzero(self.valid)
+            stored = self._decode(rows[:, None], self.values[np.ix_(rows, np.flatnonzero(on_grid))])
+            errors = np.abs(stored - compiled.scores[np.ix_(rows, knots)])
+            max_error = float(np.nanmax(errors)) if errors.size else 0.0
+        return {
+            "columns": int(self.values.shape[0]),
+            "points": int(self.size),
+            "step": self.step,
+            "dtype": str(self.values.dtype),
+            "nbytes": self.nbytes,
+            "max_abs_error": round(max_error, 6),
+        }
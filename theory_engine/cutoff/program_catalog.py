@@ -0,0 +1,355 @@
+"""
+프로그램 카탈로그 (대학/전공 검색·자동완성 인덱스)
+
+PERCENTAGE 프로그램 컬럼을 (공식 대학명, 대학 별칭, 전공, 전공 별칭, 계열, 원본 컬럼)
+구조로 정리하고 접두사/자모/초성/bigram 인덱스를 만들어 키 입력마다 호출되는
+대상 선택기 자동완성을 선형 스캔 없이 처리합니다.
+
+검색 단계 (점수 높은 순):
+- exact: 검색어 == 이름 (대학명/별칭/전공/컬럼)
+- prefix: 이름의 접두사
+- jamo: 자모 단위 접두사 (입력 중인 음절 "갗" → "가천")
+- chosung: 초성 접두사 ("ㄱㅊ" → "가천")
+- contains: 이름/컬럼의 부분 문자열
+
+사용법:
+    catalog = ProgramCatalog.from_extractor(extractor)
+    catalog.autocomplete("가천 의")        # ["가천의학 이과", "가천한의 이과", ...]
+    catalog.search("ㅇㅅ 의예", limit=5)   # CatalogHit 목록 (점수/매칭 단계 포함)
+    catalog.containing("의학")             # search_programs()와 동일 (부분 문자열, 컬럼 순서)
+"""
+
+import heapq
+import logging
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# ============================================================
+# 한글 자모 분해
+# ============================================================
+_HANGUL_BASE = 0xAC00
+_HANGUL_LAST = 0xD7A3
+_CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNGSUNG = "ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ"
+_JONGSUNG = ["", "ㄱ", "ㄲ", "ㄳ", "ㄴ", "ㄵ", "ㄶ", "ㄷ", "ㄹ", "ㄺ", "ㄻ", "ㄼ", "ㄽ", "ㄾ",
+             "ㄿ", "ㅀ", "ㅁ", "ㅂ", "ㅄ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+
+# 겹자모 → 입력 순서 자모 (IME 입력 중간 상태와 맞추기 위함: "닭" 입력 중 "달" + "ㄱ")
+_COMPOUND_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ",
+    "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ",
+    "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ",
+}
+
+_CONSONANTS = frozenset(_CHOSUNG) | frozenset(j for j in _JONGSUNG if j)
+
+
+def decompose_hangul(text: str) -> str:
+    """한글 음절을 입력 순서 자모열로 분해 (그 외 문자는 그대로)"""
+    out: List[str] = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            offset = code - _HANGUL_BASE
+            jamo = (
+                _CHOSUNG[offset // 588]
+                + _JUNGSUNG[(offset % 588) // 28]
+                + _JONGSUNG[offset % 28]
+            )
+        else:
+            jamo = ch
+        out.append("".join(_COMPOUND_JAMO.get(j, j) for j in jamo))
+    return "".join(out)
+
+
+def chosung(text: str) -> str:
+    """초성열 (한글 음절은 초성, 그 외 문자는 그대로)"""
+    out: List[str] = []
+    for ch in text:
+        code = ord(ch)
+        if _HANGUL_BASE <= code <= _HANGUL_LAST:
+            out.append(_CHOSUNG[(code - _HANGUL_BASE) // 588])
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def is_chosung_query(text: str) -> bool:
+    """자음 자모로만 이루어진 검색어인지 ("ㄱㅊ")"""
+    return bool(text) and all(ch in _CONSONANTS for ch in text)
+
+
+def normalize_query(text: str) -> str:
+    """검색 정규화 (공백 제거, 영문 소문자)"""
+    return "".join(str(text).split()).lower()
+
+
+# ============================================================
+# 카탈로그
+# ============================================================
+# 매칭 단계별 기본 점수
+STAGE_SCORES = {
+    "exact": 100.0,
+    "prefix": 80.0,
+    "jamo": 60.0,
+    "chosung": 50.0,
+    "contains": 30.0,
+}
+
+# 이름 종류별 가중치 (공식명/전공 > 별칭 > 원본 컬럼)
+_NAME_WEIGHTS = {
+    "university": 1.0,
+    "major": 1.0,
+    "university_alias": 0.85,
+    "major_alias": 0.85,
+    "column": 0.8,
+}
+
+# 접두사 인덱스 최대 길이 (이보다 긴 검색어는 bigram 부분 문자열 검색)
+MAX_PREFIX_CHARS = 12
+MAX_PREFIX_JAMO = 30
+
+
+@dataclass(frozen=True)
+class ProgramEntry:
+    """카탈로그 프로그램 1건"""
+    column: str
+    university: Optional[str]
+    university_aliases: Tuple[str, ...]
+    major: str
+    major_aliases: Tuple[str, ...]
+    track: str
+    position: int
+
+    def names(self) -> List[Tuple[str, str]]:
+        """(이름 종류, 이름) 목록"""
+        names = [("column", self.column), ("major", self.major)]
+        if self.university:
+            names.append(("university", self.university))
+        names.extend(("university_alias", a) for a in self.university_aliases)
+        names.extend(("major_alias", a) for a in self.major_aliases)
+        return names
+
+
+@dataclass(frozen=True)
+class CatalogHit:
+    """검색 결과 1건"""
+    entry: ProgramEntry
+    score: float
+    stage: str
+
+    @property
+    def column(self) -> str:
+        return self.entry.column
+
+
+class ProgramCatalog:
+    """프로그램 카탈로그 + 검색 인덱스 (생성 후 읽기 전용)"""
+
+    def __init__(self, entries: List[ProgramEntry]):
+        """
+        Args:
+            entries: ProgramEntry 목록 (position = 컬럼 순서)
+        """
+        self.entries = entries
+
+        # 이름 인덱스: 키 → {entry id: 가중치}
+        self._exact: Dict[str, Dict[int, float]] = {}
+        self._prefix: Dict[str, Dict[int, float]] = {}
+        self._jamo: Dict[str, Dict[int, float]] = {}
+        self._chosung: Dict[str, Dict[int, float]] = {}
+        # 부분 문자열: 문자/bigram → entry id 집합 (이름 + 원본 컬럼)
+        self._grams: Dict[str, Set[int]] = {}
+        self._haystacks: List[Tuple[str, ...]] = []
+        self._column_grams: Dict[str, Set[int]] = {}
+
+        for idx, entry in enumerate(entries):
+            haystack = []
+            for kind, name in entry.names():
+                key = normalize_query(name)
+                if not key:
+                    continue
+                weight = _NAME_WEIGHTS[kind]
+                haystack.append(key)
+                self._add(self._exact, key, idx, weight)
+                for n in range(1, min(len(key), MAX_PREFIX_CHARS) + 1):
+                    self._add(self._prefix, key[:n], idx, weight)
+                jamo = decompose_hangul(key)
+                for n in range(1, min(len(jamo), MAX_PREFIX_JAMO) + 1):
+                    self._add(self._jamo, jamo[:n], idx, weight)
+                initials = chosung(key)
+                for n in range(1, min(len(initials), MAX_PREFIX_CHARS) + 1):
+                    self._add(self._chosung, initials[:n], idx, weight)
+                for gram in self._grams_of(key):
+                    self._grams.setdefault(gram, set()).add(idx)
+            self._haystacks.append(tuple(haystack))
+            for gram in self._grams_of(entry.column):
+                self._column_grams.setdefault(gram, set()).add(idx)
+
+        logger.info(f"프로그램 카탈로그: {len(entries)}개 (접두사 키 {len(self._prefix)}개)")
+
+    # ============================================================
+    # 구축
+    # ============================================================
+    @classmethod
+    def from_extractor(cls, extractor) -> "ProgramCatalog":
+        """CutoffExtractor의 프로그램 컬럼/파싱 키/별칭 사전으로 구축"""
+        major_aliases = cls._major_alias_map(extractor.MAJOR_ALIASES)
+        entries = []
+        for position, column in enumerate(extractor._program_column_strs):
+            official, major, track = extractor.program_keys[column]
+            entries.append(ProgramEntry(
+                column=column,
+                university=official,
+                university_aliases=tuple(extractor.UNIVERSITY_ALIASES.get(official, ())) if official else (),
+                major=major,
+                major_aliases=tuple(major_aliases.get(major, ())),
+                track=track,
+                position=position,
+            ))
+        return cls(entries)
+
+    @staticmethod
+    def _major_alias_map(major_aliases: Dict[str, List[str]]) -> Dict[str, List[str]]:
+        """전공 → 별칭 (양방향: "의학" ↔ "의예")"""
+        mapping: Dict[str, List[str]] = {}
+        for major, aliases in major_aliases.items():
+            for name in aliases:
+                mapping.setdefault(major, [])
+                if name not in mapping[major]:
+                    mapping[major].append(name)
+                mapping.setdefault(name, [])
+                if major not in mapping[name]:
+                    mapping[name].append(major)
+        return mapping
+
+    @staticmethod
+    def _add(index: Dict[str, Dict[int, float]], key: str, idx: int, weight: float) -> None:
+        postings = index.setdefault(key, {})
+        if postings.get(idx, 0.0) < weight:
+            postings[idx] = weight
+
+    @staticmethod
+    def _grams_of(text: str) -> Set[str]:
+        """문자 + bigram 집합"""
+        grams = set(text)
+        grams.update(text[i:i + 2] for i in range(len(text) - 1))
+        return grams
+
+    def _candidates(self, needle: str, index: Dict[str, Set[int]]) -> Set[int]:
+        """needle의 모든 문자/bigram을 가진 entry (부분 문자열 후보, 검증 전)"""
+        grams = [needle] if len(needle) == 1 else [needle[i:i + 2] for i in range(len(needle) - 1)]
+        result: Optional[Set[int]] = None
+        for gram in sorted(grams, key=lambda g: len(index.get(g, ()))):
+            postings = index.get(gram)
+            if not postings:
+                return set()
+            result = set(postings) if result is None else result & postings
+            if not result:
+                break
+        return result or set()
+
+    # ============================================================
+    # 검색
+    # ============================================================
+    def _match_token(self, token: str) -> Dict[int, Tuple[float, str]]:
+        """검색어 토큰 1개 → {entry id: (점수, 단계)}"""
+        hits: Dict[int, Tuple[float, str]] = {}
+
+        def collect(postings: Optional[Dict[int, float]], stage: str) -> None:
+            if not postings:
+                return
+            base = STAGE_SCORES[stage]
+            for idx, weight in postings.items():
+                score = base * weight
+                if idx not in hits or hits[idx][0] < score:
+                    hits[idx] = (score, stage)
+
+        collect(self._exact.get(token), "exact")
+        collect(self._prefix.get(token), "prefix")
+        if is_chosung_query(token):
+            collect(self._chosung.get(token), "chosung")
+        collect(self._jamo.get(decompose_hangul(token)), "jamo")
+
+        # 1~2글자는 문자/bigram 인덱스 자체가 포함 여부 (검증 불필요)
+        exact_grams = len(token) <= 2
+        contains = {
+            idx: 1.0 for idx in self._candidates(token, self._grams)
+            if idx not in hits and (exact_grams or any(token in name for name in self._haystacks[idx]))
+        }
+        collect(contains, "contains")
+        return hits
+
+    def search(self, query: str, limit: Optional[int] = 10, track: str = "") -> List[CatalogHit]:
+        """
+        순위 검색
+
+        공백으로 나눈 토큰이 모두 매칭되는 프로그램만 반환합니다 ("가천 의" → 가천 ∧ 의…).
+
+        Args:
+            query: 검색어 (대학/전공/별칭, 자모·초성 입력 허용)
+            limit: 최대 결과 수 (None이면 전체)
+            track: 계열 필터 (계열 없는 컬럼은 포함)
+
+        Returns:
+            CatalogHit 목록 (점수↓ → 컬럼 길이↑ → 컬럼 순서)
+        """
+        tokens = [normalize_query(t) for t in str(query).split()]
+        tokens = [t for t in tokens if t]
+        if not tokens:
+            return []
+
+        # 토큰별 점수 합산, 대표 단계는 가장 약한 매칭
+        scores: Optional[Dict[int, Tuple[float, str]]] = None
+        for token in tokens:
+            hits = self._match_token(token)
+            if scores is None:
+                scores = hits
+            else:
+                scores = {
+                    idx: (score + hits[idx][0], min(stage, hits[idx][1], key=STAGE_SCORES.__getitem__))
+                    for idx, (score, stage) in scores.items() if idx in hits
+                }
+            if not scores:
+                return []
+
+        ranked = [
+            (-score, len(self.entries[idx].column), idx, stage)
+            for idx, (score, stage) in scores.items()
+            if not track or self.entries[idx].track in (track, "")
+        ]
+        ranked = sorted(ranked) if limit is None else heapq.nsmallest(limit, ranked)
+        return [
+            CatalogHit(self.entries[idx], round(-neg_score, 2), stage)
+            for neg_score, _, idx, stage in ranked
+        ]
+
+    def autocomplete(self, query: str, limit: int = 10, track: str = "") -> List[str]:
+        """자동완성: 상위 컬럼명 목록"""
+        return [hit.column for hit in self.search(query, limit=limit, track=track)]
+
+    def containing(self, keyword: str) -> List[str]:
+        """
+        원본 컬럼명에 keyword가 포함된 프로그램 (컬럼 순서)
+
+        CutoffExtractor.search_programs()의 부분 문자열 의미를 bigram 인덱스로 처리합니다.
+        """
+        if not keyword:
+            return [entry.column for entry in self.entries]
+        candidates = self._candidates(keyword, self._column_grams)
+        return [
+            self.entries[idx].column for idx in sorted(candidates)
+            if keyword in self.entries[idx].column
+        ]
+
+    def get_stats(self) -> Dict[str, int]:
+        """통계 정보"""
+        return {
+            "entries": len(self.entries),
+            "prefix_keys": len(self._prefix),
+            "jamo_keys": len(self._jamo),
+            "chosung_keys": len(self._chosung),
+            "grams": len(self._grams),
+        }
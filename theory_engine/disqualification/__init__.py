@@ -6,8 +6,33 @@
 
     engine = DisqualificationEngine()
     result = engine.check(profile, target)
+
+    # 학생 1명 × 대상 N개 (학생 조건 비트셋 1회 + 대상별 룰 마스크 AND)
+    masks = engine.target_masks(targets)          # 대상 목록이 고정이면 재사용
+    batch = engine.check_many(profile, targets, severity_threshold=2, masks=masks)
+    batch.disqualified, batch.rule_code, batch.info_at(i)
+
+    # 학생 S명 × 대상 T개 (코호트 리포트, 청크 단위)
+    matrix = engine.check_matrix(profiles, targets, severity_threshold=2)
+    matrix.disqualified, matrix.rule_code, matrix.rule_at(i, j)
+
+    # RESTRICT 시트 → 모집단위별 요구조건 테이블 (데이터 기반 룰)
+    table = RestrictTable.compile(excel_data["RESTRICT"])
+    table.check(profile, target)                  # DisqualificationInfo or None
 """
 
-from .disqualification_engine import DisqualificationEngine, DisqualificationRule
+from .disqualification_engine import (
+    DisqualificationArrays,
+    DisqualificationEngine,
+    DisqualificationMatrix,
+    DisqualificationRule,
+    ProfileFeature,
+    TargetFeature,
+)
+from .restrict_compiler import RestrictProfile, RestrictTable, merge_disqualification
 
-__all__ = ["DisqualificationEngine", "DisqualificationRule"]
+__all__ = [
+    "DisqualificationEngine", "DisqualificationRule", "DisqualificationArrays", "DisqualificationMatrix",
+    "ProfileFeature", "TargetFeature",
+    "RestrictTable", "RestrictProfile", "merge_disqualification",
+]
@@ -2,13 +2,32 @@
 결격 사유 체크 엔진
 
 RESTRICT 시트 기반 결격 룰 적용
+
+룰 인덱스 (생성 시 1회 구축):
+- 대학 패턴 정규식은 룰 생성 시 1회 컴파일
+- 와일드카드(.*) 룰은 별도 목록, 나머지는 공식 대학명 → 적용 룰 목록으로 색인
+- (공식 대학명, 전공)별 적용 룰 목록은 최초 조회 시 메모이즈
+- 메시지 포맷은 explain=True일 때만 (explain=False는 판정/룰 ID만)
+
+2단계 판정:
+- 1단계 (학생): 학생에만 의존하는 조건(영어/한국사 등급, 수학 선택, 탐구 구성)을
+  ProfileFeature 비트셋으로 1회 계산 → 룰 비트셋으로 변환
+- 2단계 (대상): 대상별 룰 마스크 (대학 패턴 적용 여부 + 의료계열 등 대상 조건, 메모이즈)
+  결격 룰 = 학생 룰 비트 & 대상 마스크 (check_many는 uint64 배열 AND 1회)
+- profile_feature가 없는 룰(사용자 정의 check_func)은 적용 대상에서만 check_func 호출
+- check_matrix (학생 S × 대상 T): 학생 룰 비트가 같은 학생끼리 묶어 (고유 비트 × T) 코드표를
+  브로드캐스트로 1회 계산 후 학생 청크 단위로 모음 (임시 배열 크기 = 청크 × T)
 """
 
 import re
 import logging
-from typing import Dict, List, Optional, Callable, Any
+import threading
+from enum import IntFlag
+from typing import Dict, List, Optional, Callable, Any, Pattern, Sequence, Tuple
 from dataclasses import dataclass, field
 
+import numpy as np
+
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -19,6 +38,29 @@ from theory_engine.cutoff import CutoffExtractor
 
 logger = logging.getLogger(__name__)
 
+# 룰 비트셋 폭 (uint64)
+MAX_RULES = 64
+
+# check_matrix 청크 크기 (셀 수, uint64 임시 배열 기준 32MB)
+MATRIX_CHUNK_CELLS = 1 << 22
+
+
+class ProfileFeature(IntFlag):
+    """학생에만 의존하는 결격 조건 (1단계 비트셋)"""
+    NONE = 0
+    ENGLISH_ABOVE_3 = 1 << 0            # 영어 3등급 초과
+    ENGLISH_ABOVE_2 = 1 << 1            # 영어 2등급 초과
+    HISTORY_ABOVE_4 = 1 << 2            # 한국사 4등급 초과
+    SCIENCE_WITHOUT_CALCULUS = 1 << 3   # 이과 + 미적분/기하 아님
+    NOT_TWO_SCIENCE = 1 << 4            # 과학탐구 2과목 아님
+    SAME_CATEGORY_LEVEL1 = 1 << 5       # 동일 과목군 Ⅰ+Ⅰ
+
+
+class TargetFeature(IntFlag):
+    """대상(프로그램)에만 의존하는 조건 (2단계 마스크 구축용)"""
+    NONE = 0
+    MEDICAL = 1 << 0                    # 의료계열 전공
+
 
 @dataclass
 class DisqualificationRule:
@@ -30,6 +72,110 @@ class DisqualificationRule:
     code: DisqualificationCode
     message_template: str
     severity: int = 1  # 1=경고, 2=심각
+    pattern: Optional[Pattern] = field(default=None, repr=False, compare=False)  # 컴파일된 university_pattern
+    # 2단계 판정용 선언 (profile_feature가 None이면 check_func로 판정)
+    # 결격 = 학생이 profile_feature를 가짐 AND 대상이 target_feature를 모두 가짐
+    profile_feature: Optional[ProfileFeature] = None
+    target_feature: TargetFeature = TargetFeature.NONE
+
+    # 모든 대학에 적용되는 패턴
+    WILDCARD_PATTERN = r".*"
+
+    def __post_init__(self):
+        if self.pattern is None:
+            self.pattern = re.compile(self.university_pattern, re.IGNORECASE)
+
+    @property
+    def is_wildcard(self) -> bool:
+        """모든 대학 적용 룰 여부"""
+        return self.university_pattern == self.WILDCARD_PATTERN
+
+    @property
+    def is_declarative(self) -> bool:
+        """비트셋으로 판정 가능한 룰 (profile_feature 선언)"""
+        return self.profile_feature is not None
+
+    def applies_to(self, official_university: str, major: str) -> bool:
+        """대학 패턴이 공식 대학명 또는 전공명에 매칭되는지 (와일드카드는 항상)"""
+        return (
+            self.is_wildcard
+            or self.pattern.search(official_university) is not None
+            or self.pattern.search(major) is not None
+        )
+
+    def format_message(self, profile: Any, target: Any, official_university: str) -> str:
+        """결격 사유 메시지"""
+        return self.message_template.format(
+            university=official_university,
+            major=target.major,
+            grade=profile.english_grade,
+            history_grade=profile.history_grade,
+        )
+
+
+@dataclass
+class DisqualificationArrays:
+    """결격 일괄 판정 결과 (check_many, 원소별 check(explain=False)와 같은 판정)"""
+    disqualified: np.ndarray                 # bool
+    triggered: np.ndarray                    # uint64 룰 비트셋 (bit i = rules[i])
+    rule_code: np.ndarray                    # uint8, 0=통과, i+1 = 주 결격 룰 rules[i]
+    rules: Tuple[DisqualificationRule, ...]
+
+    def __len__(self) -> int:
+        return len(self.disqualified)
+
+    def info_at(self, i: int) -> DisqualificationInfo:
+        """i번째 원소를 DisqualificationInfo로 (reason은 engine.explain_reason으로)"""
+        if not self.disqualified[i]:
+            return DisqualificationInfo(is_disqualified=False)
+        bits = int(self.triggered[i])
+        order = sorted(
+            (j for j in range(len(self.rules)) if bits >> j & 1),
+            key=lambda j: -self.rules[j].severity
+        )
+        primary = self.rules[self.rule_code[i] - 1]
+        return DisqualificationInfo(
+            is_disqualified=True,
+            reason=None,
+            code=primary.code,
+            rules_triggered=[self.rules[j].rule_id for j in order]
+        )
+
+
+@dataclass
+class DisqualificationMatrix:
+    """학생 S명 × 대상 T개 결격 판정 (check_matrix, 셀별 check(explain=False)의 주 결격 룰과 동일)"""
+    disqualified: np.ndarray                 # (S, T) bool
+    rule_code: np.ndarray                    # (S, T) uint8, 0=통과, k+1 = rule_ids[k] (주 결격 룰)
+    rule_ids: Tuple[str, ...]
+    codes: Tuple[DisqualificationCode, ...]  # rule_ids[k]의 결격 코드
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.disqualified.shape
+
+    def rule_at(self, i: int, j: int) -> Optional[str]:
+        """(학생 i, 대상 j) 주 결격 룰 ID"""
+        code = int(self.rule_code[i, j])
+        return self.rule_ids[code - 1] if code else None
+
+    def code_at(self, i: int, j: int) -> Optional[DisqualificationCode]:
+        """(학생 i, 대상 j) 결격 코드"""
+        code = int(self.rule_code[i, j])
+        return self.codes[code - 1] if code else None
+
+    def counts_by_rule(self, axis: Optional[int] = None) -> Dict[str, Any]:
+        """
+        주 결격 룰별 건수
+
+        Args:
+            axis: None이면 전체 건수(int), 0이면 대상별 (T,) 배열, 1이면 학생별 (S,) 배열
+        """
+        counts = {}
+        for k, rule_id in enumerate(self.rule_ids):
+            hit = self.rule_code == k + 1
+            counts[rule_id] = int(hit.sum()) if axis is None else hit.sum(axis=axis)
+        return counts
 
 
 class DisqualificationEngine:
@@ -65,16 +211,109 @@ class DisqualificationEngine:
         CutoffExtractor._build_alias_reverse_map()
         self.rules: List[DisqualificationRule] = []
         self._load_rules()
-        logger.info(f"결격 체크 엔진 초기화: {len(self.rules)}개 룰")
+
+        # 대학명 → 공식 대학명, (공식 대학명, 전공) → 적용 룰 / 대상 룰 마스크 (메모이즈)
+        self._official_cache: Dict[str, str] = {}
+        self._applicable_cache: Dict[Tuple[str, str], Tuple[DisqualificationRule, ...]] = {}
+        self._target_mask_cache: Dict[Tuple[str, str], int] = {}
+        self._medical_cache: Dict[str, bool] = {}
+        self._medical_keywords = tuple(sorted({self._normalize_major(kw) for kw in self.MEDICAL_MAJOR_KEYWORDS}))
+        self._index_lock = threading.Lock()
+        self._build_rule_index()
+        logger.info(
+            f"결격 체크 엔진 초기화: {len(self.rules)}개 룰 "
+            f"(와일드카드 {len(self._wildcard_rules)}개, 대학 색인 {len(self._rules_by_university)}개)"
+        )
+
+    # ============================================================
+    # 룰 인덱스
+    # ============================================================
+    def _build_rule_index(self) -> None:
+        """
+        와일드카드/대학별 룰 분리 + 공식 대학명 → 대학 패턴 매칭 룰 색인
+        + 2단계 판정용 룰 비트 (rules[i] = bit i)
+        """
+        if len(self.rules) > MAX_RULES:
+            raise ValueError(f"결격 룰은 최대 {MAX_RULES}개: {len(self.rules)}개")
+
+        self._wildcard_rules = [r for r in self.rules if r.is_wildcard]
+        self._specific_rules = [r for r in self.rules if not r.is_wildcard]
+        self._rules_by_university: Dict[str, Tuple[DisqualificationRule, ...]] = {
+            official: self._match_university(official)
+            for official in set(CutoffExtractor.ALIAS_TO_OFFICIAL.values())
+        }
+        self._applicable_cache = {}
+        self._target_mask_cache = {}
+        # 룰 구성 버전 (외부에 보관한 target_masks 무효화 판단용)
+        self.rules_version = getattr(self, "rules_version", -1) + 1
+
+        self._rule_index = {id(r): i for i, r in enumerate(self.rules)}
+        # 트리거 룰 정렬 순서 (심각도 내림차순, 같으면 정의 순서 = 기존 stable sort)
+        self._priority = sorted(range(len(self.rules)), key=lambda i: -self.rules[i].severity)
+        # 선언형 룰: (학생 조건, 룰 비트), 그 외: check_func 룰 비트
+        self._feature_rules = [
+            (r.profile_feature, 1 << i) for i, r in enumerate(self.rules) if r.is_declarative
+        ]
+        self._callable_mask = sum(1 << i for i, r in enumerate(self.rules) if not r.is_declarative)
+        self._severity_masks: Dict[int, int] = {}
+
+    @property
+    def has_custom_rules(self) -> bool:
+        """check_func로만 판정하는 룰 존재 여부 (학생 필드 의존성을 알 수 없음)"""
+        return bool(self._callable_mask)
+
+    def _severity_mask(self, severity_threshold: int) -> int:
+        """심각도 임계값 이상 룰 비트"""
+        mask = self._severity_masks.get(severity_threshold)
+        if mask is None:
+            mask = sum(1 << i for i, r in enumerate(self.rules) if r.severity >= severity_threshold)
+            self._severity_masks[severity_threshold] = mask
+        return mask
+
+    def _match_university(self, official_university: str) -> Tuple[DisqualificationRule, ...]:
+        """대학 패턴이 공식 대학명에 매칭되는 (비 와일드카드) 룰"""
+        return tuple(r for r in self._specific_rules if r.pattern.search(official_university))
+
+    def add_rule(self, rule: DisqualificationRule) -> None:
+        """룰 추가 (색인/메모이즈 재구축)"""
+        with self._index_lock:
+            self.rules.append(rule)
+            self._build_rule_index()
+
+    def applicable_rules(self, official_university: str, major: str) -> Tuple[DisqualificationRule, ...]:
+        """
+        (공식 대학명, 전공)에 적용되는 룰 (룰 정의 순서, 메모이즈)
+
+        기존 판정과 동일: 와일드카드 룰 + 대학 패턴이 공식 대학명 또는 전공명에 매칭되는 룰
+        """
+        key = (official_university, major)
+        rules = self._applicable_cache.get(key)
+        if rules is not None:
+            return rules
+
+        by_university = self._rules_by_university.get(official_university)
+        if by_university is None:
+            by_university = self._match_university(official_university)
+        matched = {id(r) for r in by_university}
+        rules = tuple(
+            r for r in self.rules
+            if r.is_wildcard or id(r) in matched or r.pattern.search(major)
+        )
+        self._applicable_cache[key] = rules
+        return rules
 
     def _normalize_university(self, name: str) -> str:
         """CutoffExtractor의 대학명 정규화 로직 재사용"""
         return CutoffExtractor._normalize_university(name)
 
     def _get_official_university(self, name: str) -> str:
-        """별칭 → 공식 대학명 변환 (부분매칭 금지: 오매핑 방지)"""
-        normalized = self._normalize_university(name)
-        return CutoffExtractor.ALIAS_TO_OFFICIAL.get(normalized, name)
+        """별칭 → 공식 대학명 변환 (부분매칭 금지: 오매핑 방지, 메모이즈)"""
+        official = self._official_cache.get(name)
+        if official is None:
+            normalized = self._normalize_university(name)
+            official = CutoffExtractor.ALIAS_TO_OFFICIAL.get(normalized, name)
+            self._official_cache[name] = official
+        return official
 
     @staticmethod
     def _normalize_major(major: str) -> str:
@@ -88,7 +327,7 @@ class DisqualificationEngine:
 
     def _is_medical_major(self, major: str) -> bool:
         """
-        의료계열 전공 판정 (정확/접두사 매칭)
+        의료계열 전공 판정 (정확/접두사 매칭, 전공별 메모이즈)
 
         ⚠️ HIGH 갭 대응:
         - 기존: "의" 단일 포함 → "의류학" 등 오탐 가능
@@ -98,6 +337,14 @@ class DisqualificationEngine:
         if not major_raw:
             return False
 
+        cached = self._medical_cache.get(major_raw)
+        if cached is None:
+            cached = self._medical_cache[major_raw] = self._match_medical_major(major_raw)
+        return cached
+
+    def _match_medical_major(self, major_raw: str) -> bool:
+        """의료계열 키워드 정확/접두사 매칭 (전공 Alias 포함)"""
+
         major_compact = re.sub(r"\s+", "", major_raw)
 
         # 전공 Alias 체인 적용 (의예 → 의학 등)
@@ -111,8 +358,7 @@ class DisqualificationEngine:
         normalized_candidates = [self._normalize_major(c) for c in candidates if c]
 
         for cand in normalized_candidates:
-            for kw in self.MEDICAL_MAJOR_KEYWORDS:
-                kw_norm = self._normalize_major(kw)
+            for kw_norm in self._medical_keywords:
                 if cand == kw_norm or cand.startswith(kw_norm):
                     return True
 
@@ -129,7 +375,8 @@ class DisqualificationEngine:
             check_func=lambda p, t: p.english_grade > 3,
             code=DisqualificationCode.ENGLISH_GRADE,
             message_template="영어 {grade}등급: 대부분 대학은 3등급 이내 필수",
-            severity=2
+            severity=2,
+            profile_feature=ProfileFeature.ENGLISH_ABOVE_3
         ))
 
         self.rules.append(DisqualificationRule(
@@ -139,7 +386,8 @@ class DisqualificationEngine:
             check_func=lambda p, t: p.english_grade > 2,
             code=DisqualificationCode.ENGLISH_GRADE,
             message_template="영어 {grade}등급: {university}는 2등급 이내 권장",
-            severity=1
+            severity=1,
+            profile_feature=ProfileFeature.ENGLISH_ABOVE_2
         ))
 
         # ===== 한국사 등급 제한 =====
@@ -150,7 +398,8 @@ class DisqualificationEngine:
             check_func=lambda p, t: p.history_grade > 4,
             code=DisqualificationCode.HISTORY_GRADE,
             message_template="한국사 {history_grade}등급: 대부분 대학은 4등급 이내 필수",
-            severity=2
+            severity=2,
+            profile_feature=ProfileFeature.HISTORY_ABOVE_4
         ))
 
         # ===== 수학 선택과목 제한 =====
@@ -158,13 +407,11 @@ class DisqualificationEngine:
             rule_id="MATH_SUBJ_001",
             description="이과 미적분/기하 필수",
             university_pattern=r"서울대|연세대|고려대|성균관|한양대|KAIST|포항공대",
-            check_func=lambda p, t: (
-                p.track.value == "이과" and
-                p.math.subject not in ["수학(미적)", "수학(기하)", "미적분", "기하"]
-            ),
+            check_func=lambda p, t: self._is_science_without_calculus(p),
             code=DisqualificationCode.MATH_SUBJECT,
             message_template="{university} 이과: 미적분/기하 필수",
-            severity=2
+            severity=2,
+            profile_feature=ProfileFeature.SCIENCE_WITHOUT_CALCULUS
         ))
 
         # ===== 탐구과목 제한 (의대) =====
@@ -175,7 +422,9 @@ class DisqualificationEngine:
             check_func=lambda p, t: self._check_medical_inquiry(p, t),
             code=DisqualificationCode.INQUIRY_SUBJECT,
             message_template="{university} {major}: 과학탐구 2과목 필수",
-            severity=2
+            severity=2,
+            profile_feature=ProfileFeature.NOT_TWO_SCIENCE,
+            target_feature=TargetFeature.MEDICAL
         ))
 
         # ===== 탐구 조합 제한 (서울대) =====
@@ -186,21 +435,28 @@ class DisqualificationEngine:
             check_func=lambda p, t: self._check_same_subject_combo(p),
             code=DisqualificationCode.INQUIRY_COMBINATION,
             message_template="서울대: 동일 과목군 Ⅰ+Ⅰ 조합 불가",
-            severity=2
+            severity=2,
+            profile_feature=ProfileFeature.SAME_CATEGORY_LEVEL1
         ))
 
+    # 이과 수학 필수 선택과목
+    CALCULUS_SUBJECTS = ("수학(미적)", "수학(기하)", "미적분", "기하")
+
+    def _is_science_without_calculus(self, profile: StudentProfile) -> bool:
+        """이과인데 미적분/기하가 아닌지"""
+        return profile.track.value == "이과" and profile.math.subject not in self.CALCULUS_SUBJECTS
+
     def _check_medical_inquiry(self, profile: StudentProfile, target: TargetProgram) -> bool:
         """의대/약대 과탐 2과목 필수 체크"""
         if not self._is_medical_major(target.major):
             return False
+        return not self._has_two_science(profile)
 
+    def _has_two_science(self, profile: StudentProfile) -> bool:
+        """탐구 2과목 모두 과학탐구인지"""
         inq1 = profile.inquiry1.subject if profile.inquiry1 else ""
         inq2 = profile.inquiry2.subject if profile.inquiry2 else ""
-
-        is_science1 = any(s in inq1 for s in self.SCIENCE_SUBJECTS)
-        is_science2 = any(s in inq2 for s in self.SCIENCE_SUBJECTS)
-
-        return not (is_science1 and is_science2)
+        return self._is_science(inq1) and self._is_science(inq2)
 
     def _check_same_subject_combo(self, profile: StudentProfile) -> bool:
         """동일 과목군 I+I 조합 체크"""
@@ -226,11 +482,129 @@ class DisqualificationEngine:
                 return cat.split()[0]  # "물리학", "화학" 등
         return "기타"
 
+    # ============================================================
+    # 1단계: 학생 조건 비트셋
+    # ============================================================
+    def profile_features(self, profile: StudentProfile) -> ProfileFeature:
+        """학생에만 의존하는 결격 조건을 1회 평가 (평가 실패 조건은 미해당)"""
+        checks = (
+            (ProfileFeature.ENGLISH_ABOVE_3, lambda: profile.english_grade > 3),
+            (ProfileFeature.ENGLISH_ABOVE_2, lambda: profile.english_grade > 2),
+            (ProfileFeature.HISTORY_ABOVE_4, lambda: profile.history_grade > 4),
+            (ProfileFeature.SCIENCE_WITHOUT_CALCULUS, lambda: self._is_science_without_calculus(profile)),
+            (ProfileFeature.NOT_TWO_SCIENCE, lambda: not self._has_two_science(profile)),
+            (ProfileFeature.SAME_CATEGORY_LEVEL1, lambda: self._check_same_subject_combo(profile)),
+        )
+        features = ProfileFeature.NONE
+        for feature, predicate in checks:
+            try:
+                if predicate():
+                    features |= feature
+            except Exception as e:
+                logger.warning(f"학생 조건 {feature.name} 평가 실패: {e}")
+        return features
+
+    def profile_rule_bits(self, features: ProfileFeature) -> int:
+        """학생 조건 → 학생 조건을 충족한 선언형 룰 비트"""
+        bits = 0
+        for feature, bit in self._feature_rules:
+            if features & feature:
+                bits |= bit
+        return bits
+
+    @staticmethod
+    def profile_key(profile: StudentProfile) -> Tuple:
+        """학생 조건 평가에 쓰이는 필드 (같은 키 = 같은 ProfileFeature, 일괄 판정 메모이즈용)"""
+        return (
+            profile.track, profile.english_grade, profile.history_grade,
+            profile.math.subject if profile.math else None,
+            profile.inquiry1.subject if profile.inquiry1 else None,
+            profile.inquiry2.subject if profile.inquiry2 else None,
+        )
+
+    def _profile_bits_many(self, profiles: Sequence[StudentProfile]) -> np.ndarray:
+        """학생 목록 → 선언형 룰 비트 (uint64, 학생 조건 키별 1회 평가)"""
+        memo: Dict[Tuple, int] = {}
+        bits = np.empty(len(profiles), dtype=np.uint64)
+        for i, profile in enumerate(profiles):
+            key = self.profile_key(profile)
+            value = memo.get(key)
+            if value is None:
+                value = memo[key] = self.profile_rule_bits(self.profile_features(profile))
+            bits[i] = value
+        return bits
+
+    # ============================================================
+    # 2단계: 대상 룰 마스크
+    # ============================================================
+    def target_features(self, major: str) -> TargetFeature:
+        """대상에만 의존하는 조건"""
+        features = TargetFeature.NONE
+        if self._is_medical_major(major):
+            features |= TargetFeature.MEDICAL
+        return features
+
+    def target_mask(self, university: str, major: str) -> int:
+        """
+        대상별 룰 마스크 (메모이즈)
+
+        bit i = rules[i]가 대상에 적용 (대학 패턴 매칭) 이고
+                선언형이면 대상 조건(target_feature)도 충족
+        """
+        key = (university, major)
+        mask = self._target_mask_cache.get(key)
+        if mask is not None:
+            return mask
+
+        official = self._get_official_university(university)
+        features = self.target_features(major)
+        mask = 0
+        for rule in self.applicable_rules(official, major):
+            if rule.is_declarative and (features & rule.target_feature) != rule.target_feature:
+                continue
+            mask |= 1 << self._rule_index[id(rule)]
+        self._target_mask_cache[key] = mask
+        return mask
+
+    def target_masks(self, targets: Sequence[TargetProgram]) -> np.ndarray:
+        """대상 목록 → 룰 마스크 배열 (uint64, 프로그램 목록이 고정이면 재사용 가능)"""
+        return np.fromiter(
+            (self.target_mask(t.university, t.major) for t in targets), dtype=np.uint64, count=len(targets)
+        )
+
+    def _triggered_bits(
+        self,
+        profile: StudentProfile,
+        target: TargetProgram,
+        candidates: int
+    ) -> int:
+        """후보 룰 비트 중 check_func 룰만 원소별 평가 (선언형 룰 비트는 그대로)"""
+        bits = candidates & ~self._callable_mask
+        pending = candidates & self._callable_mask
+        while pending:
+            i = (pending & -pending).bit_length() - 1
+            pending &= pending - 1
+            rule = self.rules[i]
+            try:
+                if rule.check_func(profile, target):
+                    bits |= 1 << i
+            except Exception as e:
+                logger.warning(f"룰 {rule.rule_id} 평가 실패: {e}")
+        return bits
+
+    def _ordered_rules(self, bits: int) -> List[DisqualificationRule]:
+        """룰 비트 → 트리거 룰 (심각도 내림차순, 정의 순서)"""
+        return [self.rules[i] for i in self._priority if bits >> i & 1]
+
+    # ============================================================
+    # 판정
+    # ============================================================
     def check(
         self,
         profile: StudentProfile,
         target: TargetProgram,
-        severity_threshold: int = 1
+        severity_threshold: int = 1,
+        explain: bool = True
     ) -> DisqualificationInfo:
         """
         결격 사유 체크
@@ -239,50 +613,172 @@ class DisqualificationEngine:
             profile: 학생 프로필
             target: 지원 대학/전형
             severity_threshold: 이 심각도 이상만 결격 처리 (1=경고 포함, 2=심각만)
+            explain: False면 사유 메시지를 만들지 않음 (reason=None, 판정/코드/룰 ID는 동일)
+                     필요할 때 explain_reason()으로 생성
 
         Returns:
             DisqualificationInfo
         """
-        triggered_rules: List[DisqualificationRule] = []
-        official_university = self._get_official_university(target.university)
-
-        for rule in self.rules:
-            # 대학 패턴 매칭
-            if not re.search(rule.university_pattern, official_university, re.IGNORECASE):
-                if not re.search(rule.university_pattern, target.major, re.IGNORECASE):
-                    if rule.university_pattern != r".*":
-                        continue
-
-            # 조건 체크
-            try:
-                if rule.check_func(profile, target):
-                    if rule.severity >= severity_threshold:
-                        triggered_rules.append(rule)
-                        logger.debug(f"룰 트리거: {rule.rule_id} - {rule.description}")
-            except Exception as e:
-                logger.warning(f"룰 {rule.rule_id} 평가 실패: {e}")
+        candidates = (
+            self.target_mask(target.university, target.major)
+            & self._severity_mask(severity_threshold)
+            & (self.profile_rule_bits(self.profile_features(profile)) | self._callable_mask)
+        )
+        triggered_rules = self._ordered_rules(self._triggered_bits(profile, target, candidates))
 
         if triggered_rules:
             # 가장 심각한 룰 선택
-            triggered_rules.sort(key=lambda r: r.severity, reverse=True)
             primary = triggered_rules[0]
-
-            message = primary.message_template.format(
-                university=official_university,
-                major=target.major,
-                grade=profile.english_grade,
-                history_grade=profile.history_grade,
-            )
+            for rule in triggered_rules:
+                logger.debug(f"룰 트리거: {rule.rule_id} - {rule.description}")
 
             return DisqualificationInfo(
                 is_disqualified=True,
-                reason=message,
+                reason=primary.format_message(
+                    profile, target, self._get_official_university(target.university)
+                ) if explain else None,
                 code=primary.code,
                 rules_triggered=[r.rule_id for r in triggered_rules]
             )
 
         return DisqualificationInfo(is_disqualified=False)
 
+    def check_many(
+        self,
+        profile: StudentProfile,
+        targets: Sequence[TargetProgram],
+        severity_threshold: int = 1,
+        masks: Optional[np.ndarray] = None
+    ) -> DisqualificationArrays:
+        """
+        학생 1명 × 대상 N개 일괄 판정 (2단계 비트 연산)
+
+        Args:
+            profile: 학생 프로필
+            targets: 대상 목록
+            severity_threshold: 심각도 임계값
+            masks: target_masks(targets) 결과 (같은 대상 목록 반복 시 재사용)
+
+        Returns:
+            DisqualificationArrays (원소별 check(explain=False)와 같은 판정/룰)
+        """
+        if masks is None:
+            masks = self.target_masks(targets)
+        profile_bits = self.profile_rule_bits(self.profile_features(profile))
+        candidates = masks & np.uint64(self._severity_mask(severity_threshold))
+        triggered = candidates & np.uint64(profile_bits)
+
+        # check_func 룰: 적용 대상에서만 원소별 평가
+        if self._callable_mask:
+            allowed = profile_bits | self._callable_mask
+            for i in np.flatnonzero(candidates & np.uint64(self._callable_mask)):
+                triggered[i] = self._triggered_bits(profile, targets[i], int(candidates[i]) & allowed)
+
+        return self._arrays(triggered)
+
+    def check_matrix(
+        self,
+        profiles: Sequence[StudentProfile],
+        targets: Sequence[TargetProgram],
+        severity_threshold: int = 1,
+        masks: Optional[np.ndarray] = None,
+        chunk_cells: int = MATRIX_CHUNK_CELLS
+    ) -> DisqualificationMatrix:
+        """
+        학생 S명 × 대상 T개 일괄 판정 (코호트 리포트용)
+
+        학생 룰 비트 (S,)와 대상 룰 마스크 (T,)를 브로드캐스트 AND.
+        학생 룰 비트 종류는 학생 조건 조합 수(최대 2^6)로 제한되므로
+        (고유 비트 × T) 주 결격 코드표를 1회 계산하고 학생 청크별로 행을 모읍니다.
+        check_func 룰은 적용 대상 셀에서만 원소별 평가합니다.
+
+        Args:
+            profiles: 학생 목록
+            targets: 대상 목록
+            severity_threshold: 심각도 임계값
+            masks: target_masks(targets) 결과 (재사용 시)
+            chunk_cells: 청크당 셀 수 (임시 배열 크기 상한)
+
+        Returns:
+            DisqualificationMatrix
+        """
+        if masks is None:
+            masks = self.target_masks(targets)
+        candidates = masks & np.uint64(self._severity_mask(severity_threshold))
+        profile_bits = self._profile_bits_many(profiles)
+        unique_bits, inverse = np.unique(profile_bits, return_inverse=True)
+        code_table = self._rule_codes(unique_bits[:, None] & candidates[None, :])
+
+        n_students, n_targets = len(profiles), len(targets)
+        rule_code = np.empty((n_students, n_targets), dtype=np.uint8)
+        callable_cols = np.flatnonzero(candidates & np.uint64(self._callable_mask))
+        chunk = max(1, chunk_cells // max(1, n_targets))
+        for start in range(0, n_students, chunk):
+            stop = min(start + chunk, n_students)
+            rows = inverse[start:stop]
+            rule_code[start:stop] = code_table[rows]
+            if not len(callable_cols):
+                continue
+            # check_func 룰 적용 열만 원소별 재평가
+            triggered = unique_bits[rows][:, None] & candidates[None, callable_cols]
+            for s in range(stop - start):
+                allowed = int(profile_bits[start + s]) | self._callable_mask
+                for c, j in enumerate(callable_cols):
+                    triggered[s, c] = self._triggered_bits(
+                        profiles[start + s], targets[j], int(candidates[j]) & allowed
+                    )
+            rule_code[start:stop, callable_cols] = self._rule_codes(triggered)
+
+        return DisqualificationMatrix(
+            disqualified=rule_code != 0,
+            rule_code=rule_code,
+            rule_ids=tuple(r.rule_id for r in self.rules),
+            codes=tuple(r.code for r in self.rules),
+        )
+
+    def _rule_codes(self, triggered: np.ndarray) -> np.ndarray:
+        """룰 비트셋 배열 → 주 결격 룰 코드 (uint8, 0=통과, i+1 = rules[i])"""
+        rule_code = np.zeros(triggered.shape, dtype=np.uint8)
+        present = int(np.bitwise_or.reduce(triggered, axis=None)) if triggered.size else 0
+        # 우선순위 역순으로 덮어써서 가장 앞선 룰이 남도록
+        for i in reversed(self._priority):
+            if not present >> i & 1:
+                continue
+            rule_code[(triggered & np.uint64(1 << i)) != 0] = i + 1
+        return rule_code
+
+    def _arrays(self, triggered: np.ndarray) -> DisqualificationArrays:
+        """룰 비트셋 배열 → 판정/주 결격 룰 코드"""
+        return DisqualificationArrays(
+            disqualified=triggered != 0,
+            triggered=triggered,
+            rule_code=self._rule_codes(triggered),
+            rules=tuple(self.rules),
+        )
+
+    def explain_reason(
+        self,
+        info: DisqualificationInfo,
+        profile: StudentProfile,
+        target: TargetProgram
+    ) -> Optional[str]:
+        """check(explain=False) 결과의 사유 메시지 (첫 번째 트리거 룰 = 가장 심각한 룰)"""
+        if not info.is_disqualified or not info.rules_triggered:
+            return info.reason
+        if info.reason is not None:
+            return info.reason
+        rule = self.get_rule(info.rules_triggered[0])
+        if rule is None:
+            return None
+        return rule.format_message(profile, target, self._get_official_university(target.university))
+
+    def get_rule(self, rule_id: str) -> Optional[DisqualificationRule]:
+        """룰 ID → 룰"""
+        for rule in self.rules:
+            if rule.rule_id == rule_id:
+                return rule
+        return None
+
     def get_all_rules(self) -> List[Dict]:
         """모든 룰 목록"""
         return [
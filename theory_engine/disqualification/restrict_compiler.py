@@ -0,0 +1,549 @@
+"""
+RESTRICT 시트 결격 룰 컴파일러
+
+RESTRICT 시트의 카테고리 블록을 모집단위별 요구조건 배열(선언형 룰 테이블)로 변환합니다.
+런타임 판정은 학생 조건 벡터(RestrictProfile)와 요구조건 배열의 벡터 비교이며
+룰별 Python 코드를 실행하지 않습니다.
+
+시트 구조 (header=0 로드 기준):
+    "□ 결격사유<수학,탐구>" | Unnamed | Unnamed | Unnamed | "□ 결격사유<영어,한국사,제2외국어>" | ...
+- 헤더에 "결격사유<...>"가 있는 컬럼부터 다음 헤더 직전까지가 한 블록
+- 블록 첫 컬럼: 모집단위 (PERCENTAGE 컬럼명 형식, 예: "가천의학 이과")
+- 나머지 컬럼: 조건 값. 블록 첫 행이 소제목("모집단위", "수학", ...)이면 소제목 이름으로,
+  아니면 <> 안 항목 순서대로 컬럼을 항목에 대응
+- 알 수 없는 항목(비고 등)은 무시
+
+항목 → 요구조건:
+    수학          허용 선택과목 ("미적,기하" → 미적분/기하만, 빈칸/무관 → 제한 없음)
+    탐구          과학탐구 최소 과목 수 ("과탐2", "과탐 1과목", "과탐" → 2, 사탐/무관 → 0)
+    영어 / 한국사  등급 상한 ("3", "3등급 이내")
+    제2외국어      탐구 대체 불가 여부 ("불가", "X", "불인정" → 불가)
+    과학탐구과목   Ⅱ 과목 최소 수 ("Ⅱ 1과목 필수"), 동일 과목 Ⅰ+Ⅱ 불가 ("서로 다른", "동일 과목 불가")
+
+사용법:
+    table = RestrictTable.compile(excel_data["RESTRICT"])
+    table.rules                                   # 모집단위 × 요구조건 DataFrame
+    vec = RestrictProfile.from_profile(profile)
+    table.evaluate(vec)                           # (R,) 위반 비트 (uint8)
+    table.check(profile, target)                  # DisqualificationInfo or None
+    table.evaluate_matrix(profiles, targets)      # (S, T) 주 위반 번호 (uint8)
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from ..constants import DisqualificationCode
+from ..cutoff import CutoffExtractor
+from ..model import DisqualificationInfo, StudentProfile, TargetProgram
+
+logger = logging.getLogger(__name__)
+
+# 블록 헤더 ("□ 결격사유<수학,탐구>")
+_BLOCK_HEADER = re.compile(r"결격사유\s*<([^>]*)>")
+
+# 소제목 행의 모집단위 컬럼 이름
+_PROGRAM_LABELS = {"모집단위", "대학", "학과", "대학/학과", "모집단위명"}
+
+# 수학 선택과목 비트
+MATH_CALCULUS, MATH_GEOMETRY, MATH_STATISTICS = 1, 2, 4
+MATH_ANY = MATH_CALCULUS | MATH_GEOMETRY | MATH_STATISTICS
+_MATH_TOKENS = (("미적", MATH_CALCULUS), ("기하", MATH_GEOMETRY), ("확통", MATH_STATISTICS), ("확률", MATH_STATISTICS))
+
+# 등급 상한 없음
+NO_GRADE_CAP = 9
+
+# 제2외국어/한문 과목 (탐구 대체 판정)
+SECOND_LANGUAGE_SUBJECTS = (
+    "독일어", "프랑스어", "스페인어", "중국어", "일본어", "러시아어", "아랍어", "베트남어", "한문",
+)
+
+# 과학탐구 과목군
+SCIENCE_SUBJECTS = ("물리학", "화학", "생명과학", "지구과학")
+
+# 위반 비트 (순서 = 주 결격 사유 우선순위)
+RESTRICT_VIOLATIONS: Tuple[Tuple[str, DisqualificationCode, str], ...] = (
+    ("RESTRICT_MATH", DisqualificationCode.MATH_SUBJECT, "{program}: 수학 {math} 필수"),
+    ("RESTRICT_SCIENCE", DisqualificationCode.INQUIRY_SUBJECT, "{program}: 과학탐구 {science}과목 필수"),
+    ("RESTRICT_ENGLISH", DisqualificationCode.ENGLISH_GRADE, "{program}: 영어 {english}등급 이내 필수"),
+    ("RESTRICT_HISTORY", DisqualificationCode.HISTORY_GRADE, "{program}: 한국사 {history}등급 이내 필수"),
+    ("RESTRICT_SECOND_FOREIGN", DisqualificationCode.SECOND_FOREIGN, "{program}: 제2외국어/한문 탐구 대체 불가"),
+    ("RESTRICT_SCIENCE2", DisqualificationCode.INQUIRY_SUBJECT, "{program}: 과학탐구 Ⅱ {science2}과목 필수"),
+    ("RESTRICT_SAME_SUBJECT", DisqualificationCode.INQUIRY_COMBINATION, "{program}: 동일 과목 Ⅰ+Ⅱ 조합 불가"),
+)
+
+# RESTRICT 결격 심각도 (입학 자격 미달 = 심각)
+RESTRICT_SEVERITY = 2
+
+# 요구조건 컬럼 (rules DataFrame / 배열 이름)
+REQUIREMENT_COLUMNS = (
+    "allowed_math", "min_science", "max_english", "max_history",
+    "no_second_language", "min_science2", "distinct_science",
+)
+
+
+# ============================================================
+# 셀 값 파서
+# ============================================================
+def _text(value: Any) -> str:
+    """셀 → 공백 정리 문자열 (결측은 빈 문자열)"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return ""
+    text = str(value).strip()
+    return "" if text in ("-", "무관", "없음", "제한없음") else text
+
+
+def _first_int(text: str) -> Optional[int]:
+    match = re.search(r"\d+", text)
+    return int(match.group()) if match else None
+
+
+def parse_math(value: Any) -> int:
+    """허용 수학 선택과목 비트 (제한 없음 = MATH_ANY)"""
+    text = _text(value)
+    bits = 0
+    for token, bit in _MATH_TOKENS:
+        if token in text:
+            bits |= bit
+    return bits or MATH_ANY
+
+
+def parse_science_count(value: Any) -> int:
+    """과학탐구 최소 과목 수"""
+    text = _text(value)
+    if "과탐" not in text and "과학" not in text:
+        return 0
+    count = _first_int(text)
+    return min(2, count) if count is not None else 2
+
+
+def parse_grade_cap(value: Any) -> int:
+    """등급 상한 (없으면 NO_GRADE_CAP)"""
+    text = _text(value)
+    grade = _first_int(text)
+    return grade if grade is not None and 1 <= grade <= NO_GRADE_CAP else NO_GRADE_CAP
+
+
+def parse_no_second_language(value: Any) -> bool:
+    """제2외국어/한문 탐구 대체 불가 여부"""
+    text = _text(value).upper()
+    return text in ("X", "N", "NO") or "불가" in text or "불인정" in text or "미인정" in text
+
+
+def parse_science_subjects(value: Any) -> Tuple[int, bool]:
+    """(Ⅱ 과목 최소 수, 동일 과목 Ⅰ+Ⅱ 불가)"""
+    text = _text(value)
+    min_level2 = 0
+    if re.search(r"Ⅱ|II", text) and "필수" in text:
+        level2_text = re.sub(r"Ⅱ|II", " ", text)
+        count = _first_int(level2_text)
+        min_level2 = min(2, count) if count is not None else 1
+    # "동일 과목 가능" 같은 허용 문구는 제외 (금지 표현만)
+    distinct = re.search(r"서로\s*다른|동일[^,;/]*(불가|불인정|미인정|금지)", text) is not None
+    return min_level2, distinct
+
+
+# 항목명 → (요구조건 컬럼, 파서)
+_ITEM_PARSERS = {
+    "수학": lambda v: {"allowed_math": parse_math(v)},
+    "탐구": lambda v: {"min_science": parse_science_count(v)},
+    "영어": lambda v: {"max_english": parse_grade_cap(v)},
+    "한국사": lambda v: {"max_history": parse_grade_cap(v)},
+    "제2외국어": lambda v: {"no_second_language": parse_no_second_language(v)},
+    "과학탐구과목": lambda v: dict(zip(("min_science2", "distinct_science"), parse_science_subjects(v))),
+}
+
+_DEFAULT_REQUIREMENTS = {
+    "allowed_math": MATH_ANY,
+    "min_science": 0,
+    "max_english": NO_GRADE_CAP,
+    "max_history": NO_GRADE_CAP,
+    "no_second_language": False,
+    "min_science2": 0,
+    "distinct_science": False,
+}
+
+
+# ============================================================
+# 학생 조건 벡터
+# ============================================================
+@dataclass
+class RestrictProfile:
+    """RESTRICT 판정에 필요한 학생 조건 (스칼라 또는 (S, 1) 배열)"""
+    math: Any                  # 수학 선택과목 비트 (미확인 = 0)
+    science_count: Any         # 과학탐구 과목 수
+    english: Any               # 영어 등급
+    history: Any               # 한국사 등급
+    second_language: Any       # 제2외국어/한문 응시 여부
+    science2_count: Any        # 과학탐구 Ⅱ 과목 수
+    same_science: Any          # 같은 과학 과목 Ⅰ+Ⅱ
+
+    @classmethod
+    def from_profile(cls, profile: StudentProfile) -> "RestrictProfile":
+        """StudentProfile → 조건 벡터"""
+        math_subject = str(profile.math.subject if profile.math else "")
+        math = 0
+        for token, bit in _MATH_TOKENS:
+            if token in math_subject:
+                math |= bit
+
+        inquiries = [str(s.subject) for s in (profile.inquiry1, profile.inquiry2) if s is not None]
+        science = [_science_category(s) for s in inquiries]
+        science_subjects = [s for s, cat in zip(inquiries, science) if cat]
+        categories = [cat for cat in science if cat]
+
+        return cls(
+            math=math,
+            science_count=len(science_subjects),
+            english=int(profile.english_grade),
+            history=int(profile.history_grade),
+            second_language=any(lang in s for s in inquiries for lang in SECOND_LANGUAGE_SUBJECTS),
+            science2_count=sum(1 for s in science_subjects if _is_level2(s)),
+            same_science=len(categories) == 2 and categories[0] == categories[1],
+        )
+
+    @classmethod
+    def from_profiles(cls, profiles: Sequence[StudentProfile]) -> "RestrictProfile":
+        """학생 S명 → (S, 1) 배열 조건 (evaluate 결과 (S, R), 같은 성적/과목 조합은 1회 변환)"""
+        memo: Dict[Tuple, RestrictProfile] = {}
+        vectors = []
+        for profile in profiles:
+            key = (
+                profile.english_grade, profile.history_grade,
+                profile.math.subject if profile.math else None,
+                profile.inquiry1.subject if profile.inquiry1 else None,
+                profile.inquiry2.subject if profile.inquiry2 else None,
+            )
+            vector = memo.get(key)
+            if vector is None:
+                vector = memo[key] = cls.from_profile(profile)
+            vectors.append(vector)
+        return cls(**{
+            name: np.array([getattr(v, name) for v in vectors]).reshape(-1, 1)
+            for name in cls.__dataclass_fields__
+        })
+
+    def take(self, index: Any) -> "RestrictProfile":
+        """배열 조건의 일부 학생 (index: 슬라이스/정수 배열)"""
+        return RestrictProfile(**{
+            name: np.asarray(getattr(self, name))[index] for name in self.__dataclass_fields__
+        })
+
+
+def _science_category(subject: str) -> str:
+    """과학탐구 과목군 (아니면 빈 문자열)"""
+    for category in SCIENCE_SUBJECTS:
+        if category in subject:
+            return category
+    return ""
+
+
+def _is_level2(subject: str) -> bool:
+    return "Ⅱ" in subject or "II" in subject
+
+
+# ============================================================
+# 룰 테이블
+# ============================================================
+class RestrictTable:
+    """모집단위별 RESTRICT 요구조건 (읽기 전용)"""
+
+    def __init__(self, rules: pd.DataFrame):
+        """
+        Args:
+            rules: 모집단위(program) 인덱스 × REQUIREMENT_COLUMNS DataFrame
+                   (+ university, major, track 파싱 결과)
+        """
+        self.rules = rules
+        self.programs: List[str] = list(rules.index)
+        self.allowed_math = rules["allowed_math"].to_numpy(dtype=np.uint8)
+        self.min_science = rules["min_science"].to_numpy(dtype=np.uint8)
+        self.max_english = rules["max_english"].to_numpy(dtype=np.uint8)
+        self.max_history = rules["max_history"].to_numpy(dtype=np.uint8)
+        self.no_second_language = rules["no_second_language"].to_numpy(dtype=bool)
+        self.min_science2 = rules["min_science2"].to_numpy(dtype=np.uint8)
+        self.distinct_science = rules["distinct_science"].to_numpy(dtype=bool)
+
+        self._row_of_program = {p: i for i, p in enumerate(self.programs)}
+        self._row_of_key: Dict[Tuple[Optional[str], str, str], int] = {}
+        for i, (univ, major, track) in enumerate(zip(rules["university"], rules["major"], rules["track"])):
+            self._row_of_key.setdefault((univ, major, track), i)
+        self._row_cache: Dict[Tuple[str, str, str], Optional[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.programs)
+
+    # ============================================================
+    # 컴파일
+    # ============================================================
+    @classmethod
+    def compile(cls, restrict_df: pd.DataFrame) -> "RestrictTable":
+        """RESTRICT 시트 → 룰 테이블 (블록이 없으면 빈 테이블)"""
+        requirements: Dict[str, Dict[str, Any]] = {}
+        unknown_items = set()
+
+        for items, block in cls._blocks(restrict_df):
+            columns, body = cls._item_columns(items, block)
+            for row in body.itertuples(index=False):
+                program = _text(row[0])
+                if not program or program in _PROGRAM_LABELS:
+                    continue
+                entry = requirements.setdefault(program, dict(_DEFAULT_REQUIREMENTS))
+                for pos, item in columns:
+                    parser = _ITEM_PARSERS.get(item)
+                    if parser is None:
+                        unknown_items.add(item)
+                        continue
+                    for key, value in parser(row[pos]).items():
+                        entry[key] = cls._stricter(key, entry[key], value)
+
+        if unknown_items:
+            logger.debug(f"RESTRICT 미지원 항목 무시: {sorted(unknown_items)}")
+
+        programs = list(requirements)
+        rules = pd.DataFrame(
+            [requirements[p] for p in programs], index=pd.Index(programs, name="program"),
+            columns=list(REQUIREMENT_COLUMNS),
+        )
+        parsed = [CutoffExtractor.parse_program_column(p) for p in programs]
+        rules["university"] = [univ for univ, _, _ in parsed]
+        rules["major"] = [major for _, major, _ in parsed]
+        rules["track"] = [track for _, _, track in parsed]
+
+        # 제한이 하나도 없는 모집단위 제외
+        restricted = (rules[list(REQUIREMENT_COLUMNS)] != pd.Series(_DEFAULT_REQUIREMENTS)).any(axis=1)
+        rules = rules[restricted]
+        logger.info(f"RESTRICT 룰 컴파일: {len(rules)}개 모집단위 (블록 항목 {len(programs)}개)")
+        return cls(rules)
+
+    @staticmethod
+    def _blocks(restrict_df: pd.DataFrame) -> List[Tuple[List[str], pd.DataFrame]]:
+        """헤더 "결격사유<...>" 기준 블록 분할 → [(항목 목록, 블록 DataFrame)]"""
+        starts = []
+        for pos, col in enumerate(restrict_df.columns):
+            match = _BLOCK_HEADER.search(str(col))
+            if match:
+                items = [item.strip() for item in re.split(r"[,，/]", match.group(1)) if item.strip()]
+                starts.append((pos, items))
+
+        blocks = []
+        for i, (pos, items) in enumerate(starts):
+            end = starts[i + 1][0] if i + 1 < len(starts) else len(restrict_df.columns)
+            blocks.append((items, restrict_df.iloc[:, pos:end]))
+        return blocks
+
+    @staticmethod
+    def _item_columns(items: List[str], block: pd.DataFrame) -> Tuple[List[Tuple[int, str]], pd.DataFrame]:
+        """블록 컬럼 위치 → 항목명 (소제목 행이 있으면 소제목 기준)"""
+        if len(block) and _text(block.iloc[0, 0]) in _PROGRAM_LABELS:
+            labels = [_text(v) for v in block.iloc[0, 1:]]
+            columns = [(pos + 1, label) for pos, label in enumerate(labels) if label]
+            return columns, block.iloc[1:]
+        return [(pos + 1, item) for pos, item in enumerate(items[: block.shape[1] - 1])], block
+
+    @staticmethod
+    def _stricter(key: str, current: Any, value: Any) -> Any:
+        """같은 모집단위가 여러 행/블록에 있으면 더 엄격한 조건"""
+        if key == "allowed_math":
+            return current & value
+        if key in ("max_english", "max_history"):
+            return min(current, value)
+        if key in ("no_second_language", "distinct_science"):
+            return bool(current or value)
+        return max(current, value)
+
+    # ============================================================
+    # 모집단위 조회
+    # ============================================================
+    def row_of_program(self, program: Any) -> Optional[int]:
+        """PERCENTAGE 컬럼명 → 행"""
+        return self._row_of_program.get(str(program))
+
+    def row_for(self, university: str, major: str, track: str = "") -> Optional[int]:
+        """
+        대학/전공/계열 → 행 (메모이즈)
+
+        공식 대학명 + 전공(또는 전공 Alias) 정확 일치.
+        계열 일치 모집단위 우선, 없으면 계열 구분 없는 모집단위 (다른 계열 룰은 적용하지 않음)
+        """
+        key = (university, major, track)
+        if key in self._row_cache:
+            return self._row_cache[key]
+
+        CutoffExtractor._build_alias_reverse_map()
+        official = CutoffExtractor.ALIAS_TO_OFFICIAL.get(
+            CutoffExtractor._normalize_university(university), university
+        )
+        major_text = re.sub(r"\s+", "", str(major or ""))
+        candidates = [major_text] + list(CutoffExtractor.MAJOR_ALIASES.get(major_text, []))
+
+        row = None
+        for candidate in candidates:
+            for track_key in ((track, "") if track else ("",)):
+                row = self._row_of_key.get((official, candidate, track_key))
+                if row is not None:
+                    break
+            if row is not None:
+                break
+        self._row_cache[key] = row
+        return row
+
+    # ============================================================
+    # 판정
+    # ============================================================
+    def evaluate(self, profile: RestrictProfile, rows: Optional[Sequence[int]] = None) -> np.ndarray:
+        """
+        위반 비트 (bit k = RESTRICT_VIOLATIONS[k])
+
+        Args:
+            profile: 학생 조건 (스칼라 → (R,), (S, 1) 배열 → (S, R))
+            rows: 대상 행 (None이면 전체)
+
+        Returns:
+            uint8 위반 비트 배열
+        """
+        idx = slice(None) if rows is None else np.asarray(rows, dtype=np.intp)
+        allowed_math = self.allowed_math[idx]
+        math = np.asarray(profile.math, dtype=np.uint8)
+
+        checks = (
+            (allowed_math != MATH_ANY) & ((allowed_math & math) == 0),
+            np.asarray(profile.science_count) < self.min_science[idx],
+            np.asarray(profile.english) > self.max_english[idx],
+            np.asarray(profile.history) > self.max_history[idx],
+            self.no_second_language[idx] & np.asarray(profile.second_language, dtype=bool),
+            np.asarray(profile.science2_count) < self.min_science2[idx],
+            self.distinct_science[idx] & np.asarray(profile.same_science, dtype=bool),
+        )
+        violations = np.zeros(np.broadcast(*checks).shape, dtype=np.uint8)
+        for bit, violated in enumerate(checks):
+            violations |= violated.astype(np.uint8) << bit
+        return violations
+
+    def evaluate_matrix(
+        self,
+        profiles: Sequence[StudentProfile],
+        targets: Sequence[TargetProgram],
+        chunk_cells: int = 1 << 22,
+        vectors: Optional[RestrictProfile] = None,
+        out: Optional[np.ndarray] = None,
+        offset: int = 0
+    ) -> np.ndarray:
+        """
+        학생 S명 × 대상 T개 주 위반 번호 (uint8, 0=없음, k+1 = RESTRICT_VIOLATIONS[k])
+
+        대상 → 행은 계열별로 1회 조회 (다른 계열 룰은 적용하지 않음).
+        학생 청크 × 룰이 있는 대상 열만 브로드캐스트 비교합니다.
+
+        Args:
+            out: 기존 코드 행렬 (주어지면 0인 셀에만 위반 번호 + offset 기록, 추가 (S, T) 배열 없음)
+            offset: out에 기록할 때 더할 값 (엔진 룰 수)
+        """
+        vectors = vectors or RestrictProfile.from_profiles(profiles)
+        tracks = np.array([p.track.value for p in profiles], dtype=object)
+        codes = np.zeros((len(profiles), len(targets)), dtype=np.uint8) if out is None else out
+
+        for track in dict.fromkeys(tracks):
+            rows = np.full(len(targets), -1, dtype=np.intp)
+            for j, target in enumerate(targets):
+                row = self.row_for(target.university, target.major, track)
+                if row is not None:
+                    rows[j] = row
+            cols = np.flatnonzero(rows >= 0)
+            if not len(cols):
+                continue
+            students = np.flatnonzero(tracks == track)
+            chunk = max(1, chunk_cells // len(cols))
+            for start in range(0, len(students), chunk):
+                sel = students[start:start + chunk]
+                cells = np.ix_(sel, cols)
+                primary = self.primary_violation(self.evaluate(vectors.take(sel), rows[cols]))
+                current = codes[cells]
+                codes[cells] = np.where((current == 0) & (primary > 0), primary + np.uint8(offset), current)
+        return codes
+
+    @staticmethod
+    def primary_violation(violations: np.ndarray) -> np.ndarray:
+        """위반 비트 → 주 위반 번호 (uint8, 0=없음, k+1 = RESTRICT_VIOLATIONS[k])"""
+        violations = np.asarray(violations, dtype=np.uint8)
+        lowest = violations & (~violations + np.uint8(1))
+        return np.where(violations == 0, 0, np.log2(np.maximum(lowest, 1)).astype(np.uint8) + 1).astype(np.uint8)
+
+    def check(
+        self,
+        profile: StudentProfile,
+        target: TargetProgram,
+        severity_threshold: int = 2,
+        explain: bool = True,
+        restrict_profile: Optional[RestrictProfile] = None
+    ) -> Optional[DisqualificationInfo]:
+        """
+        target 1개 판정
+
+        Returns:
+            DisqualificationInfo (결격일 때), 모집단위가 없거나 통과면 None
+        """
+        if severity_threshold > RESTRICT_SEVERITY:
+            return None
+        row = self.row_for(target.university, target.major, profile.track.value)
+        if row is None:
+            return None
+
+        vec = restrict_profile or RestrictProfile.from_profile(profile)
+        bits = int(self.evaluate(vec, [row])[0])
+        if not bits:
+            return None
+
+        triggered = [k for k in range(len(RESTRICT_VIOLATIONS)) if bits >> k & 1]
+        primary = triggered[0]
+        return DisqualificationInfo(
+            is_disqualified=True,
+            reason=self.format_reason(row, primary) if explain else None,
+            code=RESTRICT_VIOLATIONS[primary][1],
+            rules_triggered=[RESTRICT_VIOLATIONS[k][0] for k in triggered],
+        )
+
+    def format_reason(self, row: int, violation: int) -> str:
+        """행 × 위반 번호(0부터) → 사유 메시지"""
+        allowed = int(self.allowed_math[row])
+        math = "/".join(name for name, bit in (("미적분", MATH_CALCULUS), ("기하", MATH_GEOMETRY),
+                                                ("확률과통계", MATH_STATISTICS)) if allowed & bit)
+        return RESTRICT_VIOLATIONS[violation][2].format(
+            program=self.programs[row],
+            math=math,
+            science=int(self.min_science[row]),
+            english=int(self.max_english[row]),
+            history=int(self.max_history[row]),
+            science2=int(self.min_science2[row]),
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 정보 (요구조건별 제한 모집단위 수)"""
+        return {
+            "programs": len(self),
+            "restrictions": {
+                key: int((self.rules[key] != default).sum())
+                for key, default in _DEFAULT_REQUIREMENTS.items()
+            },
+        }
+
+
+def merge_disqualification(
+    base: DisqualificationInfo,
+    extra: Optional[DisqualificationInfo]
+) -> DisqualificationInfo:
+    """엔진 판정 + RESTRICT 판정 (엔진 결격이 있으면 주 사유 유지, 룰 ID는 합침)"""
+    if extra is None or not extra.is_disqualified:
+        return base
+    if not base.is_disqualified:
+        return extra
+    return DisqualificationInfo(
+        is_disqualified=True,
+        reason=base.reason,
+        code=base.code,
+        rules_triggered=list(base.rules_triggered) + list(extra.rules_triggered),
+    )
@@ -10,7 +10,7 @@ Theory Engine 데이터 로더
 import pandas as pd
 import logging
 import os
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Tuple
 from pathlib import Path
 
 from .config import (
@@ -18,6 +18,7 @@ from .config import (
     SHEET_CONFIG,
     INDEX_KEY_COLUMNS,
 )
+from .cutoff.percentage_store import PercentageStore
 from .utils import (
     validate_sheets,
     validate_columns,
@@ -33,12 +34,15 @@ logger = logging.getLogger(__name__)
 # ============================================================
 _workbook_cache: Dict[Tuple[str, bool], Dict[str, pd.DataFrame]] = {}
 _workbook_mtime: Dict[Tuple[str, bool], float] = {}
+# 엑셀 경로 → PERCENTAGE Long 저장소 (메타데이터의 mtime/크기로 무효화)
+_percentage_store_cache: Dict[str, PercentageStore] = {}
 
 
 def clear_workbook_cache() -> None:
     """워크북 캐시 초기화 (테스트/개발용)"""
     _workbook_cache.clear()
     _workbook_mtime.clear()
+    _percentage_store_cache.clear()
 
 
 # ============================================================
@@ -220,6 +224,97 @@ def load_index_optimized(
 # ============================================================
 # PERCENTAGE 시트 로드 (정규화)
 # ============================================================
+def load_percentage_store(
+    path: Optional[str] = None,
+    store_path: Optional[str] = None,
+    use_cache: bool = True,
+    persist: bool = True
+) -> PercentageStore:
+    """
+    PERCENTAGE Long 저장소 로드 (워크북 버전별 1회 구축)
+
+    조회 순서: 메모리 캐시 → 디스크(pickle, 원본 경로/mtime/크기 일치 시) → Wide 시트에서 구축
+
+    Args:
+        path: 엑셀 파일 경로 (None이면 config.EXCEL_PATH 사용)
+        store_path: 저장소 pickle 경로 (None이면 weights/percentage_store.pkl)
+        use_cache: 메모리/디스크 캐시 사용 여부
+        persist: 새로 구축한 저장소를 디스크에 저장할지 여부
+
+    Returns:
+        PercentageStore
+    """
+    path_obj = Path(path if path is not None else EXCEL_PATH).resolve()
+    if not path_obj.exists():
+        raise FileNotFoundError(f"엑셀 파일 없음: {path_obj}")
+
+    source = _percentage_source(path_obj)
+    cache_key = str(path_obj)
+
+    if use_cache:
+        store = _cached_percentage_store(cache_key, source, store_path)
+        if store is not None:
+            return store
+
+    df = load_percentage_raw(str(path_obj))
+    store = PercentageStore.build(df, metadata=source)
+    if use_cache:
+        _percentage_store_cache[cache_key] = store
+        if persist:
+            try:
+                store.save(store_path)
+            except OSError as e:
+                logger.warning(f"PERCENTAGE 저장소 저장 실패: {e}")
+    return store
+
+
+def percentage_store_for(
+    percentage_df: pd.DataFrame,
+    store_path: Optional[str] = None
+) -> Optional[PercentageStore]:
+    """
+    load_workbook()이 반환한 PERCENTAGE 시트에 대응하는 저장소 (CutoffExtractor 공유용)
+
+    워크북 캐시에서 같은 DataFrame 객체를 찾고, 메모리/디스크 캐시에 있는 저장소만 반환합니다
+    (새로 구축하지 않음). 워크북 캐시 이후 파일이 바뀌었거나 저장소가 없으면 None.
+    """
+    for cache_key, sheets in list(_workbook_cache.items()):
+        if sheets.get("PERCENTAGE") is not percentage_df:
+            continue
+        path = cache_key[0]
+        path_obj = Path(path)
+        if not path_obj.exists() or path_obj.stat().st_mtime != _workbook_mtime.get(cache_key):
+            return None
+        return _cached_percentage_store(path, _percentage_source(path_obj), store_path)
+    return None
+
+
+def _percentage_source(path_obj: Path) -> Dict[str, Any]:
+    """저장소 무효화 기준 (원본 경로/mtime/크기)"""
+    stat = path_obj.stat()
+    return {
+        "source_path": str(path_obj),
+        "source_mtime": stat.st_mtime,
+        "source_size": stat.st_size,
+    }
+
+
+def _cached_percentage_store(
+    cache_key: str,
+    source: Dict[str, Any],
+    store_path: Optional[str]
+) -> Optional[PercentageStore]:
+    """메모리 → 디스크 캐시 조회 (원본 정보 불일치 시 None)"""
+    cached = _percentage_store_cache.get(cache_key)
+    if cached is not None and all(cached.metadata.get(k) == v for k, v in source.items()):
+        logger.debug(f"PERCENTAGE 저장소 캐시 히트: {cache_key}")
+        return cached
+    store = PercentageStore.load(store_path, expected=source)
+    if store is not None:
+        _percentage_store_cache[cache_key] = store
+    return store
+
+
 def load_percentage_normalized(
     path: Optional[str] = None
 ) -> pd.DataFrame:
@@ -236,39 +331,14 @@ def load_percentage_normalized(
     |-----------|----------------|-------|
     | 0.0       | 가천의학 이과   | 99.6  |
     
+    Long 변환/프로그램명 파싱은 load_percentage_store()에서 워크북 버전별 1회만 수행합니다
+    (읽기 전용 API이므로 저장소를 디스크에 쓰지 않음).
+    공식 대학명/전공/계열이 파싱된 categorical 형식은 load_percentage_store().to_long()을 사용합니다.
+
     Returns:
-        Long 형태 DataFrame
+        Long 형태 DataFrame (percentile, program, score, university_major, track)
     """
-    sheets = load_workbook(path)
-    df = sheets.get("PERCENTAGE")
-    
-    if df is None:
-        raise ValueError("PERCENTAGE 시트가 없습니다")
-    
-    logger.info(f"PERCENTAGE 원본: {df.shape}")
-    
-    # 첫 컬럼 이름 확인
-    percentile_col = df.columns[0]
-    logger.debug(f"PERCENTAGE 첫 컬럼: {percentile_col}")
-    
-    # Wide → Long 변환
-    df_long = df.melt(
-        id_vars=[percentile_col],
-        var_name="program",
-        value_name="score"
-    )
-    
-    # 컬럼명 정규화
-    df_long = df_long.rename(columns={percentile_col: "percentile"})
-    
-    # NaN 제거
-    df_long = df_long.dropna(subset=["score"])
-    
-    # 대학명-전공-계열 파싱 시도
-    # 패턴: "가천의학 이과", "서울대자연 이과" 등
-    # 공백으로 계열 분리
-    df_long[["university_major", "track"]] = df_long["program"].str.rsplit(" ", n=1, expand=True)
-    
+    df_long = load_percentage_store(path, persist=False).to_legacy_long()
     logger.info(f"PERCENTAGE 정규화: {len(df_long)}행")
     return df_long
 
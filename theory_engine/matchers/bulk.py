@@ -0,0 +1,102 @@
+"""
+대량(Bulk) 퍼지 매칭 헬퍼
+
+온보딩 업로드처럼 수천 개의 자유 입력 문자열을 한 번에 매칭할 때 사용합니다.
+- 입력 중복 제거 후 고유값만 점수 계산
+- rapidfuzz 사용 가능 시 process.cdist(workers=-1)로 벡터화 계산
+- 없으면 순수 Python 스코어러로 동일한 (질의 × 후보) 점수 행렬 생성
+"""
+
+import logging
+from typing import Callable, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    from rapidfuzz import fuzz, process
+    HAS_RAPIDFUZZ = True
+except ImportError:  # rapidfuzz 없으면 순수 Python 폴백
+    fuzz = None
+    process = None
+    HAS_RAPIDFUZZ = False
+
+
+# 결과 DataFrame 컬럼 (match_many 계열 공통)
+BULK_RESULT_COLUMNS = ["input", "normalized", "canonical", "score", "stage"]
+
+
+def dedupe_inputs(names: Sequence[str]) -> Tuple[np.ndarray, List[str]]:
+    """
+    입력 중복 제거
+
+    Args:
+        names: 입력 문자열 목록 (None/NaN 허용)
+
+    Returns:
+        (codes, uniques)
+        - codes: 원본 위치 → 고유값 위치 (len(names),)
+        - uniques: 고유 입력 문자열 목록 (결측은 "")
+    """
+    values = ["" if v is None or (isinstance(v, float) and np.isnan(v)) else str(v) for v in names]
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), sort=False)
+    return codes, [str(u) for u in uniques]
+
+
+def score_matrix(
+    queries: Sequence[str],
+    choices: Sequence[str],
+    fallback_scorer: Callable[[str, str], float],
+    scorer: Optional[Callable] = None,
+    dtype: type = np.float32,
+) -> np.ndarray:
+    """
+    (질의 × 후보) 유사도 점수 행렬 (0~100)
+
+    Args:
+        queries: 정규화된 질의 문자열
+        choices: 정규화된 후보 문자열
+        fallback_scorer: rapidfuzz 없을 때 사용할 (s1, s2) → score 함수
+        scorer: rapidfuzz 스코어러 (None이면 fuzz.ratio)
+        dtype: 행렬 자료형 (단건 스코어러와 같은 값/동점 판정이 필요하면 np.float64)
+
+    Returns:
+        ndarray, shape (len(queries), len(choices))
+    """
+    if not queries or not choices:
+        return np.zeros((len(queries), len(choices)), dtype=dtype)
+
+    if HAS_RAPIDFUZZ:
+        return process.cdist(
+            list(queries),
+            list(choices),
+            scorer=scorer or fuzz.ratio,
+            dtype=dtype,
+            workers=-1,
+        )
+
+    matrix = np.empty((len(queries), len(choices)), dtype=dtype)
+    for i, query in enumerate(queries):
+        for j, choice in enumerate(choices):
+            matrix[i, j] = fallback_scorer(query, choice)
+    return matrix
+
+
+def expand_results(
+    codes: np.ndarray,
+    names: Sequence[str],
+    normalized: List[str],
+    canonical: List[Optional[str]],
+    scores: List[float],
+    stages: List[str],
+) -> pd.DataFrame:
+    """고유값 단위 결과를 원본 입력 순서(중복 포함)로 펼침"""
+    return pd.DataFrame({
+        "input": list(names),
+        "normalized": np.asarray(normalized, dtype=object)[codes] if len(codes) else [],
+        "canonical": np.asarray(canonical, dtype=object)[codes] if len(codes) else [],
+        "score": np.asarray(scores, dtype=float)[codes] if len(codes) else [],
+        "stage": np.asarray(stages, dtype=object)[codes] if len(codes) else [],
+    }, columns=BULK_RESULT_COLUMNS)
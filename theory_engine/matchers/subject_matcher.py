@@ -4,18 +4,29 @@
 사용법:
     matcher = SubjectMatcher()
     canonical, score = matcher.match("물리학I")  # → ("물리학 Ⅰ", 95.0)
+
+    # 대량 매칭 (온보딩 업로드)
+    df = matcher.match_many(["물리1", "생윤", "물리1"])  # input/canonical/score/stage 컬럼
 """
 
+import functools
 import re
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 import logging
 
+import pandas as pd
+
+from .bulk import dedupe_inputs, expand_results, score_matrix
+
 logger = logging.getLogger(__name__)
 
 
 class SubjectMatcher:
     """탐구과목 이름 퍼지 매칭"""
 
+    # match() 결과 캐시 크기 (자유 입력 키 → LRU로 상한 유지)
+    MATCH_CACHE_MAX_SIZE = 4096
+
     # 표준 과목명 → 별칭 목록
     CANONICAL_SUBJECTS: Dict[str, List[str]] = {
         # === 국어 ===
@@ -74,6 +85,8 @@ class SubjectMatcher:
             threshold: 매칭 임계값 (0-100)
         """
         self.threshold = threshold
+        # 입력 → match() 결과 (인스턴스별 LRU, 스레드 안전)
+        self._match_cached = functools.lru_cache(maxsize=self.MATCH_CACHE_MAX_SIZE)(self._match_uncached)
         self._build_reverse_mapping()
         logger.info(f"SubjectMatcher 초기화: {len(self.alias_to_canonical)}개 매핑")
 
@@ -120,8 +133,20 @@ class SubjectMatcher:
             - canonical_name: 정규화된 과목명
             - confidence_score: 신뢰도 (0-100)
         """
+        return self._match_cached(input_name)
+
+    def _match_uncached(self, input_name: str) -> Tuple[str, float]:
+        """match() 캐시 미스 경로"""
+        canonical, score, _ = self._match_with_stage(input_name)
+        return canonical, score
+
+    def _match_with_stage(self, input_name: str) -> Tuple[str, float, str]:
+        """match() 본체: (canonical, score, stage) 반환
+
+        stage: "exact" | "partial" | "fuzzy" | "none"
+        """
         if not input_name:
-            return input_name, 0.0
+            return input_name, 0.0, "none"
 
         normalized = self._normalize(input_name)
 
@@ -129,15 +154,14 @@ class SubjectMatcher:
         if normalized in self.alias_to_canonical:
             canonical = self.alias_to_canonical[normalized]
             logger.debug(f"정확 매칭: '{input_name}' → '{canonical}'")
-            return canonical, 100.0
+            return canonical, 100.0, "exact"
 
         # 2. 부분 매칭 (포함 관계)
-        for alias, canonical in self.alias_to_canonical.items():
-            if normalized in alias or alias in normalized:
-                score = len(normalized) / max(len(alias), len(normalized)) * 100
-                if score >= self.threshold:
-                    logger.debug(f"부분 매칭: '{input_name}' → '{canonical}' (score={score:.1f})")
-                    return canonical, score
+        partial = self._partial_match(normalized)
+        if partial is not None:
+            canonical, score = partial
+            logger.debug(f"부분 매칭: '{input_name}' → '{canonical}' (score={score:.1f})")
+            return canonical, score, "partial"
 
         # 3. 레벤슈타인 거리 기반 매칭 (간단 구현)
         best_match = None
@@ -151,11 +175,81 @@ class SubjectMatcher:
 
         if best_match and best_score >= self.threshold:
             logger.debug(f"유사 매칭: '{input_name}' → '{best_match}' (score={best_score:.1f})")
-            return best_match, best_score
+            return best_match, best_score, "fuzzy"
 
         # 4. 매칭 실패 - 원본 반환
         logger.debug(f"매칭 실패: '{input_name}'")
-        return input_name, 0.0
+        return input_name, 0.0, "none"
+
+    def _partial_match(self, normalized: str) -> Optional[Tuple[str, float]]:
+        """부분 매칭 (포함 관계) - 임계값을 넘는 첫 별칭"""
+        for alias, canonical in self.alias_to_canonical.items():
+            if normalized in alias or alias in normalized:
+                score = len(normalized) / max(len(alias), len(normalized)) * 100
+                if score >= self.threshold:
+                    return canonical, score
+        return None
+
+    def match_many(self, names: Sequence[str]) -> pd.DataFrame:
+        """
+        대량 매칭 (중복 제거 + 벡터화 퍼지 단계)
+
+        정확/부분 매칭은 match()와 동일하게 처리하고, 남은 입력만 모아
+        별칭 전체와 한 번에 점수를 계산합니다 (rapidfuzz 있으면 process.cdist,
+        없으면 _similarity_score).
+
+        Note:
+            rapidfuzz 사용 시 퍼지 단계 점수는 fuzz.ratio 기준이므로
+            match()의 문자집합 유사도와 값이 다를 수 있습니다.
+
+        Args:
+            names: 입력 과목명 목록
+
+        Returns:
+            DataFrame (input, normalized, canonical, score, stage), 입력 순서 유지
+        """
+        codes, uniques = dedupe_inputs(names)
+
+        normalized = [self._normalize(u) for u in uniques]
+        canonical: List[Optional[str]] = [None] * len(uniques)
+        scores = [0.0] * len(uniques)
+        stages = ["none"] * len(uniques)
+
+        pending: List[int] = []
+        for i, norm in enumerate(normalized):
+            if not uniques[i]:
+                canonical[i] = uniques[i]
+                continue
+            if norm in self.alias_to_canonical:
+                canonical[i], scores[i], stages[i] = self.alias_to_canonical[norm], 100.0, "exact"
+                continue
+            partial = self._partial_match(norm)
+            if partial is not None:
+                canonical[i], scores[i] = partial
+                stages[i] = "partial"
+                continue
+            pending.append(i)
+
+        if pending:
+            aliases = list(self.alias_to_canonical.keys())
+            matrix = score_matrix(
+                [normalized[i] for i in pending],
+                aliases,
+                fallback_scorer=self._similarity_score,
+            )
+            best_idx = matrix.argmax(axis=1)
+            best_scores = matrix[range(len(pending)), best_idx]
+            for row, i in enumerate(pending):
+                best = float(best_scores[row])
+                if best > 0 and best >= self.threshold:
+                    canonical[i] = self.alias_to_canonical[aliases[best_idx[row]]]
+                    scores[i] = best
+                    stages[i] = "fuzzy"
+                else:
+                    canonical[i] = uniques[i]
+
+        logger.debug(f"대량 매칭: 입력 {len(codes)}개, 고유 {len(uniques)}개, 퍼지 {len(pending)}개")
+        return expand_results(codes, names, normalized, canonical, scores, stages)
 
     def _similarity_score(self, s1: str, s2: str) -> float:
         """두 문자열 유사도 (0-100)"""
@@ -0,0 +1,254 @@
+"""
+Theory Engine 계측(metrics)
+
+- RAWSCORE 변환 단계별 적중 횟수 (stage1~4, precomputed, not_found)
+- 단계별 지연시간 히스토그램 (ms)
+- Stage 4(전체 퍼지) 도달 입력 샘플 로그 → 별칭 추가 후보 파악
+- 외부 수집기 연동용 hook (Prometheus/StatsD 등)
+
+사용법:
+    from theory_engine.metrics import get_conversion_metrics, register_metrics_hook
+
+    # 이벤트 단위 hook (변환 1건마다 호출)
+    register_metrics_hook(lambda event: statsd.timing(f"rawscore.{event['stage']}", event["elapsed_ms"]))
+
+    # 주기적 스냅샷
+    snapshot = get_conversion_metrics().snapshot()
+    print(snapshot["counters"], snapshot["top_fallback_inputs"])
+"""
+
+import bisect
+import logging
+import threading
+import time
+from collections import Counter, deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from .config import (
+    METRICS_FALLBACK_INPUTS_MAX_SIZE,
+    METRICS_LATENCY_BUCKETS_MS,
+    METRICS_STAGE4_SAMPLE_SIZE,
+    METRICS_STAGE4_LOG_EVERY,
+)
+
+logger = logging.getLogger(__name__)
+
+MetricsHook = Callable[[Dict[str, Any]], None]
+
+# 변환 단계 라벨 (match_type 접두어 기준)
+CONVERSION_STAGES = [
+    "precomputed",
+    "stage1_영역",
+    "stage2_과목명",
+    "stage3_탐구영역",
+    "stage3_fuzzy",
+    "stage4_global_fuzzy",
+    "not_found",
+]
+
+# 별칭 추가 후보로 집계하는 (느린) 단계
+FALLBACK_STAGES = ("stage3_fuzzy", "stage4_global_fuzzy")
+
+
+def conversion_stage(result: Dict[str, Any]) -> str:
+    """
+    convert_raw_to_standard() 결과 → 단계 라벨
+
+    "stage3_fuzzy(conf=92)" 처럼 부가정보가 붙은 match_type은 접두어만 사용합니다.
+    """
+    if not result.get("found"):
+        return "not_found"
+    if result.get("source") == "precomputed":
+        return "precomputed"
+    match_type = result.get("match_type") or "not_found"
+    return str(match_type).split("(")[0]
+
+
+# ============================================================
+# 히스토그램
+# ============================================================
+class LatencyHistogram:
+    """고정 버킷 지연시간 히스토그램 (ms)"""
+
+    def __init__(self, buckets: Sequence[float] = METRICS_LATENCY_BUCKETS_MS):
+        self.buckets: Tuple[float, ...] = tuple(sorted(buckets))
+        self.counts: List[int] = [0] * (len(self.buckets) + 1)  # 마지막: +Inf
+        self.total_ms = 0.0
+        self.count = 0
+        self.max_ms = 0.0
+
+    def observe(self, elapsed_ms: float) -> None:
+        """관측값 추가 (버킷 상한 이하에 포함)"""
+        self.counts[bisect.bisect_left(self.buckets, elapsed_ms)] += 1
+        self.total_ms += elapsed_ms
+        self.count += 1
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def to_dict(self) -> Dict[str, Any]:
+        labels = [f"le_{b:g}" for b in self.buckets] + ["le_inf"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.count,
+            "sum_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+# ============================================================
+# 변환 계측
+# ============================================================
+class ConversionMetrics:
+    """RAWSCORE 변환 계측 수집기 (스레드 안전)"""
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = METRICS_LATENCY_BUCKETS_MS,
+        sample_size: int = METRICS_STAGE4_SAMPLE_SIZE,
+        log_every: int = METRICS_STAGE4_LOG_EVERY,
+        fallback_max_size: int = METRICS_FALLBACK_INPUTS_MAX_SIZE
+    ):
+        self._buckets = tuple(buckets)
+        self._sample_size = sample_size
+        self._log_every = max(1, log_every)
+        self._fallback_max_size = max(2, fallback_max_size)
+        self._lock = threading.Lock()
+        self._hooks: List[MetricsHook] = []
+        self.reset()
+
+    def reset(self) -> None:
+        """카운터/히스토그램/샘플 초기화 (hook은 유지)"""
+        with self._lock:
+            self.counters: Counter = Counter()
+            self.histograms: Dict[str, LatencyHistogram] = {}
+            self.fallback_inputs: Counter = Counter()  # (단계, 입력 과목명) → 횟수
+            self.stage4_samples: Deque[Dict[str, Any]] = deque(maxlen=self._sample_size)
+
+    # ------------------------------------------------------------
+    # hook
+    # ------------------------------------------------------------
+    def register_hook(self, hook: MetricsHook) -> None:
+        """이벤트 hook 등록 (변환 1건마다 event dict로 호출)"""
+        with self._lock:
+            if hook not in self._hooks:
+                self._hooks.append(hook)
+
+    def unregister_hook(self, hook: MetricsHook) -> None:
+        """이벤트 hook 해제"""
+        with self._lock:
+            if hook in self._hooks:
+                self._hooks.remove(hook)
+
+    # ------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------
+    def record(
+        self,
+        stage: str,
+        elapsed_ms: float,
+        subject: Optional[str] = None,
+        raw_score: Optional[int] = None,
+        match_type: Optional[str] = None
+    ) -> None:
+        """
+        변환 1건 기록
+
+        Args:
+            stage: 단계 라벨 (CONVERSION_STAGES)
+            elapsed_ms: 소요 시간 (ms)
+            subject: 입력 과목명 (원본)
+            raw_score: 원점수
+            match_type: 원본 match_type (부가정보 포함)
+        """
+        event = {
+            "stage": stage,
+            "elapsed_ms": elapsed_ms,
+            "subject": subject,
+            "raw_score": raw_score,
+            "match_type": match_type,
+        }
+
+        with self._lock:
+            self.counters[stage] += 1
+            histogram = self.histograms.get(stage)
+            if histogram is None:
+                histogram = self.histograms[stage] = LatencyHistogram(self._buckets)
+            histogram.observe(elapsed_ms)
+
+            if stage in FALLBACK_STAGES:
+                self.fallback_inputs[(stage, subject)] += 1
+                # 자유 입력 키 → 상한 초과 시 상위 입력만 남김 (누수 방지)
+                if len(self.fallback_inputs) > self._fallback_max_size:
+                    self.fallback_inputs = Counter(
+                        dict(self.fallback_inputs.most_common(self._fallback_max_size // 2))
+                    )
+
+            if stage == "stage4_global_fuzzy":
+                self.stage4_samples.append({**event, "timestamp": time.time()})
+                stage4_count = self.counters[stage]
+                if (stage4_count - 1) % self._log_every == 0:
+                    logger.info(
+                        f"[metrics] Stage 4 도달 #{stage4_count}: "
+                        f"'{subject}' 원점수={raw_score} ({match_type}, {elapsed_ms:.1f}ms)"
+                    )
+
+            hooks = list(self._hooks)
+
+        # hook 실패가 변환 결과에 영향을 주지 않도록 격리
+        for hook in hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                logger.warning(f"[metrics] hook 실패: {e}")
+
+    # ------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------
+    def top_fallback_inputs(self, n: int = 20) -> List[Dict[str, Any]]:
+        """stage3_fuzzy/stage4에 자주 도달한 입력 (별칭 추가 후보)"""
+        with self._lock:
+            items = self.fallback_inputs.most_common(n)
+        return [
+            {"stage": stage, "subject": subject, "count": count}
+            for (stage, subject), count in items
+        ]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 계측값 스냅샷 (JSON 직렬화 가능)"""
+        with self._lock:
+            counters = {stage: self.counters.get(stage, 0) for stage in CONVERSION_STAGES}
+            counters.update({k: v for k, v in self.counters.items() if k not in counters})
+            histograms = {stage: h.to_dict() for stage, h in self.histograms.items()}
+            samples = list(self.stage4_samples)
+            total = sum(self.counters.values())
+
+        slow = sum(counters.get(stage, 0) for stage in FALLBACK_STAGES)
+        return {
+            "total": total,
+            "counters": counters,
+            "fallback_ratio": round(slow / total, 4) if total else 0.0,
+            "latency_ms": histograms,
+            "stage4_samples": samples,
+            "top_fallback_inputs": self.top_fallback_inputs(),
+        }
+
+
+# ============================================================
+# 싱글톤
+# ============================================================
+_conversion_metrics = ConversionMetrics()
+
+
+def get_conversion_metrics() -> ConversionMetrics:
+    """RAWSCORE 변환 계측 싱글톤"""
+    return _conversion_metrics
+
+
+def register_metrics_hook(hook: MetricsHook) -> None:
+    """RAWSCORE 변환 이벤트 hook 등록"""
+    _conversion_metrics.register_hook(hook)
+
+
+def unregister_metrics_hook(hook: MetricsHook) -> None:
+    """RAWSCORE 변환 이벤트 hook 해제"""
+    _conversion_metrics.unregister_hook(hook)
@@ -11,9 +11,14 @@ INDEX 시트 조회 최적화 모듈
     # 폴백 조회 (INDEX 실패 시)
     fallback = get_index_fallback()
     result = fallback.calculate_from_rawscore(korean_conv, math_conv, inq1_conv, inq2_conv)
+
+    # RAWSCORE 사전계산 테이블 (tools/precompute_rawscore_table.py로 생성)
+    table = RawscoreTable.load()
+    result = table.lookup("물리학 Ⅰ", 47)
 """
 
 from .index_optimizer import IndexOptimizer
 from .index_fallback import IndexFallback, get_index_fallback
+from .rawscore_table import RawscoreTable
 
-__all__ = ["IndexOptimizer", "IndexFallback", "get_index_fallback"]
+__all__ = ["IndexOptimizer", "IndexFallback", "get_index_fallback", "RawscoreTable"]
@@ -37,6 +37,8 @@ class IndexOptimizer:
         """
         self.raw_df = index_df.copy()
         self._cache: Dict[Tuple, Dict] = {}
+        # 계열별 일괄 조회용 배열 (lookup_many 첫 호출 시 구축)
+        self._track_arrays: Dict[str, Dict[str, Any]] = {}
         self.use_multiindex = False
         self._build_optimized_index()
 
@@ -311,6 +313,110 @@ class IndexOptimizer:
 
         return result
 
+    def _arrays_for_track(self, track: str) -> Dict[str, Any]:
+        """계열별 (키 행렬, 누백, 키 → 위치) — _fuzzy_lookup과 같은 행 순서"""
+        arrays = self._track_arrays.get(track)
+        if arrays is not None:
+            return arrays
+
+        try:
+            track_df = self.indexed_df.xs(track, level='track', drop_level=False) \
+                if 'track' in self.indexed_df.index.names else self.indexed_df
+        except KeyError:
+            track_df = self.indexed_df
+
+        levels = track_df.index.to_frame(index=False)
+        score_cols = ['korean_std', 'math_std', 'inq1_std', 'inq2_std']
+        scores = levels[[c for c in score_cols if c in levels.columns]].to_numpy(dtype=float)
+        if 'cumulative_pct' in track_df.columns:
+            cumulative = pd.to_numeric(track_df['cumulative_pct'], errors='coerce').to_numpy(dtype=float)
+        else:
+            cumulative = np.full(len(track_df), np.nan)
+
+        position: Dict[Tuple[float, ...], int] = {}
+        duplicated = set()
+        for pos, row in enumerate(map(tuple, scores)):
+            if row in position:
+                duplicated.add(row)
+            else:
+                position[row] = pos
+
+        arrays = {
+            'scores': scores,
+            'cumulative_pct': cumulative,
+            'position': position,
+            'duplicated': duplicated,
+        }
+        self._track_arrays[track] = arrays
+        return arrays
+
+    def lookup_many(
+        self,
+        keys: np.ndarray,
+        track: str,
+        fuzzy: bool = True,
+        chunk_size: int = 256
+    ) -> Dict[str, np.ndarray]:
+        """
+        표준점수 조합 일괄 조회 (lookup()과 같은 결과, 근사 검색은 청크 단위 L1 argmin)
+
+        Args:
+            keys: (K, 4) 국어/수학/탐구1/탐구2 표준점수
+            track: 계열
+            fuzzy: True면 근사 검색 허용
+            chunk_size: 근사 검색 시 한 번에 거리 계산할 질의 수
+
+        Returns:
+            {"found": (K,) bool, "exact": (K,) bool, "cumulative_pct": (K,) float (없으면 NaN)}
+        """
+        keys = np.asarray(keys, dtype=float).reshape(-1, 4)
+        found = np.zeros(len(keys), dtype=bool)
+        exact = np.zeros(len(keys), dtype=bool)
+        cumulative = np.full(len(keys), np.nan)
+
+        def scalar(i: int) -> None:
+            result = self.lookup(*(int(v) for v in keys[i]), track, fuzzy=fuzzy)
+            found[i] = bool(result.get('found'))
+            exact[i] = bool(result.get('exact_match'))
+            if result.get('cumulative_pct') is not None:
+                cumulative[i] = result['cumulative_pct']
+
+        if not self.use_multiindex or len(keys) == 0:
+            for i in range(len(keys)):
+                scalar(i)
+            return {'found': found, 'exact': exact, 'cumulative_pct': cumulative}
+
+        arrays = self._arrays_for_track(track)
+        scores, values = arrays['scores'], arrays['cumulative_pct']
+        position, duplicated = arrays['position'], arrays['duplicated']
+
+        misses = []
+        for i, key in enumerate(map(tuple, keys)):
+            if key in duplicated:
+                scalar(i)                 # 중복 키는 단건 조회 규칙 그대로
+            elif key in position:
+                found[i] = exact[i] = True
+                cumulative[i] = values[position[key]]
+            else:
+                misses.append(i)
+
+        if misses and fuzzy and len(scores) and scores.shape[1] == 4:
+            misses = np.asarray(misses)
+            # 정수 점수면 int32로 거리 계산 (argmin 동점 처리는 float와 동일)
+            integral = np.array_equal(scores, np.rint(scores)) and np.array_equal(keys, np.rint(keys))
+            dtype = np.int32 if integral else float
+            columns = [np.ascontiguousarray(scores[:, c], dtype=dtype) for c in range(4)]
+            for start in range(0, len(misses), chunk_size):
+                idx = misses[start:start + chunk_size]
+                query = keys[idx].astype(dtype)
+                distances = np.abs(columns[0][None, :] - query[:, 0, None])
+                for c in range(1, 4):
+                    distances += np.abs(columns[c][None, :] - query[:, c, None])
+                nearest = distances.argmin(axis=1)
+                found[idx] = True
+                cumulative[idx] = values[nearest]
+        return {'found': found, 'exact': exact, 'cumulative_pct': cumulative}
+
     def get_percentile_from_rawscore(
         self,
         korean_percentile: float,
@@ -0,0 +1,328 @@
+"""
+RAWSCORE 사전계산 테이블
+
+모든 정규 과목 × 모든 원점수(0~100)에 대해 convert_raw_to_standard()의
+다단계 매칭을 오프라인에서 1회 수행하고 결과(match_type 포함)를 압축 JSON으로 저장합니다.
+
+공통/선택 원점수 입력:
+- 시트 행에 공통/선택 값이 있는 과목 → (공통 0~최대) × (선택 0~최대) 격자 전체
+- 그 외 과목 → 다단계 매칭 결과가 공통/선택 값과 무관하므로 총점별 1개
+  (총점 입력 결과와 다를 때만 저장)
+
+런타임에는 테이블이 담당하는 과목이면 테이블 결과가 최종이므로
+(범위 밖 입력은 즉시 실패) Stage 3/4 퍼지 매칭이 요청 시점에 실행되지 않습니다.
+
+사용법:
+    # 오프라인 (tools/precompute_rawscore_table.py)
+    table = RawscoreTable.build(rawscore_df)
+    table.save()
+
+    # 런타임 (rules.convert_raw_to_standard 내부에서 자동 사용)
+    table = RawscoreTable.load()
+    table.lookup("국어(언매)", 85)
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# 기본 저장 경로 (weights/ 아래 JSON, 런타임 로드 대상)
+DEFAULT_TABLE_PATH = Path(__file__).parent.parent / "weights" / "rawscore_table.json"
+
+# 원점수 범위 (총점)
+RAW_SCORE_RANGE = range(0, 101)
+
+# 공통/선택 원점수 컬럼 (convert_raw_to_standard와 동일)
+SPLIT_COLUMNS = ("공통원점수", "선택원점수")
+
+
+def rawscore_fingerprint(rawscore_df: pd.DataFrame) -> str:
+    """RAWSCORE 시트 지문 (테이블과 시트 내용 일치 확인용, 컬럼명+전체 셀 값)"""
+    hashed = pd.util.hash_pandas_object(rawscore_df.astype(str), index=False)
+    header = pd.util.hash_pandas_object(pd.Series([str(c) for c in rawscore_df.columns]), index=False)
+    digest = (int(hashed.sum()) + int(header.sum())) & 0xFFFFFFFFFFFFFFFF
+    return f"rows={len(rawscore_df)}:{digest:016x}"
+
+
+class RawscoreTable:
+    """원점수 → 표준점수/백분위/등급/누적% 사전계산 테이블"""
+
+    FORMAT_VERSION = 2
+
+    # 엔트리 값 순서 (JSON 압축 저장)
+    VALUE_COLUMNS = ["standard_score", "percentile", "grade", "cumulative_pct", "match_type"]
+
+    def __init__(
+        self,
+        subjects: Dict[str, Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Args:
+            subjects: {정규화 과목명: {
+                "total": {"85": [...]},
+                "split_range": [공통 최대, 선택 최대],   # 공통/선택 과목만
+                "split": {"76-9": [...]},               # 공통/선택 과목만 (격자 전체)
+                "split_by_total": {"85": [...] | None}, # 그 외 과목, 총점 결과와 다를 때만
+            }}
+            metadata: 버전/지문 등 메타데이터
+        """
+        self.subjects = subjects
+        self.metadata = metadata or {}
+
+    # ============================================================
+    # 조회
+    # ============================================================
+    def covers(self, subject: str) -> bool:
+        """해당 (정규화) 과목을 테이블이 담당하는지"""
+        return subject in self.subjects
+
+    def lookup(
+        self,
+        subject: str,
+        raw_score: int,
+        raw_common: Optional[int] = None,
+        raw_select: Optional[int] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        사전계산 결과 조회
+
+        Args:
+            subject: 정규화된 과목명 (normalize_subject 결과)
+            raw_score: 총 원점수
+            raw_common: 공통 원점수 (optional)
+            raw_select: 선택 원점수 (optional)
+
+        공통/선택 입력은 공통/선택 과목이면 격자, 그 외 과목이면 총점별 결과
+        (다단계 매칭과 같은 match_type)를 사용합니다. 키는 입력 형태를 따릅니다.
+
+        Returns:
+            convert_raw_to_standard()와 같은 형태의 dict, 미존재(다단계 매칭도 실패) 시 None
+        """
+        entry = self.subjects.get(subject)
+        if entry is None:
+            return None
+
+        total = entry.get("total", {})
+        if raw_common is not None and raw_select is not None:
+            key = f"{subject}-{raw_common}-{raw_select}"
+            if "split_range" in entry:
+                values = entry.get("split", {}).get(f"{raw_common}-{raw_select}")
+            else:
+                by_total = entry.get("split_by_total", {})
+                raw = str(raw_score)
+                values = by_total[raw] if raw in by_total else total.get(raw)
+        else:
+            key = f"{subject}-{raw_score}"
+            values = total.get(str(raw_score))
+
+        if values is None:
+            return None
+
+        result = {"found": True, "key": key, "source": "precomputed"}
+        result.update(dict(zip(self.VALUE_COLUMNS, values)))
+        return result
+
+    # ============================================================
+    # 구축 (오프라인)
+    # ============================================================
+    @classmethod
+    def build(
+        cls,
+        rawscore_df: pd.DataFrame,
+        subjects: Optional[Iterable[str]] = None
+    ) -> "RawscoreTable":
+        """
+        전체 과목 × 원점수 조합을 다단계 매칭으로 1회 해석
+
+        Args:
+            rawscore_df: RAWSCORE 시트 DataFrame
+            subjects: 대상 과목 (None이면 정규 과목명 + 시트의 영역/과목명 전체)
+
+        Returns:
+            RawscoreTable
+        """
+        # rules → optimizers 순환 임포트 방지 (오프라인 구축 시에만 필요)
+        from ..config import ENGINE_VERSION, EXCEL_VERSION
+        from ..rules import convert_raw_to_standard, normalize_subject, get_subject_matcher
+
+        if subjects is None:
+            subjects = list(get_subject_matcher().get_all_canonical_names())
+            for col in ("영역", "과목명"):
+                if col in rawscore_df.columns:
+                    subjects.extend(str(v) for v in rawscore_df[col].dropna().unique())
+
+        normalized_subjects: List[str] = []
+        for subject in subjects:
+            normalized = normalize_subject(subject)
+            if normalized and normalized not in normalized_subjects:
+                normalized_subjects.append(normalized)
+
+        split_ranges = cls._split_ranges(rawscore_df, normalize_subject)
+
+        table: Dict[str, Dict[str, Any]] = {}
+        match_type_counts: Dict[str, int] = {}
+
+        for subject in normalized_subjects:
+            total: Dict[str, List[Any]] = {}
+            for raw in RAW_SCORE_RANGE:
+                conv = convert_raw_to_standard(rawscore_df, subject, raw, use_table=False)
+                if conv.get("found"):
+                    total[str(raw)] = cls._pack(conv)
+                    stage = str(conv.get("match_type")).split("(")[0]
+                    match_type_counts[stage] = match_type_counts.get(stage, 0) + 1
+
+            entry: Dict[str, Any] = {"total": total}
+            if subject in split_ranges:
+                common_max, select_max = split_ranges[subject]
+                split: Dict[str, List[Any]] = {}
+                for common in range(common_max + 1):
+                    for select in range(select_max + 1):
+                        conv = convert_raw_to_standard(
+                            rawscore_df, subject, common + select, common, select, use_table=False
+                        )
+                        if conv.get("found"):
+                            split[f"{common}-{select}"] = cls._pack(conv)
+                entry.update(split_range=[common_max, select_max], split=split)
+            else:
+                # 공통/선택 행이 없는 과목: 결과는 총점으로만 정해짐 (공통/선택 값은 임의)
+                by_total: Dict[str, Optional[List[Any]]] = {}
+                for raw in RAW_SCORE_RANGE:
+                    conv = convert_raw_to_standard(rawscore_df, subject, raw, raw, 0, use_table=False)
+                    packed = cls._pack(conv) if conv.get("found") else None
+                    if packed != total.get(str(raw)):
+                        by_total[str(raw)] = packed
+                if by_total:
+                    entry["split_by_total"] = by_total
+
+            if total or entry.get("split") or entry.get("split_by_total"):
+                table[subject] = entry
+                logger.info(
+                    f"[{subject}] 사전계산: 총점 {len(total)}개, 공통/선택 {len(entry.get('split', {}))}개"
+                )
+
+        metadata = {
+            "format_version": cls.FORMAT_VERSION,
+            "engine_version": ENGINE_VERSION,
+            "excel_version": EXCEL_VERSION,
+            "rawscore_fingerprint": rawscore_fingerprint(rawscore_df),
+            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "total_subjects": len(table),
+            "match_type_counts": match_type_counts,
+        }
+        built = cls(table, metadata)
+        # 공통/선택 과목 수, 엔트리 수 (총점/격자/총점 기준 공통·선택)
+        for name in ("split_subjects", "total_entries", "split_entries", "split_by_total_entries"):
+            metadata[name] = built.get_stats()[name]
+        return built
+
+    @staticmethod
+    def _split_ranges(rawscore_df: pd.DataFrame, normalize: Any) -> Dict[str, Tuple[int, int]]:
+        """
+        공통/선택 값이 있는 과목 → (공통 최대, 선택 최대)
+
+        다단계 매칭에서 공통/선택 값을 쓰는 것은 Stage 1(영역 매칭) 행뿐이므로
+        영역 기준으로 모읍니다 (컬럼이 없거나 값이 없으면 빈 dict).
+        """
+        if "영역" not in rawscore_df.columns or not all(c in rawscore_df.columns for c in SPLIT_COLUMNS):
+            return {}
+        common = pd.to_numeric(rawscore_df[SPLIT_COLUMNS[0]], errors="coerce")
+        select = pd.to_numeric(rawscore_df[SPLIT_COLUMNS[1]], errors="coerce")
+        has_split = common.notna() & select.notna() & rawscore_df["영역"].notna()
+        if not has_split.any():
+            return {}
+        areas = rawscore_df.loc[has_split, "영역"].astype(str)
+        subjects = areas.map({a: normalize(a) for a in areas.unique()})
+        maxima = pd.DataFrame({"subject": subjects, "common": common[has_split], "select": select[has_split]})
+        maxima = maxima.groupby("subject")[["common", "select"]].max()
+        return {s: (int(row.common), int(row.select)) for s, row in maxima.iterrows()}
+
+    @classmethod
+    def _pack(cls, conv: Dict[str, Any]) -> List[Any]:
+        """변환 결과 → JSON 직렬화 가능한 값 리스트"""
+        packed = []
+        for col in cls.VALUE_COLUMNS:
+            value = conv.get(col)
+            if value is None or (not isinstance(value, str) and pd.isna(value)):
+                packed.append(None)
+            elif isinstance(value, str):
+                packed.append(value)
+            elif float(value).is_integer() and col in ("standard_score", "grade"):
+                packed.append(int(value))
+            else:
+                packed.append(float(value))
+        return packed
+
+    # ============================================================
+    # 저장/로드
+    # ============================================================
+    def save(self, path: Optional[str] = None) -> Path:
+        """압축 JSON 저장"""
+        path = Path(path) if path is not None else DEFAULT_TABLE_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = {
+            "metadata": self.metadata,
+            "columns": self.VALUE_COLUMNS,
+            "subjects": self.subjects,
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+        logger.info(f"RAWSCORE 사전계산 테이블 저장: {path} ({len(self.subjects)}개 과목)")
+        return path
+
+    @classmethod
+    def load(cls, path: Optional[str] = None) -> Optional["RawscoreTable"]:
+        """
+        테이블 로드
+
+        Returns:
+            RawscoreTable, 파일이 없거나 포맷/버전이 맞지 않으면 None
+        """
+        from ..config import EXCEL_VERSION
+
+        path = Path(path) if path is not None else DEFAULT_TABLE_PATH
+        if not path.exists():
+            return None
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        metadata = data.get("metadata", {})
+        if metadata.get("format_version") != cls.FORMAT_VERSION:
+            logger.warning(f"RAWSCORE 사전계산 테이블 포맷 불일치: {metadata.get('format_version')}")
+            return None
+        if data.get("columns") != cls.VALUE_COLUMNS:
+            logger.warning("RAWSCORE 사전계산 테이블 컬럼 불일치")
+            return None
+        if metadata.get("excel_version") != EXCEL_VERSION:
+            logger.warning(
+                f"RAWSCORE 사전계산 테이블 엑셀 버전 불일치: "
+                f"{metadata.get('excel_version')} != {EXCEL_VERSION}"
+            )
+            return None
+
+        logger.info(f"RAWSCORE 사전계산 테이블 로드: {path} ({len(data.get('subjects', {}))}개 과목)")
+        return cls(data.get("subjects", {}), metadata)
+
+    def matches(self, rawscore_df: pd.DataFrame) -> bool:
+        """테이블이 주어진 RAWSCORE 시트로 만들어졌는지 (지문 비교)"""
+        return self.metadata.get("rawscore_fingerprint") == rawscore_fingerprint(rawscore_df)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 정보"""
+        return {
+            "subjects": len(self.subjects),
+            "split_subjects": sum(1 for v in self.subjects.values() if "split_range" in v),
+            "total_entries": sum(len(v.get("total", {})) for v in self.subjects.values()),
+            "split_entries": sum(len(v.get("split", {})) for v in self.subjects.values()),
+            "split_by_total_entries": sum(len(v.get("split_by_total", {})) for v in self.subjects.values()),
+            "excel_version": self.metadata.get("excel_version"),
+        }
@@ -6,8 +6,32 @@
 
     model = AdmissionProbabilityModel()
     result = model.calculate(student_score, cutoff_safe, cutoff_normal, cutoff_risk)
+
+    # 배열 일괄 계산 (원소별 calculate()와 비트 단위 동일, 커트라인 없음은 NaN)
+    batch = model.calculate_many(scores, safe, normal, risk)
+    batch.probability, batch.level_code, batch.levels
+
+    # 분포 기반 (PERCENTAGE 곡선에 로지스틱 CDF 적합, config.PROBABILITY_MODE="distribution")
+    model = DistributionProbabilityModel()
+    model.calculate_rows(scores, compiled, rows)   # 프로그램별 파라미터 (C, 3) 1회 적합
+
+    # 과거 결과 기반 보정 (tools/fit_probability_calibration.py로 생성한 101칸 격자 테이블)
+    model = AdmissionProbabilityModel(calibration=ProbabilityCalibration.load(mode="linear"))
 """
 
-from .admission_model import AdmissionProbabilityModel, ProbabilityResult
+from .admission_model import (
+    LEVEL_CODES,
+    AdmissionProbabilityModel,
+    ProbabilityArrays,
+    ProbabilityResult,
+    round_like_python,
+)
+from .distribution_model import DistributionProbabilityModel, ProgramDistributions
+from .calibration import ProbabilityCalibration, load_outcomes
 
-__all__ = ["AdmissionProbabilityModel", "ProbabilityResult"]
+__all__ = [
+    "AdmissionProbabilityModel", "ProbabilityResult", "ProbabilityArrays",
+    "LEVEL_CODES", "round_like_python",
+    "DistributionProbabilityModel", "ProgramDistributions",
+    "ProbabilityCalibration", "load_outcomes",
+]
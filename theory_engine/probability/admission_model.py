@@ -5,11 +5,35 @@
 """
 
 import logging
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, Optional, Sequence, Tuple
 from dataclasses import dataclass
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# calculate_many() 레벨 코드 (uint8) ↔ 레벨 문자열
+LEVEL_CODES: Tuple[str, ...] = ("적정", "예상", "소신", "상향", "알수없음")
+LEVEL_CODE = {level: code for code, level in enumerate(LEVEL_CODES)}
+
+
+def round_like_python(values: np.ndarray, ndigits: int) -> np.ndarray:
+    """
+    원소별 Python round(x, ndigits)와 비트 단위로 같은 결과
+
+    np.round는 x * 10**n 을 반올림하므로 .xxxx5 근처에서 곱셈 오차로 Python round()와
+    다를 수 있습니다. 반올림 경계(소수부 0.5) 근처 값만 Python round()로 다시 계산합니다.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    factor = 10.0 ** ndigits
+    scaled = values * factor
+    result = np.rint(scaled) / factor
+    with np.errstate(invalid="ignore"):
+        near_half = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_half.any():
+        result[near_half] = [round(float(v), ndigits) for v in values[near_half]]
+    return result
+
 
 @dataclass
 class ProbabilityResult:
@@ -20,9 +44,38 @@ class ProbabilityResult:
     confidence_high: float
 
 
+@dataclass
+class ProbabilityArrays:
+    """확률 일괄 계산 결과 (calculate_many, 원소별 ProbabilityResult와 동일 값)"""
+    probability: np.ndarray
+    level_code: np.ndarray      # uint8, LEVEL_CODES 인덱스
+    confidence_low: np.ndarray
+    confidence_high: np.ndarray
+
+    @property
+    def levels(self) -> np.ndarray:
+        """레벨 문자열 배열"""
+        return np.asarray(LEVEL_CODES, dtype=object)[self.level_code]
+
+    def __len__(self) -> int:
+        return len(self.probability)
+
+    def result_at(self, i: int) -> ProbabilityResult:
+        """i번째 원소를 ProbabilityResult로"""
+        return ProbabilityResult(
+            probability=float(self.probability[i]),
+            level=LEVEL_CODES[self.level_code[i]],
+            confidence_low=float(self.confidence_low[i]),
+            confidence_high=float(self.confidence_high[i]),
+        )
+
+
 class AdmissionProbabilityModel:
     """합격 확률 계산 모델"""
 
+    # config.PROBABILITY_MODE 값 (보정 테이블이 어느 모델 원확률로 적합됐는지 기록)
+    MODE = "linear"
+
     # 라인별 기본 확률 범위
     LEVEL_RANGES = {
         "적정": (0.80, 1.00),
@@ -31,19 +84,22 @@ class AdmissionProbabilityModel:
         "상향": (0.00, 0.20),
     }
 
-    def __init__(self, uncertainty: float = 0.10):
+    def __init__(self, uncertainty: float = 0.10, calibration: Optional[Any] = None):
         """
         Args:
             uncertainty: 기본 불확실성 (표준편차)
+            calibration: 확률 보정 테이블 (ProbabilityCalibration, None이면 미보정)
         """
         self.uncertainty = uncertainty
+        self.calibration = calibration
 
     def calculate(
         self,
         student_score: float,
         cutoff_safe: Optional[float],
         cutoff_normal: Optional[float],
-        cutoff_risk: Optional[float]
+        cutoff_risk: Optional[float],
+        program: Optional[Any] = None
     ) -> ProbabilityResult:
         """
         합격 확률 계산
@@ -53,6 +109,7 @@ class AdmissionProbabilityModel:
             cutoff_safe: 적정 커트라인 (80%)
             cutoff_normal: 예상 커트라인 (50%)
             cutoff_risk: 소신 커트라인 (20%)
+            program: PERCENTAGE 컬럼명 (프로그램별 보정 테이블 조회용, optional)
 
         Returns:
             ProbabilityResult
@@ -101,6 +158,10 @@ class AdmissionProbabilityModel:
         # 확률 범위 제한
         prob = max(0.01, min(0.99, prob))
 
+        # 과거 결과 기반 보정 (레벨은 유지)
+        if self.calibration is not None:
+            prob = self.calibration.apply_one(prob, level, program)
+
         # 신뢰구간 (95%)
         ci_low = max(0.00, prob - 1.96 * self.uncertainty)
         ci_high = min(1.00, prob + 1.96 * self.uncertainty)
@@ -112,6 +173,139 @@ class AdmissionProbabilityModel:
             confidence_high=round(ci_high, 4)
         )
 
+    def calculate_many(
+        self,
+        student_scores,
+        cutoff_safe,
+        cutoff_normal,
+        cutoff_risk,
+        programs: Optional[Sequence[Any]] = None
+    ) -> ProbabilityArrays:
+        """
+        합격 확률 일괄 계산 (calculate()의 구간 규칙을 np.select로 벡터화)
+
+        Args:
+            student_scores: 학생 환산점수 배열
+            cutoff_safe / cutoff_normal / cutoff_risk: 커트라인 배열 (None 대신 NaN)
+            (스칼라는 브로드캐스트)
+            programs: 원소별 PERCENTAGE 컬럼명 (프로그램별 보정 테이블 조회용, optional)
+
+        Returns:
+            ProbabilityArrays (원소별 calculate() 결과와 비트 단위 동일)
+
+        Note:
+            - 커트라인 판정은 calculate()의 truthiness와 같음 (NaN·0은 "없음")
+            - calculate()를 재정의한 하위 클래스는 원소별 calculate() 호출로 처리
+        """
+        score, safe, normal, risk = np.broadcast_arrays(
+            *(np.asarray(v, dtype=np.float64) for v in (student_scores, cutoff_safe, cutoff_normal, cutoff_risk))
+        )
+        if type(self).calculate is not AdmissionProbabilityModel.calculate:
+            return self._calculate_many_scalar(score, safe, normal, risk, programs)
+        return self._calculate_many_linear(score, safe, normal, risk, programs)
+
+    def _calculate_many_linear(
+        self,
+        score: np.ndarray,
+        safe: np.ndarray,
+        normal: np.ndarray,
+        risk: np.ndarray,
+        programs: Optional[Sequence[Any]] = None
+    ) -> ProbabilityArrays:
+        """calculate() 구간 선형 규칙의 벡터화 본체 (같은 shape의 float64 배열)"""
+        has_normal = ~np.isnan(normal)
+        has_safe = ~np.isnan(safe) & (safe != 0)
+        has_risk = ~np.isnan(risk) & (risk != 0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            is_safe = has_normal & has_safe & (score >= safe)
+            is_normal = has_normal & ~is_safe & (score >= normal)
+            is_risk = has_normal & ~is_safe & ~is_normal & has_risk & (score >= risk)
+            is_reach = has_normal & ~is_safe & ~is_normal & ~is_risk
+
+            # 적정: _calc_prob_above(score, safe, 0.80, 0.99)
+            range_above = safe * 0.05
+            above = (score - safe) / range_above
+            above = np.where(above < 1.0, above, 1.0)
+            prob_safe = np.where(range_above <= 0, 0.80, 0.80 + above * (0.99 - 0.80))
+
+            # 예상
+            ratio = (score - normal) / (safe - normal)
+            ratio = np.where(ratio > 0.0, ratio, 0.0)
+            ratio = np.where(ratio < 1.0, ratio, 1.0)
+            prob_normal = 0.50 + np.where(has_safe, ratio, 0.5) * 0.30
+
+            # 소신
+            ratio = (score - risk) / (normal - risk)
+            ratio = np.where(ratio > 0.0, ratio, 0.0)
+            ratio = np.where(ratio < 1.0, ratio, 1.0)
+            prob_risk = 0.20 + ratio * 0.30
+
+            # 상향
+            ratio = score / risk
+            ratio = np.where((risk > 0) & (ratio > 0), ratio, 0.0)
+            prob_reach = np.where(has_risk, ratio * 0.20, 0.10)
+
+        prob = np.select(
+            [is_safe, is_normal, is_risk, is_reach],
+            [prob_safe, prob_normal, prob_risk, prob_reach],
+            default=0.50,
+        )
+        prob = np.where(prob < 0.99, prob, 0.99)
+        prob = np.where(prob > 0.01, prob, 0.01)
+
+        level_code = np.select(
+            [is_safe, is_normal, is_risk, is_reach],
+            [LEVEL_CODE["적정"], LEVEL_CODE["예상"], LEVEL_CODE["소신"], LEVEL_CODE["상향"]],
+            default=LEVEL_CODE["알수없음"],
+        ).astype(np.uint8)
+
+        if self.calibration is not None:
+            prob = self.calibration.apply(prob, level_code, _broadcast_programs(programs, prob.shape))
+
+        ci_low = prob - 1.96 * self.uncertainty
+        ci_low = np.where(ci_low > 0.00, ci_low, 0.00)
+        ci_high = prob + 1.96 * self.uncertainty
+        ci_high = np.where(ci_high < 1.00, ci_high, 1.00)
+
+        # 커트라인 없음: calculate()의 고정값 (반올림 없음)
+        return ProbabilityArrays(
+            probability=np.where(has_normal, round_like_python(prob, 4), 0.50),
+            level_code=level_code,
+            confidence_low=np.where(has_normal, round_like_python(ci_low, 4), 0.30),
+            confidence_high=np.where(has_normal, round_like_python(ci_high, 4), 0.70),
+        )
+
+    def _calculate_many_scalar(
+        self,
+        score: np.ndarray,
+        safe: np.ndarray,
+        normal: np.ndarray,
+        risk: np.ndarray,
+        programs: Optional[Sequence[Any]] = None
+    ) -> ProbabilityArrays:
+        """원소별 calculate() 호출 (NaN 커트라인 → None, programs가 있을 때만 program 전달)"""
+        def opt(value: float) -> Optional[float]:
+            return None if np.isnan(value) else float(value)
+
+        rows = zip(score.ravel(), safe.ravel(), normal.ravel(), risk.ravel())
+        if programs is None:
+            results = [self.calculate(float(s), opt(a), opt(b), opt(c)) for s, a, b, c in rows]
+        else:
+            results = [
+                self.calculate(float(s), opt(a), opt(b), opt(c), program=p)
+                for (s, a, b, c), p in zip(rows, _broadcast_programs(programs, score.shape).ravel())
+            ]
+        shape = score.shape
+        return ProbabilityArrays(
+            probability=np.array([r.probability for r in results], dtype=np.float64).reshape(shape),
+            level_code=np.array(
+                [LEVEL_CODE.get(r.level, LEVEL_CODE["알수없음"]) for r in results], dtype=np.uint8
+            ).reshape(shape),
+            confidence_low=np.array([r.confidence_low for r in results], dtype=np.float64).reshape(shape),
+            confidence_high=np.array([r.confidence_high for r in results], dtype=np.float64).reshape(shape),
+        )
+
     def _calc_prob_above(
         self,
         score: float,
@@ -184,6 +378,13 @@ class AdmissionProbabilityModel:
         )
 
 
+def _broadcast_programs(programs: Optional[Sequence[Any]], shape: Tuple[int, ...]) -> Optional[np.ndarray]:
+    """원소별 프로그램명 배열 (object, 확률 배열 shape로 브로드캐스트)"""
+    if programs is None:
+        return None
+    return np.broadcast_to(np.asarray(programs, dtype=object), shape)
+
+
 # 테스트 코드
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
@@ -0,0 +1,468 @@
+"""
+합격 확률 보정 (과거 합격/불합격 결과 기반)
+
+LEVEL_RANGES / _calc_prob_above의 5% 여유 같은 수기 상수로 계산한 확률을
+실제 합격률에 맞추는 보정 테이블입니다.
+
+- 오프라인 적합 (tools/fit_probability_calibration.py)
+  과거 결과(CSV/Parquet) → 모델 원확률 계산 → 레벨별 또는 프로그램별
+  isotonic(PAV) 또는 Platt(로지스틱) 보정 → 101칸 격자 테이블을 JSON으로 저장
+- 런타임 적용
+  원확률 → 격자 위치 인덱스 산술 + 이웃 두 칸 선형 혼합 (검색 없음)
+  테이블은 (레벨 5 + 프로그램 P, 101) 행렬 1개
+
+보정은 확률/신뢰구간만 바꾸며 레벨(커트라인 기준 판정)은 바꾸지 않습니다.
+표본이 min_samples 미만인 레벨은 항등 테이블, 프로그램은 레벨 테이블을 사용합니다.
+원확률 척도는 모델마다 다르므로 적합한 모델 모드(linear/distribution)를 메타데이터에
+기록하고, 런타임 모드와 다르면 로드하지 않습니다.
+
+사용법:
+    # 오프라인
+    outcomes = load_outcomes("history.csv")
+    calibration = ProbabilityCalibration.fit(outcomes, method="isotonic", by="level")
+    calibration.save()
+
+    # 런타임 (config.USE_PROBABILITY_CALIBRATION = True 이면 rules가 자동 로드)
+    model = AdmissionProbabilityModel(calibration=ProbabilityCalibration.load(mode="linear"))
+"""
+
+import copy
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .admission_model import LEVEL_CODE, LEVEL_CODES
+
+logger = logging.getLogger(__name__)
+
+# 기본 저장 경로 (weights/ 아래 JSON, 런타임 로드 대상)
+DEFAULT_CALIBRATION_PATH = Path(__file__).parent.parent / "weights" / "probability_calibration.json"
+
+# 보정 격자 칸 수 (확률 0.00 ~ 1.00, 0.01 간격)
+CALIBRATION_BINS = 101
+
+CALIBRATION_METHODS = ("isotonic", "platt")
+CALIBRATION_GROUPS = ("level", "program")
+
+# 과거 결과 컬럼
+OUTCOME_COLUMN = "admitted"
+SCORE_COLUMNS = ("student_score", "cutoff_safe", "cutoff_normal", "cutoff_risk")
+
+# 모델 출력 확률 범위 (calculate()의 제한과 동일)
+PROB_MIN, PROB_MAX = 0.01, 0.99
+
+_GRID = np.linspace(0.0, 1.0, CALIBRATION_BINS)
+
+
+# ============================================================
+# 적합 함수
+# ============================================================
+def isotonic_fit(x: np.ndarray, y: np.ndarray, weight: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    단조 증가 회귀 (Pool Adjacent Violators) → 보정 격자 값
+
+    Args:
+        x: 모델 원확률
+        y: 합격 여부 (0/1)
+        weight: 표본 가중치 (None이면 1)
+
+    Returns:
+        (CALIBRATION_BINS,) 격자 보정값 (블록 가중평균 x 위치 사이 선형 보간, 범위 밖은 가장자리 값)
+    """
+    if len(x) == 0:
+        return _GRID.copy()
+
+    order = np.argsort(x, kind="stable")
+    x = np.asarray(x, dtype=np.float64)[order]
+    y = np.asarray(y, dtype=np.float64)[order]
+    w = np.ones_like(x) if weight is None else np.asarray(weight, dtype=np.float64)[order]
+
+    # 같은 x는 먼저 합침 (동점 순서에 결과가 좌우되지 않도록)
+    unique_x, start = np.unique(x, return_index=True)
+    sum_w = np.add.reduceat(w, start)
+    sum_wy = np.add.reduceat(w * y, start)
+    sum_wx = np.add.reduceat(w * x, start)
+
+    # 블록 스택: (가중치 합, 가중 y 합, 가중 x 합)
+    blocks_w, blocks_wy, blocks_wx = [], [], []
+    for bw, bwy, bwx in zip(sum_w, sum_wy, sum_wx):
+        blocks_w.append(bw)
+        blocks_wy.append(bwy)
+        blocks_wx.append(bwx)
+        while len(blocks_w) > 1 and blocks_wy[-2] / blocks_w[-2] >= blocks_wy[-1] / blocks_w[-1]:
+            bw, bwy, bwx = blocks_w.pop(), blocks_wy.pop(), blocks_wx.pop()
+            blocks_w[-1] += bw
+            blocks_wy[-1] += bwy
+            blocks_wx[-1] += bwx
+
+    blocks_w = np.array(blocks_w)
+    knot_x = np.array(blocks_wx) / blocks_w
+    knot_y = np.array(blocks_wy) / blocks_w
+    return np.interp(_GRID, knot_x, knot_y)
+
+
+def platt_fit(
+    x: np.ndarray,
+    y: np.ndarray,
+    weight: Optional[np.ndarray] = None,
+    max_iter: int = 50,
+    tol: float = 1e-10
+) -> Tuple[float, float]:
+    """
+    Platt 보정 P = 1 / (1 + exp(-(a·logit(x) + b))) 의 (a, b) (Newton-Raphson, 2×2 폐형)
+
+    a ≤ 0 (단조성 위반)이면 항등 (1, 0)을 반환합니다.
+    """
+    x = np.clip(np.asarray(x, dtype=np.float64), PROB_MIN, PROB_MAX)
+    y = np.asarray(y, dtype=np.float64)
+    w = np.ones_like(x) if weight is None else np.asarray(weight, dtype=np.float64)
+    f = np.log(x) - np.log1p(-x)
+
+    a, b = 1.0, 0.0
+    for _ in range(max_iter):
+        p = 0.5 * (1.0 + np.tanh(0.5 * (a * f + b)))
+        g = w * (p - y)
+        h = np.maximum(w * p * (1.0 - p), 1e-12)
+        grad = np.array([np.dot(g, f), g.sum()])
+        hess = np.array([[np.dot(h, f * f), np.dot(h, f)], [np.dot(h, f), h.sum()]])
+        try:
+            step = np.linalg.solve(hess, grad)
+        except np.linalg.LinAlgError:
+            break
+        a, b = a - step[0], b - step[1]
+        if np.abs(step).max() < tol:
+            break
+
+    if not (np.isfinite(a) and np.isfinite(b)) or a <= 0:
+        return 1.0, 0.0
+    return float(a), float(b)
+
+
+def platt_table(a: float, b: float) -> np.ndarray:
+    """Platt 계수 → 보정 격자 값 (격자 양끝은 모델 출력 범위로 제한 후 계산)"""
+    grid = np.clip(_GRID, PROB_MIN, PROB_MAX)
+    z = a * (np.log(grid) - np.log1p(-grid)) + b
+    return 0.5 * (1.0 + np.tanh(0.5 * z))
+
+
+def brier_score(probability: np.ndarray, outcome: np.ndarray) -> float:
+    """Brier score (평균 제곱 오차)"""
+    if len(probability) == 0:
+        return float("nan")
+    return float(np.mean((np.asarray(probability) - np.asarray(outcome)) ** 2))
+
+
+# ============================================================
+# 과거 결과
+# ============================================================
+def load_outcomes(path: str) -> pd.DataFrame:
+    """
+    과거 결과 파일 로드 (.parquet 은 pandas parquet 엔진 필요, 그 외 CSV)
+
+    필수 컬럼:
+        admitted (0/1)
+        probability + level  또는  student_score, cutoff_safe, cutoff_normal, cutoff_risk
+    선택 컬럼:
+        program (PERCENTAGE 컬럼명, by="program" 적합 시 사용)
+    """
+    path = Path(path)
+    if path.suffix.lower() in (".parquet", ".pq"):
+        return pd.read_parquet(path)
+    return pd.read_csv(path, encoding="utf-8-sig")
+
+
+def prepare_outcomes(outcomes: pd.DataFrame, model: Optional[Any] = None) -> pd.DataFrame:
+    """
+    과거 결과 → (probability, level_code, admitted[, program]) 정리
+
+    probability가 없으면 보정하지 않은 모델로 다시 계산합니다 (model.calibration은 무시).
+    예상 커트라인이 없는 행(알수없음)과 결과 결측 행은 제외합니다.
+    """
+    if OUTCOME_COLUMN not in outcomes.columns:
+        raise ValueError(f"과거 결과에 '{OUTCOME_COLUMN}' 컬럼이 없습니다")
+
+    if "probability" in outcomes.columns and "level" in outcomes.columns:
+        probability = pd.to_numeric(outcomes["probability"], errors="coerce").to_numpy(dtype=np.float64)
+        level_code = outcomes["level"].map(LEVEL_CODE).fillna(LEVEL_CODE["알수없음"]).to_numpy(dtype=np.uint8)
+    else:
+        missing = [c for c in SCORE_COLUMNS if c not in outcomes.columns]
+        if missing:
+            raise ValueError(f"과거 결과에 확률(probability, level) 또는 점수 컬럼이 없습니다: {missing}")
+
+        from .admission_model import AdmissionProbabilityModel
+
+        # 원확률 = 보정 없는 복사본으로 계산
+        model = copy.copy(model) if model is not None else AdmissionProbabilityModel()
+        model.calibration = None
+        result = model.calculate_many(
+            *(pd.to_numeric(outcomes[c], errors="coerce").to_numpy(dtype=np.float64) for c in SCORE_COLUMNS)
+        )
+        probability, level_code = result.probability, result.level_code
+
+    admitted = pd.to_numeric(outcomes[OUTCOME_COLUMN], errors="coerce").to_numpy(dtype=np.float64)
+    prepared = pd.DataFrame({
+        "probability": probability,
+        "level_code": level_code,
+        "admitted": admitted,
+    })
+    if "program" in outcomes.columns:
+        prepared["program"] = outcomes["program"].astype(str).to_numpy()
+
+    keep = ~np.isnan(probability) & ~np.isnan(admitted) & (level_code != LEVEL_CODE["알수없음"])
+    dropped = int((~keep).sum())
+    if dropped:
+        logger.info(f"보정 적합 제외: {dropped}행 (알수없음/결측)")
+    return prepared[keep].reset_index(drop=True)
+
+
+# ============================================================
+# 보정 테이블
+# ============================================================
+class ProbabilityCalibration:
+    """확률 보정 격자 테이블 (읽기 전용)"""
+
+    FORMAT_VERSION = 1
+
+    def __init__(
+        self,
+        levels: np.ndarray,
+        programs: Optional[Dict[str, np.ndarray]] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ):
+        """
+        Args:
+            levels: (len(LEVEL_CODES), CALIBRATION_BINS) 레벨 코드별 보정 격자
+            programs: {PERCENTAGE 컬럼명: (CALIBRATION_BINS,) 보정 격자}
+            metadata: 적합 방법/표본 수/Brier score 등
+        """
+        programs = programs or {}
+        self.program_names = list(programs)
+        self.table = np.vstack([np.asarray(levels, dtype=np.float64)] + [
+            np.asarray(programs[name], dtype=np.float64) for name in self.program_names
+        ])
+        self.table.setflags(write=False)
+        self._program_row = {name: len(LEVEL_CODES) + i for i, name in enumerate(self.program_names)}
+        self.metadata = metadata or {}
+
+    @classmethod
+    def identity(cls) -> "ProbabilityCalibration":
+        """항등 보정 (모든 레벨 원확률 그대로)"""
+        return cls(np.tile(_GRID, (len(LEVEL_CODES), 1)))
+
+    # ============================================================
+    # 적용
+    # ============================================================
+    def rows_for(self, level_code: np.ndarray, programs: Optional[Sequence[Any]] = None) -> np.ndarray:
+        """원소별 테이블 행 (프로그램 테이블이 있으면 우선, 없으면 레벨 테이블)"""
+        rows = np.asarray(level_code, dtype=np.intp)
+        if programs is None or not self._program_row:
+            return rows
+        program_rows = np.fromiter(
+            (self._program_row.get(str(p), -1) for p in np.asarray(programs, dtype=object).ravel()),
+            dtype=np.intp,
+        ).reshape(np.shape(programs))
+        program_rows = np.broadcast_to(program_rows, rows.shape)
+        return np.where(program_rows >= 0, program_rows, rows)
+
+    def apply(
+        self,
+        probability: np.ndarray,
+        level_code: np.ndarray,
+        programs: Optional[Sequence[Any]] = None
+    ) -> np.ndarray:
+        """
+        원확률 → 보정 확률 (격자 인덱스 산술 + 선형 혼합, PROB_MIN~PROB_MAX 제한)
+
+        Args:
+            probability: 모델 원확률 (반올림 전)
+            level_code: LEVEL_CODES 인덱스 (같은 shape)
+            programs: 원소별 PERCENTAGE 컬럼명 (optional)
+        """
+        probability = np.asarray(probability, dtype=np.float64)
+        rows = self.rows_for(level_code, programs)
+        pos = np.clip(probability, 0.0, 1.0) * (CALIBRATION_BINS - 1)
+        i = np.minimum(pos.astype(np.intp), CALIBRATION_BINS - 2)
+        frac = pos - i
+        left = self.table[rows, i]
+        right = self.table[rows, i + 1]
+        calibrated = left + frac * (right - left)
+        calibrated = np.where(calibrated < PROB_MAX, calibrated, PROB_MAX)
+        return np.where(calibrated > PROB_MIN, calibrated, PROB_MIN)
+
+    def apply_one(self, probability: float, level: str, program: Optional[Any] = None) -> float:
+        """스칼라 적용 (apply()와 같은 연산 → calculate/calculate_many 비트 단위 동일)"""
+        programs = None if program is None else [program]
+        return float(self.apply(np.array([probability]), np.array([LEVEL_CODE[level]]), programs)[0])
+
+    # ============================================================
+    # 적합 (오프라인)
+    # ============================================================
+    @classmethod
+    def fit(
+        cls,
+        outcomes: pd.DataFrame,
+        method: str = "isotonic",
+        by: str = "level",
+        min_samples: int = 50,
+        model: Optional[Any] = None
+    ) -> "ProbabilityCalibration":
+        """
+        과거 결과로 보정 테이블 적합
+
+        Args:
+            outcomes: 과거 결과 (load_outcomes 형식)
+            method: "isotonic" | "platt"
+            by: "level" (레벨별) | "program" (레벨별 + 표본 충분한 프로그램별)
+            min_samples: 그룹별 최소 표본 수
+            model: 원확률 계산 모델 (None이면 AdmissionProbabilityModel)
+                - 모드(model.MODE)를 메타데이터 "model"에 기록
+        """
+        if method not in CALIBRATION_METHODS:
+            raise ValueError(f"지원하지 않는 보정 방법: {method} (가능: {CALIBRATION_METHODS})")
+        if by not in CALIBRATION_GROUPS:
+            raise ValueError(f"지원하지 않는 보정 단위: {by} (가능: {CALIBRATION_GROUPS})")
+
+        data = prepare_outcomes(outcomes, model)
+        if by == "program" and "program" not in data.columns:
+            raise ValueError("by='program' 적합에는 'program' 컬럼이 필요합니다")
+
+        def fit_group(group: pd.DataFrame) -> np.ndarray:
+            x = group["probability"].to_numpy()
+            y = group["admitted"].to_numpy()
+            if method == "isotonic":
+                return isotonic_fit(x, y)
+            return platt_table(*platt_fit(x, y))
+
+        levels = np.tile(_GRID, (len(LEVEL_CODES), 1))
+        samples: Dict[str, int] = {}
+        for code, group in data.groupby("level_code"):
+            level = LEVEL_CODES[int(code)]
+            samples[level] = len(group)
+            if len(group) >= min_samples:
+                levels[int(code)] = fit_group(group)
+            else:
+                logger.info(f"[{level}] 표본 {len(group)}개 < {min_samples} → 항등 보정")
+
+        programs: Dict[str, np.ndarray] = {}
+        if by == "program":
+            for name, group in data.groupby("program"):
+                if len(group) >= min_samples:
+                    programs[str(name)] = fit_group(group)
+
+        from ..config import ENGINE_VERSION
+
+        calibration = cls(levels, programs)
+        calibrated = calibration.apply(
+            data["probability"].to_numpy(),
+            data["level_code"].to_numpy(),
+            data["program"].to_numpy() if "program" in data.columns else None,
+        )
+        calibration.metadata = {
+            "format_version": cls.FORMAT_VERSION,
+            "engine_version": ENGINE_VERSION,
+            "model": getattr(model, "MODE", "linear"),
+            "method": method,
+            "by": by,
+            "min_samples": min_samples,
+            "samples": int(len(data)),
+            "level_samples": samples,
+            "program_tables": len(programs),
+            "brier_before": round(brier_score(data["probability"], data["admitted"]), 6),
+            "brier_after": round(brier_score(calibrated, data["admitted"]), 6),
+            "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        logger.info(
+            f"확률 보정 적합: {method}/{by}, 표본 {len(data)}개, 프로그램 테이블 {len(programs)}개, "
+            f"Brier {calibration.metadata['brier_before']} → {calibration.metadata['brier_after']}"
+        )
+        return calibration
+
+    # ============================================================
+    # 저장/로드
+    # ============================================================
+    def save(self, path: Optional[str] = None) -> Path:
+        """압축 JSON 저장 (격자 값 소수 6자리)"""
+        path = Path(path) if path is not None else DEFAULT_CALIBRATION_PATH
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        levels = len(LEVEL_CODES)
+        data = {
+            "metadata": self.metadata,
+            "bins": CALIBRATION_BINS,
+            "levels": {
+                LEVEL_CODES[code]: np.round(self.table[code], 6).tolist() for code in range(levels)
+            },
+            "programs": {
+                name: np.round(self.table[levels + i], 6).tolist() for i, name in enumerate(self.program_names)
+            },
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, separators=(",", ":"))
+
+        logger.info(f"확률 보정 테이블 저장: {path} (프로그램 {len(self.program_names)}개)")
+        return path
+
+    @classmethod
+    def load(
+        cls,
+        path: Optional[str] = None,
+        mode: Optional[str] = None
+    ) -> Optional["ProbabilityCalibration"]:
+        """
+        보정 테이블 로드
+
+        Args:
+            path: JSON 경로 (None이면 기본 경로)
+            mode: 적용할 확률 모델 모드 (None이면 검사 안 함)
+
+        Returns:
+            ProbabilityCalibration, 파일이 없거나 포맷/격자 크기/모델 모드가 다르면 None
+        """
+        path = Path(path) if path is not None else DEFAULT_CALIBRATION_PATH
+        if not path.exists():
+            return None
+
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        metadata = data.get("metadata", {})
+        if metadata.get("format_version") != cls.FORMAT_VERSION:
+            logger.warning(f"확률 보정 테이블 포맷 불일치: {metadata.get('format_version')}")
+            return None
+        if data.get("bins") != CALIBRATION_BINS:
+            logger.warning(f"확률 보정 테이블 격자 크기 불일치: {data.get('bins')}")
+            return None
+        # model 키가 없는 테이블은 선형 모델 원확률로 적합된 것
+        fitted_mode = metadata.get("model", "linear")
+        if mode is not None and fitted_mode != mode:
+            logger.warning(f"확률 보정 테이블 모델 모드 불일치: {fitted_mode} != {mode} → 미보정")
+            return None
+
+        levels = np.tile(_GRID, (len(LEVEL_CODES), 1))
+        for level, values in data.get("levels", {}).items():
+            if level in LEVEL_CODE:
+                levels[LEVEL_CODE[level]] = values
+        programs = {name: np.asarray(values) for name, values in data.get("programs", {}).items()}
+
+        logger.info(
+            f"확률 보정 테이블 로드: {path} ({fitted_mode}, {metadata.get('method')}/{metadata.get('by')})"
+        )
+        return cls(levels, programs, metadata)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """통계 정보"""
+        return {
+            "model": self.metadata.get("model", "linear"),
+            "method": self.metadata.get("method"),
+            "by": self.metadata.get("by"),
+            "samples": self.metadata.get("samples"),
+            "program_tables": len(self.program_names),
+            "brier_before": self.metadata.get("brier_before"),
+            "brier_after": self.metadata.get("brier_after"),
+            "nbytes": int(self.table.nbytes),
+        }
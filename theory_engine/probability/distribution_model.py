@@ -0,0 +1,372 @@
+"""
+분포 기반 합격 확률 모델 (로지스틱 CDF)
+
+PERCENTAGE 곡선 (누백 p → 점수 s)을 "점수 s 학생의 합격 확률 = 1 - p/100"으로 보고
+프로그램별 로지스틱 CDF  P(s) = 1 / (1 + exp(-(s - location) / scale))  를 맞춥니다.
+
+- 적합: logit(1 - p/100) = (s - location) / scale 의 폐형 최소제곱 (관측점, 누백 1~99%)
+  컴파일 행렬(CompiledPercentage) 1개당 1회, 파라미터는 (C, 3) 배열
+  [location, scale, logit_sd] 로 보관
+- 확률: CDF 폐형 계산 (프로그램 축 벡터화)
+- 신뢰구간: logit 공간 ±1.96·logit_sd (적합 잔차 표준편차, 하한 = 기본 모델 대역 환산값)
+- 레벨: 확률 기준 (≥0.80 적정, ≥0.50 예상, ≥0.20 소신, 그 외 상향)
+  커트라인 20/50/80% 지점이 곧 확률 0.80/0.50/0.20 지점이므로 기존 판정과 같은 축
+
+컬럼 정보 없이 커트라인 3개만 주어지면 (s_적정, 0.80), (s_예상, 0.50), (s_소신, 0.20) 세 점으로
+같은 방식의 적합을 하고, 적합 불가(점 2개 미만, 기울기 ≤ 0)면 기존 구간 선형 규칙을 씁니다.
+
+사용법:
+    model = DistributionProbabilityModel()
+    model.calculate(score, safe, normal, risk)               # ProbabilityResult
+    model.calculate_many(scores, safe, normal, risk)         # ProbabilityArrays
+    model.calculate_rows(scores, compiled, rows)             # 곡선 적합 파라미터 사용
+    model.calculate_from_percentile(student_pct, 50.0)
+"""
+
+import logging
+import math
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .admission_model import (
+    LEVEL_CODE,
+    AdmissionProbabilityModel,
+    ProbabilityArrays,
+    ProbabilityResult,
+    round_like_python,
+)
+
+logger = logging.getLogger(__name__)
+
+# 커트라인 → 목표 확률 (CUTOFF_PERCENTILES 20/50/80 → 1 - p/100)
+CUTOFF_PROBABILITIES = (0.80, 0.50, 0.20)
+
+# 곡선 적합에 쓰는 누백 범위 (0/100%는 logit 발산)
+DEFAULT_FIT_RANGE = (1.0, 99.0)
+
+# calculate_from_percentile: 누백 차이 ±30 → 확률 0.90 / 0.10
+PERCENTILE_DIFF_SCALE = 30.0 / math.log(0.90 / 0.10)
+
+# 확률 → 레벨 경계 (LEVEL_RANGES 하한)
+_LEVEL_THRESHOLDS = ((0.80, "적정"), (0.50, "예상"), (0.20, "소신"))
+
+# 파라미터 열 순서
+PARAM_LOCATION, PARAM_SCALE, PARAM_LOGIT_SD = 0, 1, 2
+
+
+def logit(q: np.ndarray) -> np.ndarray:
+    """log(q / (1 - q))"""
+    return np.log(q) - np.log1p(-q)
+
+
+def logistic_cdf(z: np.ndarray) -> np.ndarray:
+    """1 / (1 + exp(-z)) (큰 |z|에서 overflow 없음)"""
+    return 0.5 * (1.0 + np.tanh(0.5 * np.asarray(z, dtype=np.float64)))
+
+
+def fit_logistic(
+    x: np.ndarray,
+    y: np.ndarray,
+    weight: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    행별 가중 최소제곱 y ≈ a·x + b (폐형, 행 축 벡터화)
+
+    Args:
+        x, y: (R, K) 점수 / logit 확률 (weight=0 위치는 무시, NaN 허용)
+        weight: (R, K) 0/1 사용 여부
+
+    Returns:
+        (location, scale, logit_sd, fitted) — 각 (R,)
+        fitted: 점 2개 이상, 기울기 a > 0 (점수↑ → 확률↑)
+    """
+    w = weight.astype(np.float64)
+    x = np.where(w > 0, x, 0.0)
+    y = np.where(w > 0, y, 0.0)
+    n = w.sum(axis=1)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_mean = (w * x).sum(axis=1) / n
+        y_mean = (w * y).sum(axis=1) / n
+        dx = np.where(w > 0, x - x_mean[:, None], 0.0)
+        dy = np.where(w > 0, y - y_mean[:, None], 0.0)
+        sxx = (dx * dx).sum(axis=1)
+        slope = (dx * dy).sum(axis=1) / sxx
+        intercept = y_mean - slope * x_mean
+
+        residual = np.where(w > 0, y - (slope[:, None] * x + intercept[:, None]), 0.0)
+        dof = np.maximum(n - 2, 1)
+        logit_sd = np.sqrt((residual * residual).sum(axis=1) / dof)
+
+        fitted = (n >= 2) & (sxx > 0) & (slope > 0) & np.isfinite(slope) & np.isfinite(intercept)
+        scale = np.where(fitted, 1.0 / slope, np.nan)
+        location = np.where(fitted, -intercept / slope, np.nan)
+
+    return location, scale, np.where(fitted, logit_sd, np.nan), fitted
+
+
+@dataclass(frozen=True)
+class ProgramDistributions:
+    """프로그램별 로지스틱 CDF 파라미터 (CompiledPercentage 행 순서)"""
+    params: np.ndarray          # (C, 3) location, scale, logit_sd
+    fitted: np.ndarray          # (C,) 적합 성공 여부
+    fit_range: Tuple[float, float] = DEFAULT_FIT_RANGE
+
+    @classmethod
+    def fit(
+        cls,
+        compiled: Any,
+        fit_range: Tuple[float, float] = DEFAULT_FIT_RANGE
+    ) -> "ProgramDistributions":
+        """
+        컴파일 행렬의 관측점으로 프로그램별 적합 (1회)
+
+        Args:
+            compiled: CompiledPercentage (percentiles, scores, observed)
+            fit_range: 사용할 누백 범위 [lo, hi]
+        """
+        pct = compiled.percentiles
+        lo, hi = fit_range
+        in_range = (pct >= lo) & (pct <= hi)
+        y = logit(1.0 - pct[in_range] / 100.0)
+        x = compiled.scores[:, in_range]
+        weight = compiled.observed[:, in_range]
+
+        location, scale, logit_sd, fitted = fit_logistic(x, np.broadcast_to(y, x.shape), weight)
+        params = np.column_stack([location, scale, logit_sd])
+        params.setflags(write=False)
+        fitted.setflags(write=False)
+
+        logger.info(
+            f"로지스틱 분포 적합: {int(fitted.sum())}/{len(fitted)}개 프로그램 "
+            f"(누백 {lo}~{hi}%, logit 잔차 중앙값 {np.nanmedian(logit_sd) if fitted.any() else float('nan'):.3f})"
+        )
+        return cls(params=params, fitted=fitted, fit_range=(float(lo), float(hi)))
+
+    def __len__(self) -> int:
+        return len(self.fitted)
+
+
+class DistributionProbabilityModel(AdmissionProbabilityModel):
+    """로지스틱 CDF 기반 합격 확률 모델"""
+
+    MODE = "distribution"
+
+    def __init__(
+        self,
+        uncertainty: float = 0.10,
+        fit_range: Tuple[float, float] = DEFAULT_FIT_RANGE,
+        min_logit_sd: Optional[float] = None,
+        calibration: Optional[Any] = None
+    ):
+        """
+        Args:
+            uncertainty: 기본 모델 불확실성 (min_logit_sd 기본값 계산용)
+            fit_range: 곡선 적합 누백 범위
+            min_logit_sd: 신뢰구간 logit 표준편차 하한
+                (None이면 확률 0.5 지점에서 기본 모델 대역 ±1.96·uncertainty와 같은 폭:
+                 dP/dlogit = 0.25 → uncertainty / 0.25)
+            calibration: 확률 보정 테이블 (확률/신뢰구간만 보정, 레벨은 보정 전 확률 기준)
+        """
+        super().__init__(uncertainty, calibration)
+        self.fit_range = fit_range
+        self.min_logit_sd = uncertainty / 0.25 if min_logit_sd is None else min_logit_sd
+        # 마지막으로 적합한 (컴파일 행렬, 파라미터) — 튜플 교체는 원자적
+        self._fitted: Optional[Tuple[Any, ProgramDistributions]] = None
+
+    # ============================================================
+    # 곡선 적합
+    # ============================================================
+    def distributions(self, compiled: Any) -> ProgramDistributions:
+        """컴파일 행렬별 적합 파라미터 (같은 행렬이면 재사용)"""
+        fitted = self._fitted
+        if fitted is not None and fitted[0] is compiled:
+            return fitted[1]
+        result = ProgramDistributions.fit(compiled, self.fit_range)
+        self._fitted = (compiled, result)
+        return result
+
+    def _fit_cutoffs(
+        self,
+        safe: np.ndarray,
+        normal: np.ndarray,
+        risk: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """커트라인 3점 적합 (NaN·0 커트라인은 제외, 기본 모델과 같은 판정)"""
+        x = np.column_stack([safe, normal, risk])
+        weight = ~np.isnan(x) & (x != 0)
+        y = logit(np.array(CUTOFF_PROBABILITIES))
+        return fit_logistic(x, np.broadcast_to(y, x.shape), weight)
+
+    # ============================================================
+    # 확률 계산
+    # ============================================================
+    def _evaluate(
+        self,
+        scores: np.ndarray,
+        location: np.ndarray,
+        scale: np.ndarray,
+        logit_sd: np.ndarray,
+        programs: Optional[np.ndarray] = None,
+        calibrate: bool = True
+    ) -> ProbabilityArrays:
+        """CDF 폐형 계산 → 확률/레벨/신뢰구간 (calibrate=False: 누백 기반처럼 보정 대상 아님)"""
+        z = (scores - location) / scale
+        z = np.where(np.isnan(z), -np.inf, z)   # 점수 없음 → 최하단
+        band = 1.96 * np.fmax(logit_sd, self.min_logit_sd)
+        prob = np.clip(logistic_cdf(z), 0.01, 0.99)
+        ci_low = logistic_cdf(z - band)
+        ci_high = logistic_cdf(z + band)
+
+        probability = round_like_python(prob, 4)
+        level_code = np.full(prob.shape, LEVEL_CODE["상향"], dtype=np.uint8)
+        for threshold, level in reversed(_LEVEL_THRESHOLDS):
+            level_code[probability >= threshold] = LEVEL_CODE[level]
+
+        if calibrate and self.calibration is not None:
+            prob, ci_low, ci_high = (
+                self.calibration.apply(values, level_code, programs) for values in (prob, ci_low, ci_high)
+            )
+            probability = round_like_python(prob, 4)
+
+        return ProbabilityArrays(
+            probability=probability,
+            level_code=level_code,
+            confidence_low=round_like_python(np.fmin(ci_low, prob), 4),
+            confidence_high=round_like_python(np.fmax(ci_high, prob), 4),
+        )
+
+    def calculate_many(
+        self,
+        student_scores,
+        cutoff_safe,
+        cutoff_normal,
+        cutoff_risk,
+        programs: Optional[Sequence[Any]] = None
+    ) -> ProbabilityArrays:
+        """
+        커트라인 3점 적합 기반 일괄 계산
+
+        예상 커트라인 없음 → 알수없음, 적합 불가 → 기존 구간 선형 규칙
+        """
+        score, safe, normal, risk = np.broadcast_arrays(
+            *(np.asarray(v, dtype=np.float64) for v in (student_scores, cutoff_safe, cutoff_normal, cutoff_risk))
+        )
+        shape = score.shape
+        score, safe, normal, risk = (a.ravel() for a in (score, safe, normal, risk))
+        if programs is not None:
+            programs = np.broadcast_to(np.asarray(programs, dtype=object), shape).ravel()
+
+        result = self._calculate_many_linear(score, safe, normal, risk, programs)
+        location, scale, logit_sd, fitted = self._fit_cutoffs(safe, normal, risk)
+        use = fitted & ~np.isnan(normal)
+        if use.any():
+            self._merge(result, use, self._evaluate(
+                score[use], location[use], scale[use], logit_sd[use],
+                None if programs is None else programs[use]
+            ))
+        return _reshape(result, shape)
+
+    def calculate_rows(
+        self,
+        student_scores: np.ndarray,
+        compiled: Any,
+        rows: Sequence[int]
+    ) -> ProbabilityArrays:
+        """
+        곡선 적합 파라미터 기반 일괄 계산 (프로그램 = 컴파일 행)
+
+        적합 실패 행은 커트라인 3점 경로(calculate_many)로 계산합니다.
+        """
+        rows = np.asarray(rows, dtype=np.intp)
+        scores = np.asarray(student_scores, dtype=np.float64)
+        cutoffs = compiled.cutoffs[rows]
+        programs = None
+        if self.calibration is not None:
+            programs = np.asarray(compiled.columns, dtype=object)[rows]
+        result = self.calculate_many(scores, cutoffs[:, 0], cutoffs[:, 1], cutoffs[:, 2], programs)
+
+        dist = self.distributions(compiled)
+        use = dist.fitted[rows]
+        if use.any():
+            params = dist.params[rows[use]]
+            self._merge(result, use, self._evaluate(
+                scores[use], params[:, PARAM_LOCATION], params[:, PARAM_SCALE], params[:, PARAM_LOGIT_SD],
+                None if programs is None else programs[use]
+            ))
+        return result
+
+    def calculate(
+        self,
+        student_score: float,
+        cutoff_safe: Optional[float],
+        cutoff_normal: Optional[float],
+        cutoff_risk: Optional[float],
+        program: Optional[Any] = None
+    ) -> ProbabilityResult:
+        """합격 확률 계산 (커트라인 3점 적합)"""
+        def arr(value: Optional[float]) -> np.ndarray:
+            return np.array([np.nan if value is None else float(value)])
+
+        return self.calculate_many(
+            arr(student_score), arr(cutoff_safe), arr(cutoff_normal), arr(cutoff_risk),
+            None if program is None else [program]
+        ).result_at(0)
+
+    def calculate_column(
+        self,
+        student_score: float,
+        compiled: Any,
+        column: Any
+    ) -> Optional[ProbabilityResult]:
+        """PERCENTAGE 컬럼 1개 (곡선 적합 파라미터), 컬럼 없으면 None"""
+        row = compiled.row_of(column)
+        if row is None:
+            return None
+        return self.calculate_rows(np.array([float(student_score)]), compiled, [row]).result_at(0)
+
+    def calculate_from_percentile_many(
+        self,
+        student_percentiles,
+        target_cutoff_percentiles=50.0
+    ) -> ProbabilityArrays:
+        """누백 기반 일괄 계산 (누백 차이 ±30 → 0.90/0.10 로지스틱)"""
+        diff = np.asarray(student_percentiles, dtype=np.float64) - np.asarray(
+            target_cutoff_percentiles, dtype=np.float64
+        )
+        shape = diff.shape
+        diff = diff.ravel()
+        result = self._evaluate(
+            diff, np.zeros_like(diff), np.full_like(diff, PERCENTILE_DIFF_SCALE), np.zeros_like(diff),
+            calibrate=False
+        )
+        return _reshape(result, shape)
+
+    def calculate_from_percentile(
+        self,
+        student_percentile: float,
+        target_cutoff_percentile: float = 50.0
+    ) -> ProbabilityResult:
+        """누백 기반 확률 계산 (로지스틱 CDF)"""
+        return self.calculate_from_percentile_many(
+            np.array([float(student_percentile)]), np.array([float(target_cutoff_percentile)])
+        ).result_at(0)
+
+    @staticmethod
+    def _merge(result: ProbabilityArrays, mask: np.ndarray, part: ProbabilityArrays) -> None:
+        """mask 위치를 part 값으로 교체"""
+        result.probability[mask] = part.probability
+        result.level_code[mask] = part.level_code
+        result.confidence_low[mask] = part.confidence_low
+        result.confidence_high[mask] = part.confidence_high
+
+
+def _reshape(result: ProbabilityArrays, shape: Tuple[int, ...]) -> ProbabilityArrays:
+    return ProbabilityArrays(
+        probability=result.probability.reshape(shape),
+        level_code=result.level_code.reshape(shape),
+        confidence_low=result.confidence_low.reshape(shape),
+        confidence_high=result.confidence_high.reshape(shape),
+    )
@@ -4,7 +4,7 @@ Theory Engine 룰 엔진 v3
 - RAWSCORE 변환: convert_raw_to_standard()
 - INDEX 조회: lookup_index() - MultiIndex + Fuzzy
 - PERCENTAGE 조회: lookup_percentage()
-- RESTRICT 체크: check_disqualification()
+- RESTRICT 체크: check_disqualification(), check_disqualification_matrix() (학생 × 대상)
 - 확률 계산: calculate_probability()
 - 전체 파이프라인: compute_theory_result()
 
@@ -16,14 +16,27 @@ Theory Engine 룰 엔진 v3
 - DisqualificationEngine: 결격 룰 엔진
 """
 
+import copy
+import functools
+import numpy as np
 import pandas as pd
 import logging
+import threading
 import time
-from typing import Dict, List, Optional, Any
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple
 
 from .config import (
     PERCENTAGE_INTERPOLATION_POLICY,
+    PERCENTAGE_GRID_STEP,
+    PERCENTAGE_GRID_DTYPE,
+    PROBABILITY_MODE,
+    DISTRIBUTION_FIT_RANGE,
+    USE_PROBABILITY_CALIBRATION,
     INDEX_NOT_FOUND_POLICY,
+    PROFILE_CACHE_MAX_SIZE,
+    USE_PRECOMPUTED_RAWSCORE,
+    METRICS_ENABLED,
     InterpolationPolicy,
 )
 from .constants import (
@@ -46,10 +59,18 @@ from .model import (
 
 # 새 모듈 임포트
 from .matchers import SubjectMatcher
-from .optimizers import IndexOptimizer, get_index_fallback
+from .optimizers import IndexOptimizer, RawscoreTable, get_index_fallback
 from .cutoff import CutoffExtractor
-from .probability import AdmissionProbabilityModel
-from .disqualification import DisqualificationEngine
+from .loader import percentage_store_for
+from .probability import AdmissionProbabilityModel, DistributionProbabilityModel, ProbabilityCalibration
+from .disqualification import (
+    DisqualificationEngine,
+    DisqualificationMatrix,
+    RestrictTable,
+    merge_disqualification,
+)
+from .disqualification.restrict_compiler import RESTRICT_VIOLATIONS
+from .metrics import get_conversion_metrics, conversion_stage
 
 logger = logging.getLogger(__name__)
 
@@ -60,6 +81,24 @@ _cutoff_extractor: Optional[CutoffExtractor] = None
 _probability_model: Optional[AdmissionProbabilityModel] = None
 _disqualification_engine: Optional[DisqualificationEngine] = None
 
+# DataFrame별 인스턴스의 원본 (다른 DataFrame이 들어오면 재구축)
+_index_optimizer_source: Optional[pd.DataFrame] = None
+_cutoff_extractor_source: Optional[pd.DataFrame] = None
+_cutoff_extractor_lock = threading.Lock()
+_restrict_table: Optional[RestrictTable] = None
+_restrict_table_source: Optional[pd.DataFrame] = None
+_restrict_table_lock = threading.Lock()
+
+# RAWSCORE 사전계산 테이블 (None: 미로드, False: 사용 불가)
+_rawscore_table: Any = None
+_rawscore_table_source: Optional[pd.DataFrame] = None  # 지문 검증을 통과한 DataFrame
+_rawscore_table_mismatch: Optional[pd.DataFrame] = None  # 지문 불일치로 판정된 DataFrame
+
+# 프로필 단위 캐시: 점수 관련 필드 → raw_components (변환 + INDEX 결과)
+_profile_cache: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+_profile_cache_sources: Tuple = ()
+_profile_cache_lock = threading.Lock()
+
 
 def get_subject_matcher() -> SubjectMatcher:
     """SubjectMatcher 싱글톤"""
@@ -70,10 +109,23 @@ def get_subject_matcher() -> SubjectMatcher:
 
 
 def get_probability_model() -> AdmissionProbabilityModel:
-    """AdmissionProbabilityModel 싱글톤"""
+    """
+    확률 모델 싱글톤 (config.PROBABILITY_MODE: "linear" | "distribution")
+
+    config.USE_PROBABILITY_CALIBRATION이면 보정 테이블을 함께 로드합니다.
+    """
     global _probability_model
     if _probability_model is None:
-        _probability_model = AdmissionProbabilityModel()
+        calibration = None
+        if USE_PROBABILITY_CALIBRATION:
+            # 다른 모드의 원확률로 적합한 테이블은 적용하지 않음
+            calibration = ProbabilityCalibration.load(mode=PROBABILITY_MODE)
+        if PROBABILITY_MODE == "distribution":
+            _probability_model = DistributionProbabilityModel(
+                fit_range=DISTRIBUTION_FIT_RANGE, calibration=calibration
+            )
+        else:
+            _probability_model = AdmissionProbabilityModel(calibration=calibration)
     return _probability_model
 
 
@@ -87,27 +139,54 @@ def get_disqualification_engine() -> DisqualificationEngine:
 
 def get_index_optimizer(index_df: pd.DataFrame) -> IndexOptimizer:
     """IndexOptimizer (DataFrame별 인스턴스)"""
-    global _index_optimizer
-    if _index_optimizer is None:
+    global _index_optimizer, _index_optimizer_source
+    if _index_optimizer is None or _index_optimizer_source is not index_df:
         _index_optimizer = IndexOptimizer(index_df)
+        _index_optimizer_source = index_df
     return _index_optimizer
 
 
 def get_cutoff_extractor(percentage_df: pd.DataFrame) -> CutoffExtractor:
-    """CutoffExtractor (DataFrame별 인스턴스)"""
-    global _cutoff_extractor
-    if _cutoff_extractor is None:
-        _cutoff_extractor = CutoffExtractor(percentage_df)
-    return _cutoff_extractor
+    """
+    CutoffExtractor (DataFrame별 인스턴스)
+
+    load_workbook()으로 읽은 시트면 캐시된 PERCENTAGE 저장소의 프로그램 파싱 결과를 재사용합니다.
+    """
+    global _cutoff_extractor, _cutoff_extractor_source
+    with _cutoff_extractor_lock:
+        # 동시 호출 시 1회만 구축 (인스턴스 자체는 스레드 간 공유 가능)
+        if _cutoff_extractor is None or _cutoff_extractor_source is not percentage_df:
+            _cutoff_extractor = CutoffExtractor(
+                percentage_df, grid_step=PERCENTAGE_GRID_STEP, grid_dtype=PERCENTAGE_GRID_DTYPE,
+                store=percentage_store_for(percentage_df),
+            )
+            _cutoff_extractor_source = percentage_df
+        return _cutoff_extractor
+
+
+def get_restrict_table(restrict_df: Optional[pd.DataFrame]) -> Optional[RestrictTable]:
+    """RESTRICT 룰 테이블 (DataFrame별 1회 컴파일, 시트가 비었거나 블록이 없으면 None)"""
+    global _restrict_table, _restrict_table_source
+    if restrict_df is None or restrict_df.empty:
+        return None
+    with _restrict_table_lock:
+        if _restrict_table_source is not restrict_df:
+            table = RestrictTable.compile(restrict_df)
+            _restrict_table = table if len(table) else None
+            _restrict_table_source = restrict_df
+        return _restrict_table
 
 
 # ============================================================
 # 과목명 정규화 (SubjectMatcher 활용)
 # ============================================================
+@functools.lru_cache(maxsize=4096)
 def normalize_subject(subject: str) -> str:
     """
     과목명 정규화
 
+    RAWSCORE 시트의 영역/과목명 컬럼 전체에 반복 적용되므로 결과를 메모이즈합니다.
+
     Args:
         subject: 입력 과목명 (예: "물리학1", "화학I")
 
@@ -125,6 +204,56 @@ def normalize_subject(subject: str) -> str:
         return canonical
 
 
+def _normalize_column(series: pd.Series) -> pd.Series:
+    """컬럼 전체 과목명 정규화 (고유값 단위로 1회씩, 결측은 "")"""
+    mapping = {x: normalize_subject(str(x)) for x in series.dropna().unique()}
+    return series.map(mapping).fillna("")
+
+
+# ============================================================
+# RAWSCORE 사전계산 테이블
+# ============================================================
+def set_rawscore_table(table: Optional[RawscoreTable]) -> None:
+    """
+    RAWSCORE 사전계산 테이블 지정 (None이면 기본 경로에서 다시 로드)
+
+    변환 결과가 바뀔 수 있으므로 프로필 캐시도 함께 초기화합니다.
+    """
+    global _rawscore_table, _rawscore_table_source, _rawscore_table_mismatch
+    _rawscore_table = table
+    _rawscore_table_source = None
+    _rawscore_table_mismatch = None
+    clear_profile_cache()
+
+
+def get_rawscore_table(rawscore_df: pd.DataFrame) -> Optional[RawscoreTable]:
+    """
+    주어진 RAWSCORE 시트에 사용할 사전계산 테이블
+
+    테이블의 지문이 시트와 다르면(엑셀 재배포 등) None을 반환하여
+    기존 다단계 매칭을 사용하게 합니다. 지문 검증(일치/불일치 모두)은
+    DataFrame별 1회만 수행합니다.
+    """
+    global _rawscore_table, _rawscore_table_source, _rawscore_table_mismatch
+    if not USE_PRECOMPUTED_RAWSCORE:
+        return None
+
+    if _rawscore_table is None:
+        _rawscore_table = RawscoreTable.load() or False
+    if _rawscore_table is False:
+        return None
+
+    if _rawscore_table_source is not rawscore_df:
+        if _rawscore_table_mismatch is rawscore_df:
+            return None
+        if not _rawscore_table.matches(rawscore_df):
+            logger.warning("RAWSCORE 사전계산 테이블 지문 불일치 → 다단계 매칭 사용")
+            _rawscore_table_mismatch = rawscore_df
+            return None
+        _rawscore_table_source = rawscore_df
+    return _rawscore_table
+
+
 # ============================================================
 # RAWSCORE 변환 (v2: 다단계 매칭)
 # ============================================================
@@ -133,7 +262,8 @@ def convert_raw_to_standard(
     subject: str,
     raw_score: int,
     raw_common: Optional[int] = None,
-    raw_select: Optional[int] = None
+    raw_select: Optional[int] = None,
+    use_table: bool = True
 ) -> Dict[str, Any]:
     """
     원점수 → 표준점수/백분위/등급 변환 (v2: 다단계 매칭)
@@ -150,18 +280,49 @@ def convert_raw_to_standard(
         raw_score: 총 원점수
         raw_common: 공통 원점수 (optional)
         raw_select: 선택 원점수 (optional)
+        use_table: 사전계산 테이블 사용 여부 (테이블 구축 시 False)
 
     Returns:
         {
             "found": bool,
             "key": str,
             "match_type": str,  # stage1_영역, stage2_과목명, stage3_탐구영역, stage4_fuzzy
+            "source": str,      # "precomputed" | "rawscore"
             "standard_score": int,
             "percentile": float,
             "grade": int,
             "cumulative_pct": float,
         }
     """
+    if not METRICS_ENABLED:
+        return _convert_raw_to_standard(
+            rawscore_df, subject, raw_score, raw_common, raw_select, use_table
+        )
+
+    # 단계별 적중 횟수/지연시간 계측
+    start = time.perf_counter()
+    result = _convert_raw_to_standard(
+        rawscore_df, subject, raw_score, raw_common, raw_select, use_table
+    )
+    get_conversion_metrics().record(
+        conversion_stage(result),
+        (time.perf_counter() - start) * 1000.0,
+        subject=subject,
+        raw_score=raw_score,
+        match_type=result.get("match_type"),
+    )
+    return result
+
+
+def _convert_raw_to_standard(
+    rawscore_df: pd.DataFrame,
+    subject: str,
+    raw_score: int,
+    raw_common: Optional[int],
+    raw_select: Optional[int],
+    use_table: bool
+) -> Dict[str, Any]:
+    """convert_raw_to_standard() 본체 (계측 제외)"""
     # 과목명 정규화
     normalized_subject = normalize_subject(subject)
 
@@ -171,6 +332,24 @@ def convert_raw_to_standard(
     else:
         key = f"{normalized_subject}-{raw_score}"
 
+    # 사전계산 테이블: 담당 과목이면 테이블 결과가 최종 (퍼지 단계 미실행, 범위 밖 입력은 즉시 실패)
+    table = get_rawscore_table(rawscore_df) if use_table else None
+    if table is not None and table.covers(normalized_subject):
+        hit = table.lookup(normalized_subject, raw_score, raw_common, raw_select)
+        if hit is not None:
+            return hit
+        logger.warning(f"RAWSCORE 조회 실패: {key} (precomputed)")
+        return {
+            "found": False,
+            "key": key,
+            "match_type": None,
+            "source": "precomputed",
+            "standard_score": None,
+            "percentile": None,
+            "grade": None,
+            "cumulative_pct": None,
+        }
+
     result_df = pd.DataFrame()
     match_type = None
 
@@ -179,9 +358,7 @@ def convert_raw_to_standard(
     # ============================================================
     if "영역" in rawscore_df.columns:
         # 정규화된 과목명으로 매칭
-        mask1 = rawscore_df["영역"].apply(
-            lambda x: normalize_subject(str(x)) if pd.notna(x) else ""
-        ) == normalized_subject
+        mask1 = _normalize_column(rawscore_df["영역"]) == normalized_subject
 
         if mask1.any():
             # 원점수 매칭 (공통/선택 or 단일)
@@ -201,9 +378,7 @@ def convert_raw_to_standard(
     # ============================================================
     if result_df.empty and "과목명" in rawscore_df.columns:
         # 과목명 정규화 매칭
-        mask2 = rawscore_df["과목명"].apply(
-            lambda x: normalize_subject(str(x)) if pd.notna(x) else ""
-        ) == normalized_subject
+        mask2 = _normalize_column(rawscore_df["과목명"]) == normalized_subject
 
         if mask2.any():
             # 원점수 매칭
@@ -219,16 +394,12 @@ def convert_raw_to_standard(
     # ============================================================
     if result_df.empty and "영역" in rawscore_df.columns and "과목명" in rawscore_df.columns:
         # 탐구 영역 필터
-        탐구_mask = rawscore_df["영역"].apply(
-            lambda x: str(x).strip() if pd.notna(x) else ""
-        ) == "탐구"
+        탐구_mask = rawscore_df["영역"].fillna("").astype(str).str.strip() == "탐구"
         탐구_df = rawscore_df[탐구_mask].copy()
 
         if not 탐구_df.empty:
             # 과목명 정규화 후 매칭
-            탐구_df["_normalized"] = 탐구_df["과목명"].apply(
-                lambda x: normalize_subject(str(x)) if pd.notna(x) else ""
-            )
+            탐구_df["_normalized"] = _normalize_column(탐구_df["과목명"])
 
             # 완전 매칭
             mask3 = 탐구_df["_normalized"] == normalized_subject
@@ -244,18 +415,26 @@ def convert_raw_to_standard(
                 matcher = get_subject_matcher()
                 input_canonical, _ = matcher.match(normalized_subject)
 
-                for idx, row in 탐구_df.iterrows():
-                    과목명_raw = row.get("과목명", "")
-                    if pd.isna(과목명_raw):
-                        continue
-                    과목명_canonical, confidence = matcher.match(str(과목명_raw))
-                    원점수 = row.get("원점수", -1)
-
-                    if 과목명_canonical == input_canonical and 원점수 == raw_score:
-                        result_df = 탐구_df.loc[[idx]]
-                        match_type = f"stage3_fuzzy(conf={confidence:.0f})"
-                        logger.debug(f"Stage 3 Fuzzy 성공: {key} ({match_type})")
-                        break
+                # 과목명별 매칭 결과 (고유값 단위) → 첫 번째 일치 행
+                matched = {
+                    name: matcher.match(str(name))
+                    for name in 탐구_df["과목명"].dropna().unique()
+                }
+                canonical_col = 탐구_df["과목명"].map(
+                    {name: canonical for name, (canonical, _) in matched.items()}
+                )
+                mask3f = canonical_col == input_canonical
+                if "원점수" in 탐구_df.columns:
+                    mask3f = mask3f & (탐구_df["원점수"] == raw_score)
+                else:
+                    mask3f = mask3f & (raw_score == -1)
+
+                if mask3f.any():
+                    idx = mask3f.idxmax()
+                    confidence = matched[탐구_df.at[idx, "과목명"]][1]
+                    result_df = 탐구_df.loc[[idx]]
+                    match_type = f"stage3_fuzzy(conf={confidence:.0f})"
+                    logger.debug(f"Stage 3 Fuzzy 성공: {key} ({match_type})")
 
     # ============================================================
     # Stage 4: 전체 퍼지 매칭 (최후 수단)
@@ -305,6 +484,7 @@ def convert_raw_to_standard(
             "found": False,
             "key": key,
             "match_type": None,
+            "source": "rawscore",
             "standard_score": None,
             "percentile": None,
             "grade": None,
@@ -332,6 +512,7 @@ def convert_raw_to_standard(
         "found": True,
         "key": key,
         "match_type": match_type,
+        "source": "rawscore",
         "standard_score": safe_get(row, ["202511(가채점)", "표준점수", "standard_score"], 6),
         "percentile": safe_get(row, ["백분위", "percentile"], 7),
         "grade": safe_get(row, ["등급", "grade"], 8),
@@ -399,6 +580,25 @@ def lookup_index(
     return result
 
 
+def lookup_index_many(
+    index_df: pd.DataFrame,
+    keys: np.ndarray,
+    track: str
+) -> Dict[str, Any]:
+    """
+    표준점수 조합 일괄 INDEX 조회 (lookup_index와 같은 근사 매칭, 로그 없음)
+
+    Args:
+        index_df: INDEX 시트 DataFrame
+        keys: (K, 4) 국어/수학/탐구1/탐구2 표준점수
+        track: 계열
+
+    Returns:
+        {"found": (K,) bool, "exact": (K,) bool, "cumulative_pct": (K,) float}
+    """
+    return get_index_optimizer(index_df).lookup_many(keys, track, fuzzy=True)
+
+
 # ============================================================
 # PERCENTAGE 조회 (CutoffExtractor 활용)
 # ============================================================
@@ -419,7 +619,7 @@ def lookup_percentage(
         major: 전공명
         percentile: 누적백분위
         track: 계열 (optional)
-        policy: 보간 정책
+        policy: 보간 정책 (MONOTONE_CUBIC이면 단조 3차, 그 외는 선형 보간)
 
     Returns:
         {
@@ -436,38 +636,16 @@ def lookup_percentage(
     """
     extractor = get_cutoff_extractor(percentage_df)
 
-    # 커트라인 추출
-    cutoff_result = extractor.extract_cutoffs(university, major, track)
-
-    if not cutoff_result.get("found", False):
+    # 컬럼 매칭 1회로 커트라인 + 환산점수 + 보간 정보 (불변 결과 → 스레드 안전)
+    method = (
+        InterpolationPolicy.MONOTONE_CUBIC.value
+        if policy == InterpolationPolicy.MONOTONE_CUBIC
+        else InterpolationPolicy.LINEAR.value
+    )
+    resolution = extractor.resolve(university, major, track, percentile, method)
+    if not resolution.found:
         logger.warning(f"PERCENTAGE에서 {university}{major} 찾을 수 없음")
-        return {
-            "found": False,
-            "score": None,
-            "cutoff_safe": None,
-            "cutoff_normal": None,
-            "cutoff_risk": None,
-            "column": None,
-            "match_info": cutoff_result.get("match_info", {}) if cutoff_result else {},
-            "interpolated": None,
-            "interpolation_method": None,
-        }
-
-    # 해당 누백에서의 점수 조회
-    score = extractor.get_score_at_percentile(university, major, percentile, track)
-    score_lookup = getattr(extractor, "_last_score_lookup", {}) or {}
-
-    return {
-        "found": True,
-        "score": score,
-        "cutoff_safe": cutoff_result.get("cutoff_safe"),
-        "cutoff_normal": cutoff_result.get("cutoff_normal"),
-        "cutoff_risk": cutoff_result.get("cutoff_risk"),
-        "column": cutoff_result.get("column"),
-        "match_info": cutoff_result.get("match_info", {}),
-        "interpolated": score_lookup.get("interpolated"),
-        "interpolation_method": score_lookup.get("interpolation_method"),
-    }
+    return resolution.to_dict()
 
 
 # ============================================================
@@ -477,22 +655,63 @@ def check_disqualification(
     restrict_df: pd.DataFrame,
     profile: StudentProfile,
     target: TargetProgram,
-    severity_threshold: int = 2
+    severity_threshold: int = 2,
+    explain: bool = True
 ) -> DisqualificationInfo:
     """
-    결격 사유 확인 (DisqualificationEngine 활용)
+    결격 사유 확인 (DisqualificationEngine + RESTRICT 시트 룰)
+
+    엔진 결격이 있으면 엔진 사유가 주 사유이고, RESTRICT 룰 ID는 rules_triggered 뒤에 붙습니다.
 
     Args:
-        restrict_df: RESTRICT 시트 DataFrame (현재 미사용, 향후 동적 룰 로딩용)
+        restrict_df: RESTRICT 시트 DataFrame (비었으면 엔진 룰만 적용)
         profile: 학생 프로필
         target: 지원 대학/전형
         severity_threshold: 심각도 임계값 (2=심각한 것만)
+        explain: False면 사유 메시지 생략 (판정만 필요할 때)
 
     Returns:
         DisqualificationInfo
     """
     engine = get_disqualification_engine()
-    return engine.check(profile, target, severity_threshold)
+    result = engine.check(profile, target, severity_threshold, explain=explain)
+    table = get_restrict_table(restrict_df)
+    if table is None:
+        return result
+    return merge_disqualification(result, table.check(profile, target, severity_threshold, explain=explain))
+
+
+def check_disqualification_matrix(
+    restrict_df: Optional[pd.DataFrame],
+    profiles: List[StudentProfile],
+    targets: List[TargetProgram],
+    severity_threshold: int = 2
+) -> DisqualificationMatrix:
+    """
+    학생 S명 × 대상 T개 결격 행렬 (코호트 리포트용)
+
+    셀 (i, j)는 check_disqualification(restrict_df, profiles[i], targets[j])와 같은 판정이고,
+    rule_code는 그 주 결격 룰 (엔진 룰 우선, 엔진 통과 시 RESTRICT 첫 위반).
+    50K × 1100 기준 결과 2개 (bool + uint8) 약 110MB, 계산 임시 배열은 청크 크기로 제한.
+
+    Returns:
+        DisqualificationMatrix (rule_ids = 엔진 룰 + RESTRICT_* 룰)
+    """
+    engine = get_disqualification_engine()
+    matrix = engine.check_matrix(profiles, targets, severity_threshold)
+    table = get_restrict_table(restrict_df)
+    if table is None or severity_threshold > 2:
+        return matrix
+
+    # 엔진 통과 셀에만 RESTRICT 위반 번호 기록 (청크 단위, 제자리)
+    table.evaluate_matrix(profiles, targets, out=matrix.rule_code, offset=len(matrix.rule_ids))
+    np.not_equal(matrix.rule_code, 0, out=matrix.disqualified)
+    return DisqualificationMatrix(
+        disqualified=matrix.disqualified,
+        rule_code=matrix.rule_code,
+        rule_ids=matrix.rule_ids + tuple(rule_id for rule_id, _, _ in RESTRICT_VIOLATIONS),
+        codes=matrix.codes + tuple(code for _, code, _ in RESTRICT_VIOLATIONS),
+    )
 
 
 # ============================================================
@@ -502,7 +721,9 @@ def calculate_probability(
     student_score: float,
     cutoff_safe: Optional[float],
     cutoff_normal: Optional[float],
-    cutoff_risk: Optional[float]
+    cutoff_risk: Optional[float],
+    percentage_df: Optional[pd.DataFrame] = None,
+    column: Optional[Any] = None
 ) -> Dict[str, Any]:
     """
     합격 확률 계산
@@ -512,6 +733,9 @@ def calculate_probability(
         cutoff_safe: 적정 커트라인 (80%)
         cutoff_normal: 예상 커트라인 (50%)
         cutoff_risk: 소신 커트라인 (20%)
+        percentage_df / column: PERCENTAGE 시트와 매칭 컬럼
+            (분포 모드에서 주어지면 해당 컬럼 곡선에 적합한 분포 사용,
+             보정 테이블 사용 시 컬럼별 보정 테이블 조회)
 
     Returns:
         {
@@ -522,7 +746,13 @@ def calculate_probability(
         }
     """
     model = get_probability_model()
-    result = model.calculate(student_score, cutoff_safe, cutoff_normal, cutoff_risk)
+    result = None
+    if isinstance(model, DistributionProbabilityModel) and percentage_df is not None and column is not None:
+        compiled = get_cutoff_extractor(percentage_df).compiled
+        if compiled is not None:
+            result = model.calculate_column(student_score, compiled, column)
+    if result is None:
+        result = model.calculate(student_score, cutoff_safe, cutoff_normal, cutoff_risk, program=column)
 
     return {
         "probability": result.probability,
@@ -545,70 +775,87 @@ def level_to_theory(level: str) -> LevelTheory:
 
 
 # ============================================================
-# 최상위 계산 함수
+# 프로필 단위 캐시 (변환 + INDEX)
 # ============================================================
-def compute_theory_result(
-    excel_data: Dict[str, pd.DataFrame],
-    profile: StudentProfile,
-    debug: bool = False
-) -> TheoryResult:
+def profile_cache_key(profile: StudentProfile) -> Tuple:
     """
-    전체 이론 계산 파이프라인
+    점수 관련 필드만으로 구성한 캐시 키
 
-    Args:
-        excel_data: 엑셀 시트 dict (load_workbook 결과)
-        profile: 학생 프로필
-        debug: True면 raw_components에 상세 저장
-
-    Returns:
-        TheoryResult
+    영어/한국사 등급, 지원 대학 목록 등은 변환/INDEX 결과에 영향이 없으므로 제외합니다.
     """
-    result = TheoryResult()
-
-    # 1. 원점수 → 표준점수 변환
-    korean_conv = convert_raw_to_standard(
-        excel_data["RAWSCORE"],
-        profile.korean.subject,
-        profile.korean.raw_total or 0,
-        profile.korean.raw_common,
-        profile.korean.raw_select
+    def exam_key(exam: Optional[ExamScore], with_split: bool) -> Optional[Tuple]:
+        if exam is None:
+            return None
+        if with_split:
+            return (exam.subject, exam.raw_total, exam.raw_common, exam.raw_select)
+        return (exam.subject, exam.raw_total)
+
+    return (
+        profile.track.value,
+        exam_key(profile.korean, True),
+        exam_key(profile.math, True),
+        exam_key(profile.inquiry1, False),
+        exam_key(profile.inquiry2, False),
     )
 
-    math_conv = convert_raw_to_standard(
-        excel_data["RAWSCORE"],
-        profile.math.subject,
-        profile.math.raw_total or 0,
-        profile.math.raw_common,
-        profile.math.raw_select
-    )
 
-    # 탐구과목 정규화 후 변환
-    inq1_subject = normalize_subject(profile.inquiry1.subject) if profile.inquiry1 else ""
-    inq2_subject = normalize_subject(profile.inquiry2.subject) if profile.inquiry2 else ""
+def clear_profile_cache() -> None:
+    """프로필 캐시 초기화 (테스트/개발용)"""
+    global _profile_cache_sources
+    with _profile_cache_lock:
+        _profile_cache.clear()
+        _profile_cache_sources = ()
+
+
+def get_profile_cache_stats() -> Dict[str, int]:
+    """프로필 캐시 통계"""
+    return {"size": len(_profile_cache), "max_size": PROFILE_CACHE_MAX_SIZE}
+
 
-    inq1_conv = convert_raw_to_standard(
-        excel_data["RAWSCORE"],
-        inq1_subject,
-        profile.inquiry1.raw_total or 0
-    ) if profile.inquiry1 else {"found": False}
+def convert_exam(
+    excel_data: Dict[str, pd.DataFrame],
+    exam: Optional[ExamScore],
+    inquiry: bool
+) -> Dict[str, Any]:
+    """
+    과목 1개 원점수 변환 (파이프라인 1단계, 과목 단위)
+
+    국어/수학은 공통/선택 원점수 포함, 탐구는 과목명 정규화 후 총점으로 변환합니다.
+
+    Returns:
+        convert_raw_to_standard 결과 + "subject" (변환에 사용한 과목명)
+    """
+    if exam is None:
+        return {"found": False, "subject": ""}
+    if inquiry:
+        subject = normalize_subject(exam.subject)
+        conv = convert_raw_to_standard(excel_data["RAWSCORE"], subject, exam.raw_total or 0)
+    else:
+        subject = exam.subject
+        conv = convert_raw_to_standard(
+            excel_data["RAWSCORE"], subject, exam.raw_total or 0, exam.raw_common, exam.raw_select
+        )
+    conv["subject"] = subject
+    return conv
 
-    inq2_conv = convert_raw_to_standard(
-        excel_data["RAWSCORE"],
-        inq2_subject,
-        profile.inquiry2.raw_total or 0
-    ) if profile.inquiry2 else {"found": False}
 
-    # raw_components 저장
-    result.raw_components.update({
+def conversion_components(
+    korean_conv: Dict[str, Any],
+    math_conv: Dict[str, Any],
+    inq1_conv: Dict[str, Any],
+    inq2_conv: Dict[str, Any]
+) -> Dict[str, Any]:
+    """과목별 변환 결과 → raw_components (변환 부분)"""
+    return {
         "korean_standard": korean_conv.get("standard_score"),
         "korean_percentile": korean_conv.get("percentile"),
         "korean_grade": korean_conv.get("grade"),
         "math_standard": math_conv.get("standard_score"),
         "math_percentile": math_conv.get("percentile"),
         "math_grade": math_conv.get("grade"),
-        "inquiry1_subject": inq1_subject,
+        "inquiry1_subject": inq1_conv.get("subject", ""),
         "inquiry1_standard": inq1_conv.get("standard_score"),
-        "inquiry2_subject": inq2_subject,
+        "inquiry2_subject": inq2_conv.get("subject", ""),
         "inquiry2_standard": inq2_conv.get("standard_score"),
         "rawscore_keys": [
             korean_conv.get("key"),
@@ -616,21 +863,25 @@ def compute_theory_result(
             inq1_conv.get("key"),
             inq2_conv.get("key"),
         ],
-    })
+    }
 
-    # 2. INDEX 조회 (+ 폴백 로직)
-    cumulative_pct = None
+
+def index_components(
+    excel_data: Dict[str, pd.DataFrame],
+    stds: Tuple,
+    track: str
+) -> Dict[str, Any]:
+    """
+    INDEX 조회 → raw_components (INDEX 부분, 파이프라인 2단계)
+
+    Args:
+        stds: (국어, 수학, 탐구1, 탐구2) 표준점수 (없으면 0)
+        track: 계열
+    """
     index_result = None
 
     if "INDEX" in excel_data:
-        index_result = lookup_index(
-            excel_data["INDEX"],
-            korean_conv.get("standard_score") or 0,
-            math_conv.get("standard_score") or 0,
-            inq1_conv.get("standard_score") or 0,
-            inq2_conv.get("standard_score") or 0,
-            profile.track.value
-        )
+        index_result = lookup_index(excel_data["INDEX"], *stds, track)
 
     # INDEX 조회 실패 시 폴백 비활성화 (Phase 2: 가중치 없이 호출 불가)
     if not index_result or not index_result.get("found"):
@@ -646,193 +897,315 @@ def compute_theory_result(
             "subjects_used": [],
         }
 
-    if index_result:
-        cumulative_pct = index_result.get("cumulative_pct")
-        result.raw_components.update({
-            "index_key": index_result.get("index_key"),
-            "index_found": index_result.get("found"),
-            "index_match_type": index_result.get("match_type"),
-            "percentile_sum": index_result.get("percentile_sum"),
-            "national_rank": index_result.get("national_rank"),
-            "cumulative_pct": cumulative_pct,
-            "fallback_subjects": index_result.get("subjects_used"),
-            "fallback_confidence": index_result.get("confidence"),
-        })
-
-    # 3. 각 target에 대해 처리
-    for target in profile.targets:
-        _t0 = time.perf_counter()
+    return {
+        "index_key": index_result.get("index_key"),
+        "index_found": index_result.get("found"),
+        "index_match_type": index_result.get("match_type"),
+        "percentile_sum": index_result.get("percentile_sum"),
+        "national_rank": index_result.get("national_rank"),
+        "cumulative_pct": index_result.get("cumulative_pct"),
+        "fallback_subjects": index_result.get("subjects_used"),
+        "fallback_confidence": index_result.get("confidence"),
+    }
 
-        # Explainability 기본(대학/전공 매핑)
-        try:
-            # CutoffExtractor의 정적 alias 데이터 재사용
-            CutoffExtractor._build_alias_reverse_map()
-            _official_univ = CutoffExtractor.ALIAS_TO_OFFICIAL.get(
-                CutoffExtractor._normalize_university(target.university),
-                target.university
-            )
-        except Exception:
-            _official_univ = target.university
-
-        _univ_method = "alias" if _official_univ != target.university else "exact"
-        explainability = ExplainabilityInfo(
-            university_mapping=MappingInfo(
-                input=target.university,
-                matched=_official_univ,
-                method=_univ_method,
-                confidence=1.0,
-                alias_chain=[target.university, _official_univ] if _univ_method == "alias" else [],
-            ),
-            major_mapping=MappingInfo(
-                input=target.major,
-                matched=target.major,
-                method="exact",
-                confidence=1.0,
-            ),
+
+def _compute_profile_components(
+    excel_data: Dict[str, pd.DataFrame],
+    profile: StudentProfile,
+    use_cache: bool = True
+) -> Dict[str, Any]:
+    """
+    프로필 단위 계산 (원점수 변환 4과목 + INDEX 조회)
+
+    target 목록과 무관한 단계이므로 같은 학생을 다른 target으로 재평가할 때
+    캐시에서 바로 꺼내 씁니다. RAWSCORE/INDEX DataFrame이 바뀌면 캐시 전체를 무효화합니다.
+
+    Returns:
+        raw_components 갱신용 dict (cumulative_pct 포함)
+    """
+    global _profile_cache_sources
+
+    key = profile_cache_key(profile)
+    sources = (excel_data.get("RAWSCORE"), excel_data.get("INDEX"))
+
+    if use_cache:
+        with _profile_cache_lock:
+            if len(_profile_cache_sources) != len(sources) or any(
+                a is not b for a, b in zip(_profile_cache_sources, sources)
+            ):
+                if _profile_cache:
+                    logger.debug("프로필 캐시 무효화(워크북 변경)")
+                _profile_cache.clear()
+                _profile_cache_sources = sources
+            elif key in _profile_cache:
+                _profile_cache.move_to_end(key)
+                return copy.deepcopy(_profile_cache[key])
+
+    # 1. 원점수 → 표준점수 변환
+    convs = [
+        convert_exam(excel_data, profile.korean, inquiry=False),
+        convert_exam(excel_data, profile.math, inquiry=False),
+        convert_exam(excel_data, profile.inquiry1, inquiry=True),
+        convert_exam(excel_data, profile.inquiry2, inquiry=True),
+    ]
+    components = conversion_components(*convs)
+
+    # 2. INDEX 조회 (+ 폴백 로직)
+    stds = tuple(conv.get("standard_score") or 0 for conv in convs)
+    components.update(index_components(excel_data, stds, profile.track.value))
+
+    if use_cache:
+        with _profile_cache_lock:
+            _profile_cache[key] = copy.deepcopy(components)
+            _profile_cache.move_to_end(key)
+            while len(_profile_cache) > PROFILE_CACHE_MAX_SIZE:
+                _profile_cache.popitem(last=False)
+
+    return components
+
+
+def score_target(
+    excel_data: Dict[str, pd.DataFrame],
+    target: TargetProgram,
+    track: str,
+    cumulative_pct: Optional[float]
+) -> Optional[Dict[str, Any]]:
+    """
+    target 1개 PERCENTAGE 조회 + 확률 (파이프라인 4단계, 결격이 아닌 target만)
+
+    Returns:
+        {"student_pct", "perc_result", "prob_result"} (prob_result는 조회 실패 시 None),
+        PERCENTAGE 시트가 없으면 None
+    """
+    if "PERCENTAGE" not in excel_data:
+        return None
+
+    # 학생의 누백 사용 (없으면 50.0)
+    student_pct = cumulative_pct if cumulative_pct else 50.0
+    perc_result = lookup_percentage(
+        excel_data["PERCENTAGE"],
+        target.university,
+        target.major,
+        student_pct,
+        track=track
+    )
+
+    prob_result = None
+    if perc_result.get("found"):
+        prob_result = calculate_probability(
+            perc_result.get("score") or 0,
+            perc_result.get("cutoff_safe"),
+            perc_result.get("cutoff_normal"),
+            perc_result.get("cutoff_risk"),
+            percentage_df=excel_data["PERCENTAGE"],
+            column=perc_result.get("column"),
         )
+    return {"student_pct": student_pct, "perc_result": perc_result, "prob_result": prob_result}
 
-        # 결격 체크
-        disqual = check_disqualification(
-            excel_data.get("RESTRICT", pd.DataFrame()),
-            profile,
-            target,
-            severity_threshold=2  # 심각한 결격만
+
+def build_program_result(
+    target: TargetProgram,
+    disqual: DisqualificationInfo,
+    scored: Optional[Dict[str, Any]],
+    started_at: float
+) -> ProgramResult:
+    """
+    결격 판정 + score_target 결과 → ProgramResult (Explainability 포함)
+
+    Args:
+        started_at: target 처리 시작 시각 (time.perf_counter, performance_ms 계산용)
+    """
+    # Explainability 기본(대학/전공 매핑)
+    try:
+        # CutoffExtractor의 정적 alias 데이터 재사용
+        CutoffExtractor._build_alias_reverse_map()
+        _official_univ = CutoffExtractor.ALIAS_TO_OFFICIAL.get(
+            CutoffExtractor._normalize_university(target.university),
+            target.university
         )
+    except Exception:
+        _official_univ = target.university
+
+    _univ_method = "alias" if _official_univ != target.university else "exact"
+    explainability = ExplainabilityInfo(
+        university_mapping=MappingInfo(
+            input=target.university,
+            matched=_official_univ,
+            method=_univ_method,
+            confidence=1.0,
+            alias_chain=[target.university, _official_univ] if _univ_method == "alias" else [],
+        ),
+        major_mapping=MappingInfo(
+            input=target.major,
+            matched=target.major,
+            method="exact",
+            confidence=1.0,
+        ),
+    )
 
-        if disqual.is_disqualified:
-            # 결격 상세 (Explainability)
-            for rid in (disqual.rules_triggered or []):
-                explainability.disqualification_details.append(
-                    DisqualificationDetail(
-                        rule_id=rid,
-                        reason=disqual.reason or ""
-                    )
+    if disqual.is_disqualified:
+        # 결격 상세 (Explainability)
+        for rid in (disqual.rules_triggered or []):
+            explainability.disqualification_details.append(
+                DisqualificationDetail(
+                    rule_id=rid,
+                    reason=disqual.reason or ""
                 )
-            explainability.performance_ms = round((time.perf_counter() - _t0) * 1000.0, 2)
-
-            prog_result = ProgramResult(
-                target=target,
-                level_theory=LevelTheory.DISQUALIFIED,
-                disqualification=disqual,
-                explainability=explainability,
-            )
-            result.program_results.append(prog_result)
-            continue
-
-        # PERCENTAGE 조회 및 확률 계산
-        if "PERCENTAGE" in excel_data:
-            # 학생의 누백 사용 (없으면 50.0)
-            student_pct = cumulative_pct if cumulative_pct else 50.0
-
-            perc_result = lookup_percentage(
-                excel_data["PERCENTAGE"],
-                target.university,
-                target.major,
-                student_pct,
-                track=profile.track.value
             )
+        explainability.performance_ms = round((time.perf_counter() - started_at) * 1000.0, 2)
+        return ProgramResult(
+            target=target,
+            level_theory=LevelTheory.DISQUALIFIED,
+            disqualification=disqual,
+            explainability=explainability,
+        )
 
-            if perc_result.get("found"):
-                # Explainability: 매칭/소스 정보 채우기
-                match_info = perc_result.get("match_info") or {}
-                if match_info:
-                    stage = match_info.get("match_stage")
-                    fuzzy_score = match_info.get("fuzzy_score")
-
-                    # 대학 매핑
-                    univ_method = match_info.get("university_method", explainability.university_mapping.method)
-                    if stage == "fuzzy":
-                        univ_method = "fuzzy"
-
-                    univ_conf = 1.0
-                    if isinstance(fuzzy_score, (int, float)) and stage == "fuzzy":
-                        univ_conf = max(0.0, min(1.0, float(fuzzy_score) / 100.0))
-
-                    explainability.university_mapping = MappingInfo(
-                        input=target.university,
-                        matched=match_info.get("university_official", _official_univ),
-                        method=univ_method,
-                        confidence=univ_conf,
-                        fuzzy_score=float(fuzzy_score) if isinstance(fuzzy_score, (int, float)) else None,
-                    )
-
-                    # 전공 매핑
-                    major_method = match_info.get("major_method", explainability.major_mapping.method)
-                    if stage == "fuzzy":
-                        major_method = "fuzzy"
-
-                    explainability.major_mapping = MappingInfo(
-                        input=target.major,
-                        matched=match_info.get("major_used", target.major),
-                        method=major_method,
-                        confidence=univ_conf if stage == "fuzzy" else 1.0,
-                        fuzzy_score=float(fuzzy_score) if isinstance(fuzzy_score, (int, float)) else None,
-                        alias_chain=list(match_info.get("alias_chain") or []),
-                    )
-
-                explainability.cutoff_source = CutoffSourceInfo(
-                    sheet="PERCENTAGE",
-                    column_name=str(perc_result.get("column")) if perc_result.get("column") is not None else None,
-                    percentile=float(student_pct) if student_pct is not None else None,
-                    interpolated=bool(perc_result.get("interpolated")) if perc_result.get("interpolated") is not None else False,
-                    interpolation_method=perc_result.get("interpolation_method"),
-                )
+    if scored is None:
+        # PERCENTAGE 시트 없음
+        explainability.cutoff_source = CutoffSourceInfo(
+            sheet="PERCENTAGE",
+            column_name=None,
+            percentile=None,
+            interpolated=False,
+            interpolation_method=None,
+        )
+        explainability.performance_ms = round((time.perf_counter() - started_at) * 1000.0, 2)
+        return ProgramResult(
+            target=target,
+            level_theory=LevelTheory.NO_DATA,
+            disqualification=disqual,
+            explainability=explainability,
+        )
 
-                # 확률 계산
-                prob_result = calculate_probability(
-                    perc_result.get("score") or 0,
-                    perc_result.get("cutoff_safe"),
-                    perc_result.get("cutoff_normal"),
-                    perc_result.get("cutoff_risk")
-                )
+    student_pct = scored["student_pct"]
+    perc_result = scored["perc_result"]
+    prob_result = scored["prob_result"]
+
+    if prob_result is None:
+        explainability.cutoff_source = CutoffSourceInfo(
+            sheet="PERCENTAGE",
+            column_name=None,
+            percentile=float(student_pct) if student_pct is not None else None,
+            interpolated=False,
+            interpolation_method=None,
+        )
+        explainability.performance_ms = round((time.perf_counter() - started_at) * 1000.0, 2)
+        return ProgramResult(
+            target=target,
+            level_theory=LevelTheory.NO_DATA,
+            disqualification=disqual,
+            explainability=explainability,
+        )
 
-                level = level_to_theory(prob_result["level"])
-
-                explainability.performance_ms = round((time.perf_counter() - _t0) * 1000.0, 2)
-                prog_result = ProgramResult(
-                    target=target,
-                    p_theory=prob_result["probability"],
-                    score_theory=perc_result.get("score"),
-                    level_theory=level,
-                    cutoff_safe=perc_result.get("cutoff_safe"),
-                    cutoff_normal=perc_result.get("cutoff_normal"),
-                    cutoff_risk=perc_result.get("cutoff_risk"),
-                    disqualification=disqual,
-                    explainability=explainability,
-                )
-            else:
-                explainability.cutoff_source = CutoffSourceInfo(
-                    sheet="PERCENTAGE",
-                    column_name=None,
-                    percentile=float(student_pct) if student_pct is not None else None,
-                    interpolated=False,
-                    interpolation_method=None,
-                )
-                explainability.performance_ms = round((time.perf_counter() - _t0) * 1000.0, 2)
-                prog_result = ProgramResult(
-                    target=target,
-                    level_theory=LevelTheory.NO_DATA,
-                    disqualification=disqual,
-                    explainability=explainability,
-                )
+    # Explainability: 매칭/소스 정보 채우기
+    match_info = perc_result.get("match_info") or {}
+    if match_info:
+        stage = match_info.get("match_stage")
+        fuzzy_score = match_info.get("fuzzy_score")
+
+        # 대학 매핑
+        univ_method = match_info.get("university_method", explainability.university_mapping.method)
+        if stage == "fuzzy":
+            univ_method = "fuzzy"
+
+        univ_conf = 1.0
+        if isinstance(fuzzy_score, (int, float)) and stage == "fuzzy":
+            univ_conf = max(0.0, min(1.0, float(fuzzy_score) / 100.0))
+
+        explainability.university_mapping = MappingInfo(
+            input=target.university,
+            matched=match_info.get("university_official", _official_univ),
+            method=univ_method,
+            confidence=univ_conf,
+            fuzzy_score=float(fuzzy_score) if isinstance(fuzzy_score, (int, float)) else None,
+        )
 
-            result.program_results.append(prog_result)
-        else:
-            explainability.cutoff_source = CutoffSourceInfo(
-                sheet="PERCENTAGE",
-                column_name=None,
-                percentile=None,
-                interpolated=False,
-                interpolation_method=None,
-            )
-            explainability.performance_ms = round((time.perf_counter() - _t0) * 1000.0, 2)
-            prog_result = ProgramResult(
-                target=target,
-                level_theory=LevelTheory.NO_DATA,
-                disqualification=disqual,
-                explainability=explainability,
-            )
-            result.program_results.append(prog_result)
+        # 전공 매핑
+        major_method = match_info.get("major_method", explainability.major_mapping.method)
+        if stage == "fuzzy":
+            major_method = "fuzzy"
+
+        explainability.major_mapping = MappingInfo(
+            input=target.major,
+            matched=match_info.get("major_used", target.major),
+            method=major_method,
+            confidence=univ_conf if stage == "fuzzy" else 1.0,
+            fuzzy_score=float(fuzzy_score) if isinstance(fuzzy_score, (int, float)) else None,
+            alias_chain=list(match_info.get("alias_chain") or []),
+        )
+
+    explainability.cutoff_source = CutoffSourceInfo(
+        sheet="PERCENTAGE",
+        column_name=str(perc_result.get("column")) if perc_result.get("column") is not None else None,
+        percentile=float(student_pct) if student_pct is not None else None,
+        interpolated=bool(perc_result.get("interpolated")) if perc_result.get("interpolated") is not None else False,
+        interpolation_method=perc_result.get("interpolation_method"),
+    )
+
+    explainability.performance_ms = round((time.perf_counter() - started_at) * 1000.0, 2)
+    return ProgramResult(
+        target=target,
+        p_theory=prob_result["probability"],
+        score_theory=perc_result.get("score"),
+        level_theory=level_to_theory(prob_result["level"]),
+        cutoff_safe=perc_result.get("cutoff_safe"),
+        cutoff_normal=perc_result.get("cutoff_normal"),
+        cutoff_risk=perc_result.get("cutoff_risk"),
+        disqualification=disqual,
+        explainability=explainability,
+    )
+
+
+# ============================================================
+# 최상위 계산 함수
+# ============================================================
+def compute_theory_result(
+    excel_data: Dict[str, pd.DataFrame],
+    profile: StudentProfile,
+    debug: bool = False,
+    use_cache: bool = True
+) -> TheoryResult:
+    """
+    전체 이론 계산 파이프라인
+
+    Args:
+        excel_data: 엑셀 시트 dict (load_workbook 결과)
+        profile: 학생 프로필
+        debug: True면 raw_components에 상세 저장
+        use_cache: True면 프로필 단위 변환/INDEX 결과 캐시 사용
+
+    Returns:
+        TheoryResult
+    """
+    result = TheoryResult()
+
+    # 1~2. 원점수 변환 + INDEX 조회 (프로필 캐시)
+    components = _compute_profile_components(excel_data, profile, use_cache=use_cache)
+    result.raw_components.update(components)
+    cumulative_pct = components.get("cumulative_pct")
+
+    # 3. target 컬럼 일괄 매칭 (인덱스로 안 풀리는 target은 퍼지 단계를 한 번에 계산)
+    if "PERCENTAGE" in excel_data and profile.targets:
+        get_cutoff_extractor(excel_data["PERCENTAGE"]).resolve_many(
+            [(t.university, t.major, profile.track.value) for t in profile.targets]
+        )
+
+    # 4. 각 target에 대해 처리 (결격 → PERCENTAGE/확률 → 결과 조립)
+    restrict_df = excel_data.get("RESTRICT", pd.DataFrame())
+    for target in profile.targets:
+        _t0 = time.perf_counter()
+
+        # 결격 체크
+        disqual = check_disqualification(
+            restrict_df,
+            profile,
+            target,
+            severity_threshold=2  # 심각한 결격만
+        )
+        scored = None if disqual.is_disqualified else score_target(
+            excel_data, target, profile.track.value, cumulative_pct
+        )
+        result.program_results.append(build_program_result(target, disqual, scored, _t0))
 
     return result
 
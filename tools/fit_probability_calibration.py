@@ -0,0 +1,104 @@
+"""
+합격 확률 보정 테이블 생성 스크립트
+
+과거 합격/불합격 결과(CSV/Parquet)로 모델 원확률을 레벨별 또는 프로그램별로
+isotonic(PAV) / Platt 보정하고, 101칸 격자 테이블을 JSON으로 저장합니다.
+런타임은 config.USE_PROBABILITY_CALIBRATION = True 일 때 이 테이블을 배열 조회로 적용합니다.
+
+사용법:
+    python tools/fit_probability_calibration.py --outcomes history.csv
+    python tools/fit_probability_calibration.py --outcomes history.parquet --method platt --by program
+    python tools/fit_probability_calibration.py --outcomes history.csv --mode distribution
+
+원확률은 --mode(기본 config.PROBABILITY_MODE) 모델로 계산하며, 모드는 테이블 메타데이터에
+기록되어 런타임 모드가 다르면 적용되지 않습니다.
+
+입력 컬럼:
+    admitted (0/1)
+    probability + level  또는  student_score, cutoff_safe, cutoff_normal, cutoff_risk
+    program (선택, --by program 시 필요)
+
+출력:
+    theory_engine/weights/probability_calibration.json
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from theory_engine.config import DISTRIBUTION_FIT_RANGE, PROBABILITY_MODE  # noqa: E402
+from theory_engine.probability import (  # noqa: E402
+    AdmissionProbabilityModel,
+    DistributionProbabilityModel,
+)
+from theory_engine.probability.calibration import (  # noqa: E402
+    CALIBRATION_GROUPS,
+    CALIBRATION_METHODS,
+    DEFAULT_CALIBRATION_PATH,
+    ProbabilityCalibration,
+    load_outcomes,
+)
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="합격 확률 보정 테이블 생성")
+    parser.add_argument("--outcomes", required=True, help="과거 결과 파일 (CSV/Parquet)")
+    parser.add_argument("--method", default="isotonic", choices=CALIBRATION_METHODS, help="보정 방법")
+    parser.add_argument("--by", default="level", choices=CALIBRATION_GROUPS, help="보정 단위")
+    parser.add_argument(
+        "--mode", default=PROBABILITY_MODE, choices=("linear", "distribution"),
+        help="원확률 계산 모델 (런타임 config.PROBABILITY_MODE와 같아야 적용됨)"
+    )
+    parser.add_argument("--min-samples", type=int, default=50, help="그룹별 최소 표본 수")
+    parser.add_argument("--output", default=str(DEFAULT_CALIBRATION_PATH), help="출력 JSON 경로")
+    args = parser.parse_args()
+
+    try:
+        outcomes = load_outcomes(args.outcomes)
+    except Exception as e:
+        logger.error(f"과거 결과 로드 실패: {e}")
+        return
+
+    if args.mode == "distribution":
+        model = DistributionProbabilityModel(fit_range=DISTRIBUTION_FIT_RANGE)
+    else:
+        model = AdmissionProbabilityModel()
+
+    start = time.time()
+    try:
+        calibration = ProbabilityCalibration.fit(
+            outcomes, method=args.method, by=args.by, min_samples=args.min_samples, model=model
+        )
+    except ValueError as e:
+        logger.error(f"보정 적합 실패: {e}")
+        return
+    output_path = calibration.save(args.output)
+    elapsed = time.time() - start
+
+    metadata = calibration.metadata
+    print("\n" + "=" * 60)
+    print("확률 보정 테이블 생성 완료")
+    print("=" * 60)
+    print(f"출력 파일: {output_path}")
+    print(f"모델: {metadata['model']} / 방법: {metadata['method']} / 단위: {metadata['by']}")
+    print(f"표본: {metadata['samples']}개 (레벨별 {metadata['level_samples']})")
+    print(f"프로그램 테이블: {metadata['program_tables']}개")
+    print(f"Brier score: {metadata['brier_before']} → {metadata['brier_after']}")
+    print(f"소요 시간: {elapsed:.1f}초")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+RAWSCORE 사전계산 테이블 생성 스크립트
+
+모든 정규 과목 × 원점수(0~100, 공통/선택 분리 포함)에 대해
+다단계 매칭(Stage 1~4)을 1회 수행하고 결과를 압축 JSON으로 저장합니다.
+런타임 변환은 이 테이블만 조회하므로 퍼지 매칭 단계가 실행되지 않습니다.
+
+사용법:
+    python tools/precompute_rawscore_table.py
+    python tools/precompute_rawscore_table.py --excel <엑셀 경로> --output <JSON 경로>
+
+출력:
+    theory_engine/weights/rawscore_table.json
+
+주의:
+    - 엑셀(RAWSCORE 시트)이 바뀌면 다시 실행해야 합니다
+      (지문 불일치 시 런타임은 자동으로 다단계 매칭을 사용)
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+# 프로젝트 루트 추가
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from theory_engine.loader import load_rawscore  # noqa: E402
+from theory_engine.optimizers.rawscore_table import DEFAULT_TABLE_PATH, RawscoreTable  # noqa: E402
+
+
+def main():
+    """메인 함수"""
+    parser = argparse.ArgumentParser(description="RAWSCORE 사전계산 테이블 생성")
+    parser.add_argument("--excel", default=None, help="엑셀 파일 경로 (기본: config.EXCEL_PATH)")
+    parser.add_argument("--output", default=str(DEFAULT_TABLE_PATH), help="출력 JSON 경로")
+    args = parser.parse_args()
+
+    # 과목명 매칭 경고는 구축 중 대량 발생하므로 숨김
+    logging.getLogger("theory_engine.rules").setLevel(logging.ERROR)
+
+    try:
+        rawscore_df = load_rawscore(args.excel)
+    except Exception as e:
+        logger.error(f"RAWSCORE 로드 실패: {e}")
+        return
+
+    start = time.time()
+    table = RawscoreTable.build(rawscore_df)
+    output_path = table.save(args.output)
+    elapsed = time.time() - start
+
+    stats = table.get_stats()
+    print("\n" + "=" * 60)
+    print("RAWSCORE 사전계산 완료")
+    print("=" * 60)
+    print(f"출력 파일: {output_path}")
+    print(f"과목: {stats['subjects']}개")
+    print(f"총점 엔트리: {stats['total_entries']}개")
+    print(f"공통/선택 엔트리: {stats['split_entries']}개")
+    print(f"매칭 단계 분포: {table.metadata['match_type_counts']}")
+    print(f"소요 시간: {elapsed:.1f}초")
+
+
+if __name__ == "__main__":
+    main()